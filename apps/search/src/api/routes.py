@@ -1,11 +1,21 @@
 """API route handlers for search endpoints."""
 
 import logging
+import math
 import time
+from collections.abc import AsyncIterator
+from typing import Any
 
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from qdrant_client.http import models as qdrant_models
 
 from src.api.schemas import (
+    BatchConflict,
+    ConflictCandidateBatchRequest,
+    ConflictCandidateBatchResponse,
+    ConflictCandidateBatchResult,
     ConflictCandidateRequest,
     ConflictCandidateResponse,
     EmbedRequest,
@@ -14,23 +24,61 @@ from src.api.schemas import (
     MemoryIndexRequest,
     MemoryIndexResponse,
     MultiQueryRequest,
+    QueryPlanInfo,
+    SearchPhaseEvent,
     SearchRequest,
     SearchResponse,
     SearchResult,
     SessionAwareRequest,
     SessionAwareResponse,
     SessionAwareResult,
+    SimilarRequest,
+    SimilarResponse,
+    SimilarResults,
 )
 from src.config import get_settings
+from src.embedders.scheduler import EmbeddingLane
+from src.indexing.dedup import content_hash, fingerprint_payload, overwrite_payloads, plan_batch
 from src.middleware.auth import ApiKeyContext, optional_scope
+from src.retrieval.constants import TURN_CHUNKS_FIELD
 from src.retrieval.multi_query import MultiQueryConfig
+from src.retrieval.pagination import InvalidCursorError
+from src.retrieval.planner import current_query_plan
 from src.retrieval.session import SessionRetrieverConfig
-from src.retrieval.types import RerankerTier, SearchFilters, SearchQuery, SearchStrategy, TimeRange
-from src.services.schema_manager import SchemaManager, get_memory_collection_schema
-from src.utils.metrics import get_content_type, get_metrics
+from src.retrieval.types import (
+    QueryPlan,
+    RerankerTier,
+    SearchFilters,
+    SearchPhase,
+    SearchQuery,
+    SearchResultItem,
+    SearchStrategy,
+    SimilarVector,
+    TimeRange,
+)
+from src.services.compression import PayloadCodec
+from src.services.schema_manager import (
+    SchemaManager,
+    apply_storage_settings,
+    get_memory_collection_schema,
+    late_chunks_from_settings,
+    quantization_from_settings,
+)
+from src.services.sharding import ShardRouter
+from src.utils.deadline import (
+    DEADLINE_HEADER,
+    DEADLINE_TIMEOUT_HEADER,
+    Deadline,
+    DeadlineExceededError,
+)
+from src.utils.metrics import get_content_type, get_metrics, record_deadline_miss
 
 logger = logging.getLogger(__name__)
 
+# Conflict (near-duplicate memory) search: minimum similarity and candidates per memory
+CONFLICT_SCORE_THRESHOLD = 0.65
+CONFLICT_CANDIDATE_LIMIT = 10
+
 # Auth dependency for search operations (requires memory:read scope when auth enabled)
 search_auth = Depends(optional_scope("memory:read", "search:read"))
 
@@ -104,28 +152,178 @@ async def metrics() -> Response:
     return Response(content=get_metrics(), media_type=get_content_type())
 
 
+def _to_search_result(r: SearchResultItem) -> SearchResult:
+    """Map a retriever result item to the API response schema."""
+    return SearchResult(
+        id=str(r.id),
+        score=r.score,
+        rrf_score=r.rrf_score,
+        reranker_score=r.reranker_score,
+        rerank_tier=r.rerank_tier.value if r.rerank_tier else None,
+        payload=r.payload,
+        degraded=r.degraded,
+        collection=r.collection,
+    )
+
+
+def _to_plan_info(plan: QueryPlan | None) -> QueryPlanInfo | None:
+    """Map a query planner decision to the API response schema."""
+    if plan is None:
+        return None
+    return QueryPlanInfo(
+        mode=plan.mode.value,
+        fetch_limit=plan.fetch_limit,
+        estimated_matches=plan.estimated_matches,
+        hnsw_ef=plan.hnsw_ef,
+        cached=plan.cached,
+    )
+
+
+def _phase_line(phase: SearchPhase, start_time: float) -> str:
+    """Serialize a search phase as one NDJSON line."""
+    results = [_to_search_result(r) for r in phase.results]
+    event = SearchPhaseEvent(
+        phase=phase.phase.value,
+        results=results,
+        total=len(results),
+        took_ms=int((time.time() - start_time) * 1000),
+        reason=phase.reason,
+        plan=_to_plan_info(phase.plan),
+    )
+    return event.model_dump_json() + "\n"
+
+
+async def _stream_search_phases(
+    first_phase: SearchPhase,
+    phases: AsyncIterator[SearchPhase],
+    start_time: float,
+) -> AsyncIterator[str]:
+    """Stream search phases as NDJSON, reporting late failures in-band.
+
+    Args:
+        first_phase: Already-computed first-stage phase.
+        phases: Remaining phases from the retriever.
+        start_time: Request start time for took_ms.
+
+    Yields:
+        NDJSON lines, one per phase.
+    """
+    yield _phase_line(first_phase, start_time)
+    try:
+        async for phase in phases:
+            yield _phase_line(phase, start_time)
+    except Exception as e:
+        logger.error(f"Streaming search failed after first phase: {e}", exc_info=True)
+        event = SearchPhaseEvent(
+            phase="error",
+            results=[],
+            total=0,
+            took_ms=int((time.time() - start_time) * 1000),
+            reason=str(e),
+        )
+        yield event.model_dump_json() + "\n"
+
+
+def _request_deadline(request: Request, search_request: SearchRequest) -> Deadline | None:
+    """Resolve the effective deadline for a search request.
+
+    Combines the absolute deadline header, the relative timeout header and the
+    ``timeout_ms`` body field, keeping the earliest.
+
+    Args:
+        request: FastAPI request object.
+        search_request: Search query and parameters.
+
+    Returns:
+        Earliest deadline, or None if the caller set none.
+
+    Raises:
+        HTTPException: If a deadline header is not a finite number.
+    """
+    deadlines: list[Deadline] = []
+    try:
+        for header in (DEADLINE_HEADER, DEADLINE_TIMEOUT_HEADER):
+            if header not in request.headers:
+                continue
+            value = float(request.headers[header])
+            if not math.isfinite(value):
+                raise ValueError(f"{header} must be finite, got {value}")
+            deadlines.append(
+                Deadline(value) if header == DEADLINE_HEADER else Deadline.from_timeout_ms(value)
+            )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid deadline header: {e}",
+        ) from e
+    if search_request.timeout_ms is not None:
+        deadlines.append(Deadline.from_timeout_ms(search_request.timeout_ms))
+
+    return min(deadlines, key=lambda d: d.deadline_ms, default=None)
+
+
+def _shard_router(request: Request) -> ShardRouter:
+    """Get the app's shard router, or a disabled one if sharding isn't set up.
+
+    Args:
+        request: FastAPI request object.
+
+    Returns:
+        Shard router for routing Qdrant requests by org.
+    """
+    return getattr(request.app.state, "shard_router", None) or ShardRouter()
+
+
+def _payload_codec(request: Request) -> PayloadCodec:
+    """Get the app's payload codec, or a decode-only one if compression isn't set up.
+
+    Args:
+        request: FastAPI request object.
+
+    Returns:
+        Codec for compressing and restoring large payload fields.
+    """
+    return getattr(request.app.state, "payload_codec", None) or PayloadCodec()
+
+
 @router.post("/query", response_model=SearchResponse)
 async def search(
     request: Request,
     search_request: SearchRequest,
     api_key: ApiKeyContext = search_auth,
-) -> SearchResponse:
+) -> SearchResponse | StreamingResponse:
     """Perform vector search with optional reranking.
 
     Executes hybrid search using dense and sparse vectors, optionally applying
     multi-tier reranking for improved relevance.
 
+    A deadline may be set with the ``X-Request-Deadline`` header (Unix epoch ms),
+    the ``X-Request-Timeout-Ms`` header or the ``timeout_ms`` field. Stages share
+    the remaining budget, skipping reranking when it runs short; requests that
+    are already expired are rejected with 504 before any work starts.
+
+    With ``stream=true`` the response is NDJSON: a ``candidates`` line with the
+    first-stage fused results as soon as Qdrant returns, followed by a
+    ``reranked`` line or a ``rerank_skipped`` marker.
+
     Args:
         request: FastAPI request object with app state.
         search_request: Search query and parameters.
 
     Returns:
-        Search results with scores and metadata.
+        Search results with scores and metadata, or an NDJSON stream of phases.
 
     Raises:
-        HTTPException: If search fails.
+        HTTPException: If search fails or the deadline is exceeded.
     """
     start_time = time.time()
+    deadline = _request_deadline(request, search_request)
+    if deadline is not None and deadline.expired:
+        record_deadline_miss("admission")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Request deadline already expired",
+        )
 
     logger.info(
         f"Search request: query='{search_request.text[:50]}...', "
@@ -141,6 +339,20 @@ async def search(
             detail="Search service unavailable: retriever not initialized",
         )
 
+    collection = search_request.collection or "engram_turns"
+    if search_request.stream and collection in ("engram_memory", "federated"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Streaming is not supported for collection '{collection}'",
+        )
+
+    paginate = search_request.paginate or search_request.cursor is not None
+    if paginate and (search_request.stream or collection == "engram_memory"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pagination is not supported for streaming or the engram_memory collection",
+        )
+
     try:
         # Build search filters - ALWAYS include org_id for tenant isolation
         time_range = None
@@ -157,6 +369,7 @@ async def search(
             type=search_request.filters.type if search_request.filters else None,
             time_range=time_range,
             vt_end_after=search_request.filters.vt_end_after if search_request.filters else None,
+            project=search_request.filters.project if search_request.filters else None,
         )
 
         # Convert string strategy/tier to enums if provided
@@ -175,16 +388,41 @@ async def search(
             rerank=search_request.rerank,
             rerank_tier=rerank_tier,
             rerank_depth=search_request.rerank_depth,
+            deadline_ms=int(deadline.deadline_ms) if deadline is not None else None,
+            hnsw_ef=search_request.hnsw_ef,
+            exact=search_request.exact,
+            quantization_rescore=search_request.quantization_rescore,
+            quantization_oversampling=search_request.quantization_oversampling,
         )
 
+        # Streaming: compute the first phase eagerly so setup errors still map to HTTP errors
+        if search_request.stream:
+            phases = search_retriever.search_phases(query, turns=collection == "engram_turns")
+            first_phase = await anext(phases)
+            return StreamingResponse(
+                _stream_search_phases(first_phase, phases, start_time),
+                media_type="application/x-ndjson",
+            )
+
         # Execute search - use turns collection by default
-        collection = search_request.collection or "engram_turns"
-        if collection == "engram_turns":
+        current_query_plan.set(None)
+        next_cursor = None
+        if paginate:
+            # First page caches the reranked list; later pages are served from it
+            page = await search_retriever.search_page(
+                query,
+                cursor=search_request.cursor,
+                turns=collection == "engram_turns",
+                federated=collection == "federated",
+            )
+            results, next_cursor = page.items, page.next_cursor
+        elif collection == "engram_turns":
             results = await search_retriever.search_turns(query)
+        elif collection == "federated":
+            # Turns and memories in one pass, reranked together
+            results = await search_retriever.search_federated(query)
         elif collection == "engram_memory":
             # Direct Qdrant search for memory collection with filters
-            from qdrant_client.http import models as qdrant_models
-
             embedder_factory = getattr(request.app.state, "embedder_factory", None)
             qdrant = getattr(request.app.state, "qdrant", None)
             text_embedder = await embedder_factory.get_embedder("text")
@@ -250,6 +488,7 @@ async def search(
                 query_filter=query_filter,
                 limit=search_request.limit,
                 score_threshold=search_request.threshold,
+                **_shard_router(request).selector_kwargs(filters.org_id),
             )
 
             results = [
@@ -259,7 +498,7 @@ async def search(
                     rrf_score=None,
                     reranker_score=None,
                     rerank_tier=None,
-                    payload=p.payload or {},
+                    payload=_payload_codec(request).decode(p.payload),
                     degraded=False,
                 )
                 for p in qdrant_results.points
@@ -282,6 +521,7 @@ async def search(
                 rerank_tier=r.rerank_tier.value if r.rerank_tier else None,
                 payload=r.payload,
                 degraded=r.degraded,
+                collection=r.collection,
             )
             for r in results
         ]
@@ -292,8 +532,21 @@ async def search(
             results=search_results,
             total=len(search_results),
             took_ms=took_ms,
+            plan=_to_plan_info(current_query_plan.get()),
+            next_cursor=next_cursor,
         )
 
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    except DeadlineExceededError as e:
+        took_ms = int((time.time() - start_time) * 1000)
+        logger.warning(f"Search deadline exceeded after {took_ms}ms: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(e),
+        ) from e
+
     except Exception as e:
         took_ms = int((time.time() - start_time) * 1000)
         logger.error(f"Search failed after {took_ms}ms: {e}", exc_info=True)
@@ -653,6 +906,50 @@ async def index_memory(
         except ImportError as e:
             logger.warning(f"Sparse embedder unavailable: {e}")
 
+        # Build payload - include original ULID as node_id for reference
+        # CRITICAL: org_id is mandatory for tenant isolation in vector search
+        versions = embedder_factory.model_versions()
+        model_versions = [versions["text"]]
+        if sparse_embedder is not None:
+            model_versions.append(versions["sparse"])
+        payload = fingerprint_payload(
+            {
+                "content": memory_request.content,
+                "type": memory_request.type,
+                "tags": memory_request.tags,
+                "project": memory_request.project,
+                "source_session_id": memory_request.source_session_id,
+                "node_id": memory_request.id,  # Original ULID for graph lookups
+                "org_id": api_key.org_id,  # Tenant isolation - required for all queries
+            },
+            content_hash(memory_request.content, model_versions),
+        )
+
+        # Re-indexing identical content only needs a lookup (and a payload write if it changed)
+        codec = _payload_codec(request)
+        shard_router = _shard_router(request)
+        plan = await plan_batch(
+            qdrant.client, "engram_memory", shard_router, [point_uuid], [payload]
+        )
+        plan.record("engram_memory")
+        if not plan.embed:
+            if plan.update_payload:
+                await overwrite_payloads(
+                    qdrant.client,
+                    "engram_memory",
+                    shard_router,
+                    [point_uuid],
+                    [codec.encode(payload)],
+                )
+            took_ms = int((time.time() - start_time) * 1000)
+            logger.info(f"Memory unchanged: id={memory_request.id}, took_ms={took_ms}")
+            return MemoryIndexResponse(
+                id=memory_request.id,
+                indexed=True,
+                took_ms=took_ms,
+                unchanged=True,
+            )
+
         # Generate embeddings
         dense_embedding = await text_embedder.embed(memory_request.content, is_query=False)
 
@@ -663,7 +960,9 @@ async def index_memory(
 
         # Add sparse embedding if available
         if sparse_embedder is not None:
-            sparse_dict = sparse_embedder.embed_sparse(memory_request.content)
+            sparse_dict = await sparse_embedder.embed_sparse_async(
+                memory_request.content, lane=EmbeddingLane.LIVE
+            )
             if sparse_dict:
                 # embed_sparse returns {token_id: weight}, convert to indices/values
                 indices = list(sparse_dict.keys())
@@ -673,28 +972,17 @@ async def index_memory(
                     values=values,
                 )
 
-        # Build payload - include original ULID as node_id for reference
-        # CRITICAL: org_id is mandatory for tenant isolation in vector search
-        payload = {
-            "content": memory_request.content,
-            "type": memory_request.type,
-            "tags": memory_request.tags,
-            "project": memory_request.project,
-            "source_session_id": memory_request.source_session_id,
-            "node_id": memory_request.id,  # Original ULID for graph lookups
-            "org_id": api_key.org_id,  # Tenant isolation - required for all queries
-        }
-
         # Upsert to Qdrant - use UUID for point ID
         point = PointStruct(
             id=point_uuid,
             vector=vectors,
-            payload=payload,
+            payload=codec.encode(payload),
         )
 
         await qdrant.client.upsert(
             collection_name="engram_memory",
             points=[point],
+            **shard_router.selector_kwargs(api_key.org_id),
         )
 
         took_ms = int((time.time() - start_time) * 1000)
@@ -724,7 +1012,9 @@ async def get_conflict_candidates(
     """Find potential duplicate memories for deduplication.
 
     Embeds the provided content and searches for similar memories to detect
-    potential conflicts before storing a new memory.
+    potential conflicts before storing a new memory. When the memory is already
+    indexed, pass its node ID instead: its stored vector is used, so nothing is
+    embedded, and the memory itself is excluded from the candidates.
 
     Args:
         request: FastAPI request object with app state.
@@ -741,9 +1031,18 @@ async def get_conflict_candidates(
 
     logger.info(
         f"Conflict candidate search: content_len={len(conflict_request.content)}, "
-        f"project={conflict_request.project}, key={api_key.prefix}"
+        f"id={conflict_request.id}, project={conflict_request.project}, key={api_key.prefix}"
     )
 
+    if conflict_request.id:
+        return await _conflict_candidates_by_id(request, conflict_request, api_key, start_time)
+
+    if not conflict_request.content:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either content or id is required",
+        )
+
     # Verify embedder factory and Qdrant are available
     embedder_factory = getattr(request.app.state, "embedder_factory", None)
     qdrant = getattr(request.app.state, "qdrant", None)
@@ -761,55 +1060,27 @@ async def get_conflict_candidates(
         )
 
     try:
-        from qdrant_client.http import models
-
         # Generate embedding for the content
         text_embedder = await embedder_factory.get_embedder("text")
         query_vector = await text_embedder.embed(conflict_request.content, is_query=True)
 
-        # Build filter conditions - ALWAYS include org_id for tenant isolation
-        conditions: list[models.Condition] = [
-            models.FieldCondition(
-                key="org_id",
-                match=models.MatchValue(value=api_key.org_id),
-            )
-        ]
-
-        # Add optional project filter
-        if conflict_request.project:
-            conditions.append(
-                models.FieldCondition(
-                    key="project",
-                    match=models.MatchValue(value=conflict_request.project),
-                )
-            )
-
-        qdrant_filter = models.Filter(must=conditions)
-
         # Query Qdrant with score_threshold=0.65 to find similar memories
         results = await qdrant.client.query_points(
             collection_name="engram_memory",
             query=query_vector,
             using="text_dense",
-            query_filter=qdrant_filter,
-            limit=10,
-            score_threshold=0.65,
+            query_filter=_conflict_filter(api_key.org_id, conflict_request.project),
+            limit=CONFLICT_CANDIDATE_LIMIT,
+            score_threshold=CONFLICT_SCORE_THRESHOLD,
             with_payload=True,
+            **_shard_router(request).selector_kwargs(api_key.org_id),
         )
 
         took_ms = int((time.time() - start_time) * 1000)
 
         # Map results to response schema
-        candidates = [
-            ConflictCandidateResponse(
-                id=p.payload.get("node_id", str(p.id)),
-                content=p.payload.get("content", ""),
-                type=p.payload.get("type", "context"),
-                score=p.score,
-                vt_start=p.payload.get("vt_start", 0),
-            )
-            for p in results.points
-        ]
+        codec = _payload_codec(request)
+        candidates = [_to_conflict_candidate(p, codec) for p in results.points]
 
         logger.info(f"Conflict search completed: candidates={len(candidates)}, took_ms={took_ms}")
 
@@ -824,6 +1095,309 @@ async def get_conflict_candidates(
         ) from e
 
 
+def _conflict_filter(org_id: str, project: str | None) -> qdrant_models.Filter:
+    """Build the memory filter for a conflict search (org_id always, project optional)."""
+    # ALWAYS include org_id for tenant isolation
+    conditions: list[qdrant_models.Condition] = [
+        qdrant_models.FieldCondition(key="org_id", match=qdrant_models.MatchValue(value=org_id))
+    ]
+    if project:
+        conditions.append(
+            qdrant_models.FieldCondition(
+                key="project", match=qdrant_models.MatchValue(value=project)
+            )
+        )
+    return qdrant_models.Filter(must=conditions)
+
+
+def _to_conflict_candidate(point: Any, codec: PayloadCodec) -> ConflictCandidateResponse:
+    """Map a scored memory point (or result item) to a conflict candidate."""
+    payload = codec.decode(point.payload)
+    return ConflictCandidateResponse(
+        id=payload.get("node_id", str(point.id)),
+        content=payload.get("content", ""),
+        type=payload.get("type", "context"),
+        score=point.score,
+        vt_start=payload.get("vt_start", 0),
+    )
+
+
+def _batch_conflicts(
+    vectors: list[list[float]], projects: list[str | None], threshold: float
+) -> list[list[BatchConflict]]:
+    """Find pairs of batch items whose embeddings are at least ``threshold`` similar.
+
+    Like ``_conflict_filter``, items only conflict within the same project; an
+    item without a project can conflict with any item.
+
+    Args:
+        vectors: Dense embeddings of the batch items.
+        projects: Project of each batch item, if any.
+        threshold: Minimum cosine similarity for a conflict.
+
+    Returns:
+        For each item, the other items it conflicts with, most similar first.
+    """
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = matrix / np.where(norms == 0, 1.0, norms)
+    similarity = matrix @ matrix.T
+    labels = np.asarray([project or "" for project in projects], dtype=object)
+    unscoped = labels == ""
+    same_scope = (labels[:, None] == labels[None, :]) | unscoped[:, None] | unscoped[None, :]
+    similarity[~same_scope] = -1.0
+    np.fill_diagonal(similarity, -1.0)
+
+    conflicts: list[list[BatchConflict]] = []
+    for row in similarity:
+        matches = np.flatnonzero(row >= threshold)
+        matches = matches[np.argsort(-row[matches], kind="stable")]
+        conflicts.append([BatchConflict(index=int(j), score=float(row[j])) for j in matches])
+    return conflicts
+
+
+@router.post("/conflict-candidates/batch", response_model=ConflictCandidateBatchResponse)
+async def get_conflict_candidates_batch(
+    request: Request,
+    batch_request: ConflictCandidateBatchRequest,
+    api_key: ApiKeyContext = search_auth,
+) -> ConflictCandidateBatchResponse:
+    """Find potential duplicate memories for a batch of new memories.
+
+    Embeds every item in one batch, searches the memory collection for all of
+    them in one ``query_batch_points`` call (each with its own project filter),
+    and also reports items in the batch that conflict with each other.
+
+    Args:
+        request: FastAPI request object with app state.
+        batch_request: Memories to check for conflicts.
+        api_key: Authenticated API key context with org_id.
+
+    Returns:
+        Conflict candidates and in-batch conflicts per item, in request order.
+
+    Raises:
+        HTTPException: If search fails.
+    """
+    start_time = time.time()
+    items = batch_request.items
+
+    logger.info(f"Batch conflict candidate search: items={len(items)}, key={api_key.prefix}")
+
+    embedder_factory = getattr(request.app.state, "embedder_factory", None)
+    qdrant = getattr(request.app.state, "qdrant", None)
+
+    if embedder_factory is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Conflict search unavailable: embedder factory not initialized",
+        )
+
+    if qdrant is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Conflict search unavailable: Qdrant not initialized",
+        )
+
+    try:
+        text_embedder = await embedder_factory.get_embedder("text")
+        vectors = await text_embedder.embed_batch([item.content for item in items], is_query=True)
+
+        shard_key = _shard_router(request).shard_key(api_key.org_id)
+        responses = await qdrant.client.query_batch_points(
+            collection_name="engram_memory",
+            requests=[
+                qdrant_models.QueryRequest(
+                    query=vector,
+                    using="text_dense",
+                    filter=_conflict_filter(api_key.org_id, item.project),
+                    limit=CONFLICT_CANDIDATE_LIMIT,
+                    score_threshold=CONFLICT_SCORE_THRESHOLD,
+                    with_payload=True,
+                    shard_key=shard_key,
+                )
+                for item, vector in zip(items, vectors, strict=True)
+            ],
+        )
+
+        batch_conflicts = _batch_conflicts(
+            vectors, [item.project for item in items], CONFLICT_SCORE_THRESHOLD
+        )
+
+    except Exception as e:
+        took_ms = int((time.time() - start_time) * 1000)
+        logger.error(
+            f"Batch conflict candidate search failed after {took_ms}ms: {e}", exc_info=True
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Conflict candidate search failed: {str(e)}",
+        ) from e
+
+    codec = _payload_codec(request)
+    results = [
+        ConflictCandidateBatchResult(
+            index=index,
+            candidates=[_to_conflict_candidate(p, codec) for p in response.points],
+            batch_conflicts=batch_conflicts[index],
+        )
+        for index, response in enumerate(responses)
+    ]
+
+    took_ms = int((time.time() - start_time) * 1000)
+    logger.info(
+        f"Batch conflict search completed: items={len(items)}, "
+        f"candidates={sum(len(r.candidates) for r in results)}, "
+        f"batch_conflicts={sum(len(r.batch_conflicts) for r in results) // 2}, "
+        f"took_ms={took_ms}"
+    )
+
+    return ConflictCandidateBatchResponse(results=results, took_ms=took_ms)
+
+
+async def _conflict_candidates_by_id(
+    request: Request,
+    conflict_request: ConflictCandidateRequest,
+    api_key: ApiKeyContext,
+    start_time: float,
+) -> list[ConflictCandidateResponse]:
+    """Find conflict candidates for an indexed memory from its stored vector."""
+    search_retriever = getattr(request.app.state, "search_retriever", None)
+    if search_retriever is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Conflict search unavailable: retriever not initialized",
+        )
+
+    try:
+        similar = await search_retriever.search_similar(
+            [conflict_request.id],
+            SearchFilters(org_id=api_key.org_id, project=conflict_request.project),
+            limit=CONFLICT_CANDIDATE_LIMIT,
+            score_threshold=CONFLICT_SCORE_THRESHOLD,
+        )
+    except Exception as e:
+        took_ms = int((time.time() - start_time) * 1000)
+        logger.error(f"Conflict candidate search failed after {took_ms}ms: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Conflict candidate search failed: {str(e)}",
+        ) from e
+
+    candidates = [_to_conflict_candidate(item, _payload_codec(request)) for item in similar[0]]
+
+    took_ms = int((time.time() - start_time) * 1000)
+    logger.info(f"Conflict search by id completed: candidates={len(candidates)}, took_ms={took_ms}")
+    return candidates
+
+
+@router.post("/similar", response_model=SimilarResponse)
+async def search_similar(
+    request: Request,
+    similar_request: SimilarRequest,
+    api_key: ApiKeyContext = search_auth,
+) -> SimilarResponse:
+    """Find points similar to already-indexed turns or memories.
+
+    Uses the stored vectors of the given points, so no embedding is computed.
+    Accepts a batch of IDs and returns one result list per ID.
+
+    Args:
+        request: FastAPI request object with app state.
+        similar_request: Source IDs, collection, vector and limits.
+        api_key: Authenticated API key context with org_id.
+
+    Returns:
+        Similar points per source ID, each excluding the source itself.
+
+    Raises:
+        HTTPException: If the request is invalid or the search fails.
+    """
+    start_time = time.time()
+
+    logger.info(
+        f"Similar request: ids={len(similar_request.ids)}, "
+        f"collection={similar_request.collection}, vector={similar_request.vector}, "
+        f"key={api_key.prefix}"
+    )
+
+    search_retriever = getattr(request.app.state, "search_retriever", None)
+    if search_retriever is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search service unavailable: retriever not initialized",
+        )
+
+    if similar_request.collection not in ("engram_memory", "engram_turns"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Similar search is not supported for collection '{similar_request.collection}'",
+        )
+
+    try:
+        vector = SimilarVector(similar_request.vector)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown vector '{similar_request.vector}'",
+        ) from e
+
+    request_filters = similar_request.filters
+    time_range = None
+    if request_filters and request_filters.time_range:
+        time_range = TimeRange(
+            start=request_filters.time_range.get("start", 0),
+            end=request_filters.time_range.get("end", 0),
+        )
+
+    # CRITICAL: org_id is mandatory for all queries (tenant isolation)
+    filters = SearchFilters(
+        org_id=api_key.org_id,
+        session_id=request_filters.session_id if request_filters else None,
+        type=request_filters.type if request_filters else None,
+        time_range=time_range,
+        vt_end_after=request_filters.vt_end_after if request_filters else None,
+        project=request_filters.project if request_filters else None,
+    )
+
+    # The turns collection is resolved to its tiers by the retriever
+    collection = (
+        "engram_memory"
+        if similar_request.collection == "engram_memory"
+        else search_retriever.turns_collection_name
+    )
+
+    try:
+        similar = await search_retriever.search_similar(
+            similar_request.ids,
+            filters,
+            collection=collection,
+            vector=vector,
+            limit=similar_request.limit,
+            score_threshold=similar_request.threshold,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    except Exception as e:
+        took_ms = int((time.time() - start_time) * 1000)
+        logger.error(f"Similar search failed after {took_ms}ms: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Similar search failed: {str(e)}",
+        ) from e
+
+    took_ms = int((time.time() - start_time) * 1000)
+    logger.info(f"Similar search completed: ids={len(similar_request.ids)}, took_ms={took_ms}")
+
+    return SimilarResponse(
+        results=[
+            SimilarResults(id=item_id, results=[_to_search_result(r) for r in items])
+            for item_id, items in zip(similar_request.ids, similar, strict=True)
+        ],
+        took_ms=took_ms,
+    )
+
+
 @router.post("/admin/{collection_name}/recreate")
 async def recreate_collection(
     request: Request,
@@ -870,18 +1444,32 @@ async def recreate_collection(
         schema_manager = SchemaManager(qdrant, settings)
 
         # Get the appropriate schema
+        quantization = quantization_from_settings(settings)
         if collection_name == "engram_memory":
-            schema = get_memory_collection_schema(collection_name)
+            schema = get_memory_collection_schema(collection_name, quantization)
         else:
             from src.services.schema_manager import get_turns_collection_schema
 
-            schema = get_turns_collection_schema(collection_name)
+            # Keep the late chunk vector: running indexers and the retriever
+            # already write and query it
+            late_chunks = late_chunks_from_settings(settings) or await schema_manager.has_vector(
+                collection_name, TURN_CHUNKS_FIELD
+            )
+            schema = get_turns_collection_schema(
+                collection_name, quantization, late_chunks=late_chunks
+            )
+        schema = apply_storage_settings(schema, settings)
+        if not _shard_router(request).enabled:
+            # This server fell back to unrouted requests (see
+            # SchemaManager.shard_router), which a custom-sharded collection rejects
+            schema = schema.model_copy(update={"shard_keys": []})
 
         # Delete existing collection
         deleted = await schema_manager.delete_collection(collection_name)
 
         # Create with new schema
         await schema_manager.create_collection(schema)
+        await schema_manager.ensure_payload_indexes(schema)
 
         logger.info(f"Collection recreated: {collection_name}, was_deleted={deleted}")
 
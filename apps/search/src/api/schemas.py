@@ -54,7 +54,37 @@ class SearchRequest(BaseModel):
     rerank_depth: int = Field(default=30, ge=1, le=100, description="Number of results to rerank")
     collection: str | None = Field(
         default=None,
-        description="Collection name (default: 'engram_turns')",
+        description=(
+            "Collection name (default: 'engram_turns'), or 'federated' to search turns "
+            "and memories together"
+        ),
+    )
+    stream: bool = Field(
+        default=False,
+        description="Stream NDJSON phases: first-stage candidates, then reranked results",
+    )
+    timeout_ms: int | None = Field(
+        default=None,
+        ge=1,
+        description="Request budget in milliseconds; stages degrade to fit it",
+    )
+    hnsw_ef: int | None = Field(
+        default=None, ge=1, description="HNSW ef for dense search (server default if None)"
+    )
+    exact: bool = Field(default=False, description="Exact (brute-force) dense search")
+    quantization_rescore: bool | None = Field(
+        default=None, description="Rescore quantized candidates with original vectors"
+    )
+    quantization_oversampling: float | None = Field(
+        default=None, ge=1.0, description="Quantized candidate oversampling factor"
+    )
+    paginate: bool = Field(
+        default=False,
+        description="Cache the reranked list up to rerank_depth and return a next_cursor",
+    )
+    cursor: str | None = Field(
+        default=None,
+        description="Cursor from the previous page; the page is served from the cached list",
     )
 
 
@@ -70,6 +100,21 @@ class SearchResult(BaseModel):
     degraded: bool = Field(
         default=False, description="Whether result is from degraded/fallback mode"
     )
+    collection: str | None = Field(
+        default=None, description="Collection the result came from (federated search)"
+    )
+
+
+class QueryPlanInfo(BaseModel):
+    """First-stage execution plan chosen by the query planner."""
+
+    mode: str = Field(description="Plan: 'exact', 'filtered_hnsw', 'hnsw', or 'manual'")
+    fetch_limit: int = Field(description="Candidates fetched from Qdrant")
+    estimated_matches: int | None = Field(
+        default=None, description="Estimated points matching the filter"
+    )
+    hnsw_ef: int | None = Field(default=None, description="HNSW ef chosen by the planner")
+    cached: bool = Field(default=False, description="Estimate served from cache")
 
 
 class SearchResponse(BaseModel):
@@ -78,6 +123,56 @@ class SearchResponse(BaseModel):
     results: list[SearchResult] = Field(description="Search results")
     total: int = Field(description="Total number of results")
     took_ms: int = Field(description="Time taken in milliseconds")
+    plan: QueryPlanInfo | None = Field(default=None, description="First-stage query plan")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page (paginated searches only)"
+    )
+
+
+class SearchPhaseEvent(BaseModel):
+    """One NDJSON line of a streaming search response."""
+
+    phase: str = Field(description="Phase: 'candidates', 'reranked', 'rerank_skipped', or 'error'")
+    results: list[SearchResult] = Field(description="Results for this phase")
+    total: int = Field(description="Number of results in this phase")
+    took_ms: int = Field(description="Time since request start in milliseconds")
+    reason: str | None = Field(default=None, description="Reason for rerank skip or error")
+    plan: QueryPlanInfo | None = Field(default=None, description="First-stage query plan")
+
+
+class SimilarRequest(BaseModel):
+    """Similar-by-id search request payload."""
+
+    ids: list[str] = Field(
+        min_length=1, max_length=100, description="Point IDs or memory node IDs (ULIDs)"
+    )
+    collection: str = Field(
+        default="engram_memory",
+        description="Collection of the points: 'engram_memory' or 'engram_turns'",
+    )
+    vector: str = Field(
+        default="dense",
+        description="Stored vector to compare: 'dense', 'sparse', or 'colbert' (turns only)",
+    )
+    limit: int = Field(default=10, ge=1, le=100, description="Maximum results per ID")
+    threshold: float | None = Field(
+        default=None, ge=0.0, le=1.0, description="Minimum similarity score threshold"
+    )
+    filters: SearchFilters | None = Field(default=None, description="Optional search filters")
+
+
+class SimilarResults(BaseModel):
+    """Points similar to one source point."""
+
+    id: str = Field(description="Source ID, as given in the request")
+    results: list[SearchResult] = Field(description="Similar points, excluding the source")
+
+
+class SimilarResponse(BaseModel):
+    """Similar-by-id search response."""
+
+    results: list[SimilarResults] = Field(description="Results per source ID, in request order")
+    took_ms: int = Field(description="Time taken in milliseconds")
 
 
 class EmbedRequest(BaseModel):
@@ -177,13 +272,22 @@ class MemoryIndexResponse(BaseModel):
     id: str = Field(description="Indexed memory ID")
     indexed: bool = Field(description="Whether indexing succeeded")
     took_ms: int = Field(description="Time taken in milliseconds")
+    unchanged: bool = Field(
+        default=False,
+        description="Content was already indexed with the current models and not re-embedded",
+    )
 
 
 class ConflictCandidateRequest(BaseModel):
     """Conflict candidate search request payload."""
 
-    content: str = Field(description="Memory content to check for conflicts")
+    content: str = Field(default="", description="Memory content to check for conflicts")
     project: str | None = Field(default=None, description="Optional project filter")
+    id: str | None = Field(
+        default=None,
+        description="Node ID of an already-indexed memory; its stored vector is used "
+        "instead of embedding content",
+    )
 
 
 class ConflictCandidateResponse(BaseModel):
@@ -194,3 +298,46 @@ class ConflictCandidateResponse(BaseModel):
     type: str = Field(description="Memory type (decision/context/insight/preference/fact)")
     score: float = Field(description="Similarity score")
     vt_start: int = Field(description="Valid time start timestamp (milliseconds since epoch)")
+
+
+class ConflictCandidateBatchItem(BaseModel):
+    """One memory in a batch conflict candidate search."""
+
+    content: str = Field(description="Memory content to check for conflicts")
+    project: str | None = Field(default=None, description="Optional project filter")
+
+
+class ConflictCandidateBatchRequest(BaseModel):
+    """Batch conflict candidate search request payload."""
+
+    items: list[ConflictCandidateBatchItem] = Field(
+        min_length=1, max_length=100, description="Memories to check for conflicts"
+    )
+
+
+class BatchConflict(BaseModel):
+    """Conflict with another memory in the same batch."""
+
+    index: int = Field(description="Index of the conflicting item in the request")
+    score: float = Field(description="Cosine similarity between the two contents")
+
+
+class ConflictCandidateBatchResult(BaseModel):
+    """Conflict candidates for one memory in a batch."""
+
+    index: int = Field(description="Index of the item in the request")
+    candidates: list[ConflictCandidateResponse] = Field(
+        description="Indexed memories similar to this item"
+    )
+    batch_conflicts: list[BatchConflict] = Field(
+        default_factory=list, description="Other items in the batch similar to this item"
+    )
+
+
+class ConflictCandidateBatchResponse(BaseModel):
+    """Batch conflict candidate search response."""
+
+    results: list[ConflictCandidateBatchResult] = Field(
+        description="Conflict candidates per item, in request order"
+    )
+    took_ms: int = Field(description="Time taken in milliseconds")
@@ -195,6 +195,105 @@ class LateChunker:
 
         return results
 
+    def embed_long(
+        self,
+        text: str,
+        chunk_tokens: int = 128,
+        max_tokens: int | None = None,
+        window_batch_size: int = 8,
+    ) -> list[LateChunkResult]:
+        """Embed fixed-size token chunks of a text longer than the model's window.
+
+        ``embed_chunks`` only sees the first ``max_seq_length`` tokens. Here the
+        text is tokenized once without truncation and split into windows of
+        ``max_seq_length`` tokens, each run through the transformer once
+        (batched), and every ``chunk_tokens`` span of a window is mean-pooled.
+        Chunks keep the context of their window at one forward pass per
+        window instead of one per chunk; token spans come from the
+        tokenizer's offsets, so no boundary estimation is needed.
+
+        Args:
+            text: Text to embed.
+            chunk_tokens: Tokens per chunk.
+            max_tokens: Tokens covered at most (the rest is ignored); all if None.
+            window_batch_size: Windows per forward pass.
+
+        Returns:
+            One LateChunkResult per chunk, in text order.
+        """
+        if not text:
+            return []
+
+        tokenizer = self.model.tokenizer
+        encoded = tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            truncation=False,
+            verbose=False,
+        )
+        ids: list[int] = encoded["input_ids"][:max_tokens]
+        offsets: list[tuple[int, int]] = encoded["offset_mapping"][:max_tokens]
+        if not ids:
+            return []
+
+        # Windows hold whole chunks between the special tokens ([CLS] first)
+        window = self.model.max_seq_length - tokenizer.num_special_tokens_to_add()
+        chunk_tokens = max(1, min(chunk_tokens, window))
+        window -= window % chunk_tokens
+        starts = list(range(0, len(ids), window))
+
+        results = []
+        for batch_start in range(0, len(starts), window_batch_size):
+            batch = starts[batch_start : batch_start + window_batch_size]
+            token_embeddings = self._get_window_embeddings(
+                [ids[start : start + window] for start in batch]
+            )
+            for row, start in enumerate(batch):
+                length = min(window, len(ids) - start)
+                for offset in range(0, length, chunk_tokens):
+                    end = min(offset + chunk_tokens, length)
+                    boundary = ChunkBoundary(
+                        start_token=start + offset,
+                        end_token=start + end,
+                        start_char=offsets[start + offset][0],
+                        end_char=offsets[start + end - 1][1],
+                    )
+                    results.append(
+                        LateChunkResult(
+                            text=text[boundary.start_char : boundary.end_char],
+                            # +1 skips the leading special token
+                            embedding=self._pool_tokens(token_embeddings[row], offset + 1, end + 1),
+                            boundary=boundary,
+                        )
+                    )
+
+        return results
+
+    def _get_window_embeddings(self, windows: list[list[int]]) -> torch.Tensor:
+        """Get per-token embeddings for a padded batch of token windows.
+
+        Args:
+            windows: Token IDs of each window, without special tokens.
+
+        Returns:
+            Tensor of shape (windows, seq_len, hidden_dim).
+        """
+        tokenizer = self.model.tokenizer
+        rows = [tokenizer.build_inputs_with_special_tokens(window) for window in windows]
+        width = max(len(row) for row in rows)
+        pad = tokenizer.pad_token_id or 0
+        input_ids = torch.tensor(
+            [row + [pad] * (width - len(row)) for row in rows], device=self._device
+        )
+        attention_mask = torch.tensor(
+            [[1] * len(row) + [0] * (width - len(row)) for row in rows], device=self._device
+        )
+
+        with torch.no_grad():
+            outputs = self.model.forward({"input_ids": input_ids, "attention_mask": attention_mask})
+        return outputs["token_embeddings"]
+
     def _get_token_embeddings(self, text: str) -> torch.Tensor | None:
         """Get per-token embeddings from the transformer.
 
@@ -8,6 +8,7 @@ import httpx
 import numpy as np
 from huggingface_hub import AsyncInferenceClient
 
+from src.embedders.scheduler import EmbeddingLane, EmbeddingScheduler, default_lane
 from src.rerankers.base import BaseReranker, RankedResult
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ class HuggingFaceEmbedder:
         timeout: int = 30,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        max_concurrency: int = 16,
     ) -> None:
         """Initialize the HuggingFace embedder client.
 
@@ -48,11 +50,13 @@ class HuggingFaceEmbedder:
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retry attempts on failure.
             retry_delay: Base delay between retries in seconds (exponential backoff).
+            max_concurrency: API requests in flight, shared by all priority lanes.
         """
         self.model_id = model_id
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.scheduler = EmbeddingScheduler("huggingface", concurrency=max_concurrency)
 
         # Get model configuration
         self.config = self.MODEL_CONFIGS.get(model_id, {"dimensions": 768, "query_prefix": ""})
@@ -82,12 +86,15 @@ class HuggingFaceEmbedder:
         """
         logger.debug(f"HuggingFaceEmbedder '{self.model_id}' ready (API-based)")
 
-    async def embed(self, text: str, is_query: bool = True) -> list[float]:
+    async def embed(
+        self, text: str, is_query: bool = True, lane: EmbeddingLane | str | None = None
+    ) -> list[float]:
         """Generate embedding for a single text.
 
         Args:
             text: Text to embed.
             is_query: Whether this is a query (vs document). Queries may use special prefixes.
+            lane: Priority lane (default: query for queries, else live).
 
         Returns:
             Embedding vector as list of floats.
@@ -95,6 +102,11 @@ class HuggingFaceEmbedder:
         Raises:
             httpx.HTTPError: If the API request fails after all retries.
         """
+        return await self.scheduler.run(
+            lane or default_lane(is_query), lambda: self._embed(text, is_query)
+        )
+
+    async def _embed(self, text: str, is_query: bool) -> list[float]:
         # Apply query prefix if needed
         if is_query and self.config["query_prefix"]:
             text = self.config["query_prefix"] + text
@@ -156,12 +168,18 @@ class HuggingFaceEmbedder:
         # All retries exhausted
         raise httpx.HTTPError(f"Failed to generate embedding after {self.max_retries} attempts")
 
-    async def embed_batch(self, texts: list[str], is_query: bool = True) -> list[list[float]]:
+    async def embed_batch(
+        self,
+        texts: list[str],
+        is_query: bool = True,
+        lane: EmbeddingLane | str | None = None,
+    ) -> list[list[float]]:
         """Generate embeddings for multiple texts.
 
         Args:
             texts: List of texts to embed.
             is_query: Whether these are queries (vs documents).
+            lane: Priority lane (default: query for queries, else live).
 
         Returns:
             List of embedding vectors.
@@ -171,7 +189,7 @@ class HuggingFaceEmbedder:
         """
         # Process each text individually (API doesn't support true batching for feature_extraction)
         # Use asyncio.gather for concurrent requests
-        tasks = [self.embed(text, is_query=is_query) for text in texts]
+        tasks = [self.embed(text, is_query=is_query, lane=lane) for text in texts]
         return await asyncio.gather(*tasks)
 
     async def close(self) -> None:
@@ -1,16 +1,22 @@
 """Async NATS JetStream client wrapper."""
 
+import asyncio
+import contextlib
 import json
 import logging
 import os
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 import nats
+from nats.aio.msg import Msg
 from nats.js import JetStreamContext
 from nats.js.api import AckPolicy, ConsumerConfig, DeliverPolicy
 from pydantic import BaseModel, Field
 
+from src.utils.metrics import set_nats_consumer_lag
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +25,141 @@ class NatsClientConfig(BaseModel):
 
     servers: str = Field(default="nats://localhost:4222", description="NATS server URL")
     client_name: str = Field(default="search-service", description="NATS client name")
+    fetch_batch: int = Field(default=10, ge=1, description="Initial messages per pull fetch")
+    fetch_max_batch: int = Field(
+        default=256, ge=1, description="Upper bound for the adaptive fetch size"
+    )
+    fetch_target_ms: int = Field(
+        default=1000,
+        ge=1,
+        description="Handling time per fetched batch above which the fetch size shrinks",
+    )
+    pull_workers: int = Field(
+        default=1, ge=1, description="Concurrent pull workers per durable consumer"
+    )
+    fetch_pause_ms: int = Field(
+        default=100, ge=1, description="Wait before re-checking capacity when the consumer is full"
+    )
+    nak_delay_ms: int = Field(
+        default=1000, ge=0, description="Redelivery delay after the first failed delivery"
+    )
+    nak_max_delay_ms: int = Field(
+        default=60000, ge=0, description="Cap on the exponential redelivery delay"
+    )
+    ack_wait_s: float = Field(
+        default=60.0, gt=0, description="Time an unsettled delivery waits before redelivery"
+    )
+    max_deliver: int = Field(
+        default=10, ge=1, description="Deliveries per message before JetStream gives up on it"
+    )
+    lag_report_interval_s: float = Field(
+        default=15.0, gt=0, description="Interval between consumer lag metric updates"
+    )
+
+
+class AdaptiveFetchSize:
+    """Pull fetch size adapted to how fast fetched batches are handled.
+
+    The size doubles while full batches are handled within the target time, so
+    a backlog is drained in large fetches, and halves whenever a batch takes
+    longer, e.g. because the downstream queue is applying backpressure. Shared
+    by all pull workers of a subscription.
+    """
+
+    def __init__(self, initial: int, maximum: int, target_ms: float, minimum: int = 1) -> None:
+        """Initialize the fetch size.
+
+        Args:
+            initial: Starting fetch size.
+            maximum: Largest fetch size.
+            target_ms: Handling time per batch above which the size shrinks.
+            minimum: Smallest fetch size.
+        """
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.target_ms = target_ms
+        self.size = min(max(initial, minimum), self.maximum)
+
+    def record(self, requested: int, received: int, elapsed_ms: float) -> None:
+        """Adjust the size after a fetched batch has been handled.
+
+        Args:
+            requested: Messages requested from the server.
+            received: Messages actually delivered.
+            elapsed_ms: Time spent handling the delivered messages.
+        """
+        if received == 0:
+            return
+        if elapsed_ms > self.target_ms:
+            self.size = max(self.minimum, self.size // 2)
+        elif received >= requested:
+            self.size = min(self.maximum, self.size * 2)
+
+
+class MessageDelivery:
+    """Settlement handle for one JetStream message.
+
+    Manual-ack handlers keep the handle and settle it once the message has been
+    durably processed (ack) or has failed (nak, redelivered after an
+    exponential backoff on the delivery count). Settling twice is a no-op.
+    Until then the subscription extends its ack wait with in-progress acks.
+    """
+
+    def __init__(self, msg: Msg, nak_delay_ms: int = 1000, nak_max_delay_ms: int = 60000) -> None:
+        """Initialize the handle.
+
+        Args:
+            msg: JetStream message to settle.
+            nak_delay_ms: Redelivery delay after the first failed delivery.
+            nak_max_delay_ms: Cap on the redelivery delay.
+        """
+        self.msg = msg
+        self.nak_delay_ms = nak_delay_ms
+        self.nak_max_delay_ms = nak_max_delay_ms
+        self.settled = False
+
+    async def ack(self) -> None:
+        """Acknowledge the message so it is never redelivered."""
+        await self._settle("ack", self.msg.ack)
+
+    async def nak(self) -> None:
+        """Reject the message for redelivery after a backoff delay."""
+        await self._settle("nak", self.msg.nak, self.nak_delay_s)
+
+    async def term(self) -> None:
+        """Reject the message permanently (it can never be processed)."""
+        await self._settle("term", self.msg.term)
+
+    async def in_progress(self) -> None:
+        """Reset the message's ack wait while it is still queued or being processed."""
+        if self.settled:
+            return
+        try:
+            await self.msg.in_progress()
+        except Exception as e:
+            logger.warning(f"Failed to extend ack wait on {self.msg.subject}: {e}")
+
+    @property
+    def nak_delay_s(self) -> float:
+        """Backoff before redelivery, doubling with every failed delivery."""
+        try:
+            delivered = max(int(self.msg.metadata.num_delivered), 1)
+        except (AttributeError, TypeError, ValueError):
+            delivered = 1
+        delay_ms = min(self.nak_delay_ms * 2 ** min(delivered - 1, 30), self.nak_max_delay_ms)
+        return delay_ms / 1000.0
+
+    async def _settle(
+        self, action: str, settle: Callable[..., Awaitable[None]], *args: Any
+    ) -> None:
+        if self.settled:
+            return
+        self.settled = True
+        try:
+            await settle(*args)
+        except Exception as e:
+            # Unsettled messages are redelivered once the ack wait expires
+            logger.warning(f"Failed to {action} message on {self.msg.subject}: {e}")
 
 
 class NatsClient:
@@ -90,49 +231,115 @@ class NatsClient:
         self,
         topic: str,
         group_id: str,
-        handler: Callable[[str, dict[str, Any]], Awaitable[None]],
+        handler: Callable[..., Awaitable[None]],
+        manual_ack: bool = False,
+        capacity: Callable[[], int] | None = None,
     ) -> None:
         """Subscribe to a topic and process messages.
 
+        By default each message is acked once the handler returns. With
+        ``manual_ack`` the handler is called as ``handler(subject, data,
+        delivery)`` and owns the MessageDelivery: it must ack or nak it, e.g.
+        after the message's content has been written. Messages whose handler
+        raises are nak'ed with backoff either way; bodies that are not valid
+        JSON are terminated.
+
+        ``pull_workers`` workers fetch from the same durable consumer
+        concurrently. Fetch sizes adapt between 1 and ``fetch_max_batch`` (see
+        AdaptiveFetchSize), and the consumer's pending count is reported as
+        the ``nats_consumer_lag`` metric.
+
+        Deliveries not yet settled get an in-progress ack every third of
+        ``ack_wait_s``, so messages waiting in batches or the indexing pipeline
+        are not redelivered to other workers meanwhile. A message is delivered
+        at most ``max_deliver`` times. Both are only applied when the durable
+        consumer is created.
+
         Args:
             topic: Topic name.
             group_id: Consumer group ID (becomes durable consumer name).
             handler: Async callback for processing messages.
+            manual_ack: Pass each message's MessageDelivery to the handler
+                instead of acking on return.
+            capacity: Returns how many more messages the handler can accept;
+                fetches are shrunk to fit, and paused while it is 0.
         """
         await self.connect()
 
         subject = self._topic_to_subject(topic)
         stream = self._subject_to_stream(subject)
+        workers = self.config.pull_workers
 
         logger.info(f"Subscribing to {subject} on stream {stream} as {group_id}")
 
-        # Create or get the pull subscription
-        psub = await self._js.pull_subscribe(
-            subject=subject,
-            durable=group_id,
-            stream=stream,
-            config=ConsumerConfig(
-                durable_name=group_id,
-                ack_policy=AckPolicy.EXPLICIT,
-                deliver_policy=DeliverPolicy.ALL,
-            ),
+        # One pull subscription per worker, all bound to the same durable consumer
+        psubs = [
+            await self._js.pull_subscribe(
+                subject=subject,
+                durable=group_id,
+                stream=stream,
+                config=ConsumerConfig(
+                    durable_name=group_id,
+                    ack_policy=AckPolicy.EXPLICIT,
+                    deliver_policy=DeliverPolicy.ALL,
+                    ack_wait=self.config.ack_wait_s,
+                    max_deliver=self.config.max_deliver,
+                ),
+            )
+            for _ in range(workers)
+        ]
+        fetch_size = AdaptiveFetchSize(
+            initial=self.config.fetch_batch,
+            maximum=self.config.fetch_max_batch,
+            target_ms=self.config.fetch_target_ms,
         )
 
-        logger.info(f"Started consuming from {subject}")
-
+        logger.info(f"Started consuming from {subject} with {workers} pull workers")
+
+        in_flight: set[MessageDelivery] = set()
+        tasks = [
+            asyncio.create_task(self._report_lag(topic, psubs[0])),
+            asyncio.create_task(self._extend_in_flight(in_flight)),
+        ]
+        try:
+            await asyncio.gather(
+                *(
+                    self._pull_loop(psub, handler, manual_ack, capacity, fetch_size, in_flight)
+                    for psub in psubs
+                )
+            )
+        finally:
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    async def _pull_loop(
+        self,
+        psub: JetStreamContext.PullSubscription,
+        handler: Callable[..., Awaitable[None]],
+        manual_ack: bool,
+        capacity: Callable[[], int] | None,
+        fetch_size: AdaptiveFetchSize,
+        in_flight: set[MessageDelivery],
+    ) -> None:
+        """Fetch and handle messages for one pull worker until cancelled."""
+        workers = self.config.pull_workers
         while True:
             try:
-                # Fetch messages in batches
-                msgs = await psub.fetch(batch=10, timeout=5)
-
-                for msg in msgs:
-                    try:
-                        data = json.loads(msg.data.decode("utf-8"))
-                        await handler(msg.subject, data)
-                        await msg.ack()
-                    except Exception as e:
-                        logger.error(f"Error processing message: {e}", exc_info=True)
-                        await msg.nak()
+                # Fetch no more than this worker's share of what the handler can take
+                batch = fetch_size.size
+                if capacity is not None:
+                    batch = min(batch, -(-capacity() // workers))
+                    if batch <= 0:
+                        await asyncio.sleep(self.config.fetch_pause_ms / 1000.0)
+                        continue
+                msgs = await psub.fetch(batch=batch, timeout=5)
+
+                start = time.perf_counter()
+                await self._handle_batch(msgs, handler, manual_ack, in_flight)
+                fetch_size.record(batch, len(msgs), (time.perf_counter() - start) * 1000)
 
             except nats.errors.TimeoutError:
                 # No messages available, continue polling
@@ -141,6 +348,54 @@ class NatsClient:
                 logger.error(f"Error fetching messages: {e}", exc_info=True)
                 continue
 
+    async def _handle_batch(
+        self,
+        msgs: list[Msg],
+        handler: Callable[..., Awaitable[None]],
+        manual_ack: bool,
+        in_flight: set[MessageDelivery] | None = None,
+    ) -> None:
+        """Decode a fetched batch off the event loop, then handle it in order."""
+        decoded = await asyncio.to_thread(_decode_all, msgs)
+
+        for msg, data in zip(msgs, decoded, strict=True):
+            delivery = MessageDelivery(msg, self.config.nak_delay_ms, self.config.nak_max_delay_ms)
+            if isinstance(data, Exception):
+                # Redelivery cannot fix a malformed body
+                logger.error(f"Terminating undecodable message on {msg.subject}: {data}")
+                await delivery.term()
+                continue
+            if in_flight is not None:
+                in_flight.add(delivery)
+            try:
+                if manual_ack:
+                    await handler(msg.subject, data, delivery)
+                else:
+                    await handler(msg.subject, data)
+                    await delivery.ack()
+            except Exception as e:
+                logger.error(f"Error processing message: {e}", exc_info=True)
+                await delivery.nak()
+
+    async def _report_lag(self, topic: str, psub: JetStreamContext.PullSubscription) -> None:
+        """Periodically export the durable consumer's pending message count."""
+        while True:
+            try:
+                info = await psub.consumer_info()
+                set_nats_consumer_lag(topic, 0, info.num_pending or 0)
+            except Exception as e:
+                logger.warning(f"Failed to read consumer lag for {topic}: {e}")
+            await asyncio.sleep(self.config.lag_report_interval_s)
+
+    async def _extend_in_flight(self, in_flight: set[MessageDelivery]) -> None:
+        """Send in-progress acks for unsettled deliveries until cancelled."""
+        while True:
+            await asyncio.sleep(self.config.ack_wait_s / 3)
+            settled = {delivery for delivery in in_flight if delivery.settled}
+            in_flight.difference_update(settled)
+            if in_flight:
+                await asyncio.gather(*(delivery.in_progress() for delivery in list(in_flight)))
+
     async def close(self) -> None:
         """Close the NATS connection."""
         if self._nc is not None:
@@ -169,3 +424,14 @@ class NatsClient:
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
         await self.close()
+
+
+def _decode_all(msgs: list[Msg]) -> list[Any]:
+    """Decode JSON message bodies, returning the exception for undecodable ones."""
+    decoded: list[Any] = []
+    for msg in msgs:
+        try:
+            decoded.append(json.loads(msg.data.decode("utf-8")))
+        except Exception as e:
+            decoded.append(e)
+    return decoded
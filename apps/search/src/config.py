@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     search_host: str = Field(default="0.0.0.0", description="Server host")
     search_port: int = Field(default=6176, description="Server port")
     search_workers: int = Field(default=1, description="Number of worker processes")
+    service_mode: str = Field(
+        default="all",
+        description="all: search API plus in-process indexing consumers; search: API only",
+    )
     debug: bool = Field(default=False, description="Enable debug mode")
 
     # Qdrant
@@ -30,6 +34,96 @@ class Settings(BaseSettings):
     qdrant_prefer_grpc: bool = Field(
         default=False, description="Prefer gRPC over HTTP for better performance"
     )
+    qdrant_quantization: str | None = Field(
+        default=None,
+        description=(
+            "Dense/ColBERT vector quantization: 'scalar', 'product', 'binary' (off if None)"
+        ),
+    )
+    qdrant_quantization_always_ram: bool = Field(
+        default=True, description="Keep quantized vectors in RAM when originals are on disk"
+    )
+    qdrant_dense_on_disk: bool = Field(
+        default=False, description="Store dense vectors on disk (mmap) instead of RAM"
+    )
+    qdrant_dense_hnsw_on_disk: bool = Field(
+        default=False, description="Store the dense HNSW graph on disk instead of RAM"
+    )
+    qdrant_colbert_on_disk: bool = Field(
+        default=False, description="Store ColBERT multi-vectors (rescoring only) on disk"
+    )
+    qdrant_colbert_hnsw_on_disk: bool = Field(
+        default=False, description="Store the ColBERT HNSW graph on disk instead of RAM"
+    )
+    qdrant_sparse_index_on_disk: bool = Field(
+        default=False, description="Store sparse inverted indexes on disk instead of RAM"
+    )
+    qdrant_payload_on_disk: bool | None = Field(
+        default=None, description="Store payloads on disk (Qdrant default if None)"
+    )
+    qdrant_memmap_threshold_kb: int | None = Field(
+        default=None, ge=0, description="Segment size (KB) above which vectors are mmapped"
+    )
+    qdrant_indexing_threshold_kb: int | None = Field(
+        default=None, ge=0, description="Segment size (KB) above which HNSW is built"
+    )
+    qdrant_shard_by_org: bool = Field(
+        default=False,
+        description="Route points and searches to custom shard keys by org_id",
+    )
+    qdrant_dedicated_shard_orgs: list[str] = Field(
+        default_factory=list,
+        description="Orgs with a shard key of their own; all others share the default key",
+    )
+    qdrant_default_shard_key: str = Field(
+        default="default", description="Shard key shared by orgs without a dedicated shard"
+    )
+    qdrant_shards_per_key: int = Field(
+        default=1, ge=1, description="Physical shards created per shard key"
+    )
+    qdrant_turns_tiering_enabled: bool = Field(
+        default=False,
+        description="Split turns into a hot (recent, RAM) and a cold (older, on-disk) collection",
+    )
+    qdrant_turns_cold_collection: str = Field(
+        default="engram_turns_cold", description="Cold-tier collection for turns past the window"
+    )
+    qdrant_turns_hot_window_hours: float = Field(
+        default=168.0, gt=0.0, description="Age (hours) after which turns move to the cold tier"
+    )
+    qdrant_turns_cold_quantization: str | None = Field(
+        default="scalar",
+        description="Cold-tier dense/ColBERT quantization: 'scalar', 'product', 'binary' or None",
+    )
+    qdrant_turns_tier_migration_enabled: bool = Field(
+        default=False,
+        description="Run the hot-to-cold turn migration in this server (enable on one process)",
+    )
+    qdrant_turns_tier_migration_interval_s: float = Field(
+        default=900.0, gt=0.0, description="Seconds between hot-to-cold migration runs"
+    )
+    qdrant_turns_tier_migration_batch_size: int = Field(
+        default=256, ge=1, description="Points moved per round trip during tier migration"
+    )
+    payload_compression_enabled: bool = Field(
+        default=False,
+        description="zstd-compress large turn and memory payload fields (needs zstandard)",
+    )
+    payload_compression_fields: list[str] = Field(
+        default=["content", "tool_calls"],
+        description="Payload fields eligible for compression (never payload-indexed fields)",
+    )
+    payload_compression_min_bytes: int = Field(
+        default=1024, ge=0, description="Only compress field values at least this large"
+    )
+    payload_compression_level: int = Field(
+        default=3, ge=1, le=22, description="zstd compression level"
+    )
+    payload_compression_dictionaries: list[str] = Field(
+        default_factory=list,
+        description="Trained zstd dictionary files, newest (used for writes) first; keep old "
+        "ones listed while payloads compressed with them remain",
+    )
 
     # OAuth introspection (for token validation)
     oauth_introspection_url: str = Field(
@@ -62,6 +156,68 @@ class Settings(BaseSettings):
         default=True, description="Enable NATS consumer for turn indexing"
     )
     nats_consumer_group: str = Field(default="search-group", description="NATS consumer group ID")
+    nats_pull_workers: int = Field(
+        default=4, ge=1, description="Concurrent pull workers per NATS durable consumer"
+    )
+    nats_fetch_max_batch: int = Field(
+        default=256, ge=1, description="Upper bound for the adaptive NATS fetch size"
+    )
+    nats_ack_wait_s: float = Field(
+        default=60.0, gt=0, description="Seconds an unacked NATS delivery waits before redelivery"
+    )
+    nats_max_deliver: int = Field(
+        default=10, ge=1, description="Deliveries per NATS message before it is given up"
+    )
+    nats_memory_consumer_enabled: bool = Field(
+        default=False, description="Also consume memory node events in indexing workers"
+    )
+    indexing_workers: int = Field(
+        default=1, ge=1, description="Processes started by the standalone indexing worker"
+    )
+    indexing_upsert_chunk_bytes: int = Field(
+        default=4 * 1024 * 1024,
+        ge=1,
+        description="Approximate vector and payload bytes per indexing upsert request",
+    )
+    indexing_upsert_concurrency: int = Field(
+        default=4, ge=1, description="Upsert requests in flight per indexing batch"
+    )
+    indexing_upsert_wait: bool = Field(
+        default=True, description="Wait for indexing upserts to be applied, not just accepted"
+    )
+    indexing_upsert_ordering: str | None = Field(
+        default=None, description="Indexing upsert write ordering: weak, medium or strong"
+    )
+    indexing_upsert_retries: int = Field(
+        default=3, ge=0, description="Retries with backoff per indexing upsert request"
+    )
+    indexing_pipeline_depth: int = Field(
+        default=2,
+        ge=1,
+        description="Batches queued between the embed and upsert stages of indexing consumers",
+    )
+    session_centroids_enabled: bool = Field(
+        default=False,
+        description=(
+            "Maintain per-session mean vectors in the sessions collection while indexing turns"
+        ),
+    )
+    session_centroids_collection: str = Field(
+        default="sessions", description="Collection holding the session centroids"
+    )
+    session_centroid_sparse_terms: int = Field(
+        default=256,
+        ge=0,
+        description="Top sparse terms kept per session aggregate (0 disables the sparse vector)",
+    )
+    late_chunking_enabled: bool = Field(
+        default=False,
+        description="Index late-chunked dense vectors of whole turns and search them with max-sim",
+    )
+    late_chunk_tokens: int = Field(default=128, ge=16, description="Tokens per late chunk")
+    late_chunk_max_tokens: int = Field(
+        default=8192, ge=1, description="Tokens of a turn covered by late chunks at most"
+    )
 
     # Search defaults (to be used in Phase 4)
     search_default_limit: int = Field(default=10, description="Default search result limit")
@@ -80,6 +236,84 @@ class Settings(BaseSettings):
         default="hybrid",
         description="Search strategy: 'dense', 'sparse', or 'hybrid'",
     )
+    search_payload_projection: bool = Field(
+        default=True,
+        description="Fetch only first-stage payload fields when oversampling for reranking "
+        "and hydrate full payloads for the final results",
+    )
+    search_first_stage_payload_fields: list[str] = Field(
+        default=["content", "session_id", "type", "timestamp"],
+        description="Payload fields fetched for reranking candidates when projection is on",
+    )
+    search_hybrid_fusion: str = Field(
+        default="rrf",
+        description="Hybrid fusion method: 'rrf', 'dbsf', or 'linear' (alpha-weighted)",
+    )
+    search_hybrid_min_branch_weight: float = Field(
+        default=0.15,
+        ge=0.0,
+        le=0.5,
+        description="Skip embedding a hybrid branch whose alpha weight falls below this value",
+    )
+    search_deadline_rerank_share: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Share of a request's remaining deadline budget reserved for reranking",
+    )
+    search_deadline_min_rerank_ms: int = Field(
+        default=50,
+        ge=0,
+        description="Skip reranking (and oversampling) when less budget than this remains",
+    )
+    search_hnsw_ef: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            'Per-strategy HNSW ef at query time, e.g. {"dense": 128} (Qdrant default if unset)'
+        ),
+    )
+    search_quantization_rescore: bool = Field(
+        default=True, description="Rescore quantized candidates with original vectors"
+    )
+    search_quantization_oversampling: float | None = Field(
+        default=None,
+        ge=1.0,
+        description="Fetch this many times more quantized candidates before rescoring",
+    )
+    search_planner_enabled: bool = Field(
+        default=True,
+        description="Pick exact vs HNSW search per query from the estimated filter cardinality",
+    )
+    search_planner_exact_threshold: int = Field(
+        default=5000,
+        ge=0,
+        description="Use exact search when a filter matches at most this many points",
+    )
+    search_planner_filtered_threshold: int = Field(
+        default=50000,
+        ge=0,
+        description="Raise hnsw_ef when a filter matches at most this many points",
+    )
+    search_planner_filtered_hnsw_ef: int = Field(
+        default=256, ge=1, description="HNSW ef for restrictive filters above the exact threshold"
+    )
+    search_planner_count_cache_ttl_s: float = Field(
+        default=30.0, ge=0.0, description="Seconds to cache filter cardinality estimates"
+    )
+    search_planner_count_cache_size: int = Field(
+        default=4096, ge=0, description="Maximum cached filter cardinality estimates"
+    )
+    search_page_cache_ttl_s: float = Field(
+        default=300.0, ge=0.0, description="Seconds a paginated result list stays cached"
+    )
+    search_page_cache_size: int = Field(
+        default=1024, ge=0, description="Maximum cached paginated result lists"
+    )
+    search_page_cache_max_results: int = Field(
+        default=50000,
+        ge=0,
+        description="Maximum result items held across all cached result lists",
+    )
 
     # Embedders
     embedder_device: str = Field(
@@ -102,6 +336,10 @@ class Settings(BaseSettings):
     embedder_cache_size: int = Field(default=10000, description="Embedding cache size (LRU)")
     embedder_cache_ttl: int = Field(default=3600, description="Embedding cache TTL in seconds")
     embedder_preload: bool = Field(default=True, description="Preload models during startup")
+    embedder_lane_weights: dict[str, float] = Field(
+        default_factory=lambda: {"query": 8.0, "live": 4.0, "bulk": 1.0},
+        description="Embedder share per priority lane (query, live, bulk) under contention",
+    )
 
     # Hugging Face
     hf_api_token: str = Field(default="", description="Hugging Face API token")
@@ -170,6 +408,49 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",")]
         return v
 
+    @field_validator("qdrant_quantization", "qdrant_turns_cold_quantization")
+    @classmethod
+    def validate_qdrant_quantization(cls, v: str | None) -> str | None:
+        """Validate the vector quantization method."""
+        if v is not None and v not in ["scalar", "product", "binary"]:
+            raise ValueError(f"Quantization must be 'scalar', 'product' or 'binary', got '{v}'")
+        return v
+
+    @field_validator("indexing_upsert_ordering")
+    @classmethod
+    def validate_upsert_ordering(cls, v: str | None) -> str | None:
+        """Validate the Qdrant write ordering."""
+        if v is not None and v not in ["weak", "medium", "strong"]:
+            raise ValueError(f"Write ordering must be 'weak', 'medium' or 'strong', got '{v}'")
+        return v
+
+    @field_validator("service_mode")
+    @classmethod
+    def validate_service_mode(cls, v: str) -> str:
+        """Validate the server mode."""
+        if v not in ["all", "search"]:
+            raise ValueError(f"Service mode must be 'all' or 'search', got '{v}'")
+        return v
+
+    @field_validator("search_hybrid_fusion")
+    @classmethod
+    def validate_hybrid_fusion(cls, v: str) -> str:
+        """Validate the default hybrid fusion method."""
+        if v not in ["rrf", "dbsf", "linear"]:
+            raise ValueError(f"Hybrid fusion must be 'rrf', 'dbsf' or 'linear', got '{v}'")
+        return v
+
+    @field_validator("embedder_lane_weights")
+    @classmethod
+    def validate_embedder_lane_weights(cls, v: dict[str, float]) -> dict[str, float]:
+        """Validate embedder priority lane weights."""
+        for lane, weight in v.items():
+            if lane not in ["query", "live", "bulk"]:
+                raise ValueError(f"Lane must be 'query', 'live' or 'bulk', got '{lane}'")
+            if weight <= 0:
+                raise ValueError(f"Lane weight must be positive, got {lane}={weight}")
+        return v
+
     @field_validator("embedder_backend", "reranker_backend")
     @classmethod
     def validate_huggingface_backend(cls, v: str, info) -> str:
@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from src.embedders.scheduler import EmbeddingLane, EmbeddingScheduler, default_lane
+
 logger = logging.getLogger(__name__)
 
 # Optional torch import for local embedders
@@ -51,6 +53,10 @@ class BaseEmbedder(ABC):
         self.batch_size = batch_size
         self.cache_size = cache_size
         self._executor = ThreadPoolExecutor(max_workers=1)
+        # Orders jobs for the executor by priority lane (query, live, bulk)
+        self.scheduler = EmbeddingScheduler(
+            self.__class__.__name__.removesuffix("Embedder").lower()
+        )
         self._model: Any = None
         self._model_loaded = False
 
@@ -125,12 +131,15 @@ class BaseEmbedder(ABC):
         """
         pass
 
-    async def embed(self, text: str, is_query: bool = True) -> list[float]:
+    async def embed(
+        self, text: str, is_query: bool = True, lane: EmbeddingLane | str | None = None
+    ) -> list[float]:
         """Async embedding of a single text.
 
         Args:
                 text: Text to embed.
                 is_query: Whether this is a query.
+                lane: Priority lane (default: query for queries, else live).
 
         Returns:
                 Embedding vector.
@@ -139,14 +148,23 @@ class BaseEmbedder(ABC):
             await self.load()
 
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._embed_sync, text, is_query)
+        return await self.scheduler.run(
+            lane or default_lane(is_query),
+            lambda: loop.run_in_executor(self._executor, self._embed_sync, text, is_query),
+        )
 
-    async def embed_batch(self, texts: list[str], is_query: bool = True) -> list[list[float]]:
+    async def embed_batch(
+        self,
+        texts: list[str],
+        is_query: bool = True,
+        lane: EmbeddingLane | str | None = None,
+    ) -> list[list[float]]:
         """Async batch embedding.
 
         Args:
                 texts: List of texts to embed.
                 is_query: Whether these are queries.
+                lane: Priority lane (default: query for queries, else live).
 
         Returns:
                 List of embedding vectors.
@@ -155,7 +173,11 @@ class BaseEmbedder(ABC):
             await self.load()
 
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._embed_batch_sync, texts, is_query)
+        return await self.scheduler.run(
+            lane or default_lane(is_query),
+            lambda: loop.run_in_executor(self._executor, self._embed_batch_sync, texts, is_query),
+            cost=len(texts),
+        )
 
     async def load(self) -> None:
         """Load the model asynchronously.
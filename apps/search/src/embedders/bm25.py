@@ -13,6 +13,8 @@ from functools import lru_cache
 
 from fastembed import SparseTextEmbedding
 
+from src.embedders.scheduler import EmbeddingLane
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,11 +109,14 @@ class BM25Embedder:
         values = sparse_embedding.values.tolist()
         return dict(zip(indices, values, strict=True))
 
-    async def embed_sparse_async(self, text: str) -> dict[int, float]:
+    async def embed_sparse_async(
+        self, text: str, lane: EmbeddingLane | str = EmbeddingLane.QUERY
+    ) -> dict[int, float]:
         """Async version of embed_sparse.
 
         Args:
             text: Text to embed.
+            lane: Priority lane (unused: BM25 runs on the default executor).
 
         Returns:
             Dictionary mapping token indices to weights.
@@ -145,11 +150,14 @@ class BM25Embedder:
             results.append(dict(zip(indices, values, strict=True)))
         return results
 
-    async def embed_sparse_batch_async(self, texts: list[str]) -> list[dict[int, float]]:
+    async def embed_sparse_batch_async(
+        self, texts: list[str], lane: EmbeddingLane | str = EmbeddingLane.LIVE
+    ) -> list[dict[int, float]]:
         """Async version of embed_sparse_batch.
 
         Args:
             texts: List of texts to embed.
+            lane: Priority lane (unused: BM25 runs on the default executor).
 
         Returns:
             List of dictionaries mapping token indices to weights.
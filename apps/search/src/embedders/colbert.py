@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 import numpy as np
 
 from src.embedders.base import BaseEmbedder
+from src.embedders.scheduler import EmbeddingLane
 
 logger = logging.getLogger(__name__)
 
@@ -199,6 +201,28 @@ class ColBERTEmbedder(BaseEmbedder):
             for emb in embeddings
         ]
 
+    async def embed_document_batch_async(
+        self, documents: list[str], lane: EmbeddingLane | str = EmbeddingLane.LIVE
+    ) -> list[list[list[float]]]:
+        """Async batch document embedding, scheduled in a priority lane.
+
+        Args:
+            documents: List of document texts.
+            lane: Priority lane (default: live).
+
+        Returns:
+            List of multi-vector embeddings (one per document).
+        """
+        if not self._model_loaded:
+            await self.load()
+
+        loop = asyncio.get_event_loop()
+        return await self.scheduler.run(
+            lane,
+            lambda: loop.run_in_executor(self._executor, self.embed_document_batch, documents),
+            cost=len(documents),
+        )
+
     @property
     def dimensions(self) -> int:
         """Get embedding dimensions per token.
@@ -71,6 +71,7 @@ class EmbedderFactory:
                         batch_size=self.settings.embedder_batch_size,
                         cache_size=self.settings.embedder_cache_size,
                     )
+                self._apply_lane_weights(self._embedders["text"])
             return self._embedders["text"]
 
     async def get_code_embedder(self) -> Any:
@@ -103,6 +104,7 @@ class EmbedderFactory:
                         batch_size=self.settings.embedder_batch_size,
                         cache_size=self.settings.embedder_cache_size,
                     )
+                self._apply_lane_weights(self._embedders["code"])
             return self._embedders["code"]
 
     async def get_sparse_embedder(self) -> Any:
@@ -144,6 +146,7 @@ class EmbedderFactory:
                         batch_size=self.settings.embedder_batch_size,
                         cache_size=self.settings.embedder_cache_size,
                     )
+                    self._apply_lane_weights(self._embedders["sparse"])
                 return self._embedders["sparse"]
 
     async def get_colbert_embedder(self) -> Any:
@@ -169,6 +172,7 @@ class EmbedderFactory:
                     batch_size=self.settings.embedder_batch_size,
                     cache_size=self.settings.embedder_cache_size,
                 )
+                self._apply_lane_weights(self._embedders["colbert"])
             return self._embedders["colbert"]
 
     async def get_embedder(self, embedder_type: EmbedderType) -> BaseEmbedder:
@@ -241,6 +245,31 @@ class EmbedderFactory:
         self._embedders.clear()
         logger.info("All embedder models unloaded")
 
+    def _apply_lane_weights(self, embedder: Any) -> None:
+        # BM25 runs on the default executor and has no scheduler
+        scheduler = getattr(embedder, "scheduler", None)
+        if scheduler is not None:
+            scheduler.set_weights(self.settings.embedder_lane_weights)
+
+    def model_versions(self) -> dict[str, str]:
+        """Get the model identifier behind each embedder type.
+
+        Indexers fingerprint stored vectors with these, so changing a model
+        makes existing points count as changed.
+
+        Returns:
+                Mapping of embedder type ("text", "sparse", "colbert") to model name.
+        """
+        if self.settings.embedder_backend == "huggingface":
+            sparse_model = "Qdrant/bm25"
+        else:
+            sparse_model = self.settings.embedder_sparse_model
+        return {
+            "text": self.settings.embedder_text_model,
+            "sparse": sparse_model,
+            "colbert": self.settings.embedder_colbert_model,
+        }
+
     def __len__(self) -> int:
         """Get number of loaded embedders.
 
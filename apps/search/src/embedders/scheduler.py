@@ -0,0 +1,193 @@
+"""Priority lanes in front of the embedders.
+
+Query embedding, live indexing (NATS consumers, ``/index-memory``) and bulk
+work (backfills) used to share each embedder's executor in FIFO order, so a
+consumer queueing batch after batch could hold a search query behind all of
+them. Each embedder now runs its jobs through an EmbeddingScheduler with one
+queue per lane. When a slot frees up, the scheduler starts the waiting job
+with the smallest weighted virtual finish time: every job costs its number of
+texts divided by its lane's weight. A busy lane therefore gets a share of the
+embedder proportional to its weight, and an idle lane banks no credit for
+later.
+
+Jobs are not preempted, so a query can still wait for the one batch already
+running; bulk callers keep that bounded by sending batches of
+``embedder_batch_size``.
+
+Lanes only order jobs within one process: every process loads its own models
+and has its own schedulers. Queries and live indexing share a scheduler when
+the server runs its consumers (``SERVICE_MODE=all``). The backfill script runs
+in its own process, so its bulk lane never competes with the server's query
+lane here; its batches contend with queries for CPU or GPU only, and keeping
+a backfill away from search latency means running it on other hardware or
+with smaller batches.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TypeVar
+
+from src.utils.metrics import record_embedding_queue_wait, set_embedding_queue_depth
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class EmbeddingLane(str, Enum):
+    """Priority lanes for embedding work."""
+
+    QUERY = "query"
+    LIVE = "live"
+    BULK = "bulk"
+
+
+DEFAULT_LANE_WEIGHTS: dict[str, float] = {
+    EmbeddingLane.QUERY.value: 8.0,
+    EmbeddingLane.LIVE.value: 4.0,
+    EmbeddingLane.BULK.value: 1.0,
+}
+
+
+def default_lane(is_query: bool) -> EmbeddingLane:
+    """Lane for callers that do not pick one: queries, else live indexing."""
+    return EmbeddingLane.QUERY if is_query else EmbeddingLane.LIVE
+
+
+@dataclass
+class _Ticket:
+    """A job waiting for a slot."""
+
+    start: float
+    finish: float
+    granted: asyncio.Future[None]
+    submitted: float = field(default_factory=time.perf_counter)
+
+
+class EmbeddingScheduler:
+    """Weighted fair scheduler with one queue per lane.
+
+    Example:
+            >>> scheduler = EmbeddingScheduler("text")
+            >>> vector = await scheduler.run(EmbeddingLane.QUERY, lambda: embed(text))
+    """
+
+    def __init__(
+        self,
+        name: str,
+        weights: Mapping[str, float] | None = None,
+        concurrency: int = 1,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+                name: Embedder name used in metrics and logs.
+                weights: Relative share per lane (defaults to DEFAULT_LANE_WEIGHTS).
+                concurrency: Jobs run at once (the embedder's worker threads).
+        """
+        self.name = name
+        self.concurrency = concurrency
+        self.weights = dict(DEFAULT_LANE_WEIGHTS)
+        self.set_weights(weights or {})
+        self._queues: dict[EmbeddingLane, deque[_Ticket]] = {
+            lane: deque() for lane in EmbeddingLane
+        }
+        self._last_finish: dict[EmbeddingLane, float] = dict.fromkeys(EmbeddingLane, 0.0)
+        self._virtual_time = 0.0
+        self._active = 0
+
+    def set_weights(self, weights: Mapping[str, float]) -> None:
+        """Override lane weights.
+
+        Args:
+                weights: Weight per lane name; lanes not listed keep their weight.
+
+        Raises:
+                ValueError: If a lane is unknown or a weight is not positive.
+        """
+        for lane, weight in weights.items():
+            EmbeddingLane(lane)
+            if weight <= 0:
+                raise ValueError(f"Lane weight must be positive, got {lane}={weight}")
+            self.weights[lane] = float(weight)
+
+    def queue_depth(self, lane: EmbeddingLane | str) -> int:
+        """Number of jobs waiting in a lane."""
+        return len(self._queues[EmbeddingLane(lane)])
+
+    async def run(
+        self,
+        lane: EmbeddingLane | str,
+        job: Callable[[], Awaitable[T]],
+        cost: int = 1,
+    ) -> T:
+        """Run a job once its lane is scheduled.
+
+        Args:
+                lane: Priority lane of the job.
+                job: Starts the work, e.g. ``run_in_executor`` on the embedder's executor.
+                cost: Work units (texts) in the job.
+
+        Returns:
+                The job's result.
+        """
+        lane = EmbeddingLane(lane)
+        ticket = self._enqueue(lane, max(cost, 1))
+        self._dispatch()
+        try:
+            await ticket.granted
+        except asyncio.CancelledError:
+            if ticket.granted.cancelled():
+                # Never granted: drop the ticket unless a dispatch already skipped it
+                if ticket in self._queues[lane]:
+                    self._queues[lane].remove(ticket)
+                    self._record_depth(lane)
+            else:
+                # Granted while being cancelled: hand the slot on
+                self._release()
+            raise
+
+        record_embedding_queue_wait(self.name, lane.value, time.perf_counter() - ticket.submitted)
+        try:
+            return await job()
+        finally:
+            self._release()
+
+    def _enqueue(self, lane: EmbeddingLane, cost: int) -> _Ticket:
+        # An idle lane restarts at the current virtual time instead of
+        # using credit from the time it was idle
+        start = max(self._virtual_time, self._last_finish[lane])
+        finish = start + cost / self.weights[lane.value]
+        self._last_finish[lane] = finish
+        ticket = _Ticket(
+            start=start, finish=finish, granted=asyncio.get_running_loop().create_future()
+        )
+        self._queues[lane].append(ticket)
+        self._record_depth(lane)
+        return ticket
+
+    def _dispatch(self) -> None:
+        while self._active < self.concurrency:
+            heads = [(queue[0].finish, lane) for lane, queue in self._queues.items() if queue]
+            if not heads:
+                return
+            _, lane = min(heads, key=lambda head: head[0])
+            ticket = self._queues[lane].popleft()
+            self._record_depth(lane)
+            if ticket.granted.done():
+                continue
+            self._virtual_time = max(self._virtual_time, ticket.start)
+            self._active += 1
+            ticket.granted.set_result(None)
+
+    def _release(self) -> None:
+        self._active -= 1
+        self._dispatch()
+
+    def _record_depth(self, lane: EmbeddingLane) -> None:
+        set_embedding_queue_depth(self.name, lane.value, len(self._queues[lane]))
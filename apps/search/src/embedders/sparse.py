@@ -1,5 +1,6 @@
 """Sparse embedder using SPLADE."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -7,6 +8,7 @@ import torch
 from transformers import AutoModelForMaskedLM, AutoTokenizer
 
 from src.embedders.base import BaseEmbedder
+from src.embedders.scheduler import EmbeddingLane
 
 logger = logging.getLogger(__name__)
 
@@ -168,6 +170,49 @@ class SparseEmbedder(BaseEmbedder):
             raise RuntimeError("Model not loaded. Call load() first.")
         return [self._compute_sparse_vector(text) for text in texts]
 
+    async def embed_sparse_async(
+        self, text: str, lane: EmbeddingLane | str = EmbeddingLane.QUERY
+    ) -> dict[int, float]:
+        """Async sparse embedding, scheduled in a priority lane.
+
+        Args:
+                text: Text to embed.
+                lane: Priority lane (default: query).
+
+        Returns:
+                Dictionary mapping token IDs to weights.
+        """
+        if not self._model_loaded:
+            await self.load()
+
+        loop = asyncio.get_event_loop()
+        return await self.scheduler.run(
+            lane,
+            lambda: loop.run_in_executor(self._executor, self._compute_sparse_vector, text),
+        )
+
+    async def embed_sparse_batch_async(
+        self, texts: list[str], lane: EmbeddingLane | str = EmbeddingLane.LIVE
+    ) -> list[dict[int, float]]:
+        """Async batch sparse embedding, scheduled in a priority lane.
+
+        Args:
+                texts: List of texts to embed.
+                lane: Priority lane (default: live).
+
+        Returns:
+                List of sparse dictionaries.
+        """
+        if not self._model_loaded:
+            await self.load()
+
+        loop = asyncio.get_event_loop()
+        return await self.scheduler.run(
+            lane,
+            lambda: loop.run_in_executor(self._executor, self.embed_sparse_batch, texts),
+            cost=len(texts),
+        )
+
     @property
     def dimensions(self) -> int:
         """Get embedding dimensions.
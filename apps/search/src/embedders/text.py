@@ -1,11 +1,14 @@
 """Dense text embedder using sentence-transformers."""
 
+import asyncio
 import logging
 from typing import Any
 
 from sentence_transformers import SentenceTransformer
 
+from src.chunking.late import LateChunker
 from src.embedders.base import BaseEmbedder
+from src.embedders.scheduler import EmbeddingLane
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +132,63 @@ class TextEmbedder(BaseEmbedder):
         result: list[list[float]] = embeddings.tolist()
         return result
 
+    async def embed_late_chunks(
+        self,
+        texts: list[str],
+        chunk_tokens: int = 128,
+        max_tokens: int | None = None,
+        lane: EmbeddingLane | str | None = None,
+    ) -> list[list[list[float]]]:
+        """Async late-chunked document embedding.
+
+        Args:
+                texts: Documents to embed.
+                chunk_tokens: Tokens per chunk.
+                max_tokens: Tokens covered per document at most (all if None).
+                lane: Priority lane (default: live).
+
+        Returns:
+                Per document, one embedding per chunk.
+        """
+        if not self._model_loaded:
+            await self.load()
+
+        loop = asyncio.get_event_loop()
+        return await self.scheduler.run(
+            lane or EmbeddingLane.LIVE,
+            lambda: loop.run_in_executor(
+                self._executor, self._embed_late_chunks_sync, texts, chunk_tokens, max_tokens
+            ),
+            cost=len(texts),
+        )
+
+    def _embed_late_chunks_sync(
+        self, texts: list[str], chunk_tokens: int, max_tokens: int | None
+    ) -> list[list[list[float]]]:
+        """Synchronous late-chunked document embedding.
+
+        Args:
+                texts: Documents to embed.
+                chunk_tokens: Tokens per chunk.
+                max_tokens: Tokens covered per document at most (all if None).
+
+        Returns:
+                Per document, one embedding per chunk.
+        """
+        if not self._model:
+            raise RuntimeError("Model not loaded. Call load() first.")
+
+        chunker = LateChunker(self._model, normalize_embeddings=self.normalize_embeddings)
+        return [
+            [
+                chunk.embedding.tolist()
+                for chunk in chunker.embed_long(
+                    self._add_prefix(text, is_query=False), chunk_tokens, max_tokens
+                )
+            ]
+            for text in texts
+        ]
+
     @property
     def dimensions(self) -> int:
         """Get embedding dimensions.
@@ -6,9 +6,11 @@ with multi-vector embeddings (dense, sparse, ColBERT).
 Components:
     - BatchQueue: Efficient batching queue with automatic flushing
     - DocumentIndexer: Multi-vector embedding generation and Qdrant upsertion
+    - IndexingPipeline: Overlaps embedding of one batch with the upsert of the previous
     - MemoryEventConsumer: NATS consumer for memory.nodes.created events
     - TurnFinalizedConsumer: NATS consumer for memory.turns.finalized events
     - TurnsIndexer: Turn-level document indexer for engram_turns collection
+    - UpsertConfig: Chunk size, concurrency, write and retry settings for upserts
 
 Usage:
     from src.indexing import TurnFinalizedConsumer, create_turns_consumer
@@ -24,13 +26,14 @@ Usage:
     embedders = EmbedderFactory(settings)
 
     # Create and start turn consumer
-    consumer = create_turns_consumer(settings, qdrant, embedders, nats, nats_pubsub)
+    consumer = await create_turns_consumer(settings, qdrant, embedders, nats, nats_pubsub)
     await consumer.start()
 """
 
 from src.indexing.batch import BatchConfig, BatchQueue, Document
 from src.indexing.consumer import MemoryConsumerConfig, MemoryEventConsumer
 from src.indexing.indexer import DocumentIndexer, IndexerConfig
+from src.indexing.pipeline import IndexingPipeline
 from src.indexing.turns import (
     TurnFinalizedConsumer,
     TurnFinalizedConsumerConfig,
@@ -38,6 +41,7 @@ from src.indexing.turns import (
     TurnsIndexerConfig,
     create_turns_consumer,
 )
+from src.indexing.upload import UpsertConfig
 
 __all__ = [
     "BatchConfig",
@@ -45,11 +49,13 @@ __all__ = [
     "Document",
     "DocumentIndexer",
     "IndexerConfig",
+    "IndexingPipeline",
     "MemoryConsumerConfig",
     "MemoryEventConsumer",
     "TurnFinalizedConsumer",
     "TurnFinalizedConsumerConfig",
     "TurnsIndexer",
     "TurnsIndexerConfig",
+    "UpsertConfig",
     "create_turns_consumer",
 ]
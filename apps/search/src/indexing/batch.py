@@ -8,6 +8,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from src.clients.nats import MessageDelivery
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +38,11 @@ class BatchQueue:
     - The batch size is reached
     - The flush interval has elapsed
     - The queue is stopped (final flush)
+
+    Documents may carry the MessageDelivery of the message they came from.
+    Deliveries are acked only once the flush callback reports the whole batch
+    indexed, and nak'ed (redelivered with backoff) if it fails. The callback
+    may return a count, or a future resolving to one once the batch is written.
     """
 
     def __init__(
@@ -52,6 +59,8 @@ class BatchQueue:
         self.config = config
         self._flush_callback = flush_callback
         self._queue: list[Document] = []
+        self._deliveries: list[MessageDelivery | None] = []
+        self._settle_tasks: set[asyncio.Task[None]] = set()
         self._lock = asyncio.Lock()
         self._flush_task: asyncio.Task[None] | None = None
         self._running = False
@@ -96,13 +105,14 @@ class BatchQueue:
         await self._flush()
         logger.info("BatchQueue stopped")
 
-    async def add(self, document: Document) -> None:
+    async def add(self, document: Document, delivery: MessageDelivery | None = None) -> None:
         """Add a document to the queue.
 
         If the queue reaches the configured batch size, it will be flushed immediately.
 
         Args:
             document: Document to add to the queue.
+            delivery: Message to ack once the document is indexed (nak on failure).
 
         Raises:
             RuntimeError: If queue has reached max capacity.
@@ -117,6 +127,7 @@ class BatchQueue:
                 raise RuntimeError("BatchQueue at max capacity")
 
             self._queue.append(document)
+            self._deliveries.append(delivery)
 
             # Check if batch size reached (flush outside lock to avoid deadlock)
             if len(self._queue) >= self.config.batch_size:
@@ -139,22 +150,62 @@ class BatchQueue:
 
             # Swap queue with empty list to avoid blocking new additions
             batch = self._queue
+            deliveries = self._deliveries
             self._queue = []
+            self._deliveries = []
 
         logger.info(f"Flushing batch of {len(batch)} documents")
 
         try:
-            # Call the flush callback (indexer.index_documents)
+            # Call the flush callback (indexer.index_documents or pipeline.submit)
             result = self._flush_callback(batch)
 
             # If callback returns a coroutine, await it
             if asyncio.iscoroutine(result):
-                await result
+                result = await result
 
             logger.info(f"Successfully flushed {len(batch)} documents")
         except Exception as e:
             logger.error(f"Error flushing batch: {e}", exc_info=True)
             # Don't re-raise - we don't want to crash the flush loop
+            result = 0
+
+        # Settle the batch's messages now, or once a pipelined write completes
+        if isinstance(result, asyncio.Future):
+            task = asyncio.create_task(self._settle_when_done(result, len(batch), deliveries))
+            self._settle_tasks.add(task)
+            task.add_done_callback(self._settle_tasks.discard)
+        else:
+            await self._settle(len(batch) if result is None else result, len(batch), deliveries)
+
+    async def wait_settled(self) -> None:
+        """Wait until every flushed batch's messages have been acked or nak'ed."""
+        if self._settle_tasks:
+            await asyncio.gather(*self._settle_tasks)
+
+    async def _settle_when_done(
+        self,
+        future: "asyncio.Future[int]",
+        size: int,
+        deliveries: list[MessageDelivery | None],
+    ) -> None:
+        try:
+            indexed = await future
+        except Exception as e:
+            logger.error(f"Error indexing batch: {e}", exc_info=True)
+            indexed = 0
+        await self._settle(indexed, size, deliveries)
+
+    @staticmethod
+    async def _settle(indexed: int, size: int, deliveries: list[MessageDelivery | None]) -> None:
+        pending = [delivery for delivery in deliveries if delivery is not None]
+        if not pending:
+            return
+        if indexed >= size:
+            await asyncio.gather(*(delivery.ack() for delivery in pending))
+        else:
+            logger.warning(f"Batch of {size} documents not indexed; redelivering {len(pending)}")
+            await asyncio.gather(*(delivery.nak() for delivery in pending))
 
     async def _flush_loop(self) -> None:
         """Background loop for timed flushing.
@@ -181,3 +232,12 @@ class BatchQueue:
             Number of documents currently in the queue.
         """
         return len(self._queue)
+
+    @property
+    def free_capacity(self) -> int:
+        """Get how many more documents the queue accepts before it is full.
+
+        Returns:
+            Remaining capacity (0 when full).
+        """
+        return max(self.config.max_queue_size - len(self._queue), 0)
@@ -8,10 +8,11 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from src.clients.nats import NatsClient
+from src.clients.nats import MessageDelivery, NatsClient
 from src.clients.nats_pubsub import NatsPubSubPublisher
 from src.indexing.batch import BatchConfig, BatchQueue, Document
 from src.indexing.indexer import DocumentIndexer, IndexerConfig
+from src.indexing.pipeline import IndexingPipeline
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,9 @@ class MemoryConsumerConfig(BaseModel):
     batch_config: BatchConfig = Field(default_factory=BatchConfig)
     indexer_config: IndexerConfig = Field(default_factory=IndexerConfig)
     heartbeat_interval_ms: int = Field(default=30000, description="NATS heartbeat interval")
+    pipeline_depth: int = Field(
+        default=2, ge=1, description="Batches queued between the embed and upsert stages"
+    )
     service_id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
 
 
@@ -32,6 +36,7 @@ class MemoryEventConsumer:
 
     Subscribes to the memory.nodes.created NATS subject, extracts documents
     from events, and batches them for efficient indexing with multi-vector embeddings.
+    Batches go through an IndexingPipeline so embedding overlaps the previous upsert.
 
     Publishes consumer status updates via NATS pub/sub for monitoring.
     """
@@ -56,6 +61,7 @@ class MemoryEventConsumer:
         self.nats_pubsub = nats_pubsub
         self.config = config or MemoryConsumerConfig()
         self._batch_queue: BatchQueue | None = None
+        self._pipeline: IndexingPipeline | None = None
         self._running = False
         self._heartbeat_task: asyncio.Task[None] | None = None
 
@@ -77,10 +83,17 @@ class MemoryEventConsumer:
         # Connect to NATS
         await self.nats.connect()
 
-        # Create batch queue with indexing callback
+        # Create the embed/upsert pipeline and a batch queue feeding it
+        self._pipeline = IndexingPipeline(
+            embed=self.indexer.embed_documents,
+            upsert=self.indexer.upsert_points,
+            depth=self.config.pipeline_depth,
+            name="memory",
+        )
+        await self._pipeline.start()
         self._batch_queue = BatchQueue(
             config=self.config.batch_config,
-            flush_callback=self.indexer.index_documents,
+            flush_callback=self._pipeline.submit,
         )
 
         # Start batch queue
@@ -109,6 +122,8 @@ class MemoryEventConsumer:
                 topic=self.config.topic,
                 group_id=self.config.group_id,
                 handler=self._handle_message,
+                manual_ack=True,
+                capacity=self._fetch_capacity,
             )
         except asyncio.CancelledError:
             logger.info("Consumer task cancelled")
@@ -136,10 +151,15 @@ class MemoryEventConsumer:
                 await self._heartbeat_task
             self._heartbeat_task = None
 
-        # Flush batch queue
-        if self._batch_queue is not None:
-            await self._batch_queue.stop()
-            self._batch_queue = None
+        # Flush batch queue, wait for the pipeline to write it, then for the acks
+        batch_queue, self._batch_queue = self._batch_queue, None
+        if batch_queue is not None:
+            await batch_queue.stop()
+        if self._pipeline is not None:
+            await self._pipeline.stop()
+            self._pipeline = None
+            if batch_queue is not None:
+                await batch_queue.wait_settled()
 
         # Publish consumer_disconnected via NATS pub/sub
         if self.nats_pubsub:
@@ -157,29 +177,43 @@ class MemoryEventConsumer:
 
         logger.info("Memory consumer stopped")
 
-    async def _handle_message(self, subject: str, data: dict[str, Any]) -> None:
+    async def _handle_message(
+        self, subject: str, data: dict[str, Any], delivery: MessageDelivery | None = None
+    ) -> None:
         """Handle a single message from NATS.
 
-        Parses the message, extracts the document, and adds it to the batch queue.
+        Parses the message, extracts the document, and adds it to the batch queue,
+        which acks the message once the document is indexed. Messages that cannot
+        be queued are nak'ed for redelivery; unparseable ones are terminated.
 
         Args:
             subject: NATS subject the message was received on.
             data: Parsed message payload.
+            delivery: Message settlement handle (None when acked by the client).
         """
         try:
             # Extract document from memory node event
             document = self._parse_memory_node(data)
             if document is None:
                 logger.warning(f"Failed to parse memory node from message: {data}")
+                if delivery is not None:
+                    await delivery.term()
                 return
 
             # Add to batch queue
-            if self._batch_queue is not None:
-                await self._batch_queue.add(document)
-                logger.debug(f"Added document {document.id} to batch queue")
+            if self._batch_queue is None:
+                raise RuntimeError("Batch queue is not running")
+            await self._batch_queue.add(document, delivery)
+            logger.debug(f"Added document {document.id} to batch queue")
 
         except Exception as e:
             logger.error(f"Error processing message: {e}", exc_info=True)
+            if delivery is not None:
+                await delivery.nak()
+
+    def _fetch_capacity(self) -> int:
+        """Messages the batch queue can still take (fetching pauses at 0)."""
+        return self._batch_queue.free_capacity if self._batch_queue is not None else 0
 
     async def _heartbeat_loop(self) -> None:
         """Send periodic heartbeats via NATS pub/sub.
@@ -0,0 +1,233 @@
+"""Content fingerprints for skipping re-embedding of unchanged documents.
+
+Every indexed point stores two hashes in its payload:
+
+- ``content_hash``: SHA-256 over the embedded text and the models that
+  embedded it, so the stored vectors are current iff it matches
+- ``payload_hash``: SHA-256 over the rest of the payload
+
+Before embedding a batch, indexers fetch the stored hashes of the batch's
+point IDs (one retrieve call per shard key, hashes only) and plan each
+document as:
+
+- embed: new point, or its text or an embedding model changed
+- update payload: same content hash but different payload, so the payload is
+  overwritten and the vectors are kept
+- skip: both hashes match
+
+Replaying a stream (JetStream redeliveries, backfills) then costs Qdrant
+lookups instead of transformer inference.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from src.services.sharding import ShardRouter
+from src.utils.metrics import record_indexing_dedup
+
+logger = logging.getLogger(__name__)
+
+CONTENT_HASH_FIELD = "content_hash"
+PAYLOAD_HASH_FIELD = "payload_hash"
+
+
+def content_hash(text: str, model_versions: Iterable[str]) -> str:
+    """Fingerprint the embedding input of a document.
+
+    Args:
+        text: Text that is embedded.
+        model_versions: Identifiers of the models producing the point's vectors.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for version in model_versions:
+        digest.update(str(version).encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def payload_hash(payload: dict[str, Any]) -> str:
+    """Fingerprint a plain (unencoded) payload.
+
+    Args:
+        payload: Payload without fingerprint fields.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def fingerprint_payload(payload: dict[str, Any], text_hash: str) -> dict[str, Any]:
+    """Return the payload with both fingerprint fields added.
+
+    Args:
+        payload: Plain payload to store.
+        text_hash: ``content_hash`` of the point's embedding input.
+
+    Returns:
+        New payload dict including ``content_hash`` and ``payload_hash``.
+    """
+    return {
+        **payload,
+        CONTENT_HASH_FIELD: text_hash,
+        PAYLOAD_HASH_FIELD: payload_hash(payload),
+    }
+
+
+@dataclass
+class DedupPlan:
+    """Per-document outcome of a batch lookup, as indices into the batch."""
+
+    embed: list[int] = field(default_factory=list)
+    update_payload: list[int] = field(default_factory=list)
+    skip: list[int] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        """Number of documents planned."""
+        return len(self.embed) + len(self.update_payload) + len(self.skip)
+
+    @property
+    def skip_ratio(self) -> float:
+        """Share of documents that need no embedding."""
+        if not self.total:
+            return 0.0
+        return (len(self.update_payload) + len(self.skip)) / self.total
+
+    def record(self, collection_name: str) -> None:
+        """Log the batch's skip ratio and export it as metrics."""
+        record_indexing_dedup(
+            collection_name, len(self.embed), len(self.update_payload), len(self.skip)
+        )
+        logger.info(
+            f"{collection_name}: {len(self.skip) + len(self.update_payload)}/{self.total} "
+            f"unchanged ({self.skip_ratio:.0%}), {len(self.update_payload)} payload-only updates"
+        )
+
+
+async def plan_batch(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    shard_router: ShardRouter,
+    point_ids: Sequence[models.ExtendedPointId],
+    payloads: Sequence[dict[str, Any]],
+) -> DedupPlan:
+    """Compare a batch against the fingerprints already stored in Qdrant.
+
+    Lookup failures degrade to embedding the whole batch.
+
+    Args:
+        client: Async Qdrant client.
+        collection_name: Collection the batch is written to.
+        shard_router: Routes lookups to each org's shard key.
+        point_ids: Point IDs of the batch.
+        payloads: Plain payloads built with ``fingerprint_payload``, in ID order.
+
+    Returns:
+        Plan with every batch index in exactly one list.
+    """
+    plan = DedupPlan()
+    try:
+        stored = await _fetch_fingerprints(
+            client, collection_name, shard_router, point_ids, payloads
+        )
+    except Exception as e:
+        logger.warning(f"Fingerprint lookup failed for {collection_name}, embedding batch: {e}")
+        plan.embed = list(range(len(point_ids)))
+        return plan
+
+    for i, (point_id, payload) in enumerate(zip(point_ids, payloads, strict=True)):
+        key = _id_key(point_id)
+        existing = stored.get(key, {})
+        if existing.get(CONTENT_HASH_FIELD) != payload[CONTENT_HASH_FIELD]:
+            plan.embed.append(i)
+        elif existing.get(PAYLOAD_HASH_FIELD) != payload[PAYLOAD_HASH_FIELD]:
+            plan.update_payload.append(i)
+        else:
+            plan.skip.append(i)
+        # A repeated ID later in the batch compares against this version
+        stored[key] = payload
+    return plan
+
+
+async def overwrite_payloads(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    shard_router: ShardRouter,
+    point_ids: Sequence[models.ExtendedPointId],
+    payloads: Sequence[dict[str, Any]],
+) -> None:
+    """Replace the payloads of existing points in one request, keeping their vectors.
+
+    Args:
+        client: Async Qdrant client.
+        collection_name: Collection holding the points.
+        shard_router: Routes each update to its org's shard key.
+        point_ids: Points to update.
+        payloads: Encoded payloads to store, in ID order.
+    """
+    if not point_ids:
+        return
+
+    await client.batch_update_points(
+        collection_name=collection_name,
+        update_operations=[
+            models.OverwritePayloadOperation(
+                overwrite_payload=models.SetPayload(
+                    payload=payload,
+                    points=[point_id],
+                    shard_key=shard_router.selector_kwargs(payload.get("org_id")).get(
+                        "shard_key_selector"
+                    ),
+                )
+            )
+            for point_id, payload in zip(point_ids, payloads, strict=True)
+        ],
+    )
+
+
+async def _fetch_fingerprints(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    shard_router: ShardRouter,
+    point_ids: Sequence[models.ExtendedPointId],
+    payloads: Sequence[dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    # One retrieve per shard key, fetching only the two hash fields
+    groups: dict[Any, list[models.ExtendedPointId]] = {}
+    for point_id, payload in zip(point_ids, payloads, strict=True):
+        shard_key = shard_router.selector_kwargs(payload.get("org_id")).get("shard_key_selector")
+        groups.setdefault(shard_key, []).append(point_id)
+
+    stored: dict[str, dict[str, Any]] = {}
+    for shard_key, ids in groups.items():
+        shard_kwargs = {"shard_key_selector": shard_key} if shard_key is not None else {}
+        records = await client.retrieve(
+            collection_name=collection_name,
+            ids=ids,
+            with_payload=models.PayloadSelectorInclude(
+                include=[CONTENT_HASH_FIELD, PAYLOAD_HASH_FIELD]
+            ),
+            with_vectors=False,
+            **shard_kwargs,
+        )
+        for record in records:
+            stored[_id_key(record.id)] = record.payload or {}
+    return stored
+
+
+def _id_key(point_id: models.ExtendedPointId) -> str:
+    # Qdrant returns UUIDs in canonical form, so normalize before comparing
+    return str(point_id).lower()
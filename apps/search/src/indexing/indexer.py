@@ -1,5 +1,6 @@
 """Document indexer with multi-vector embedding generation."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -8,7 +9,11 @@ from qdrant_client.http import models
 
 from src.clients.qdrant import QdrantClientWrapper
 from src.embedders.factory import EmbedderFactory
+from src.embedders.scheduler import EmbeddingLane
 from src.indexing.batch import Document
+from src.indexing.dedup import content_hash, fingerprint_payload, overwrite_payloads, plan_batch
+from src.indexing.upload import UpsertConfig, upsert_chunked
+from src.services.sharding import ShardRouter
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,18 @@ class IndexerConfig(BaseModel):
     colbert_vector_name: str = Field(default="text_colbert", description="ColBERT vector field")
     enable_colbert: bool = Field(default=True, description="Enable ColBERT embeddings")
     batch_size: int = Field(default=32, description="Embedding batch size")
+    parallel_encoders: bool = Field(
+        default=True, description="Run dense, sparse and ColBERT encoders concurrently"
+    )
+    skip_unchanged: bool = Field(
+        default=True, description="Skip embedding documents whose stored content hash matches"
+    )
+    upsert: UpsertConfig = Field(
+        default_factory=UpsertConfig, description="Chunked parallel upsert settings"
+    )
+    embedding_lane: EmbeddingLane = Field(
+        default=EmbeddingLane.LIVE, description="Embedder priority lane (live or bulk)"
+    )
 
 
 class DocumentIndexer:
@@ -32,7 +49,8 @@ class DocumentIndexer:
     2. Sparse embeddings (SPLADE) for keyword-based search
     3. ColBERT multi-vector embeddings for late interaction (optional)
 
-    All three are stored in Qdrant for hybrid retrieval.
+    All three are stored in Qdrant for hybrid retrieval. The encoders run
+    concurrently, each on its embedder's executor in ``embedding_lane``.
     """
 
     def __init__(
@@ -40,6 +58,7 @@ class DocumentIndexer:
         qdrant_client: QdrantClientWrapper,
         embedder_factory: EmbedderFactory,
         config: IndexerConfig | None = None,
+        shard_router: ShardRouter | None = None,
     ) -> None:
         """Initialize the document indexer.
 
@@ -47,10 +66,12 @@ class DocumentIndexer:
             qdrant_client: Qdrant client wrapper.
             embedder_factory: Factory for creating embedder instances.
             config: Indexer configuration.
+            shard_router: Routes points to their org's shard key (no routing if None).
         """
         self.qdrant = qdrant_client
         self.embedders = embedder_factory
         self.config = config or IndexerConfig()
+        self.shard_router = shard_router or ShardRouter()
 
     async def index_documents(self, documents: list[Document]) -> int:
         """Index a batch of documents with multi-vector embeddings.
@@ -67,48 +88,8 @@ class DocumentIndexer:
         logger.info(f"Indexing batch of {len(documents)} documents")
 
         try:
-            # Extract text content for embedding
-            texts = [doc.content for doc in documents]
-
-            # Generate dense embeddings
-            logger.debug("Generating dense embeddings...")
-            text_embedder = await self.embedders.get_text_embedder()
-            await text_embedder.load()
-            dense_embeddings = await text_embedder.embed_batch(texts, is_query=False)
-
-            # Generate sparse embeddings
-            logger.debug("Generating sparse embeddings...")
-            sparse_embedder = await self.embedders.get_sparse_embedder()
-            await sparse_embedder.load()
-            sparse_embeddings = sparse_embedder.embed_sparse_batch(texts)
-
-            # Generate ColBERT embeddings (optional)
-            colbert_embeddings: list[list[list[float]] | None] = [None] * len(documents)
-            if self.config.enable_colbert:
-                logger.debug("Generating ColBERT embeddings...")
-                colbert_embedder = await self.embedders.get_colbert_embedder()
-                await colbert_embedder.load()
-                colbert_embeddings = [
-                    emb if emb else None for emb in colbert_embedder.embed_document_batch(texts)
-                ]
-
-            # Build Qdrant points
-            points = []
-            for i, doc in enumerate(documents):
-                point = self._build_point(
-                    doc=doc,
-                    dense_vec=dense_embeddings[i],
-                    sparse_vec=sparse_embeddings[i],
-                    colbert_vecs=colbert_embeddings[i],
-                )
-                points.append(point)
-
-            # Upsert to Qdrant
-            logger.debug(f"Upserting {len(points)} points to Qdrant")
-            await self.qdrant.client.upsert(
-                collection_name=self.config.collection_name,
-                points=points,
-            )
+            points = await self.embed_documents(documents)
+            await self.upsert_points(points)
 
             logger.info(f"Successfully indexed {len(documents)} documents")
             return len(documents)
@@ -117,6 +98,64 @@ class DocumentIndexer:
             logger.error(f"Error indexing documents: {e}", exc_info=True)
             return 0
 
+    async def embed_documents(self, documents: list[Document]) -> list[models.PointStruct]:
+        """Embed a batch of documents and build their Qdrant points.
+
+        Args:
+            documents: Documents to embed.
+
+        Documents whose stored content hash matches (see ``src.indexing.dedup``)
+        are not embedded: they are skipped, or only their payload is
+        overwritten if it changed.
+
+        Returns:
+            Points ready for upsertion, in document order.
+        """
+        payloads = [self._build_payload(doc) for doc in documents]
+        if self.config.skip_unchanged:
+            documents, payloads = await self._drop_unchanged(documents, payloads)
+            if not documents:
+                return []
+
+        texts = [doc.content for doc in documents]
+
+        if self.config.parallel_encoders:
+            dense_embeddings, sparse_embeddings, colbert_embeddings = await asyncio.gather(
+                self._embed_dense(texts), self._embed_sparse(texts), self._embed_colbert(texts)
+            )
+        else:
+            dense_embeddings = await self._embed_dense(texts)
+            sparse_embeddings = await self._embed_sparse(texts)
+            colbert_embeddings = await self._embed_colbert(texts)
+
+        return [
+            self._build_point(
+                doc=doc,
+                dense_vec=dense_embeddings[i],
+                sparse_vec=sparse_embeddings[i],
+                colbert_vecs=colbert_embeddings[i],
+                payload=payloads[i],
+            )
+            for i, doc in enumerate(documents)
+        ]
+
+    async def upsert_points(self, points: list[models.PointStruct]) -> None:
+        """Upsert points to Qdrant in parallel chunks, each within one shard key.
+
+        Args:
+            points: Points built by ``embed_documents``.
+        """
+        if not points:
+            return
+
+        await upsert_chunked(
+            self.qdrant.client,
+            self.config.collection_name,
+            points,
+            self.shard_router,
+            self.config.upsert,
+        )
+
     async def index_single(self, document: Document) -> bool:
         """Index a single document.
 
@@ -129,12 +168,42 @@ class DocumentIndexer:
         count = await self.index_documents([document])
         return count == 1
 
+    async def _embed_dense(self, texts: list[str]) -> list[list[float]]:
+        logger.debug("Generating dense embeddings...")
+        text_embedder = await self.embedders.get_text_embedder()
+        await text_embedder.load()
+        return await text_embedder.embed_batch(
+            texts, is_query=False, lane=self.config.embedding_lane
+        )
+
+    async def _embed_sparse(self, texts: list[str]) -> list[dict[int, float]]:
+        logger.debug("Generating sparse embeddings...")
+        sparse_embedder = await self.embedders.get_sparse_embedder()
+        await sparse_embedder.load()
+        return await sparse_embedder.embed_sparse_batch_async(
+            texts, lane=self.config.embedding_lane
+        )
+
+    async def _embed_colbert(self, texts: list[str]) -> list[list[list[float]] | None]:
+        # Optional
+        if not self.config.enable_colbert:
+            return [None] * len(texts)
+
+        logger.debug("Generating ColBERT embeddings...")
+        colbert_embedder = await self.embedders.get_colbert_embedder()
+        await colbert_embedder.load()
+        embeddings = await colbert_embedder.embed_document_batch_async(
+            texts, lane=self.config.embedding_lane
+        )
+        return [emb if emb else None for emb in embeddings]
+
     def _build_point(
         self,
         doc: Document,
         dense_vec: list[float],
         sparse_vec: dict[int, float],
         colbert_vecs: list[list[float]] | None,
+        payload: dict[str, Any] | None = None,
     ) -> models.PointStruct:
         """Build a Qdrant point from document and embeddings.
 
@@ -143,6 +212,7 @@ class DocumentIndexer:
             dense_vec: Dense embedding vector.
             sparse_vec: Sparse embedding dictionary (token_id -> weight).
             colbert_vecs: Optional ColBERT multi-vector embeddings.
+            payload: Plain payload from ``_build_payload`` (built if None).
 
         Returns:
             Qdrant PointStruct ready for upsertion.
@@ -161,6 +231,22 @@ class DocumentIndexer:
         if colbert_vecs and self.config.enable_colbert:
             vectors[self.config.colbert_vector_name] = colbert_vecs
 
+        # Create and return the point
+        return models.PointStruct(
+            id=doc.id,
+            vector=vectors,
+            payload=payload if payload is not None else self._build_payload(doc),
+        )
+
+    def _build_payload(self, doc: Document) -> dict[str, Any]:
+        """Build the payload of a document, including its fingerprints.
+
+        Args:
+            doc: Source document.
+
+        Returns:
+            Payload to store.
+        """
         # Build payload with content, org_id (required for tenant isolation), and metadata
         payload = {
             "content": doc.content,
@@ -172,9 +258,33 @@ class DocumentIndexer:
         if doc.session_id:
             payload["session_id"] = doc.session_id
 
-        # Create and return the point
-        return models.PointStruct(
-            id=doc.id,
-            vector=vectors,
-            payload=payload,
+        return fingerprint_payload(payload, content_hash(doc.content, self._model_versions()))
+
+    def _model_versions(self) -> list[str]:
+        """Models whose vectors a point holds, for its content hash."""
+        versions = self.embedders.model_versions()
+        used = [versions["text"], versions["sparse"]]
+        if self.config.enable_colbert:
+            used.append(versions["colbert"])
+        return used
+
+    async def _drop_unchanged(
+        self, documents: list[Document], payloads: list[dict[str, Any]]
+    ) -> tuple[list[Document], list[dict[str, Any]]]:
+        """Skip or payload-update unchanged documents, returning those to embed."""
+        plan = await plan_batch(
+            self.qdrant.client,
+            self.config.collection_name,
+            self.shard_router,
+            [doc.id for doc in documents],
+            payloads,
+        )
+        plan.record(self.config.collection_name)
+        await overwrite_payloads(
+            self.qdrant.client,
+            self.config.collection_name,
+            self.shard_router,
+            [documents[i].id for i in plan.update_payload],
+            [payloads[i] for i in plan.update_payload],
         )
+        return [documents[i] for i in plan.embed], [payloads[i] for i in plan.embed]
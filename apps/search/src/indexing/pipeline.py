@@ -0,0 +1,172 @@
+"""Staged embed/upsert pipeline for indexing consumers.
+
+Flushing a batch used to embed it and then upsert it before the next batch
+could start, so the embedders sat idle while Qdrant wrote and Qdrant sat idle
+while the next batch was embedded. The pipeline runs the two stages as
+separate workers connected by bounded queues, so batch N+1 is embedded while
+batch N is upserted.
+
+``submit`` waits while the embed queue is full, which pushes backpressure
+back to the BatchQueue and the consumer; at most ``2 * depth + 1 +
+embed_workers`` batches are in flight at once. Several embed workers help
+when embedding waits on I/O (e.g. a remote inference API); batches may then
+finish out of submission order.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from qdrant_client.http import models
+
+from src.indexing.batch import Document
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Job:
+    """A batch moving through the pipeline."""
+
+    documents: list[Document]
+    done: asyncio.Future[int]
+    points: list[models.PointStruct] | None = None
+
+
+class IndexingPipeline:
+    """Two-stage (embed, then upsert) indexing pipeline with bounded queues."""
+
+    def __init__(
+        self,
+        embed: Callable[[list[Document]], Awaitable[list[models.PointStruct]]],
+        upsert: Callable[[list[models.PointStruct]], Awaitable[None]],
+        depth: int = 2,
+        name: str = "indexing",
+        embed_workers: int = 1,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            embed: Builds points (with embeddings) for a batch of documents.
+            upsert: Writes a batch of points to Qdrant.
+            depth: Batches that may wait between stages.
+            name: Name used in log messages.
+            embed_workers: Batches embedded concurrently.
+        """
+        self._embed = embed
+        self._upsert = upsert
+        self.depth = depth
+        self.name = name
+        self.embed_workers = embed_workers
+        self._embed_queue: asyncio.Queue[_Job | None] = asyncio.Queue(maxsize=depth)
+        self._upsert_queue: asyncio.Queue[_Job | None] = asyncio.Queue(maxsize=depth)
+        self._embed_tasks: list[asyncio.Task[None]] = []
+        self._upsert_task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the stage workers are running."""
+        return self._upsert_task is not None
+
+    async def start(self) -> None:
+        """Start the embed and upsert workers."""
+        if self.running:
+            logger.warning(f"{self.name} pipeline already started")
+            return
+
+        self._embed_tasks = [
+            asyncio.create_task(self._embed_loop()) for _ in range(self.embed_workers)
+        ]
+        self._upsert_task = asyncio.create_task(self._upsert_loop())
+        logger.info(
+            f"{self.name} pipeline started (depth={self.depth}, embed_workers={self.embed_workers})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the workers after all submitted batches are indexed."""
+        if not self.running:
+            return
+
+        # Sentinels follow every submitted batch through both stages
+        for _ in self._embed_tasks:
+            await self._embed_queue.put(None)
+        with contextlib.suppress(asyncio.CancelledError):
+            await asyncio.gather(*self._embed_tasks)
+        await self._upsert_queue.put(None)
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._upsert_task
+        self._embed_tasks = []
+        self._upsert_task = None
+        logger.info(f"{self.name} pipeline stopped")
+
+    async def submit(self, documents: list[Document]) -> asyncio.Future[int]:
+        """Queue a batch for indexing, waiting while the pipeline is full.
+
+        Args:
+            documents: Documents to index.
+
+        Returns:
+            Future resolving to the count of indexed documents (0 if the batch failed).
+
+        Raises:
+            RuntimeError: If the pipeline is not running.
+        """
+        if not self.running:
+            raise RuntimeError(f"{self.name} pipeline is not running")
+
+        job = _Job(documents=documents, done=asyncio.get_running_loop().create_future())
+        await self._embed_queue.put(job)
+        return job.done
+
+    async def index(self, documents: list[Document]) -> int:
+        """Index a batch through the pipeline and wait for it to be written.
+
+        Args:
+            documents: Documents to index.
+
+        Returns:
+            Count of indexed documents (0 if the batch failed).
+        """
+        return await (await self.submit(documents))
+
+    async def _embed_loop(self) -> None:
+        while True:
+            job = await self._embed_queue.get()
+            if job is None:
+                return
+
+            try:
+                job.points = await self._embed(job.documents)
+            except Exception as e:
+                logger.error(
+                    f"{self.name} pipeline failed to embed {len(job.documents)} documents: {e}",
+                    exc_info=True,
+                )
+                _resolve(job, 0)
+                continue
+            await self._upsert_queue.put(job)
+
+    async def _upsert_loop(self) -> None:
+        while True:
+            job = await self._upsert_queue.get()
+            if job is None:
+                return
+
+            try:
+                await self._upsert(job.points or [])
+            except Exception as e:
+                logger.error(
+                    f"{self.name} pipeline failed to upsert {len(job.documents)} documents: {e}",
+                    exc_info=True,
+                )
+                _resolve(job, 0)
+                continue
+            logger.info(f"{self.name} pipeline indexed {len(job.documents)} documents")
+            _resolve(job, len(job.documents))
+
+
+def _resolve(job: _Job, count: int) -> None:
+    if not job.done.done():
+        job.done.set_result(count)
@@ -0,0 +1,250 @@
+"""Incremental session centroids for session-level retrieval.
+
+``SessionAwareRetriever`` finds sessions in the ``sessions`` collection before
+searching their turns, but nothing kept that collection current. The turns
+indexer now folds every flushed batch into one point per (org, session):
+
+- a running mean of the session's dense turn vectors
+- optionally a running mean of its sparse vectors, truncated to the
+  ``max_sparse_terms`` heaviest terms
+
+Each flush costs one retrieve and one upsert per shard key for the sessions
+it touched; there is no summarization model involved. Qdrant normalizes
+vectors stored for cosine distance, so the mean's norm is kept in the payload
+(``centroid_norm``) to continue the mean from the stored unit vector.
+
+Only turns that were embedded are folded in, so redelivered or unchanged
+turns skipped by the content hashes are not counted twice. A turn whose text
+changes is counted again, and two processes updating the same session at once
+can lose one of the updates; both only shift a mean that stays close to the
+session's content.
+"""
+
+import asyncio
+import logging
+import math
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel, Field
+from qdrant_client.http import models
+
+from src.clients.qdrant import QdrantClientWrapper
+from src.config import Settings
+from src.indexing.upload import UpsertConfig, upsert_chunked
+from src.services.sharding import ShardRouter
+
+logger = logging.getLogger(__name__)
+
+CENTROID_NORM_FIELD = "centroid_norm"
+TURN_COUNT_FIELD = "turn_count"
+
+
+class SessionCentroidConfig(BaseModel):
+    """Configuration for incremental session centroids."""
+
+    enabled: bool = Field(default=False, description="Maintain session centroids")
+    collection_name: str = Field(default="sessions", description="Sessions collection")
+    dense_vector_name: str = Field(default="text_dense", description="Dense centroid field")
+    sparse_vector_name: str = Field(default="text_sparse", description="Sparse aggregate field")
+    max_sparse_terms: int = Field(
+        default=256, ge=0, description="Sparse terms kept per session (0 disables the aggregate)"
+    )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SessionCentroidConfig":
+        """Create the session centroid configuration from application settings.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            Session centroid configuration.
+        """
+        return cls(
+            enabled=settings.session_centroids_enabled,
+            collection_name=settings.session_centroids_collection,
+            max_sparse_terms=settings.session_centroid_sparse_terms,
+        )
+
+
+def session_point_id(org_id: str, session_id: str) -> str:
+    """Deterministic point ID of a session centroid."""
+    return str(uuid.uuid5(uuid.NAMESPACE_OID, f"{org_id}/{session_id}"))
+
+
+@dataclass
+class _SessionDelta:
+    """Sums of one session's turns in a batch."""
+
+    org_id: str
+    session_id: str
+    dense_sum: list[float]
+    sparse_sum: dict[int, float] = field(default_factory=dict)
+    count: int = 0
+    timestamp: int = 0
+
+
+class SessionCentroidIndexer:
+    """Folds indexed turn points into per-session mean vectors."""
+
+    def __init__(
+        self,
+        qdrant_client: QdrantClientWrapper,
+        config: SessionCentroidConfig,
+        shard_router: ShardRouter | None = None,
+        upsert_config: UpsertConfig | None = None,
+    ) -> None:
+        """Initialize the session centroid indexer.
+
+        Args:
+            qdrant_client: Qdrant client wrapper.
+            config: Session centroid configuration.
+            shard_router: Routes session points to their org's shard key (no routing if None).
+            upsert_config: Chunked upsert settings.
+        """
+        self.qdrant = qdrant_client
+        self.config = config
+        self.shard_router = shard_router or ShardRouter()
+        self.upsert_config = upsert_config or UpsertConfig()
+        # Read-modify-write: concurrent batches in this process must not interleave
+        self._lock = asyncio.Lock()
+
+    async def update(
+        self,
+        points: Sequence[models.PointStruct],
+        dense_vector_name: str,
+        sparse_vector_name: str,
+    ) -> int:
+        """Fold turn points into the centroids of their sessions.
+
+        Args:
+            points: Turn points just upserted; points without a session are ignored.
+            dense_vector_name: Dense vector field of the turn points.
+            sparse_vector_name: Sparse vector field of the turn points.
+
+        Returns:
+            Number of sessions updated.
+        """
+        deltas = self._collect(points, dense_vector_name, sparse_vector_name)
+        if not deltas:
+            return 0
+
+        async with self._lock:
+            stored = await self._fetch(deltas)
+            session_points = [
+                self._merge(point_id, delta, stored.get(point_id))
+                for point_id, delta in deltas.items()
+            ]
+            await upsert_chunked(
+                self.qdrant.client,
+                self.config.collection_name,
+                session_points,
+                self.shard_router,
+                self.upsert_config,
+            )
+
+        logger.debug(f"Updated {len(session_points)} session centroids from {len(points)} turns")
+        return len(session_points)
+
+    def _collect(
+        self,
+        points: Sequence[models.PointStruct],
+        dense_vector_name: str,
+        sparse_vector_name: str,
+    ) -> dict[str, _SessionDelta]:
+        """Sum the batch's vectors per session."""
+        deltas: dict[str, _SessionDelta] = {}
+        for point in points:
+            payload = point.payload or {}
+            org_id, session_id = payload.get("org_id"), payload.get("session_id")
+            vectors = point.vector if isinstance(point.vector, dict) else {}
+            dense = vectors.get(dense_vector_name)
+            if not (org_id and session_id and isinstance(dense, list) and dense):
+                continue
+
+            point_id = session_point_id(org_id, session_id)
+            delta = deltas.get(point_id)
+            if delta is None:
+                delta = deltas[point_id] = _SessionDelta(
+                    org_id=org_id, session_id=session_id, dense_sum=[0.0] * len(dense)
+                )
+            delta.dense_sum = [a + b for a, b in zip(delta.dense_sum, dense, strict=True)]
+            sparse = vectors.get(sparse_vector_name)
+            if self.config.max_sparse_terms and isinstance(sparse, models.SparseVector):
+                for index, value in zip(sparse.indices, sparse.values, strict=True):
+                    delta.sparse_sum[index] = delta.sparse_sum.get(index, 0.0) + value
+            delta.count += 1
+            delta.timestamp = max(delta.timestamp, int(payload.get("timestamp") or 0))
+        return deltas
+
+    async def _fetch(self, deltas: dict[str, _SessionDelta]) -> dict[str, models.Record]:
+        """Retrieve the stored centroids, one request per shard key."""
+        groups: dict[Any, list[str]] = {}
+        for point_id, delta in deltas.items():
+            shard_key = self.shard_router.selector_kwargs(delta.org_id).get("shard_key_selector")
+            groups.setdefault(shard_key, []).append(point_id)
+
+        vector_names = [self.config.dense_vector_name]
+        if self.config.max_sparse_terms:
+            vector_names.append(self.config.sparse_vector_name)
+
+        stored: dict[str, models.Record] = {}
+        for shard_key, ids in groups.items():
+            shard_kwargs = {"shard_key_selector": shard_key} if shard_key is not None else {}
+            records = await self.qdrant.client.retrieve(
+                collection_name=self.config.collection_name,
+                ids=ids,
+                with_payload=True,
+                with_vectors=vector_names,
+                **shard_kwargs,
+            )
+            for record in records:
+                stored[str(record.id).lower()] = record
+        return stored
+
+    def _merge(
+        self, point_id: str, delta: _SessionDelta, record: models.Record | None
+    ) -> models.PointStruct:
+        """Combine a stored centroid with the batch's sums into the new point."""
+        payload: dict[str, Any] = dict(record.payload or {}) if record else {}
+        vectors: dict[str, Any] = (
+            record.vector if record and isinstance(record.vector, dict) else {}
+        )
+        old_count = int(payload.get(TURN_COUNT_FIELD, 0))
+        count = old_count + delta.count
+
+        # Stored unit vector times its saved norm is the previous mean
+        old_dense = vectors.get(self.config.dense_vector_name)
+        dense_sum = delta.dense_sum
+        if old_count and isinstance(old_dense, list) and len(old_dense) == len(dense_sum):
+            scale = float(payload.get(CENTROID_NORM_FIELD, 1.0)) * old_count
+            dense_sum = [s + v * scale for s, v in zip(dense_sum, old_dense, strict=True)]
+        dense_mean = [s / count for s in dense_sum]
+
+        new_vectors: dict[str, Any] = {self.config.dense_vector_name: dense_mean}
+        if self.config.max_sparse_terms:
+            sparse_sum = dict(delta.sparse_sum)
+            old_sparse = vectors.get(self.config.sparse_vector_name)
+            if old_count and isinstance(old_sparse, models.SparseVector):
+                for index, value in zip(old_sparse.indices, old_sparse.values, strict=True):
+                    sparse_sum[index] = sparse_sum.get(index, 0.0) + value * old_count
+            top = sorted(sparse_sum.items(), key=lambda item: item[1], reverse=True)
+            top = sorted(top[: self.config.max_sparse_terms])
+            new_vectors[self.config.sparse_vector_name] = models.SparseVector(
+                indices=[index for index, _ in top],
+                values=[value / count for _, value in top],
+            )
+
+        payload.update(
+            {
+                "org_id": delta.org_id,
+                "session_id": delta.session_id,
+                TURN_COUNT_FIELD: count,
+                CENTROID_NORM_FIELD: math.sqrt(sum(v * v for v in dense_mean)),
+                "timestamp": max(delta.timestamp, int(payload.get("timestamp") or 0)),
+            }
+        )
+        return models.PointStruct(id=point_id, vector=new_vectors, payload=payload)
@@ -14,12 +14,27 @@ from typing import Any
 from pydantic import BaseModel, Field
 from qdrant_client.http import models
 
-from src.clients.nats import NatsClient
+from src.clients.nats import MessageDelivery, NatsClient
 from src.clients.nats_pubsub import NatsPubSubPublisher
 from src.clients.qdrant import QdrantClientWrapper
 from src.config import Settings
 from src.embedders.factory import EmbedderFactory
+from src.embedders.scheduler import EmbeddingLane
 from src.indexing.batch import BatchConfig, BatchQueue, Document
+from src.indexing.dedup import (
+    DedupPlan,
+    content_hash,
+    fingerprint_payload,
+    overwrite_payloads,
+    plan_batch,
+)
+from src.indexing.pipeline import IndexingPipeline
+from src.indexing.sessions import SessionCentroidConfig, SessionCentroidIndexer
+from src.indexing.upload import UpsertConfig, upsert_chunked
+from src.services.compression import PayloadCodec
+from src.services.schema_manager import SchemaManager, late_chunks_from_settings
+from src.services.sharding import ShardRouter
+from src.services.tiering import TurnTiers
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +43,9 @@ class TurnsIndexerConfig(BaseModel):
     """Configuration for turn-level document indexer."""
 
     collection_name: str = Field(default="engram_turns", description="Qdrant collection")
+    cold_collection_name: str | None = Field(
+        default=None, description="Cold turn tier also checked for unchanged turns, if tiering"
+    )
     dense_vector_name: str = Field(default="turn_dense", description="Dense vector field")
     sparse_vector_name: str = Field(default="turn_sparse", description="Sparse vector field")
     colbert_vector_name: str = Field(default="turn_colbert", description="ColBERT vector field")
@@ -37,16 +55,47 @@ class TurnsIndexerConfig(BaseModel):
     enable_colbert: bool = Field(
         default=True, description="Enable ColBERT embeddings (requires local ML dependencies)"
     )
+    enable_late_chunks: bool = Field(
+        default=False,
+        description="Store late-chunked dense vectors of the turn (needs local ML deps)",
+    )
+    late_chunk_vector_name: str = Field(
+        default="turn_chunks", description="Late chunk multi-vector field"
+    )
+    late_chunk_tokens: int = Field(default=128, ge=1, description="Tokens per late chunk")
+    late_chunk_max_tokens: int = Field(
+        default=8192, ge=1, description="Tokens of a turn covered by late chunks at most"
+    )
     batch_size: int = Field(default=32, description="Embedding batch size")
+    parallel_encoders: bool = Field(
+        default=True, description="Run dense, sparse and ColBERT encoders concurrently"
+    )
+    skip_unchanged: bool = Field(
+        default=True, description="Skip embedding documents whose stored content hash matches"
+    )
+    upsert: UpsertConfig = Field(
+        default_factory=UpsertConfig, description="Chunked parallel upsert settings"
+    )
+    embedding_lane: EmbeddingLane = Field(
+        default=EmbeddingLane.LIVE, description="Embedder priority lane (live or bulk)"
+    )
+    sessions: SessionCentroidConfig = Field(
+        default_factory=SessionCentroidConfig, description="Incremental session centroids"
+    )
 
 
 class TurnsIndexer:
     """Indexes turn-level documents with multi-vector embeddings to Qdrant.
 
-    Generates three types of embeddings for each turn document:
+    Generates up to four types of embeddings for each turn document:
     1. Dense embeddings for semantic search (BGE-small, 384 dims)
     2. Sparse embeddings (SPLADE) for keyword-based search
     3. ColBERT multi-vector embeddings for late interaction (optional)
+    4. Late-chunked dense multi-vectors covering turns past the dense model's
+       512-token window (optional, see ``LateChunker.embed_long``)
+
+    The encoders run concurrently, each on its embedder's executor in
+    ``embedding_lane``, so none blocks the event loop or waits behind another.
     """
 
     def __init__(
@@ -54,6 +103,8 @@ class TurnsIndexer:
         qdrant_client: QdrantClientWrapper,
         embedder_factory: EmbedderFactory,
         config: TurnsIndexerConfig | None = None,
+        shard_router: ShardRouter | None = None,
+        payload_codec: PayloadCodec | None = None,
     ) -> None:
         """Initialize the turns indexer.
 
@@ -61,10 +112,23 @@ class TurnsIndexer:
             qdrant_client: Qdrant client wrapper.
             embedder_factory: Factory for creating embedder instances.
             config: Indexer configuration.
+            shard_router: Routes points to their org's shard key (no routing if None).
+            payload_codec: Compresses large payload fields (stored plain if None).
         """
         self.qdrant = qdrant_client
         self.embedders = embedder_factory
         self.config = config or TurnsIndexerConfig()
+        self.shard_router = shard_router or ShardRouter()
+        self.payload_codec = payload_codec or PayloadCodec()
+        # Whether the collection has the late chunk vector (checked on first batch)
+        self.late_chunks: bool | None = None if self.config.enable_late_chunks else False
+        self.sessions = (
+            SessionCentroidIndexer(
+                qdrant_client, self.config.sessions, self.shard_router, self.config.upsert
+            )
+            if self.config.sessions.enabled
+            else None
+        )
 
     async def index_documents(self, documents: list[Document]) -> int:
         """Index a batch of turn documents with multi-vector embeddings.
@@ -81,50 +145,8 @@ class TurnsIndexer:
         logger.info(f"Indexing batch of {len(documents)} turn documents")
 
         try:
-            # Extract text content for embedding
-            texts = [doc.content for doc in documents]
-
-            # Generate dense embeddings
-            logger.debug("Generating dense embeddings...")
-            text_embedder = await self.embedders.get_text_embedder()
-            await text_embedder.load()
-            dense_embeddings = await text_embedder.embed_batch(texts, is_query=False)
-
-            # Generate sparse embeddings (optional, requires local ML dependencies)
-            sparse_embeddings: list[dict[int, float]] = [{} for _ in documents]
-            if self.config.enable_sparse:
-                logger.debug("Generating sparse embeddings...")
-                sparse_embedder = await self.embedders.get_sparse_embedder()
-                await sparse_embedder.load()
-                sparse_embeddings = sparse_embedder.embed_sparse_batch(texts)
-
-            # Generate ColBERT embeddings (optional, requires local ML dependencies)
-            colbert_embeddings: list[list[list[float]] | None] = [None] * len(documents)
-            if self.config.enable_sparse and self.config.enable_colbert:
-                logger.debug("Generating ColBERT embeddings...")
-                colbert_embedder = await self.embedders.get_colbert_embedder()
-                await colbert_embedder.load()
-                colbert_embeddings = [
-                    emb if emb else None for emb in colbert_embedder.embed_document_batch(texts)
-                ]
-
-            # Build Qdrant points
-            points = []
-            for i, doc in enumerate(documents):
-                point = self._build_point(
-                    doc=doc,
-                    dense_vec=dense_embeddings[i],
-                    sparse_vec=sparse_embeddings[i],
-                    colbert_vecs=colbert_embeddings[i],
-                )
-                points.append(point)
-
-            # Upsert to Qdrant
-            logger.debug(f"Upserting {len(points)} points to Qdrant")
-            await self.qdrant.client.upsert(
-                collection_name=self.config.collection_name,
-                points=points,
-            )
+            points = await self.embed_documents(documents)
+            await self.upsert_points(points)
 
             logger.info(f"Successfully indexed {len(documents)} turn documents")
             return len(documents)
@@ -133,12 +155,144 @@ class TurnsIndexer:
             logger.error(f"Error indexing turn documents: {e}", exc_info=True)
             return 0
 
+    async def embed_documents(self, documents: list[Document]) -> list[models.PointStruct]:
+        """Embed a batch of turn documents and build their Qdrant points.
+
+        Args:
+            documents: Documents to embed.
+
+        Documents whose stored content hash matches (see ``src.indexing.dedup``)
+        are not embedded: they are skipped, or only their payload is
+        overwritten if it changed.
+
+        Returns:
+            Points ready for upsertion, in document order.
+        """
+        if self.late_chunks is None:
+            self.late_chunks = await self._collection_has_late_chunks()
+        payloads = [self._build_payload(doc) for doc in documents]
+        if self.config.skip_unchanged:
+            documents, payloads = await self._drop_unchanged(documents, payloads)
+            if not documents:
+                return []
+
+        texts = [doc.content for doc in documents]
+
+        if self.config.parallel_encoders:
+            (
+                dense_embeddings,
+                sparse_embeddings,
+                colbert_embeddings,
+                chunk_embeddings,
+            ) = await asyncio.gather(
+                self._embed_dense(texts),
+                self._embed_sparse(texts),
+                self._embed_colbert(texts),
+                self._embed_late_chunks(texts),
+            )
+        else:
+            dense_embeddings = await self._embed_dense(texts)
+            sparse_embeddings = await self._embed_sparse(texts)
+            colbert_embeddings = await self._embed_colbert(texts)
+            chunk_embeddings = await self._embed_late_chunks(texts)
+
+        return [
+            self._build_point(
+                doc=doc,
+                dense_vec=dense_embeddings[i],
+                sparse_vec=sparse_embeddings[i],
+                colbert_vecs=colbert_embeddings[i],
+                chunk_vecs=chunk_embeddings[i],
+                payload=payloads[i],
+            )
+            for i, doc in enumerate(documents)
+        ]
+
+    async def upsert_points(self, points: list[models.PointStruct]) -> None:
+        """Upsert points to Qdrant in parallel chunks, each within one shard key.
+
+        The points are then folded into their session centroids, if enabled.
+
+        Args:
+            points: Points built by ``embed_documents``.
+        """
+        if not points:
+            return
+
+        await upsert_chunked(
+            self.qdrant.client,
+            self.config.collection_name,
+            points,
+            self.shard_router,
+            self.config.upsert,
+        )
+
+        if self.sessions is not None:
+            # Centroids are derived data: a failure must not redeliver indexed turns
+            try:
+                await self.sessions.update(
+                    points, self.config.dense_vector_name, self.config.sparse_vector_name
+                )
+            except Exception as e:
+                logger.warning(f"Failed to update session centroids: {e}")
+
+    async def _embed_dense(self, texts: list[str]) -> list[list[float]]:
+        logger.debug("Generating dense embeddings...")
+        text_embedder = await self.embedders.get_text_embedder()
+        await text_embedder.load()
+        return await text_embedder.embed_batch(
+            texts, is_query=False, lane=self.config.embedding_lane
+        )
+
+    async def _embed_sparse(self, texts: list[str]) -> list[dict[int, float]]:
+        # Optional, requires local ML dependencies
+        if not self.config.enable_sparse:
+            return [{} for _ in texts]
+
+        logger.debug("Generating sparse embeddings...")
+        sparse_embedder = await self.embedders.get_sparse_embedder()
+        await sparse_embedder.load()
+        return await sparse_embedder.embed_sparse_batch_async(
+            texts, lane=self.config.embedding_lane
+        )
+
+    async def _embed_colbert(self, texts: list[str]) -> list[list[list[float]] | None]:
+        # Optional, requires local ML dependencies
+        if not (self.config.enable_sparse and self.config.enable_colbert):
+            return [None] * len(texts)
+
+        logger.debug("Generating ColBERT embeddings...")
+        colbert_embedder = await self.embedders.get_colbert_embedder()
+        await colbert_embedder.load()
+        embeddings = await colbert_embedder.embed_document_batch_async(
+            texts, lane=self.config.embedding_lane
+        )
+        return [emb if emb else None for emb in embeddings]
+
+    async def _embed_late_chunks(self, texts: list[str]) -> list[list[list[float]] | None]:
+        # Optional, requires local ML dependencies and the collection's chunk vector
+        if not self.late_chunks:
+            return [None] * len(texts)
+
+        logger.debug("Generating late chunk embeddings...")
+        text_embedder = await self.embedders.get_text_embedder()
+        await text_embedder.load()
+        embeddings = await text_embedder.embed_late_chunks(
+            texts,
+            chunk_tokens=self.config.late_chunk_tokens,
+            max_tokens=self.config.late_chunk_max_tokens,
+            lane=self.config.embedding_lane,
+        )
+        return [emb if emb else None for emb in embeddings]
+
     def _build_point(
         self,
         doc: Document,
         dense_vec: list[float],
         sparse_vec: dict[int, float],
         colbert_vecs: list[list[float]] | None,
+        chunk_vecs: list[list[float]] | None = None,
+        payload: dict[str, Any] | None = None,
     ) -> models.PointStruct:
         """Build a Qdrant point from document and embeddings.
 
@@ -147,6 +301,8 @@ class TurnsIndexer:
             dense_vec: Dense embedding vector.
             sparse_vec: Sparse embedding dictionary (token_id -> weight).
             colbert_vecs: Optional ColBERT multi-vector embeddings.
+            chunk_vecs: Optional late-chunked dense multi-vector embeddings.
+            payload: Plain payload from ``_build_payload`` (built if None).
 
         Returns:
             Qdrant PointStruct ready for upsertion.
@@ -164,7 +320,28 @@ class TurnsIndexer:
         # Multi-vectors are passed as list of lists directly
         if colbert_vecs and self.config.enable_colbert:
             vectors[self.config.colbert_vector_name] = colbert_vecs
+        if chunk_vecs:
+            vectors[self.config.late_chunk_vector_name] = chunk_vecs
+
+        if payload is None:
+            payload = self._build_payload(doc)
 
+        # Create and return the point (large text fields compressed if enabled)
+        return models.PointStruct(
+            id=doc.id,
+            vector=vectors,
+            payload=self.payload_codec.encode(payload),
+        )
+
+    def _build_payload(self, doc: Document) -> dict[str, Any]:
+        """Build the plain payload of a document, including its fingerprints.
+
+        Args:
+            doc: Source document.
+
+        Returns:
+            Payload before compression.
+        """
         # Build payload with content, org_id (required for tenant isolation), and metadata
         payload = {
             "content": doc.content,
@@ -176,12 +353,92 @@ class TurnsIndexer:
         if doc.session_id:
             payload["session_id"] = doc.session_id
 
-        # Create and return the point
-        return models.PointStruct(
-            id=doc.id,
-            vector=vectors,
-            payload=payload,
+        return fingerprint_payload(payload, content_hash(doc.content, self._model_versions()))
+
+    def _model_versions(self) -> list[str]:
+        """Models whose vectors a turn point holds, for its content hash."""
+        versions = self.embedders.model_versions()
+        used = [versions["text"]]
+        if self.config.enable_sparse:
+            used.append(versions["sparse"])
+            if self.config.enable_colbert:
+                used.append(versions["colbert"])
+        if self.late_chunks:
+            # Enabling late chunks (or resizing them) re-embeds turns stored without them
+            used.append(f"{versions['text']}/late-chunks-{self.config.late_chunk_tokens}")
+        return used
+
+    async def _collection_has_late_chunks(self) -> bool:
+        """Check the collection defines the late chunk vector.
+
+        Qdrant cannot add a named vector to an existing collection, and upserts
+        naming an unknown vector fail, so late chunks stay off for collections
+        created without it.
+        """
+        info = await self.qdrant.get_collection_info(self.config.collection_name)
+        vectors = info.config.params.vectors if info is not None else None
+        if isinstance(vectors, dict) and self.config.late_chunk_vector_name in vectors:
+            return True
+        logger.warning(
+            f"Collection '{self.config.collection_name}' has no "
+            f"'{self.config.late_chunk_vector_name}' vector; late chunking disabled "
+            f"(recreate the collection to enable it)"
         )
+        return False
+
+    async def _drop_unchanged(
+        self, documents: list[Document], payloads: list[dict[str, Any]]
+    ) -> tuple[list[Document], list[dict[str, Any]]]:
+        """Skip or payload-update unchanged documents, returning those to embed.
+
+        Turns missing from the hot collection are looked up in the cold tier
+        too, so redelivered turns the migrator already moved are not embedded
+        again into the hot collection.
+        """
+        plan = await self._plan_collection(
+            self.config.collection_name, documents, payloads, list(range(len(documents)))
+        )
+        cold_collection = self.config.cold_collection_name
+        if cold_collection and plan.embed:
+            cold_plan = await self._plan_collection(
+                cold_collection, documents, payloads, plan.embed
+            )
+            plan = DedupPlan(
+                embed=cold_plan.embed,
+                update_payload=plan.update_payload + cold_plan.update_payload,
+                skip=plan.skip + cold_plan.skip,
+            )
+        plan.record(self.config.collection_name)
+        return [documents[i] for i in plan.embed], [payloads[i] for i in plan.embed]
+
+    async def _plan_collection(
+        self,
+        collection_name: str,
+        documents: list[Document],
+        payloads: list[dict[str, Any]],
+        indices: list[int],
+    ) -> DedupPlan:
+        """Plan the given batch indices against one collection and apply payload updates."""
+        local = await plan_batch(
+            self.qdrant.client,
+            collection_name,
+            self.shard_router,
+            [documents[i].id for i in indices],
+            [payloads[i] for i in indices],
+        )
+        plan = DedupPlan(
+            embed=[indices[i] for i in local.embed],
+            update_payload=[indices[i] for i in local.update_payload],
+            skip=[indices[i] for i in local.skip],
+        )
+        await overwrite_payloads(
+            self.qdrant.client,
+            collection_name,
+            self.shard_router,
+            [documents[i].id for i in plan.update_payload],
+            [self.payload_codec.encode(payloads[i]) for i in plan.update_payload],
+        )
+        return plan
 
 
 class TurnFinalizedConsumerConfig(BaseModel):
@@ -192,6 +449,9 @@ class TurnFinalizedConsumerConfig(BaseModel):
     batch_config: BatchConfig = Field(default_factory=BatchConfig)
     indexer_config: TurnsIndexerConfig = Field(default_factory=TurnsIndexerConfig)
     heartbeat_interval_ms: int = Field(default=10000, description="NATS heartbeat interval")
+    pipeline_depth: int = Field(
+        default=2, ge=1, description="Batches queued between the embed and upsert stages"
+    )
     service_id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
 
 
@@ -200,7 +460,8 @@ class TurnFinalizedConsumer:
 
     Subscribes to the memory.turns.finalized NATS subject, builds complete
     turn documents from user + assistant + reasoning content, and batches
-    them for efficient indexing with multi-vector embeddings.
+    them for efficient indexing with multi-vector embeddings. Batches go
+    through an IndexingPipeline so embedding overlaps the previous upsert.
     """
 
     def __init__(
@@ -223,6 +484,7 @@ class TurnFinalizedConsumer:
         self.nats_pubsub = nats_pubsub
         self.config = config or TurnFinalizedConsumerConfig()
         self._batch_queue: BatchQueue | None = None
+        self._pipeline: IndexingPipeline | None = None
         self._running = False
         self._heartbeat_task: asyncio.Task[None] | None = None
 
@@ -240,10 +502,17 @@ class TurnFinalizedConsumer:
         # Connect to NATS
         await self.nats.connect()
 
-        # Create batch queue with indexing callback
+        # Create the embed/upsert pipeline and a batch queue feeding it
+        self._pipeline = IndexingPipeline(
+            embed=self.indexer.embed_documents,
+            upsert=self.indexer.upsert_points,
+            depth=self.config.pipeline_depth,
+            name="turns",
+        )
+        await self._pipeline.start()
         self._batch_queue = BatchQueue(
             config=self.config.batch_config,
-            flush_callback=self.indexer.index_documents,
+            flush_callback=self._pipeline.submit,
         )
 
         # Start batch queue
@@ -272,6 +541,8 @@ class TurnFinalizedConsumer:
                 topic=self.config.topic,
                 group_id=self.config.group_id,
                 handler=self._handle_message,
+                manual_ack=True,
+                capacity=self._fetch_capacity,
             )
         except asyncio.CancelledError:
             logger.info("Turn consumer task cancelled")
@@ -295,10 +566,15 @@ class TurnFinalizedConsumer:
                 await self._heartbeat_task
             self._heartbeat_task = None
 
-        # Flush batch queue
-        if self._batch_queue is not None:
-            await self._batch_queue.stop()
-            self._batch_queue = None
+        # Flush batch queue, wait for the pipeline to write it, then for the acks
+        batch_queue, self._batch_queue = self._batch_queue, None
+        if batch_queue is not None:
+            await batch_queue.stop()
+        if self._pipeline is not None:
+            await self._pipeline.stop()
+            self._pipeline = None
+            if batch_queue is not None:
+                await batch_queue.wait_settled()
 
         # Publish consumer_disconnected via NATS pub/sub
         if self.nats_pubsub:
@@ -316,27 +592,43 @@ class TurnFinalizedConsumer:
 
         logger.info("Turn consumer stopped")
 
-    async def _handle_message(self, subject: str, data: dict[str, Any]) -> None:
+    async def _handle_message(
+        self, subject: str, data: dict[str, Any], delivery: MessageDelivery | None = None
+    ) -> None:
         """Handle a single message from NATS.
 
+        The message is acked by the batch queue once its turn is indexed; if
+        it cannot be queued it is nak'ed for redelivery, and unparseable
+        events are terminated.
+
         Args:
             subject: NATS subject the message was received on.
             data: Parsed message payload.
+            delivery: Message settlement handle (None when acked by the client).
         """
         try:
             # Extract document from turn_finalized event
             document = self._parse_turn_finalized(data)
             if document is None:
                 logger.warning(f"Failed to parse turn_finalized event: {data}")
+                if delivery is not None:
+                    await delivery.term()
                 return
 
             # Add to batch queue
-            if self._batch_queue is not None:
-                await self._batch_queue.add(document)
-                logger.debug(f"Added turn document {document.id} to batch queue")
+            if self._batch_queue is None:
+                raise RuntimeError("Batch queue is not running")
+            await self._batch_queue.add(document, delivery)
+            logger.debug(f"Added turn document {document.id} to batch queue")
 
         except Exception as e:
             logger.error(f"Error processing turn message: {e}", exc_info=True)
+            if delivery is not None:
+                await delivery.nak()
+
+    def _fetch_capacity(self) -> int:
+        """Messages the batch queue can still take (fetching pauses at 0)."""
+        return self._batch_queue.free_capacity if self._batch_queue is not None else 0
 
     async def _heartbeat_loop(self) -> None:
         """Send periodic heartbeats via NATS pub/sub."""
@@ -454,7 +746,7 @@ class TurnFinalizedConsumer:
             return None
 
 
-def create_turns_consumer(
+async def create_turns_consumer(
     settings: Settings,
     qdrant_client: QdrantClientWrapper,
     embedder_factory: EmbedderFactory,
@@ -473,18 +765,28 @@ def create_turns_consumer(
     Returns:
         Configured TurnFinalizedConsumer ready to start.
     """
+    turn_tiers = TurnTiers.from_settings(settings)
     indexer_config = TurnsIndexerConfig(
         collection_name=settings.qdrant_collection,
+        cold_collection_name=turn_tiers.cold_collection if turn_tiers.enabled else None,
+        enable_late_chunks=late_chunks_from_settings(settings),
+        late_chunk_tokens=settings.late_chunk_tokens,
+        late_chunk_max_tokens=settings.late_chunk_max_tokens,
+        upsert=UpsertConfig.from_settings(settings),
+        sessions=SessionCentroidConfig.from_settings(settings),
     )
 
     indexer = TurnsIndexer(
         qdrant_client=qdrant_client,
         embedder_factory=embedder_factory,
         config=indexer_config,
+        shard_router=await SchemaManager(qdrant_client, settings).shard_router(),
+        payload_codec=PayloadCodec.from_settings(settings),
     )
 
     consumer_config = TurnFinalizedConsumerConfig(
         indexer_config=indexer_config,
+        pipeline_depth=settings.indexing_pipeline_depth,
     )
 
     return TurnFinalizedConsumer(
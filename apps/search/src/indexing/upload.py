@@ -0,0 +1,190 @@
+"""Chunked, parallel Qdrant upserts for the indexers.
+
+A batch used to go out as one ``upsert`` per shard key. With ColBERT
+multi-vectors (one 128-dim vector per token) a batch of long turns is tens of
+megabytes, and that single request dominated the upsert stage. Points are now
+split into chunks of roughly ``chunk_bytes`` and up to ``max_concurrency``
+chunks are in flight at once, each retried with exponential backoff.
+
+``wait=False`` returns once Qdrant has accepted a chunk into its write-ahead
+log instead of after it is applied, and ``ordering`` selects Qdrant's write
+ordering guarantee; both trade read-your-writes for throughput. A chunk that
+still fails after its retries fails the whole batch, which the consumers nak
+for redelivery (re-upserting the chunks that did succeed is idempotent).
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic import BaseModel, Field
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+from src.config import Settings
+from src.services.sharding import ShardRouter
+
+logger = logging.getLogger(__name__)
+
+# float32 components, as sent over gRPC (JSON over HTTP is several times larger)
+_BYTES_PER_COMPONENT = 4
+# A sparse component is an index plus a value
+_BYTES_PER_SPARSE_COMPONENT = 8
+
+
+class UpsertConfig(BaseModel):
+    """Configuration for chunked Qdrant upserts."""
+
+    chunk_bytes: int = Field(
+        default=4 * 1024 * 1024, ge=1, description="Approximate vector and payload bytes per chunk"
+    )
+    max_concurrency: int = Field(default=4, ge=1, description="Chunks upserted concurrently")
+    wait: bool = Field(default=True, description="Wait until each chunk is applied")
+    ordering: models.WriteOrdering | None = Field(
+        default=None, description="Write ordering: weak, medium or strong (Qdrant default if None)"
+    )
+    max_retries: int = Field(default=3, ge=0, description="Retries per chunk")
+    retry_delay_s: float = Field(
+        default=0.5, ge=0, description="Base retry delay in seconds, doubled per attempt"
+    )
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "UpsertConfig":
+        """Create the upsert configuration from application settings.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            Upsert configuration.
+        """
+        return cls(
+            chunk_bytes=settings.indexing_upsert_chunk_bytes,
+            max_concurrency=settings.indexing_upsert_concurrency,
+            wait=settings.indexing_upsert_wait,
+            ordering=settings.indexing_upsert_ordering,
+            max_retries=settings.indexing_upsert_retries,
+        )
+
+
+def estimate_point_bytes(point: models.PointStruct) -> int:
+    """Estimate the request size of a point.
+
+    Args:
+        point: Point to upsert.
+
+    Returns:
+        Approximate size in bytes of its vectors and JSON payload.
+    """
+    size = len(json.dumps(point.payload or {}, default=str))
+    vectors = point.vector.values() if isinstance(point.vector, dict) else [point.vector]
+    for vector in vectors:
+        if isinstance(vector, models.SparseVector):
+            size += _BYTES_PER_SPARSE_COMPONENT * len(vector.indices)
+        elif isinstance(vector, list) and vector and isinstance(vector[0], list):
+            size += _BYTES_PER_COMPONENT * sum(len(row) for row in vector)
+        elif isinstance(vector, list):
+            size += _BYTES_PER_COMPONENT * len(vector)
+    return size
+
+
+def chunk_points(
+    points: Sequence[models.PointStruct], chunk_bytes: int
+) -> list[list[models.PointStruct]]:
+    """Split points into consecutive chunks of at most ``chunk_bytes``.
+
+    A point larger than ``chunk_bytes`` gets a chunk of its own.
+
+    Args:
+        points: Points to upsert.
+        chunk_bytes: Approximate size limit per chunk.
+
+    Returns:
+        Chunks in point order.
+    """
+    chunks: list[list[models.PointStruct]] = []
+    current: list[models.PointStruct] = []
+    current_bytes = 0
+    for point in points:
+        size = estimate_point_bytes(point)
+        if current and current_bytes + size > chunk_bytes:
+            chunks.append(current)
+            current, current_bytes = [], 0
+        current.append(point)
+        current_bytes += size
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def upsert_chunked(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    points: Sequence[models.PointStruct],
+    shard_router: ShardRouter,
+    config: UpsertConfig,
+) -> None:
+    """Upsert points in parallel size-bounded chunks, one shard key per chunk.
+
+    Args:
+        client: Async Qdrant client.
+        collection_name: Target collection.
+        points: Points to upsert.
+        shard_router: Routes each point to its org's shard key.
+        config: Chunking, concurrency, write and retry settings.
+
+    Raises:
+        Exception: The error of a chunk that failed after all retries.
+    """
+    semaphore = asyncio.Semaphore(config.max_concurrency)
+
+    async def upsert(shard_kwargs: dict[str, Any], chunk: list[models.PointStruct]) -> None:
+        async with semaphore:
+            await _upsert_with_retries(client, collection_name, chunk, shard_kwargs, config)
+
+    jobs = [
+        upsert(shard_kwargs, chunk)
+        for shard_kwargs, shard_points in shard_router.partition(points)
+        for chunk in chunk_points(shard_points, config.chunk_bytes)
+    ]
+    logger.debug(f"Upserting {len(points)} points to {collection_name} in {len(jobs)} chunks")
+    await asyncio.gather(*jobs)
+
+
+async def _upsert_with_retries(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    chunk: list[models.PointStruct],
+    shard_kwargs: dict[str, Any],
+    config: UpsertConfig,
+) -> None:
+    for attempt in range(config.max_retries + 1):
+        try:
+            await client.upsert(
+                collection_name=collection_name,
+                points=chunk,
+                wait=config.wait,
+                ordering=config.ordering,
+                **shard_kwargs,
+            )
+            return
+        except Exception as e:
+            if attempt == config.max_retries or not _is_retryable(e):
+                raise
+            delay = config.retry_delay_s * (2**attempt)
+            logger.warning(
+                f"Upsert of {len(chunk)} points to {collection_name} failed "
+                f"(attempt {attempt + 1}/{config.max_retries + 1}): {e}. "
+                f"Retrying in {delay:.1f}s..."
+            )
+            await asyncio.sleep(delay)
+
+
+def _is_retryable(error: Exception) -> bool:
+    # Client errors (bad vectors, missing collection) fail the same way again
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code == 429 or error.status_code >= 500
+    return True
@@ -13,18 +13,34 @@ from src.api import router
 from src.clients import NatsClient, NatsClientConfig, NatsPubSubPublisher, QdrantClientWrapper
 from src.config import get_settings
 from src.embedders import EmbedderFactory
+from src.indexing.sessions import SessionCentroidConfig
 from src.indexing.turns import (
     TurnFinalizedConsumer,
     TurnFinalizedConsumerConfig,
     TurnsIndexer,
     TurnsIndexerConfig,
 )
+from src.indexing.upload import UpsertConfig
 from src.middleware.auth import AuthHandler, set_auth_handler
 from src.rerankers import RerankerRouter
 from src.retrieval import SearchRetriever
+from src.retrieval.constants import TURN_CHUNKS_FIELD
 from src.retrieval.multi_query import MultiQueryRetriever
-from src.retrieval.session import SessionAwareRetriever
-from src.services import SchemaManager, get_memory_collection_schema, get_turns_collection_schema
+from src.retrieval.session import SessionAwareRetriever, SessionRetrieverConfig
+from src.services import (
+    PayloadCodec,
+    SchemaManager,
+    ShardRouter,
+    TierMigrator,
+    TurnTiers,
+    apply_storage_settings,
+    get_cold_turns_schema,
+    get_memory_collection_schema,
+    get_sessions_collection_schema,
+    get_turns_collection_schema,
+    late_chunks_from_settings,
+    quantization_from_settings,
+)
 from src.utils.logging import configure_logging, get_logger
 from src.utils.metrics import SERVICE_INFO
 from src.utils.tracing import TracingMiddleware
@@ -93,6 +109,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     qdrant_client = QdrantClientWrapper(settings)
     embedder_factory = EmbedderFactory(settings)
 
+    shard_router = ShardRouter.from_settings(settings)
+    turn_tiers = TurnTiers.from_settings(settings)
+    payload_codec = PayloadCodec.from_settings(settings)
+    late_chunks = late_chunks_from_settings(settings)
+
     try:
         await qdrant_client.connect()
         app.state.qdrant = qdrant_client
@@ -100,7 +121,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         # Ensure engram_turns collection exists for turn-level indexing
         schema_manager = SchemaManager(qdrant_client, settings)
-        turns_schema = get_turns_collection_schema(settings.qdrant_collection)
+        quantization = quantization_from_settings(settings)
+        turns_schema = apply_storage_settings(
+            get_turns_collection_schema(
+                settings.qdrant_collection, quantization, late_chunks=late_chunks
+            ),
+            settings,
+        )
         created = await schema_manager.ensure_collection(turns_schema)
         if created:
             logger.info(
@@ -109,25 +136,108 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             )
 
         # Ensure engram_memory collection exists for memory indexing
-        memory_schema = get_memory_collection_schema("engram_memory")
+        memory_schema = apply_storage_settings(
+            get_memory_collection_schema("engram_memory", quantization), settings
+        )
         memory_created = await schema_manager.ensure_collection(memory_schema)
         if memory_created:
             logger.info(
                 "Created memory collection 'engram_memory' with 384-dim dense and sparse vectors"
             )
 
-        # Create tenant indexes for multi-tenancy support
-        try:
-            await schema_manager.ensure_tenant_index(settings.qdrant_collection)
-            logger.info(f"Tenant index ensured for collection '{settings.qdrant_collection}'")
-        except Exception as e:
-            logger.warning(f"Failed to create tenant index for turns collection: {e}")
+        schemas = [(turns_schema, created), (memory_schema, memory_created)]
 
+        # Ensure the sessions collection exists for session centroids (stage 1
+        # of session-aware retrieval), kept current by the turns indexer
+        if settings.session_centroids_enabled:
+            sessions_schema = apply_storage_settings(
+                get_sessions_collection_schema(settings.session_centroids_collection, quantization),
+                settings,
+            )
+            schemas.append(
+                (sessions_schema, await schema_manager.ensure_collection(sessions_schema))
+            )
+
+        # Ensure the on-disk cold tier exists when turns are time-tiered
+        if turn_tiers.enabled:
+            try:
+                cold_schema = get_cold_turns_schema(turns_schema, settings)
+                schemas.append((cold_schema, await schema_manager.ensure_collection(cold_schema)))
+                logger.info(
+                    f"Turn tiering enabled: hot '{turn_tiers.hot_collection}', "
+                    f"cold '{turn_tiers.cold_collection}'"
+                )
+            except Exception as e:
+                logger.error(f"Turn tiering disabled: {e}")
+                turn_tiers = TurnTiers(hot_collection=settings.qdrant_collection)
+
+        # Turns collections created before late chunking was enabled lack its
+        # vector (Qdrant cannot add one), so neither index nor search it there
+        if late_chunks:
+            turn_collections = [turns_schema.collection_name]
+            if turn_tiers.enabled:
+                turn_collections.append(turn_tiers.cold_collection)
+            for collection_name in turn_collections:
+                if not await schema_manager.has_vector(collection_name, TURN_CHUNKS_FIELD):
+                    logger.warning(
+                        f"Late chunking disabled: '{collection_name}' has no "
+                        f"'{TURN_CHUNKS_FIELD}' vector (recreate the collection to enable it)"
+                    )
+                    late_chunks = False
+                    break
+
+        # Apply storage placement changes to collections that already existed
+        for schema, was_created in schemas:
+            if was_created:
+                continue
+            try:
+                await schema_manager.reconcile_storage(schema)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to reconcile storage placement for '{schema.collection_name}': {e}"
+                )
+
+        # Create payload indexes (tenant + every filtered field), rebuilding stale ones
+        for schema, _ in schemas:
+            try:
+                await schema_manager.ensure_payload_indexes(schema)
+                logger.info(f"Payload indexes ensured for collection '{schema.collection_name}'")
+            except Exception as e:
+                logger.warning(
+                    f"Failed to ensure payload indexes for '{schema.collection_name}': {e}"
+                )
+
+        # Route by shard key only once every collection uses custom sharding,
+        # then create shard keys for new dedicated tenants
         try:
-            await schema_manager.ensure_tenant_index("engram_memory")
-            logger.info("Tenant index ensured for collection 'engram_memory'")
+            shard_router = await schema_manager.shard_router(
+                [schema.collection_name for schema, _ in schemas]
+            )
+            if shard_router.enabled:
+                for schema, _ in schemas:
+                    await schema_manager.ensure_shard_keys(schema)
+                logger.info(f"Shard keys ensured: {shard_router.shard_keys}")
         except Exception as e:
-            logger.warning(f"Failed to create tenant index for memory collection: {e}")
+            logger.error(f"Shard routing disabled: {e}")
+            shard_router = ShardRouter()
+
+        # Move turns past the hot window to the cold tier in the background,
+        # only in the one server process that owns the migration
+        if turn_tiers.enabled and settings.qdrant_turns_tier_migration_enabled:
+            tier_migrator = TierMigrator(
+                schema_manager,
+                turn_tiers,
+                shard_router,
+                interval_s=settings.qdrant_turns_tier_migration_interval_s,
+                batch_size=settings.qdrant_turns_tier_migration_batch_size,
+            )
+            app.state.tier_migration_task = asyncio.create_task(tier_migrator.run())
+            logger.info(
+                f"Turn tier migration started "
+                f"(every {settings.qdrant_turns_tier_migration_interval_s}s)"
+            )
+        elif turn_tiers.enabled:
+            logger.info("Turn tier migration left to the process that owns it")
 
         app.state.schema_manager = schema_manager
 
@@ -137,6 +247,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.qdrant = None
 
     # Initialize embedder factory
+    app.state.shard_router = shard_router
+    app.state.payload_codec = payload_codec
     app.state.embedder_factory = embedder_factory
 
     # Initialize reranker router
@@ -151,6 +263,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             embedder_factory=embedder_factory,
             reranker_router=reranker_router,
             settings=settings,
+            shard_router=shard_router,
+            turn_tiers=turn_tiers,
+            payload_codec=payload_codec,
+            turn_chunks=late_chunks,
         )
         app.state.search_retriever = search_retriever
         logger.info("Search retriever initialized")
@@ -169,15 +285,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             embedder_factory=embedder_factory,
             settings=settings,
             reranker_router=reranker_router,
+            config=SessionRetrieverConfig(
+                session_collection=settings.session_centroids_collection,
+                turn_collection=settings.qdrant_collection,
+                turn_vector_name="turn_dense",
+            ),
+            payload_codec=payload_codec,
         )
         app.state.session_aware_retriever = session_aware_retriever
         logger.info("Session-aware retriever initialized")
 
-        # Start turn indexing consumer if enabled
-        if settings.nats_consumer_enabled:
+        # Start turn indexing consumer if enabled; in search mode indexing runs
+        # in standalone workers (src.worker) so ingestion bursts don't hit search latency
+        if settings.service_mode == "search":
+            logger.info("Search-only mode: turn indexing left to indexing workers")
+            app.state.turns_consumer = None
+        elif settings.nats_consumer_enabled:
             try:
                 # Create NATS client
-                nats_config = NatsClientConfig(servers=settings.nats_url)
+                nats_config = NatsClientConfig(
+                    servers=settings.nats_url,
+                    pull_workers=settings.nats_pull_workers,
+                    fetch_max_batch=settings.nats_fetch_max_batch,
+                    ack_wait_s=settings.nats_ack_wait_s,
+                    max_deliver=settings.nats_max_deliver,
+                )
                 nats_client = NatsClient(config=nats_config)
                 app.state.nats_client = nats_client
 
@@ -189,19 +321,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 # Create turns indexer (disable sparse/colbert for HuggingFace API backend)
                 use_local_embeddings = settings.embedder_backend != "huggingface"
                 turns_indexer_config = TurnsIndexerConfig(
+                    cold_collection_name=(
+                        turn_tiers.cold_collection if turn_tiers.enabled else None
+                    ),
                     enable_sparse=use_local_embeddings,
                     enable_colbert=use_local_embeddings,
+                    enable_late_chunks=late_chunks,
+                    late_chunk_tokens=settings.late_chunk_tokens,
+                    late_chunk_max_tokens=settings.late_chunk_max_tokens,
+                    upsert=UpsertConfig.from_settings(settings),
+                    sessions=SessionCentroidConfig.from_settings(settings),
                 )
                 turns_indexer = TurnsIndexer(
                     qdrant_client=app.state.qdrant,
                     embedder_factory=embedder_factory,
                     config=turns_indexer_config,
+                    shard_router=shard_router,
+                    payload_codec=payload_codec,
                 )
                 app.state.turns_indexer = turns_indexer
 
                 # Create and start consumer
                 consumer_config = TurnFinalizedConsumerConfig(
                     group_id=settings.nats_consumer_group,
+                    pipeline_depth=settings.indexing_pipeline_depth,
                 )
                 turns_consumer = TurnFinalizedConsumer(
                     nats_client=nats_client,
@@ -256,6 +399,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.error(f"Error stopping turn consumer: {e}")
 
+    # Stop turn tier migration
+    if getattr(app.state, "tier_migration_task", None) is not None:
+        app.state.tier_migration_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app.state.tier_migration_task
+
     # Cancel consumer task
     if hasattr(app.state, "consumer_task") and app.state.consumer_task is not None:
         app.state.consumer_task.cancel()
@@ -28,6 +28,7 @@ from src.retrieval.classifier import (
 from src.retrieval.constants import (
     CODE_DENSE_FIELD,
     DEFAULT_RERANK_DEPTH,
+    HYBRID_PREFETCH_MULTIPLIER,
     MIN_SCORE_DENSE,
     MIN_SCORE_HYBRID,
     MIN_SCORE_SPARSE,
@@ -41,6 +42,8 @@ from src.retrieval.multi_query import (
     MultiQueryRetriever,
     QueryExpansionStrategy,
 )
+from src.retrieval.pagination import InvalidCursorError, ResultPageCache, SearchPage
+from src.retrieval.planner import QueryPlanner, current_query_plan
 from src.retrieval.retriever import SearchRetriever
 from src.retrieval.session import (
     SessionAwareRetriever,
@@ -49,12 +52,18 @@ from src.retrieval.session import (
     SessionRetrieverConfig,
 )
 from src.retrieval.types import (
+    FusionMethod,
+    PlanMode,
     QueryComplexity,
+    QueryPlan,
     RerankerTier,
     SearchFilters,
+    SearchPhase,
+    SearchPhaseType,
     SearchQuery,
     SearchResultItem,
     SearchStrategy,
+    SimilarVector,
     TimeRange,
 )
 
@@ -62,6 +71,13 @@ __all__ = [
     # Retriever
     "SearchRetriever",
     "MultiQueryRetriever",
+    # Query Planner
+    "QueryPlanner",
+    "current_query_plan",
+    # Pagination
+    "ResultPageCache",
+    "SearchPage",
+    "InvalidCursorError",
     # Session Retriever
     "SessionAwareRetriever",
     "SessionAwareSearchResult",
@@ -73,10 +89,16 @@ __all__ = [
     "QueryFeatures",
     # Types
     "SearchStrategy",
+    "FusionMethod",
+    "SimilarVector",
     "RerankerTier",
     "QueryComplexity",
     "SearchQuery",
     "SearchResultItem",
+    "SearchPhase",
+    "SearchPhaseType",
+    "PlanMode",
+    "QueryPlan",
     "SearchFilters",
     "TimeRange",
     "QueryExpansionStrategy",
@@ -88,6 +110,7 @@ __all__ = [
     "DEFAULT_RERANK_DEPTH",
     "RERANK_TIMEOUT_MS",
     "RRF_K",
+    "HYBRID_PREFETCH_MULTIPLIER",
     "TEXT_DENSE_FIELD",
     "CODE_DENSE_FIELD",
     "SPARSE_FIELD",
@@ -64,14 +64,25 @@ class QueryClassifier:
         re.IGNORECASE,
     )
     CODE_SYNTAX_PATTERN = re.compile(r"[a-zA-Z0-9_]+\(.*\)|[a-zA-Z0-9_]+\.[a-zA-Z0-9_]+")
+    # Tokens only an exact term match finds: identifiers, paths, numbers, error codes
+    LEXICAL_TOKEN_PATTERN = re.compile(
+        r"^(?:\S*[_./:()\[\]#=]\S*|\S*[a-z][A-Z]\S*|\S*\d\S*|[A-Z][A-Z_]{2,})$"
+    )
+    TRAILING_PUNCTUATION = "?!.,;:"
 
     def classify(self, query: str) -> ClassifyDict:
         """Classify query into search strategy with alpha weight.
 
         Heuristic classification:
         1. Quoted strings imply exact match intent -> Sparse
-        2. Code-like patterns (function calls, imports) -> Hybrid (lean sparse)
-        3. Natural language -> Hybrid (lean dense)
+        2. Only identifiers, paths or codes (at most 3 tokens) -> Hybrid (sparse only)
+        3. Code-like patterns (function calls, imports) -> Hybrid (lean sparse)
+        4. Long questions without names or lexical tokens -> Hybrid (dense only)
+        5. Natural language -> Hybrid (lean dense)
+
+        The decisive alphas (0.1, 0.9) fall below the default
+        ``search_hybrid_min_branch_weight`` for the weaker branch, so hybrid
+        search skips that branch's encoder and prefetch.
 
         Args:
             query: Search query to classify.
@@ -85,11 +96,29 @@ class QueryClassifier:
             # Alpha 0.1 = 10% dense, 90% sparse
             return {"strategy": SearchStrategy.SPARSE, "alpha": 0.1}
 
+        tokens = [token.rstrip(self.TRAILING_PUNCTUATION) for token in query.split()]
+        lexical = [bool(self.LEXICAL_TOKEN_PATTERN.match(token)) for token in tokens if token]
+
+        # Bare identifiers have no meaning for the dense model to match
+        if lexical and len(lexical) <= 3 and all(lexical):
+            return {"strategy": SearchStrategy.HYBRID, "alpha": 0.1}
+
         # Check for code syntax patterns
         if self.CODE_SYNTAX_PATTERN.search(query):
             # Lean towards sparse for code queries
             return {"strategy": SearchStrategy.HYBRID, "alpha": 0.3}
 
+        # Long questions in plain words are matched by meaning, not terms;
+        # capitalized names still need the sparse branch
+        names = any(token[:1].isupper() and token != "I" for token in tokens[1:])
+        if (
+            len(lexical) >= 8
+            and not any(lexical)
+            and not names
+            and self.QUESTION_PATTERN.search(query)
+        ):
+            return {"strategy": SearchStrategy.HYBRID, "alpha": 0.9}
+
         # Default: Hybrid leaning dense for natural language
         return {"strategy": SearchStrategy.HYBRID, "alpha": 0.7}
 
@@ -59,6 +59,15 @@ dense and sparse contributions.
 See: https://plg.uwaterloo.ca/~gvcormac/cormacksigir09-rrf.pdf
 """
 
+# Hybrid prefetch sizing
+HYBRID_PREFETCH_MULTIPLIER = 2
+"""Oversampling factor for each hybrid prefetch branch at equal weighting.
+
+Each branch fetches ``limit * HYBRID_PREFETCH_MULTIPLIER * 2 * weight`` candidates,
+where weight is alpha for dense and 1 - alpha for sparse. At alpha=0.5 both
+branches fetch ``limit * 2``; a branch never fetches fewer than ``limit``.
+"""
+
 # Qdrant vector field names
 TEXT_DENSE_FIELD = "text_dense"
 """Qdrant vector field name for dense text embeddings.
@@ -102,3 +111,18 @@ TURN_COLBERT_FIELD = "turn_colbert"
 Used for late-interaction search on complete conversation turns.
 Model: colbert-ir/colbertv2.0 (128 dimensions per token)
 """
+
+TURN_CHUNKS_FIELD = "turn_chunks"
+"""Qdrant multi-vector field name for late-chunked turn embeddings.
+
+One dense vector per chunk of the whole turn, pooled from a forward pass over
+its window, so content past the dense model's 512-token limit is searchable.
+Model: BAAI/bge-small-en-v1.5 (384 dimensions per chunk)
+"""
+
+MEMORY_COLLECTION = "engram_memory"
+"""Qdrant collection holding curated memories (decisions, facts, preferences).
+
+Uses the text_dense and text_sparse fields, embedded with the same models as
+turns, so one query embedding serves both collections in federated search.
+"""
@@ -0,0 +1,198 @@
+"""Cursor pagination over cached search result lists.
+
+Without pagination, fetching page 2 of a search re-runs embedding, retrieval
+and reranking with a larger limit, so deep pagination costs one full search
+per page. Instead, the first page materialises the reranked list up to
+``rerank_depth``, caches it, and returns an opaque cursor; later pages are
+sliced from the cached list.
+
+Cursors carry the cache key, org_id and offset. Cache keys are random, and a
+list is only served to the org that created it, so a cursor cannot be used to
+read another tenant's results. The cache is bounded by entry count, by the
+total number of cached results and by a TTL.
+"""
+
+import base64
+import binascii
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.config import Settings
+from src.retrieval.types import SearchResultItem
+from src.utils.metrics import record_page_cache
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed, expired, or belongs to another org."""
+
+
+@dataclass
+class PageCursor:
+    """Position in a cached result list."""
+
+    key: str
+    org_id: str
+    offset: int
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe string."""
+        raw = json.dumps({"k": self.key, "o": self.org_id, "n": self.offset}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "PageCursor":
+        """Decode a cursor produced by ``encode``.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            decoded = cls(key=str(data["k"]), org_id=str(data["o"]), offset=int(data["n"]))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as e:
+            raise InvalidCursorError("Malformed cursor") from e
+        if decoded.offset < 0:
+            raise InvalidCursorError("Malformed cursor")
+        return decoded
+
+
+@dataclass
+class SearchPage:
+    """One page of a paginated search."""
+
+    items: list[SearchResultItem]
+    # Cursor for the next page, None on the last page
+    next_cursor: str | None = None
+
+
+class ResultPageCache:
+    """Bounded TTL cache of reranked result lists, keyed by random IDs."""
+
+    def __init__(self, max_entries: int, max_results: int, ttl_s: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached lists (LRU eviction).
+            max_results: Maximum result items across all cached lists.
+            ttl_s: Seconds a list stays valid.
+        """
+        self.max_entries = max_entries
+        self.max_results = max_results
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[str, tuple[float, str, list[SearchResultItem]]] = OrderedDict()
+        self._cached_results = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ResultPageCache":
+        """Create a cache from application settings."""
+        return cls(
+            max_entries=settings.search_page_cache_size,
+            max_results=settings.search_page_cache_max_results,
+            ttl_s=settings.search_page_cache_ttl_s,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, org_id: str, items: list[SearchResultItem]) -> str | None:
+        """Cache a result list.
+
+        Args:
+            org_id: Organization that owns the results.
+            items: Full result list.
+
+        Returns:
+            Cache key, or None if the list does not fit in the cache.
+        """
+        if self.max_entries <= 0 or len(items) > self.max_results:
+            return None
+
+        key = uuid.uuid4().hex
+        self._entries[key] = (time.monotonic(), org_id, items)
+        self._cached_results += len(items)
+        while len(self._entries) > self.max_entries or self._cached_results > self.max_results:
+            self._evict(next(iter(self._entries)))
+        return key
+
+    def get(self, key: str, org_id: str) -> list[SearchResultItem]:
+        """Get a cached result list.
+
+        Args:
+            key: Cache key from ``put``.
+            org_id: Organization requesting the list.
+
+        Returns:
+            The cached result list.
+
+        Raises:
+            InvalidCursorError: If the list expired or belongs to another org.
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_s:
+            if entry is not None:
+                self._evict(key)
+            record_page_cache("expired")
+            raise InvalidCursorError("Cursor expired")
+
+        _, owner, items = entry
+        if owner != org_id:
+            record_page_cache("forbidden")
+            raise InvalidCursorError("Cursor expired")
+
+        self._entries.move_to_end(key)
+        record_page_cache("hit")
+        return items
+
+    def first_page(self, org_id: str, items: list[SearchResultItem], limit: int) -> SearchPage:
+        """Cache a freshly searched result list and return its first page.
+
+        Args:
+            org_id: Organization that owns the results.
+            items: Full result list (up to rerank depth).
+            limit: Page size.
+
+        Returns:
+            First page, with a cursor if more results remain and the list was cached.
+        """
+        next_cursor = None
+        if len(items) > limit:
+            key = self.put(org_id, items)
+            if key is not None:
+                next_cursor = PageCursor(key=key, org_id=org_id, offset=limit).encode()
+        return SearchPage(items=items[:limit], next_cursor=next_cursor)
+
+    def page(self, cursor: str, org_id: str, limit: int) -> SearchPage:
+        """Serve a page of a cached result list.
+
+        Args:
+            cursor: Cursor returned with the previous page.
+            org_id: Organization requesting the page.
+            limit: Page size.
+
+        Returns:
+            Page starting at the cursor's offset.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed, expired, or belongs
+                to another org.
+        """
+        decoded = PageCursor.decode(cursor)
+        # Reject before the lookup so foreign cursors never touch another org's entry
+        if decoded.org_id != org_id:
+            record_page_cache("forbidden")
+            raise InvalidCursorError("Cursor was issued to another organization")
+
+        items = self.get(decoded.key, org_id)
+        end = decoded.offset + limit
+        next_cursor = None
+        if end < len(items):
+            next_cursor = PageCursor(key=decoded.key, org_id=org_id, offset=end).encode()
+        return SearchPage(items=items[decoded.offset : end], next_cursor=next_cursor)
+
+    def _evict(self, key: str) -> None:
+        _, _, items = self._entries.pop(key)
+        self._cached_results -= len(items)
@@ -0,0 +1,246 @@
+"""Cost-based planning for filtered first-stage searches.
+
+A restrictive payload filter (one session, a narrow time range) can leave only a
+few hundred matching points. HNSW traversal then visits many nodes that fail the
+filter, so it is both slower and less accurate than scanning the matches
+exactly. The planner estimates filter cardinality with a cached Qdrant ``count``
+and picks, per query:
+
+- exact search when the filter matches few points
+- HNSW with a larger ``hnsw_ef`` when the filter is restrictive but not tiny
+- plain HNSW otherwise
+
+Below the exact-search threshold the matches are counted exactly (cheap at
+that size, and never cached) and the first-stage fetch is capped at that count.
+Estimates are approximate and cached, so they never cap the fetch: a low or
+stale estimate would silently shrink the rerank candidate pool.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+
+from qdrant_client.http import models
+
+from src.clients.qdrant import QdrantClientWrapper
+from src.config import Settings
+from src.retrieval.types import PlanMode, QueryPlan, SearchQuery
+from src.utils.metrics import record_query_plan
+
+logger = logging.getLogger(__name__)
+
+# Plan chosen for the current request's first stage, for response metadata
+current_query_plan: ContextVar[QueryPlan | None] = ContextVar("query_plan", default=None)
+
+# Payload fields that scope a filter to a tenant, not to a narrower subset
+TENANT_FIELDS = frozenset({"org_id"})
+
+
+class CardinalityCache:
+    """Bounded TTL cache of filter cardinality estimates."""
+
+    def __init__(self, max_size: int, ttl_s: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (LRU eviction).
+            ttl_s: Seconds an estimate stays valid.
+        """
+        self.max_size = max_size
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[str, tuple[float, int]] = OrderedDict()
+
+    def get(self, key: str) -> int | None:
+        """Get a cached estimate, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, count = entry
+        if time.monotonic() - stored_at > self.ttl_s:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return count
+
+    def put(self, key: str, count: int) -> None:
+        """Cache an estimate, evicting the least recently used entry if full."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic(), count)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class QueryPlanner:
+    """Chooses exact vs HNSW search from estimated filter cardinality.
+
+    Attributes:
+        qdrant_client: Qdrant client wrapper used for count requests.
+        settings: Application settings with planner thresholds.
+        cache: Cardinality estimates keyed by collection, shard and filter.
+    """
+
+    def __init__(self, qdrant_client: QdrantClientWrapper, settings: Settings) -> None:
+        """Initialize the planner.
+
+        Args:
+            qdrant_client: Qdrant client wrapper.
+            settings: Application settings.
+        """
+        self.qdrant_client = qdrant_client
+        self.settings = settings
+        self.cache = CardinalityCache(
+            max_size=settings.search_planner_count_cache_size,
+            ttl_s=settings.search_planner_count_cache_ttl_s,
+        )
+
+    @staticmethod
+    def is_selective(qdrant_filter: models.Filter | None) -> bool:
+        """Whether a filter narrows results below the whole tenant."""
+        if qdrant_filter is None or not qdrant_filter.must:
+            return False
+        return any(
+            getattr(condition, "key", None) not in TENANT_FIELDS for condition in qdrant_filter.must
+        )
+
+    async def plan(
+        self,
+        query: SearchQuery,
+        collection_name: str,
+        qdrant_filter: models.Filter | None,
+        fetch_limit: int,
+        shard_key: str | None = None,
+    ) -> QueryPlan:
+        """Plan the first stage of a query.
+
+        Args:
+            query: Search query (explicit exact/hnsw_ef skip planning).
+            collection_name: Collection being searched.
+            qdrant_filter: First-stage filter.
+            fetch_limit: Candidates the retriever would fetch without planning.
+            shard_key: Shard key the query is routed to.
+
+        Returns:
+            The chosen plan, also published to ``current_query_plan``.
+        """
+        plan = await self._plan(query, collection_name, qdrant_filter, fetch_limit, shard_key)
+        current_query_plan.set(plan)
+        return plan
+
+    async def _plan(
+        self,
+        query: SearchQuery,
+        collection_name: str,
+        qdrant_filter: models.Filter | None,
+        fetch_limit: int,
+        shard_key: str | None,
+    ) -> QueryPlan:
+        if query.exact or query.hnsw_ef is not None:
+            record_query_plan(PlanMode.MANUAL.value)
+            return QueryPlan(mode=PlanMode.MANUAL, fetch_limit=fetch_limit)
+
+        if not self.settings.search_planner_enabled or not self.is_selective(qdrant_filter):
+            record_query_plan(PlanMode.HNSW.value)
+            return QueryPlan(mode=PlanMode.HNSW, fetch_limit=fetch_limit)
+
+        estimate, cached = await self.estimate(collection_name, qdrant_filter, shard_key)
+        cache_result = "hit" if cached else "miss"
+        if estimate is None:
+            record_query_plan(PlanMode.HNSW.value, cache_result)
+            return QueryPlan(mode=PlanMode.HNSW, fetch_limit=fetch_limit)
+
+        capped_limit = fetch_limit
+        if estimate <= self.settings.search_planner_exact_threshold:
+            matches = await self.count_exact(collection_name, qdrant_filter, shard_key)
+            if matches is not None:
+                # No point fetching more candidates than the filter can match
+                estimate = matches
+                capped_limit = max(query.limit, min(fetch_limit, matches))
+
+        if estimate <= self.settings.search_planner_exact_threshold:
+            mode, hnsw_ef = PlanMode.EXACT, None
+        elif estimate <= self.settings.search_planner_filtered_threshold:
+            mode, hnsw_ef = PlanMode.FILTERED_HNSW, self.settings.search_planner_filtered_hnsw_ef
+        else:
+            mode, hnsw_ef = PlanMode.HNSW, None
+
+        record_query_plan(mode.value, cache_result)
+        logger.debug(
+            f"Query plan: mode={mode.value}, estimated_matches={estimate}, "
+            f"fetch_limit={capped_limit}, cached={cached}"
+        )
+        return QueryPlan(
+            mode=mode,
+            fetch_limit=capped_limit,
+            estimated_matches=estimate,
+            hnsw_ef=hnsw_ef,
+            cached=cached,
+        )
+
+    async def estimate(
+        self,
+        collection_name: str,
+        qdrant_filter: models.Filter,
+        shard_key: str | None = None,
+    ) -> tuple[int | None, bool]:
+        """Estimate how many points match a filter.
+
+        Uses Qdrant's approximate count, which reads payload index cardinality
+        instead of scanning points, and caches it briefly.
+
+        Args:
+            collection_name: Collection to count in.
+            qdrant_filter: Filter to estimate.
+            shard_key: Shard key to count in (all shards if None).
+
+        Returns:
+            Tuple of (estimated matches or None if the count failed, cache hit).
+        """
+        key = f"{collection_name}|{shard_key}|{qdrant_filter.model_dump_json(exclude_none=True)}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached, True
+
+        try:
+            result = await self.qdrant_client.client.count(
+                collection_name=collection_name,
+                count_filter=qdrant_filter,
+                exact=False,
+                shard_key_selector=shard_key,
+            )
+        except Exception as e:
+            logger.warning(f"Filter cardinality estimate failed, planning HNSW: {e}")
+            return None, False
+
+        self.cache.put(key, result.count)
+        return result.count, False
+
+    async def count_exact(
+        self,
+        collection_name: str,
+        qdrant_filter: models.Filter,
+        shard_key: str | None = None,
+    ) -> int | None:
+        """Count the points matching a small filter exactly, bypassing the cache.
+
+        Args:
+            collection_name: Collection to count in.
+            qdrant_filter: Filter to count.
+            shard_key: Shard key to count in (all shards if None).
+
+        Returns:
+            Number of matching points, or None if the count failed.
+        """
+        try:
+            result = await self.qdrant_client.client.count(
+                collection_name=collection_name,
+                count_filter=qdrant_filter,
+                exact=True,
+                shard_key_selector=shard_key,
+            )
+        except Exception as e:
+            logger.warning(f"Exact filter count failed, not capping the fetch: {e}")
+            return None
+        return result.count
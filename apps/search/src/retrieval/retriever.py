@@ -3,12 +3,21 @@
 This module implements the core search retrieval pipeline for Engram, supporting:
 - Multiple search strategies (dense, sparse, hybrid)
 - Qdrant's built-in Reciprocal Rank Fusion for hybrid search
+- Alpha-weighted prefetch budgets and score-based fusion for hybrid search
 - Multi-tier reranking with graceful degradation
+- Per-request HNSW/exact/quantization search parameters
+- Request deadlines budgeted across first-stage retrieval, reranking and hydration
 - Automatic strategy selection via query classification
+- Similar-by-id search over stored vectors, with no query embedding
+- Cursor pagination over cached reranked result lists
 """
 
 import asyncio
 import logging
+import math
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from typing import Any
 
 from qdrant_client.http import models
@@ -16,20 +25,57 @@ from qdrant_client.http import models
 from src.clients.qdrant import QdrantClientWrapper
 from src.config import Settings
 from src.embedders.factory import EmbedderFactory
+from src.embedders.scheduler import EmbeddingLane
 from src.rerankers.router import RerankerRouter
 from src.retrieval.classifier import QueryClassifier
 from src.retrieval.constants import (
     CODE_DENSE_FIELD,
+    HYBRID_PREFETCH_MULTIPLIER,
+    MEMORY_COLLECTION,
     SPARSE_FIELD,
     TEXT_DENSE_FIELD,
+    TURN_CHUNKS_FIELD,
+    TURN_COLBERT_FIELD,
     TURN_DENSE_FIELD,
     TURN_SPARSE_FIELD,
 )
-from src.retrieval.types import RerankerTier, SearchQuery, SearchResultItem, SearchStrategy
+from src.retrieval.pagination import ResultPageCache, SearchPage
+from src.retrieval.planner import QueryPlanner, current_query_plan
+from src.retrieval.types import (
+    FusionMethod,
+    QueryPlan,
+    RerankerTier,
+    SearchFilters,
+    SearchPhase,
+    SearchPhaseType,
+    SearchQuery,
+    SearchResultItem,
+    SearchStrategy,
+    SimilarVector,
+)
+from src.services.compression import PayloadCodec
+from src.services.sharding import ShardRouter
+from src.services.tiering import TurnTiers
+from src.utils.deadline import Deadline
+from src.utils.metrics import record_deadline_degradation
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class FirstStageResult:
+    """Candidates from first-stage retrieval, before reranking."""
+
+    raw_results: list[models.ScoredPoint]
+    strategy: SearchStrategy
+    collection_name: str
+    payload_selector: bool | models.PayloadSelector
+    shard_key: str | None = None
+    plan: QueryPlan | None = None
+    # Collection each candidate came from, when fanned out across turn tiers
+    point_collections: dict[str, str] | None = None
+
+
 class SearchRetriever:
     """Main search retriever with hybrid search and multi-tier reranking.
 
@@ -48,6 +94,12 @@ class SearchRetriever:
         classifier: Query classifier for automatic strategy selection.
         settings: Application settings.
         collection_name: Qdrant collection name.
+        shard_router: Maps the query's org_id to a Qdrant shard key.
+        planner: Chooses exact vs HNSW search for filtered queries.
+        turn_tiers: Hot/cold turn collections searched by search_turns.
+        page_cache: Reranked result lists served by cursor to search_page.
+        payload_codec: Restores compressed payload fields in results.
+        turn_chunks: Whether search_turns also matches late-chunked turn vectors.
     """
 
     def __init__(
@@ -56,6 +108,10 @@ class SearchRetriever:
         embedder_factory: EmbedderFactory,
         reranker_router: RerankerRouter,
         settings: Settings,
+        shard_router: ShardRouter | None = None,
+        turn_tiers: TurnTiers | None = None,
+        payload_codec: PayloadCodec | None = None,
+        turn_chunks: bool = False,
     ) -> None:
         """Initialize search retriever.
 
@@ -64,6 +120,11 @@ class SearchRetriever:
             embedder_factory: Factory for embedder instances.
             reranker_router: Router for reranking.
             settings: Application settings.
+            shard_router: Routes queries to the org's shard key (no routing if None).
+            turn_tiers: Hot/cold turn collections (the turns collection only if None).
+            payload_codec: Restores compressed payload fields in results.
+            turn_chunks: Match late-chunked turn vectors (the turns collections
+                must define them).
         """
         self.qdrant_client = qdrant_client
         self.embedder_factory = embedder_factory
@@ -72,6 +133,12 @@ class SearchRetriever:
         self.classifier = QueryClassifier()
         self.collection_name = settings.qdrant_collection
         self.turns_collection_name = settings.qdrant_collection
+        self.shard_router = shard_router or ShardRouter()
+        self.planner = QueryPlanner(qdrant_client, settings)
+        self.turn_tiers = turn_tiers or TurnTiers(hot_collection=settings.qdrant_collection)
+        self.page_cache = ResultPageCache.from_settings(settings)
+        self.payload_codec = payload_codec or PayloadCodec()
+        self.turn_chunks = turn_chunks
 
     async def search(self, query: SearchQuery) -> list[SearchResultItem]:
         """Execute search with optional reranking.
@@ -89,32 +156,270 @@ class SearchRetriever:
         Returns:
             List of search result items sorted by relevance.
         """
-        text = query.text
-        limit = query.limit
-        threshold = query.threshold
-        filters = query.filters
-        user_strategy = query.strategy
-        rerank = query.rerank
-        rerank_tier = query.rerank_tier
-        rerank_depth = query.rerank_depth
+        stage = await self._run_first_stage(query, turns=False)
+        if stage is None:
+            return []
+        return await self._finalize(query, stage)
 
-        # Determine effective limit: oversample if reranking is enabled
-        fetch_limit = max(rerank_depth, limit) if rerank else limit
+    async def search_page(
+        self,
+        query: SearchQuery,
+        cursor: str | None = None,
+        turns: bool = True,
+        federated: bool = False,
+    ) -> SearchPage:
+        """Search one page at a time.
+
+        Without a cursor, runs the full search once with ``rerank_depth``
+        results, caches that list and returns its first ``query.limit`` items.
+        With a cursor, the next page is sliced from the cached list, so nothing
+        is embedded, retrieved or reranked again.
+
+        Args:
+            query: Search query (only filters.org_id and limit are used with a cursor).
+            cursor: Cursor returned with the previous page.
+            turns: Search the turns collection (True) or the default collection.
+            federated: Search turns and memories together (overrides ``turns``).
+
+        Returns:
+            The page, with a cursor for the next one if more results remain.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed, expired, or belongs
+                to another org.
+        """
+        # Enforce tenant isolation before touching the cache
+        self._build_qdrant_filter(query.filters)
+        org_id = query.filters.org_id
+        if cursor is not None:
+            return self.page_cache.page(cursor, org_id, query.limit)
+
+        depth_query = query.model_copy(update={"limit": max(query.rerank_depth, query.limit)})
+        if federated:
+            items = await self.search_federated(depth_query)
+        elif turns:
+            items = await self.search_turns(depth_query)
+        else:
+            items = await self.search(depth_query)
+        return self.page_cache.first_page(org_id, items, query.limit)
+
+    async def search_phases(
+        self,
+        query: SearchQuery,
+        turns: bool = True,
+    ) -> AsyncIterator[SearchPhase]:
+        """Execute search and yield results as each stage completes.
+
+        Yields first-stage fused candidates as soon as Qdrant returns, then either
+        the reranked results or a rerank-skipped marker. Candidate payloads may be
+        projected to first-stage fields; reranked results carry full payloads.
+
+        Args:
+            query: Search query with retrieval parameters.
+            turns: Search the turns collection (True) or the default collection.
+
+        Yields:
+            SearchPhase for the candidates stage, then the final stage.
+        """
+        stage = await self._run_first_stage(query, turns=turns)
+        if stage is None:
+            yield SearchPhase(phase=SearchPhaseType.CANDIDATES, results=[])
+            yield SearchPhase(phase=SearchPhaseType.RERANK_SKIPPED, reason="no_results")
+            return
+
+        yield SearchPhase(
+            phase=SearchPhaseType.CANDIDATES,
+            results=self._map_raw_results(stage.raw_results[: query.limit]),
+            plan=stage.plan,
+        )
+
+        if not query.rerank or not stage.raw_results:
+            reason = "rerank_disabled" if not query.rerank else "no_results"
+            yield SearchPhase(phase=SearchPhaseType.RERANK_SKIPPED, reason=reason)
+            return
+
+        deadline = self._deadline(query)
+        if deadline is not None and not self._can_rerank(deadline):
+            record_deadline_degradation("skip_rerank")
+            yield SearchPhase(phase=SearchPhaseType.RERANK_SKIPPED, reason="deadline")
+            return
+
+        yield SearchPhase(
+            phase=SearchPhaseType.RERANKED,
+            results=await self._finalize(query, stage),
+        )
+
+    def _resolve_strategy(self, query: SearchQuery) -> tuple[SearchStrategy, float | None]:
+        """Resolve the effective search strategy and hybrid alpha for a query.
+
+        Args:
+            query: Search query with optional explicit strategy and alpha.
+
+        Returns:
+            Tuple of (strategy, alpha). Alpha is None for non-hybrid strategies
+            unless explicitly provided.
+        """
+        alpha = query.alpha
 
         # Determine strategy using classifier if not provided
         # Use config default (allows forcing dense when sparse unavailable)
         default_strategy = SearchStrategy(self.settings.search_default_strategy)
-        strategy: SearchStrategy | str = user_strategy or default_strategy
+        strategy: SearchStrategy | str = query.strategy or default_strategy
         # Only use classifier for auto-selection when default is hybrid
         # This allows forcing dense mode when sparse embeddings are unavailable
-        if not user_strategy and default_strategy == SearchStrategy.HYBRID:
-            classification = self.classifier.classify(text)
+        if not query.strategy and default_strategy == SearchStrategy.HYBRID:
+            classification = self.classifier.classify(query.text)
             strategy = classification["strategy"]
+            if alpha is None:
+                alpha = classification["alpha"]
 
         # Convert string to enum if needed
         if isinstance(strategy, str):
             strategy = SearchStrategy(strategy)
 
+        # Explicit hybrid requests still get a classifier alpha for branch weighting
+        if strategy == SearchStrategy.HYBRID and alpha is None:
+            alpha = self.classifier.classify(query.text)["alpha"]
+
+        return strategy, alpha
+
+    @staticmethod
+    def _deadline(query: SearchQuery) -> Deadline | None:
+        """Get the request deadline for a query, if any."""
+        if query.deadline_ms is None:
+            return None
+        return Deadline(query.deadline_ms)
+
+    def _can_rerank(self, deadline: Deadline, share: float = 1.0) -> bool:
+        """Check whether enough budget remains to rerank.
+
+        Args:
+            deadline: Request deadline.
+            share: Share of the remaining budget available to reranking.
+
+        Returns:
+            True if the reranking allocation meets the configured minimum.
+        """
+        return deadline.allocate_ms(share) >= self.settings.search_deadline_min_rerank_ms
+
+    def _fetch_limit(self, query: SearchQuery) -> int:
+        """Compute the first-stage fetch limit for a query.
+
+        Oversamples to ``rerank_depth`` when reranking, unless the request's
+        deadline leaves too little budget to rerank, in which case only the
+        final top-k is fetched.
+
+        Args:
+            query: Search query with retrieval parameters.
+
+        Returns:
+            Number of candidates to request from Qdrant.
+        """
+        if not query.rerank:
+            return query.limit
+
+        deadline = self._deadline(query)
+        if deadline is not None and not self._can_rerank(
+            deadline, self.settings.search_deadline_rerank_share
+        ):
+            record_deadline_degradation("reduce_prefetch")
+            return query.limit
+
+        return max(query.rerank_depth, query.limit)
+
+    async def _run_first_stage(
+        self, query: SearchQuery, turns: bool, federated: bool = False
+    ) -> FirstStageResult | None:
+        """Run first-stage retrieval within the request's deadline budget.
+
+        Embedding and Qdrant calls share the first-stage allocation: the whole
+        remaining budget, less the share reserved for reranking when it is planned.
+
+        Args:
+            query: Search query with retrieval parameters.
+            turns: Search the turns collection (True) or the default collection.
+            federated: Search turns and memories together (overrides ``turns``).
+
+        Returns:
+            First-stage candidates, or None if the strategy is unknown.
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed or expires mid-stage.
+        """
+        if federated:
+            first_stage = self._first_stage_federated(query)
+        elif turns:
+            first_stage = self._first_stage_turns(query)
+        else:
+            first_stage = self._first_stage(query)
+
+        deadline = self._deadline(query)
+        if deadline is None:
+            return await first_stage
+
+        share = 1.0
+        if query.rerank and self._can_rerank(deadline, self.settings.search_deadline_rerank_share):
+            share -= self.settings.search_deadline_rerank_share
+        return await deadline.run(first_stage, "first_stage", deadline.allocate_ms(share))
+
+    def _search_params(
+        self, query: SearchQuery, strategy: SearchStrategy, plan: QueryPlan | None = None
+    ) -> models.SearchParams | None:
+        """Build dense-search parameters from the request, plan and per-strategy config.
+
+        Args:
+            query: Search query with optional HNSW and quantization overrides.
+            strategy: Effective search strategy.
+            plan: Optional query plan (exact scan or tuned hnsw_ef).
+
+        Returns:
+            Qdrant search params, or None to use the collection defaults.
+        """
+        hnsw_ef = (
+            query.hnsw_ef
+            or (plan.hnsw_ef if plan else None)
+            or self.settings.search_hnsw_ef.get(strategy.value)
+        )
+        exact = query.exact or (plan is not None and plan.exact)
+
+        rescore = (
+            query.quantization_rescore
+            if query.quantization_rescore is not None
+            else self.settings.search_quantization_rescore
+        )
+        oversampling = (
+            query.quantization_oversampling or self.settings.search_quantization_oversampling
+        )
+        # Rescoring on with no oversampling is Qdrant's default behaviour
+        quantization = (
+            models.QuantizationSearchParams(rescore=rescore, oversampling=oversampling)
+            if not rescore or oversampling is not None
+            else None
+        )
+
+        if hnsw_ef is None and not exact and quantization is None:
+            return None
+        return models.SearchParams(hnsw_ef=hnsw_ef, exact=exact, quantization=quantization)
+
+    async def _first_stage(self, query: SearchQuery) -> FirstStageResult | None:
+        """Run first-stage retrieval against the default collection.
+
+        Args:
+            query: Search query with retrieval parameters.
+
+        Returns:
+            First-stage candidates, or None if the strategy is unknown.
+        """
+        text = query.text
+        limit = query.limit
+        threshold = query.threshold
+        filters = query.filters
+
+        # Determine effective limit: oversample if reranking is enabled
+        fetch_limit = self._fetch_limit(query)
+
+        strategy, alpha = self._resolve_strategy(query)
+
         # Get effective threshold based on strategy
         threshold_map = {
             SearchStrategy.DENSE: self.settings.search_min_score_dense,
@@ -127,8 +432,19 @@ class SearchRetriever:
         is_code_search = filters and filters.type == "code"
         vector_name = CODE_DENSE_FIELD if is_code_search else TEXT_DENSE_FIELD
 
-        # Build Qdrant filter
+        # Build Qdrant filter and route to the org's shard
         qdrant_filter = self._build_qdrant_filter(filters)
+        shard_key = self.shard_router.shard_key(filters.org_id)
+
+        # Pick exact vs HNSW and the fetch size from the filter's cardinality
+        plan = await self.planner.plan(
+            query, self.collection_name, qdrant_filter, fetch_limit, shard_key
+        )
+        fetch_limit = plan.fetch_limit
+        search_params = self._search_params(query, strategy, plan)
+
+        # Project first-stage payloads when oversampling for reranking
+        payload_selector = self._first_stage_payload_selector(fetch_limit, limit)
 
         # Fetch raw results based on strategy
         if strategy == SearchStrategy.DENSE:
@@ -138,6 +454,9 @@ class SearchRetriever:
                 limit=fetch_limit,
                 threshold=effective_threshold,
                 qdrant_filter=qdrant_filter,
+                with_payload=payload_selector,
+                search_params=search_params,
+                shard_key=shard_key,
             )
         elif strategy == SearchStrategy.SPARSE:
             raw_results = await self._search_sparse(
@@ -145,6 +464,8 @@ class SearchRetriever:
                 limit=fetch_limit,
                 threshold=effective_threshold,
                 qdrant_filter=qdrant_filter,
+                with_payload=payload_selector,
+                shard_key=shard_key,
             )
         elif strategy == SearchStrategy.HYBRID:
             raw_results = await self._search_hybrid(
@@ -152,29 +473,93 @@ class SearchRetriever:
                 vector_field=vector_name,
                 limit=fetch_limit,
                 qdrant_filter=qdrant_filter,
+                alpha=alpha,
+                fusion=query.fusion,
+                with_payload=payload_selector,
+                search_params=search_params,
+                shard_key=shard_key,
             )
         else:
             logger.error(f"Unknown search strategy: {strategy}")
-            return []
+            return None
 
         logger.debug(
             f"Retrieved {len(raw_results)} results for strategy={strategy}, "
             f"fetch_limit={fetch_limit}"
         )
 
+        return FirstStageResult(
+            raw_results=raw_results,
+            strategy=strategy,
+            collection_name=self.collection_name,
+            payload_selector=payload_selector,
+            shard_key=shard_key,
+            plan=plan,
+        )
+
+    async def _finalize(
+        self,
+        query: SearchQuery,
+        stage: FirstStageResult,
+    ) -> list[SearchResultItem]:
+        """Rerank (if enabled), trim and hydrate first-stage candidates.
+
+        Args:
+            query: Search query with retrieval parameters.
+            stage: First-stage candidates.
+
+        Returns:
+            Final search result items sorted by relevance.
+        """
+        raw_results = stage.raw_results
+        deadline = self._deadline(query)
+
         # Apply reranking if enabled
-        if rerank and raw_results:
-            return await self._apply_reranking(
-                query_text=text,
+        if query.rerank and raw_results and deadline is not None and not self._can_rerank(deadline):
+            # Too little budget left to rerank: return first-stage order instead
+            record_deadline_degradation("skip_rerank")
+            items = self._map_raw_results(raw_results[: query.limit])
+            for item in items:
+                item.degraded = True
+                item.degraded_reason = "Deadline budget exhausted before reranking"
+        elif query.rerank and raw_results:
+            items = await self._apply_reranking(
+                query_text=query.text,
                 raw_results=raw_results,
-                limit=limit,
-                rerank_tier=rerank_tier,
-                strategy=strategy,
+                limit=query.limit,
+                rerank_tier=query.rerank_tier,
+                strategy=stage.strategy,
+                deadline=deadline,
             )
+        else:
+            # No reranking - return raw results trimmed to limit
+            logger.debug(f"Skipping reranking (rerank={query.rerank}, results={len(raw_results)})")
+            items = self._map_raw_results(raw_results[: query.limit])
+
+        if stage.payload_selector is not True:
+            if stage.point_collections is None:
+                items = await self._hydrate_payloads(
+                    stage.collection_name, items, deadline, shard_key=stage.shard_key
+                )
+            else:
+                # Candidates fanned out across tiers: hydrate each from its own collection
+                by_collection: dict[str, list[SearchResultItem]] = {}
+                for item in items:
+                    collection = stage.point_collections.get(str(item.id), stage.collection_name)
+                    by_collection.setdefault(collection, []).append(item)
+                await asyncio.gather(
+                    *(
+                        self._hydrate_payloads(
+                            collection, group, deadline, shard_key=stage.shard_key
+                        )
+                        for collection, group in by_collection.items()
+                    )
+                )
 
-        # No reranking - return raw results trimmed to limit
-        logger.debug(f"Skipping reranking (rerank={rerank}, results={len(raw_results)})")
-        return self._map_raw_results(raw_results[:limit])
+        if stage.point_collections is not None:
+            for item in items:
+                item.collection = stage.point_collections.get(str(item.id))
+        return items
 
     async def _search_dense(
         self,
@@ -183,6 +568,9 @@ class SearchRetriever:
         limit: int,
         threshold: float,
         qdrant_filter: models.Filter | None,
+        with_payload: bool | models.PayloadSelector = True,
+        search_params: models.SearchParams | None = None,
+        shard_key: str | None = None,
     ) -> list[models.ScoredPoint]:
         """Execute dense vector search.
 
@@ -194,6 +582,9 @@ class SearchRetriever:
             limit: Number of results to retrieve.
             threshold: Minimum score threshold.
             qdrant_filter: Optional Qdrant filter.
+            with_payload: Payload selector for returned points (all fields by default).
+            search_params: Optional HNSW/exact/quantization search parameters.
+            shard_key: Shard key to route the query to (all shards if None).
 
         Returns:
             List of scored points from Qdrant.
@@ -213,8 +604,10 @@ class SearchRetriever:
             using=vector_field,
             query_filter=qdrant_filter,
             limit=limit,
-            with_payload=True,
+            with_payload=with_payload,
             score_threshold=threshold,
+            search_params=search_params,
+            shard_key_selector=shard_key,
         )
 
         return results.points
@@ -225,6 +618,8 @@ class SearchRetriever:
         limit: int,
         threshold: float,
         qdrant_filter: models.Filter | None,
+        with_payload: bool | models.PayloadSelector = True,
+        shard_key: str | None = None,
     ) -> list[models.ScoredPoint]:
         """Execute sparse vector search.
 
@@ -235,6 +630,8 @@ class SearchRetriever:
             limit: Number of results to retrieve.
             threshold: Minimum score threshold.
             qdrant_filter: Optional Qdrant filter.
+            with_payload: Payload selector for returned points (all fields by default).
+            shard_key: Shard key to route the query to (all shards if None).
 
         Returns:
             List of scored points from Qdrant.
@@ -243,7 +640,7 @@ class SearchRetriever:
         sparse_embedder = await self.embedder_factory.get_sparse_embedder()
 
         # Generate sparse query vector
-        sparse_dict = sparse_embedder.embed_sparse(text)
+        sparse_dict = await sparse_embedder.embed_sparse_async(text, lane=EmbeddingLane.QUERY)
 
         # Convert to Qdrant sparse vector format
         sparse_vector = models.SparseVector(
@@ -258,8 +655,9 @@ class SearchRetriever:
             using=SPARSE_FIELD,
             query_filter=qdrant_filter,
             limit=limit,
-            with_payload=True,
+            with_payload=with_payload,
             score_threshold=threshold,
+            shard_key_selector=shard_key,
         )
 
         return results.points
@@ -270,66 +668,408 @@ class SearchRetriever:
         vector_field: str,
         limit: int,
         qdrant_filter: models.Filter | None,
+        alpha: float | None = None,
+        fusion: FusionMethod | None = None,
+        with_payload: bool | models.PayloadSelector = True,
+        search_params: models.SearchParams | None = None,
+        shard_key: str | None = None,
     ) -> list[models.ScoredPoint]:
-        """Execute hybrid search with RRF fusion.
+        """Execute hybrid search with alpha-weighted fusion.
 
-        Combines dense and sparse search using Qdrant's built-in RRF fusion.
+        Combines dense and sparse search using Qdrant's built-in fusion (RRF or
+        DBSF) or a client-side alpha-weighted linear combination. Prefetch
+        budgets are scaled by each branch's weight.
 
         Args:
             text: Query text.
             vector_field: Dense vector field name (text_dense or code_dense).
             limit: Number of results to retrieve.
             qdrant_filter: Optional Qdrant filter.
+            alpha: Dense weight (0=sparse, 1=dense). None weights branches equally.
+            fusion: Fusion method (config default if None).
+            with_payload: Payload selector for returned points (all fields by default).
+            search_params: Optional search parameters for the dense branch.
+            shard_key: Shard key to route the query to (all shards if None).
 
         Returns:
-            List of scored points with RRF scores.
+            List of scored points with fused scores.
         """
-        # Generate both vectors in parallel
-        if vector_field == CODE_DENSE_FIELD:
-            code_embedder = await self.embedder_factory.get_code_embedder()
-            sparse_embedder = await self.embedder_factory.get_sparse_embedder()
-            dense_vector, sparse_dict = await asyncio.gather(
-                code_embedder.embed(text, is_query=True),
-                asyncio.to_thread(sparse_embedder.embed_sparse, text),
+        return await self._execute_hybrid(
+            collection_name=self.collection_name,
+            text=text,
+            dense_field=vector_field,
+            sparse_field=SPARSE_FIELD,
+            limit=limit,
+            qdrant_filter=qdrant_filter,
+            alpha=alpha,
+            fusion=fusion,
+            with_payload=with_payload,
+            search_params=search_params,
+            shard_key=shard_key,
+        )
+
+    def _hybrid_prefetch_limits(self, limit: int, alpha: float | None) -> tuple[int, int]:
+        """Compute per-branch prefetch limits from the dense weight.
+
+        A branch whose weight falls below ``search_hybrid_min_branch_weight`` gets a
+        limit of 0, meaning it is skipped entirely (no embedding, no HNSW traversal).
+
+        Args:
+            limit: Number of fused results to return.
+            alpha: Dense weight (0=sparse, 1=dense). None weights branches equally.
+
+        Returns:
+            Tuple of (dense_limit, sparse_limit).
+        """
+        dense_weight = 0.5 if alpha is None else alpha
+        sparse_weight = 1.0 - dense_weight
+        min_weight = self.settings.search_hybrid_min_branch_weight
+
+        def branch_limit(weight: float) -> int:
+            if weight < min_weight:
+                return 0
+            # Round first so 1 - alpha float noise doesn't bump the ceiling
+            scaled = round(limit * HYBRID_PREFETCH_MULTIPLIER * 2 * weight, 6)
+            return max(limit, math.ceil(scaled))
+
+        return branch_limit(dense_weight), branch_limit(sparse_weight)
+
+    def _resolve_fusion(self, fusion: FusionMethod | None) -> FusionMethod:
+        """Resolve the effective fusion method from request or config."""
+        if fusion is not None:
+            return fusion
+        return FusionMethod(self.settings.search_hybrid_fusion)
+
+    async def _get_dense_embedder(self, dense_field: str) -> Any:
+        """Get the dense embedder matching a dense vector field."""
+        if dense_field == CODE_DENSE_FIELD:
+            return await self.embedder_factory.get_code_embedder()
+        return await self.embedder_factory.get_text_embedder()
+
+    async def _execute_hybrid(
+        self,
+        collection_name: str,
+        text: str,
+        dense_field: str,
+        sparse_field: str,
+        limit: int,
+        qdrant_filter: models.Filter | None,
+        alpha: float | None,
+        fusion: FusionMethod | None,
+        with_payload: bool | models.PayloadSelector = True,
+        search_params: models.SearchParams | None = None,
+        shard_key: str | None = None,
+        dense_vector: list[float] | None = None,
+        sparse_vector: models.SparseVector | None = None,
+        chunk_field: str | None = None,
+    ) -> list[models.ScoredPoint]:
+        """Run a weighted hybrid query against a collection.
+
+        Skips the embedding pass and prefetch of any branch whose weight is below
+        the configured threshold, falling back to a single-branch query.
+
+        Args:
+            collection_name: Qdrant collection to search.
+            text: Query text.
+            dense_field: Dense vector field name.
+            sparse_field: Sparse vector field name.
+            limit: Number of results to retrieve.
+            qdrant_filter: Optional Qdrant filter.
+            alpha: Dense weight (0=sparse, 1=dense). None weights branches equally.
+            fusion: Fusion method (config default if None).
+            with_payload: Payload selector for returned points (all fields by default).
+            search_params: Optional search parameters for the dense branch.
+            shard_key: Shard key to route the query to (all shards if None).
+            dense_vector: Precomputed dense query vector (embedded here if None).
+            sparse_vector: Precomputed sparse query vector (embedded here if None).
+            chunk_field: Late chunk multi-vector matched along with the dense
+                field (dense branch only), if any.
+
+        Returns:
+            List of scored points with fused scores.
+        """
+        dense_limit, sparse_limit = self._hybrid_prefetch_limits(limit, alpha)
+
+        # Single-branch shortcuts: skip the low-weight encoder entirely
+        if dense_limit == 0 or sparse_limit == 0:
+            if dense_limit == 0:
+                query: Any = sparse_vector
+                if query is None:
+                    sparse_embedder = await self.embedder_factory.get_sparse_embedder()
+                    sparse_dict = await sparse_embedder.embed_sparse_async(
+                        text, lane=EmbeddingLane.QUERY
+                    )
+                    query = models.SparseVector(
+                        indices=list(sparse_dict.keys()),
+                        values=list(sparse_dict.values()),
+                    )
+                using = sparse_field
+                branch_params = None
+            else:
+                query = dense_vector
+                if query is None:
+                    dense_embedder = await self._get_dense_embedder(dense_field)
+                    query = await dense_embedder.embed(text, is_query=True)
+                using = dense_field
+                branch_params = search_params
+
+            logger.debug(f"Hybrid search skipping low-weight branch: alpha={alpha}, using={using}")
+            if chunk_field and using == dense_field:
+                return await self._query_dense_and_chunks(
+                    collection_name=collection_name,
+                    vector=query,
+                    dense_field=dense_field,
+                    chunk_field=chunk_field,
+                    limit=limit,
+                    qdrant_filter=qdrant_filter,
+                    with_payload=with_payload,
+                    search_params=search_params,
+                    shard_key=shard_key,
+                )
+            results = await self.qdrant_client.client.query_points(
+                collection_name=collection_name,
+                query=query,
+                using=using,
+                query_filter=qdrant_filter,
+                limit=limit,
+                with_payload=with_payload,
+                search_params=branch_params,
+                shard_key_selector=shard_key,
             )
-        else:
-            text_embedder = await self.embedder_factory.get_text_embedder()
+            return results.points
+
+        if dense_vector is None or sparse_vector is None:
+            # Generate both vectors in parallel
+            dense_embedder = await self._get_dense_embedder(dense_field)
             sparse_embedder = await self.embedder_factory.get_sparse_embedder()
             dense_vector, sparse_dict = await asyncio.gather(
-                text_embedder.embed(text, is_query=True),
-                asyncio.to_thread(sparse_embedder.embed_sparse, text),
+                dense_embedder.embed(text, is_query=True),
+                sparse_embedder.embed_sparse_async(text, lane=EmbeddingLane.QUERY),
             )
 
-        # Convert sparse dict to Qdrant format
-        sparse_vector = models.SparseVector(
-            indices=list(sparse_dict.keys()),
-            values=list(sparse_dict.values()),
+            # Convert sparse dict to Qdrant format
+            sparse_vector = models.SparseVector(
+                indices=list(sparse_dict.keys()),
+                values=list(sparse_dict.values()),
+            )
+
+        effective_fusion = self._resolve_fusion(fusion)
+
+        if effective_fusion == FusionMethod.LINEAR:
+            # Client-side weighted fusion needs both branch score lists
+            if chunk_field:
+                dense_points = await self._query_dense_and_chunks(
+                    collection_name=collection_name,
+                    vector=dense_vector,
+                    dense_field=dense_field,
+                    chunk_field=chunk_field,
+                    limit=dense_limit,
+                    qdrant_filter=qdrant_filter,
+                    with_payload=with_payload,
+                    search_params=search_params,
+                    shard_key=shard_key,
+                )
+                sparse_results = await self.qdrant_client.client.query_points(
+                    collection_name=collection_name,
+                    query=sparse_vector,
+                    using=sparse_field,
+                    query_filter=qdrant_filter,
+                    limit=sparse_limit,
+                    with_payload=with_payload,
+                    shard_key_selector=shard_key,
+                )
+                return self._linear_fusion(
+                    dense_points,
+                    sparse_results.points,
+                    alpha=0.5 if alpha is None else alpha,
+                    limit=limit,
+                )
+
+            dense_response, sparse_response = await self.qdrant_client.client.query_batch_points(
+                collection_name=collection_name,
+                requests=[
+                    models.QueryRequest(
+                        query=dense_vector,
+                        using=dense_field,
+                        filter=qdrant_filter,
+                        params=search_params,
+                        limit=dense_limit,
+                        with_payload=with_payload,
+                        shard_key=shard_key,
+                    ),
+                    models.QueryRequest(
+                        query=sparse_vector,
+                        using=sparse_field,
+                        filter=qdrant_filter,
+                        limit=sparse_limit,
+                        with_payload=with_payload,
+                        shard_key=shard_key,
+                    ),
+                ],
+            )
+            return self._linear_fusion(
+                dense_response.points,
+                sparse_response.points,
+                alpha=0.5 if alpha is None else alpha,
+                limit=limit,
+            )
+
+        qdrant_fusion = (
+            models.Fusion.DBSF if effective_fusion == FusionMethod.DBSF else models.Fusion.RRF
         )
 
-        # Execute hybrid search with prefetch + RRF fusion
+        dense_prefetch = models.Prefetch(
+            query=dense_vector,
+            using=dense_field,
+            params=search_params,
+            limit=dense_limit,
+        )
+        if chunk_field:
+            # Whole-turn and best-chunk hits fuse into one dense ranking first,
+            # so the sparse branch keeps its weight
+            dense_prefetch = models.Prefetch(
+                prefetch=[
+                    dense_prefetch,
+                    models.Prefetch(
+                        query=[dense_vector],
+                        using=chunk_field,
+                        params=search_params,
+                        limit=dense_limit,
+                    ),
+                ],
+                query=models.FusionQuery(fusion=models.Fusion.RRF),
+                limit=dense_limit,
+            )
+
+        # Execute hybrid search with weighted prefetch + server-side fusion
         results = await self.qdrant_client.client.query_points(
-            collection_name=self.collection_name,
+            collection_name=collection_name,
             prefetch=[
-                models.Prefetch(
-                    query=dense_vector,
-                    using=vector_field,
-                    limit=limit * 2,  # Oversample for fusion
-                ),
+                dense_prefetch,
                 models.Prefetch(
                     query=sparse_vector,
-                    using=SPARSE_FIELD,
-                    limit=limit * 2,
+                    using=sparse_field,
+                    limit=sparse_limit,
                 ),
             ],
-            query=models.FusionQuery(fusion=models.Fusion.RRF),
+            query=models.FusionQuery(fusion=qdrant_fusion),
             query_filter=qdrant_filter,
             limit=limit,
-            with_payload=True,
-            # No score threshold with RRF (scores are rank-based)
+            with_payload=with_payload,
+            shard_key_selector=shard_key,
+            # No score threshold with fusion (scores are rank/distribution based)
         )
 
         return results.points
 
+    async def _query_dense_and_chunks(
+        self,
+        collection_name: str,
+        vector: list[float],
+        dense_field: str,
+        chunk_field: str,
+        limit: int,
+        qdrant_filter: models.Filter | None,
+        with_payload: bool | models.PayloadSelector = True,
+        search_params: models.SearchParams | None = None,
+        shard_key: str | None = None,
+        score_threshold: float | None = None,
+    ) -> list[models.ScoredPoint]:
+        """Match a dense query against whole points and their late chunks.
+
+        Against the MAX_SIM chunk multi-vector, a single query vector scores a
+        point by its best chunk. Each point keeps the higher of that and its
+        whole-point score, so content past the dense model's window is found
+        while points indexed without chunks still match on the dense vector.
+
+        Args:
+            collection_name: Qdrant collection to search.
+            vector: Dense query vector.
+            dense_field: Dense vector field name.
+            chunk_field: Late chunk multi-vector field name.
+            limit: Number of results to retrieve.
+            qdrant_filter: Optional Qdrant filter.
+            with_payload: Payload selector for returned points (all fields by default).
+            search_params: Optional HNSW/exact/quantization search parameters.
+            shard_key: Shard key to route the query to (all shards if None).
+            score_threshold: Minimum score for both requests.
+
+        Returns:
+            Scored points sorted by their best score.
+        """
+        dense_response, chunk_response = await self.qdrant_client.client.query_batch_points(
+            collection_name=collection_name,
+            requests=[
+                models.QueryRequest(
+                    query=query,
+                    using=using,
+                    filter=qdrant_filter,
+                    params=search_params,
+                    limit=limit,
+                    with_payload=with_payload,
+                    score_threshold=score_threshold,
+                    shard_key=shard_key,
+                )
+                for query, using in ((vector, dense_field), ([vector], chunk_field))
+            ],
+        )
+
+        best: dict[str, models.ScoredPoint] = {}
+        for point in [*dense_response.points, *chunk_response.points]:
+            key = str(point.id)
+            if key not in best or point.score > best[key].score:
+                best[key] = point
+        return sorted(best.values(), key=lambda point: point.score, reverse=True)[:limit]
+
+    @staticmethod
+    def _linear_fusion(
+        dense_points: list[models.ScoredPoint],
+        sparse_points: list[models.ScoredPoint],
+        alpha: float,
+        limit: int,
+    ) -> list[models.ScoredPoint]:
+        """Fuse dense and sparse results with an alpha-weighted linear combination.
+
+        Scores in each list are min-max normalized to [0, 1] before blending.
+        Points missing from one branch contribute 0 for that branch.
+
+        Args:
+            dense_points: Scored points from the dense branch.
+            sparse_points: Scored points from the sparse branch.
+            alpha: Dense weight (0=sparse, 1=dense).
+            limit: Number of fused results to return.
+
+        Returns:
+            Fused scored points sorted by combined score.
+        """
+
+        def normalize(points: list[models.ScoredPoint]) -> dict[Any, float]:
+            if not points:
+                return {}
+            scores = [p.score for p in points]
+            low, high = min(scores), max(scores)
+            span = high - low
+            return {p.id: (p.score - low) / span if span > 0 else 1.0 for p in points}
+
+        dense_norm = normalize(dense_points)
+        sparse_norm = normalize(sparse_points)
+
+        by_id: dict[Any, models.ScoredPoint] = {}
+        for point in [*dense_points, *sparse_points]:
+            by_id.setdefault(point.id, point)
+
+        fused = [
+            point.model_copy(
+                update={
+                    "score": alpha * dense_norm.get(point_id, 0.0)
+                    + (1.0 - alpha) * sparse_norm.get(point_id, 0.0)
+                }
+            )
+            for point_id, point in by_id.items()
+        ]
+        fused.sort(key=lambda p: p.score, reverse=True)
+        return fused[:limit]
+
     async def _apply_reranking(
         self,
         query_text: str,
@@ -337,15 +1077,20 @@ class SearchRetriever:
         limit: int,
         rerank_tier: str | None,
         strategy: SearchStrategy,
+        deadline: Deadline | None = None,
     ) -> list[SearchResultItem]:
         """Apply reranking with timeout and graceful degradation.
 
+        Under a deadline the reranker timeout is capped by the remaining budget,
+        and the fallback tier is only tried if the budget covers a second attempt.
+
         Args:
             query_text: Original query text.
             raw_results: Raw search results from Qdrant.
             limit: Final result limit.
             rerank_tier: Reranker tier to use (auto-selected if None).
             strategy: Search strategy used.
+            deadline: Optional request deadline.
 
         Returns:
             List of search result items with reranking scores.
@@ -357,16 +1102,21 @@ class SearchRetriever:
             f"candidates={len(raw_results)}, tier={rerank_tier}"
         )
 
-        # Extract documents for reranking
-        documents = []
-        for result in raw_results:
-            payload = result.payload or {}
-            content = payload.get("content", "")
-            documents.append(str(content))
+        # Extract documents for reranking (decompressing content if stored compressed)
+        payloads = [self.payload_codec.decode(result.payload) for result in raw_results]
+        documents = [str(payload.get("content", "")) for payload in payloads]
 
         # Auto-select tier based on query complexity if not specified
         effective_tier = self._select_reranker_tier(query_text, rerank_tier)
 
+        timeout_ms = self.settings.reranker_timeout_ms
+        fallback_tier: RerankerTier | None = RerankerTier.FAST
+        if deadline is not None:
+            remaining_ms = deadline.remaining_ms()
+            timeout_ms = max(1, int(min(timeout_ms, remaining_ms)))
+            if remaining_ms < 2 * timeout_ms:
+                fallback_tier = None
+
         # Apply reranking with router (handles timeout and fallback)
         try:
             reranked_results, actual_tier, degraded = await self.reranker_router.rerank(
@@ -374,8 +1124,8 @@ class SearchRetriever:
                 documents=documents,
                 tier=effective_tier,
                 top_k=limit,
-                timeout_ms=self.settings.reranker_timeout_ms,
-                fallback_tier=RerankerTier.FAST,
+                timeout_ms=timeout_ms,
+                fallback_tier=fallback_tier,
             )
 
             rerank_latency_ms = (asyncio.get_event_loop().time() - rerank_start_time) * 1000
@@ -414,7 +1164,7 @@ class SearchRetriever:
                     rrf_score=original.score,  # Preserve original score
                     reranker_score=ranked.score,
                     rerank_tier=actual_tier,
-                    payload=original.payload or {},
+                    payload=payloads[ranked.original_index],
                     degraded=degraded,
                     degraded_reason=f"Reranker tier {actual_tier}" if degraded else None,
                 )
@@ -435,13 +1185,13 @@ class SearchRetriever:
 
             # Return raw results with degradation flags
             degraded_results = []
-            for result in raw_results[:limit]:
+            for result, payload in zip(raw_results[:limit], payloads, strict=False):
                 # Convert UUID to string if necessary
                 result_id = str(result.id) if not isinstance(result.id, (str, int)) else result.id
                 item = SearchResultItem(
                     id=result_id,
                     score=result.score,
-                    payload=result.payload or {},
+                    payload=payload,
                     degraded=True,
                     degraded_reason=f"Reranker failed: {error_message}",
                 )
@@ -449,6 +1199,88 @@ class SearchRetriever:
 
             return degraded_results
 
+    def _first_stage_payload_selector(
+        self, fetch_limit: int, limit: int
+    ) -> bool | models.PayloadSelector:
+        """Select payload fields to fetch in first-stage retrieval.
+
+        When oversampling for reranking, only the fields needed for reranking and
+        result shaping are fetched; full payloads for the final top-k are hydrated
+        afterwards with a single retrieve call.
+
+        Args:
+            fetch_limit: Number of candidates requested from Qdrant.
+            limit: Number of results that will be returned.
+
+        Returns:
+            True for full payloads, or an include selector for projected payloads.
+        """
+        if not self.settings.search_payload_projection or fetch_limit <= limit:
+            return True
+        return models.PayloadSelectorInclude(
+            include=list(self.settings.search_first_stage_payload_fields)
+        )
+
+    async def _hydrate_payloads(
+        self,
+        collection_name: str,
+        items: list[SearchResultItem],
+        deadline: Deadline | None = None,
+        shard_key: str | None = None,
+    ) -> list[SearchResultItem]:
+        """Replace projected payloads with full payloads for final results.
+
+        Falls back to the projected payloads if the retrieve call fails or does
+        not finish within the remaining deadline budget.
+
+        Args:
+            collection_name: Collection the results came from.
+            items: Final search results with projected payloads.
+            deadline: Optional request deadline.
+            shard_key: Shard key the results came from (all shards if None).
+
+        Returns:
+            The same items with full payloads.
+        """
+        if not items:
+            return items
+
+        timeout = None
+        if deadline is not None:
+            if deadline.expired:
+                record_deadline_degradation("skip_hydrate")
+                return items
+            timeout = deadline.remaining_ms() / 1000.0
+
+        try:
+            points = await asyncio.wait_for(
+                self.qdrant_client.client.retrieve(
+                    collection_name=collection_name,
+                    ids=[item.id for item in items],
+                    with_payload=True,
+                    with_vectors=False,
+                    shard_key_selector=shard_key,
+                ),
+                timeout=timeout,
+            )
+        except TimeoutError:
+            record_deadline_degradation("skip_hydrate")
+            logger.warning(
+                "Payload hydration hit the request deadline, returning projected payloads"
+            )
+            return items
+        except Exception as e:
+            logger.warning(f"Payload hydration failed, returning projected payloads: {e}")
+            return items
+
+        payloads = {str(point.id): self.payload_codec.decode(point.payload) for point in points}
+        for item in items:
+            payload = payloads.get(str(item.id))
+            if payload is not None:
+                item.payload = payload
+
+        return items
+
     def _build_qdrant_filter(
         self, filters: Any | None
     ) -> models.Filter | None:  # SearchFilters | None
@@ -511,8 +1343,8 @@ class SearchRetriever:
                 models.FieldCondition(
                     key="timestamp",
                     range=models.Range(
-                        gte=time_range["start"],
-                        lte=time_range["end"],
+                        gte=time_range.start,
+                        lte=time_range.end,
                     ),
                 )
             )
@@ -545,7 +1377,7 @@ class SearchRetriever:
             item = SearchResultItem(
                 id=result_id,
                 score=result.score,
-                payload=result.payload or {},
+                payload=self.payload_codec.decode(result.payload),
             )
             items.append(item)
         return items
@@ -631,82 +1463,258 @@ class SearchRetriever:
         Returns:
             List of search result items sorted by relevance.
         """
-        text = query.text
-        limit = query.limit
-        filters = query.filters
-        user_strategy = query.strategy
-        rerank = query.rerank
-        rerank_tier = query.rerank_tier
-        rerank_depth = query.rerank_depth
+        stage = await self._run_first_stage(query, turns=True)
+        if stage is None:
+            return []
+        return await self._finalize(query, stage)
+
+    async def _first_stage_turns(self, query: SearchQuery) -> FirstStageResult:
+        """Run first-stage retrieval against the turns collection.
+
+        With time tiering enabled, fans out to the hot and cold collections
+        (skipping the cold one when the time range allows) and merges the
+        candidates by score.
+
+        Args:
+            query: Search query with retrieval parameters.
 
+        Returns:
+            First-stage candidates.
+        """
         # Determine effective limit: oversample if reranking is enabled
-        fetch_limit = max(rerank_depth, limit) if rerank else limit
+        fetch_limit = self._fetch_limit(query)
 
-        # Determine strategy using classifier if not provided
-        # Use config default (allows forcing dense when sparse unavailable)
-        default_strategy = SearchStrategy(self.settings.search_default_strategy)
-        strategy: SearchStrategy | str = user_strategy or default_strategy
-        # Only use classifier for auto-selection when default is hybrid
-        # This allows forcing dense mode when sparse embeddings are unavailable
-        if not user_strategy and default_strategy == SearchStrategy.HYBRID:
-            classification = self.classifier.classify(text)
-            strategy = classification["strategy"]
+        strategy, alpha = self._resolve_strategy(query)
 
-        # Convert string to enum if needed
-        if isinstance(strategy, str):
-            strategy = SearchStrategy(strategy)
+        # Build Qdrant filter and route to the org's shard
+        qdrant_filter = self._build_qdrant_filter(query.filters)
+        shard_key = self.shard_router.shard_key(query.filters.org_id)
 
-        # Build Qdrant filter
-        qdrant_filter = self._build_qdrant_filter(filters)
+        time_range = query.filters.time_range
+        collections = self.turn_tiers.collections_for(time_range.start if time_range else None)
 
-        # Fetch results from turns collection
         try:
-            if strategy == SearchStrategy.DENSE:
-                raw_results = await self._search_turns_dense(
-                    text=text,
-                    limit=fetch_limit,
-                    qdrant_filter=qdrant_filter,
+            if len(collections) == 1:
+                raw_results, plan, payload_selector = await self._search_turns_tier(
+                    query,
+                    collections[0],
+                    strategy,
+                    alpha,
+                    qdrant_filter,
+                    shard_key,
+                    fetch_limit,
                 )
-            elif strategy == SearchStrategy.SPARSE:
-                raw_results = await self._search_turns_sparse(
-                    text=text,
-                    limit=fetch_limit,
-                    qdrant_filter=qdrant_filter,
+                point_collections = None
+            else:
+                # Embed once and share the vectors across tiers
+                dense_vector, sparse_vector = await self._embed_query(
+                    query.text, strategy, alpha, fetch_limit
                 )
-            else:  # HYBRID
-                raw_results = await self._search_turns_hybrid(
-                    text=text,
-                    limit=fetch_limit,
-                    qdrant_filter=qdrant_filter,
+                tiers = await asyncio.gather(
+                    *(
+                        self._search_turns_tier(
+                            query,
+                            collection,
+                            strategy,
+                            alpha,
+                            qdrant_filter,
+                            shard_key,
+                            fetch_limit,
+                            dense_vector=dense_vector,
+                            sparse_vector=sparse_vector,
+                        )
+                        for collection in collections
+                    )
+                )
+                # Tier searches ran as tasks; report the hot tier's plan
+                plan = tiers[0][1]
+                current_query_plan.set(plan)
+                raw_results, point_collections = self._merge_tiers(
+                    collections,
+                    [tier[0] for tier in tiers],
+                    max(tier[1].fetch_limit for tier in tiers),
                 )
+                payload_selector = True if all(tier[2] is True for tier in tiers) else tiers[0][2]
 
             logger.debug(
                 f"Retrieved {len(raw_results)} turn results for strategy={strategy}, "
-                f"fetch_limit={fetch_limit}"
+                f"fetch_limit={plan.fetch_limit}, tiers={collections}"
             )
 
         except Exception as e:
             logger.error(f"Turn search failed: {e}")
             raise
 
-        # Apply reranking if enabled
-        if rerank and raw_results:
-            return await self._apply_reranking(
-                query_text=text,
-                raw_results=raw_results,
-                limit=limit,
-                rerank_tier=rerank_tier,
-                strategy=strategy,
+        return FirstStageResult(
+            raw_results=raw_results,
+            strategy=strategy,
+            collection_name=collections[0],
+            payload_selector=payload_selector,
+            shard_key=shard_key,
+            plan=plan,
+            point_collections=point_collections,
+        )
+
+    async def _search_turns_tier(
+        self,
+        query: SearchQuery,
+        collection_name: str,
+        strategy: SearchStrategy,
+        alpha: float | None,
+        qdrant_filter: models.Filter | None,
+        shard_key: str | None,
+        fetch_limit: int,
+        dense_vector: list[float] | None = None,
+        sparse_vector: models.SparseVector | None = None,
+    ) -> tuple[list[models.ScoredPoint], QueryPlan, bool | models.PayloadSelector]:
+        """Plan and run the first-stage query against one turns collection.
+
+        Args:
+            query: Search query with retrieval parameters.
+            collection_name: Turns collection (tier) to search.
+            strategy: Resolved search strategy.
+            alpha: Dense weight for hybrid search.
+            qdrant_filter: First-stage filter.
+            shard_key: Shard key to route the query to (all shards if None).
+            fetch_limit: Candidates to fetch before planning.
+            dense_vector: Precomputed dense query vector (embedded here if None).
+            sparse_vector: Precomputed sparse query vector (embedded here if None).
+
+        Returns:
+            Tuple of (scored points, query plan, payload selector used).
+        """
+        # Pick exact vs HNSW and the fetch size from the filter's cardinality
+        plan = await self.planner.plan(
+            query, collection_name, qdrant_filter, fetch_limit, shard_key
+        )
+        fetch_limit = plan.fetch_limit
+        search_params = self._search_params(query, strategy, plan)
+
+        # Project first-stage payloads when oversampling for reranking
+        payload_selector = self._first_stage_payload_selector(fetch_limit, query.limit)
+
+        if strategy == SearchStrategy.DENSE:
+            raw_results = await self._search_turns_dense(
+                text=query.text,
+                limit=fetch_limit,
+                qdrant_filter=qdrant_filter,
+                with_payload=payload_selector,
+                search_params=search_params,
+                shard_key=shard_key,
+                collection_name=collection_name,
+                vector=dense_vector,
+            )
+        elif strategy == SearchStrategy.SPARSE:
+            raw_results = await self._search_turns_sparse(
+                text=query.text,
+                limit=fetch_limit,
+                qdrant_filter=qdrant_filter,
+                with_payload=payload_selector,
+                shard_key=shard_key,
+                collection_name=collection_name,
+                sparse_vector=sparse_vector,
+            )
+        else:  # HYBRID
+            raw_results = await self._search_turns_hybrid(
+                text=query.text,
+                limit=fetch_limit,
+                qdrant_filter=qdrant_filter,
+                alpha=alpha,
+                fusion=query.fusion,
+                with_payload=payload_selector,
+                search_params=search_params,
+                shard_key=shard_key,
+                collection_name=collection_name,
+                dense_vector=dense_vector,
+                sparse_vector=sparse_vector,
+            )
+
+        return raw_results, plan, payload_selector
+
+    async def _embed_query(
+        self,
+        text: str,
+        strategy: SearchStrategy,
+        alpha: float | None,
+        limit: int,
+    ) -> tuple[list[float] | None, models.SparseVector | None]:
+        """Embed a query once for the branches its strategy will run.
+
+        Turns and memories use the same text and sparse models, so the vectors
+        can be shared across turn tiers and collections.
+
+        Args:
+            text: Query text.
+            strategy: Resolved search strategy.
+            alpha: Dense weight for hybrid search.
+            limit: Fetch limit (decides which hybrid branches are skipped).
+
+        Returns:
+            Tuple of (dense vector, sparse vector), None for unused branches.
+        """
+        dense_limit, sparse_limit = self._branch_limits(strategy, alpha, limit)
+        need_dense, need_sparse = dense_limit > 0, sparse_limit > 0
+
+        async def embed_dense() -> list[float] | None:
+            if not need_dense:
+                return None
+            embedder = await self.embedder_factory.get_text_embedder()
+            return await embedder.embed(text, is_query=True)
+
+        async def embed_sparse() -> models.SparseVector | None:
+            if not need_sparse:
+                return None
+            embedder = await self.embedder_factory.get_sparse_embedder()
+            sparse_dict = await embedder.embed_sparse_async(text, lane=EmbeddingLane.QUERY)
+            return models.SparseVector(
+                indices=list(sparse_dict.keys()),
+                values=list(sparse_dict.values()),
             )
 
-        # No reranking - return raw results trimmed to limit
-        return self._map_raw_results(raw_results[:limit])
+        return await asyncio.gather(embed_dense(), embed_sparse())
+
+    @staticmethod
+    def _merge_tiers(
+        collections: list[str],
+        tier_results: list[list[models.ScoredPoint]],
+        limit: int,
+    ) -> tuple[list[models.ScoredPoint], dict[str, str]]:
+        """Merge per-tier candidates by score, keeping each point's best hit.
+
+        A point caught mid-migration can briefly exist in both tiers, so points
+        are deduplicated by ID.
+
+        Args:
+            collections: Tier collection names, aligned with ``tier_results``.
+            tier_results: Scored points from each tier.
+            limit: Maximum merged candidates.
+
+        Returns:
+            Tuple of (merged points sorted by score, point ID to source collection).
+        """
+        best: dict[str, tuple[models.ScoredPoint, str]] = {}
+        for collection, points in zip(collections, tier_results, strict=True):
+            for point in points:
+                key = str(point.id)
+                if key not in best or point.score > best[key][0].score:
+                    best[key] = (point, collection)
+
+        merged = sorted(best.values(), key=lambda entry: entry[0].score, reverse=True)[:limit]
+        return (
+            [point for point, _ in merged],
+            {str(point.id): collection for point, collection in merged},
+        )
 
     async def _search_turns_dense(
         self,
         text: str,
         limit: int,
         qdrant_filter: models.Filter | None,
+        with_payload: bool | models.PayloadSelector = True,
+        search_params: models.SearchParams | None = None,
+        shard_key: str | None = None,
+        collection_name: str | None = None,
+        vector: list[float] | None = None,
     ) -> list[models.ScoredPoint]:
         """Execute dense vector search on turns collection.
 
@@ -714,21 +1722,43 @@ class SearchRetriever:
             text: Query text.
             limit: Number of results to retrieve.
             qdrant_filter: Optional Qdrant filter.
+            with_payload: Payload selector for returned points (all fields by default).
+            search_params: Optional HNSW/exact/quantization search parameters.
+            shard_key: Shard key to route the query to (all shards if None).
+            collection_name: Turns tier to search (the turns collection if None).
+            vector: Precomputed query vector (embedded here if None).
 
         Returns:
             List of scored points from Qdrant.
         """
-        embedder = await self.embedder_factory.get_text_embedder()
-        vector = await embedder.embed(text, is_query=True)
+        if vector is None:
+            embedder = await self.embedder_factory.get_text_embedder()
+            vector = await embedder.embed(text, is_query=True)
+
+        if self.turn_chunks:
+            return await self._query_dense_and_chunks(
+                collection_name=collection_name or self.turns_collection_name,
+                vector=vector,
+                dense_field=TURN_DENSE_FIELD,
+                chunk_field=TURN_CHUNKS_FIELD,
+                limit=limit,
+                qdrant_filter=qdrant_filter,
+                with_payload=with_payload,
+                search_params=search_params,
+                shard_key=shard_key,
+                score_threshold=self.settings.search_min_score_dense,
+            )
 
         results = await self.qdrant_client.client.query_points(
-            collection_name=self.turns_collection_name,
+            collection_name=collection_name or self.turns_collection_name,
             query=vector,
             using=TURN_DENSE_FIELD,
             query_filter=qdrant_filter,
             limit=limit,
-            with_payload=True,
+            with_payload=with_payload,
             score_threshold=self.settings.search_min_score_dense,
+            search_params=search_params,
+            shard_key_selector=shard_key,
         )
 
         return results.points
@@ -738,6 +1768,10 @@ class SearchRetriever:
         text: str,
         limit: int,
         qdrant_filter: models.Filter | None,
+        with_payload: bool | models.PayloadSelector = True,
+        shard_key: str | None = None,
+        collection_name: str | None = None,
+        sparse_vector: models.SparseVector | None = None,
     ) -> list[models.ScoredPoint]:
         """Execute sparse vector search on turns collection.
 
@@ -745,26 +1779,32 @@ class SearchRetriever:
             text: Query text.
             limit: Number of results to retrieve.
             qdrant_filter: Optional Qdrant filter.
+            with_payload: Payload selector for returned points (all fields by default).
+            shard_key: Shard key to route the query to (all shards if None).
+            collection_name: Turns tier to search (the turns collection if None).
+            sparse_vector: Precomputed query vector (embedded here if None).
 
         Returns:
             List of scored points from Qdrant.
         """
-        sparse_embedder = await self.embedder_factory.get_sparse_embedder()
-        sparse_dict = sparse_embedder.embed_sparse(text)
+        if sparse_vector is None:
+            sparse_embedder = await self.embedder_factory.get_sparse_embedder()
+            sparse_dict = await sparse_embedder.embed_sparse_async(text, lane=EmbeddingLane.QUERY)
 
-        sparse_vector = models.SparseVector(
-            indices=list(sparse_dict.keys()),
-            values=list(sparse_dict.values()),
-        )
+            sparse_vector = models.SparseVector(
+                indices=list(sparse_dict.keys()),
+                values=list(sparse_dict.values()),
+            )
 
         results = await self.qdrant_client.client.query_points(
-            collection_name=self.turns_collection_name,
+            collection_name=collection_name or self.turns_collection_name,
             query=sparse_vector,
             using=TURN_SPARSE_FIELD,
             query_filter=qdrant_filter,
             limit=limit,
-            with_payload=True,
+            with_payload=with_payload,
             score_threshold=self.settings.search_min_score_sparse,
+            shard_key_selector=shard_key,
         )
 
         return results.points
@@ -774,52 +1814,410 @@ class SearchRetriever:
         text: str,
         limit: int,
         qdrant_filter: models.Filter | None,
+        alpha: float | None = None,
+        fusion: FusionMethod | None = None,
+        with_payload: bool | models.PayloadSelector = True,
+        search_params: models.SearchParams | None = None,
+        shard_key: str | None = None,
+        collection_name: str | None = None,
+        dense_vector: list[float] | None = None,
+        sparse_vector: models.SparseVector | None = None,
     ) -> list[models.ScoredPoint]:
-        """Execute hybrid search on turns collection with RRF fusion.
+        """Execute hybrid search on turns collection with alpha-weighted fusion.
 
         Args:
             text: Query text.
             limit: Number of results to retrieve.
             qdrant_filter: Optional Qdrant filter.
+            alpha: Dense weight (0=sparse, 1=dense). None weights branches equally.
+            fusion: Fusion method (config default if None).
+            with_payload: Payload selector for returned points (all fields by default).
+            search_params: Optional search parameters for the dense branch.
+            shard_key: Shard key to route the query to (all shards if None).
+            collection_name: Turns tier to search (the turns collection if None).
+            dense_vector: Precomputed dense query vector (embedded here if None).
+            sparse_vector: Precomputed sparse query vector (embedded here if None).
 
         Returns:
-            List of scored points with RRF scores.
+            List of scored points with fused scores.
         """
-        # Generate both vectors in parallel
-        text_embedder = await self.embedder_factory.get_text_embedder()
-        sparse_embedder = await self.embedder_factory.get_sparse_embedder()
-        dense_vector, sparse_dict = await asyncio.gather(
-            text_embedder.embed(text, is_query=True),
-            asyncio.to_thread(sparse_embedder.embed_sparse, text),
+        return await self._execute_hybrid(
+            collection_name=collection_name or self.turns_collection_name,
+            text=text,
+            dense_field=TURN_DENSE_FIELD,
+            sparse_field=TURN_SPARSE_FIELD,
+            chunk_field=TURN_CHUNKS_FIELD if self.turn_chunks else None,
+            limit=limit,
+            qdrant_filter=qdrant_filter,
+            alpha=alpha,
+            fusion=fusion,
+            with_payload=with_payload,
+            search_params=search_params,
+            shard_key=shard_key,
+            dense_vector=dense_vector,
+            sparse_vector=sparse_vector,
         )
 
-        sparse_vector = models.SparseVector(
-            indices=list(sparse_dict.keys()),
-            values=list(sparse_dict.values()),
+    def _branch_limits(
+        self, strategy: SearchStrategy, alpha: float | None, limit: int
+    ) -> tuple[int, int]:
+        """Per-branch fetch limits for a strategy (0 means the branch is skipped).
+
+        Args:
+            strategy: Resolved search strategy.
+            alpha: Dense weight for hybrid search.
+            limit: Candidates to fetch.
+
+        Returns:
+            Tuple of (dense_limit, sparse_limit).
+        """
+        if strategy == SearchStrategy.DENSE:
+            return limit, 0
+        if strategy == SearchStrategy.SPARSE:
+            return 0, limit
+        return self._hybrid_prefetch_limits(limit, alpha)
+
+    async def search_federated(self, query: SearchQuery) -> list[SearchResultItem]:
+        """Search turns and memories together and rerank the combined set once.
+
+        Args:
+            query: Search query with retrieval parameters.
+
+        Returns:
+            Search result items from both collections, sorted by relevance, each
+            tagged with the collection it came from.
+        """
+        stage = await self._run_first_stage(query, turns=True, federated=True)
+        if stage is None:
+            return []
+        return await self._finalize(query, stage)
+
+    async def _first_stage_federated(self, query: SearchQuery) -> FirstStageResult:
+        """Run first-stage retrieval against the turns and memory collections.
+
+        The query is embedded once. Each collection (every turn tier, plus
+        memories) gets one ``query_batch_points`` call carrying its dense and
+        sparse branch requests, and the calls run concurrently. Each branch is
+        pooled across sources and fused once, so raw scores are min-max
+        normalised on one scale: a source's best hit only ranks first if its
+        raw score does.
+
+        Args:
+            query: Search query with retrieval parameters.
+
+        Returns:
+            First-stage candidates from both sources.
+        """
+        fetch_limit = self._fetch_limit(query)
+        strategy, alpha = self._resolve_strategy(query)
+        dense_limit, sparse_limit = self._branch_limits(strategy, alpha, fetch_limit)
+        dense_weight = 0.5 if alpha is None else alpha
+        if dense_limit == 0:
+            dense_weight = 0.0
+        elif sparse_limit == 0:
+            dense_weight = 1.0
+
+        shard_key = self.shard_router.shard_key(query.filters.org_id)
+        turns_filter = self._build_qdrant_filter(query.filters)
+        memory_filter = self._build_memory_filter(query.filters)
+        search_params = self._search_params(query, strategy)
+        payload_selector = self._first_stage_payload_selector(fetch_limit, query.limit)
+
+        time_range = query.filters.time_range
+        targets = [
+            (collection, TURN_DENSE_FIELD, TURN_SPARSE_FIELD, turns_filter)
+            for collection in self.turn_tiers.collections_for(
+                time_range.start if time_range else None
+            )
+        ]
+        targets.append((MEMORY_COLLECTION, TEXT_DENSE_FIELD, SPARSE_FIELD, memory_filter))
+
+        try:
+            dense_vector, sparse_vector = await self._embed_query(
+                query.text, strategy, alpha, fetch_limit
+            )
+
+            def branch_requests(
+                dense_field: str, sparse_field: str, qdrant_filter: models.Filter
+            ) -> list[models.QueryRequest]:
+                requests = []
+                if dense_limit > 0:
+                    requests.append(
+                        models.QueryRequest(
+                            query=dense_vector,
+                            using=dense_field,
+                            filter=qdrant_filter,
+                            params=search_params,
+                            limit=dense_limit,
+                            with_payload=payload_selector,
+                            # Thresholds only apply to single-branch searches, as elsewhere
+                            score_threshold=(
+                                self.settings.search_min_score_dense if sparse_limit == 0 else None
+                            ),
+                            shard_key=shard_key,
+                        )
+                    )
+                if sparse_limit > 0:
+                    requests.append(
+                        models.QueryRequest(
+                            query=sparse_vector,
+                            using=sparse_field,
+                            filter=qdrant_filter,
+                            limit=sparse_limit,
+                            with_payload=payload_selector,
+                            score_threshold=(
+                                self.settings.search_min_score_sparse if dense_limit == 0 else None
+                            ),
+                            shard_key=shard_key,
+                        )
+                    )
+                return requests
+
+            responses = await asyncio.gather(
+                *(
+                    self.qdrant_client.client.query_batch_points(
+                        collection_name=collection,
+                        requests=branch_requests(dense_field, sparse_field, qdrant_filter),
+                    )
+                    for collection, dense_field, sparse_field, qdrant_filter in targets
+                )
+            )
+        except Exception as e:
+            logger.error(f"Federated search failed: {e}")
+            raise
+
+        # Pool each branch across sources so normalisation keeps relative scores
+        dense_points: list[models.ScoredPoint] = []
+        sparse_points: list[models.ScoredPoint] = []
+        point_collections: dict[str, str] = {}
+        for (collection, *_), response in zip(targets, responses, strict=True):
+            batches = iter(response)
+            found: list[models.ScoredPoint] = []
+            if dense_limit > 0:
+                found.extend(next(batches).points)
+                dense_points.extend(found)
+            if sparse_limit > 0:
+                sparse_found = next(batches).points
+                sparse_points.extend(sparse_found)
+                found.extend(sparse_found)
+            for point in found:
+                point_collections.setdefault(str(point.id), collection)
+
+        raw_results = self._linear_fusion(
+            dense_points, sparse_points, alpha=dense_weight, limit=fetch_limit
         )
 
-        # Execute hybrid search with prefetch + RRF fusion
-        results = await self.qdrant_client.client.query_points(
-            collection_name=self.turns_collection_name,
-            prefetch=[
-                models.Prefetch(
-                    query=dense_vector,
-                    using=TURN_DENSE_FIELD,
-                    limit=limit * 2,
+        logger.debug(
+            f"Federated search retrieved {len(raw_results)} candidates from "
+            f"{[target[0] for target in targets]}, strategy={strategy}"
+        )
+
+        return FirstStageResult(
+            raw_results=raw_results,
+            strategy=strategy,
+            collection_name=targets[0][0],
+            payload_selector=payload_selector,
+            shard_key=shard_key,
+            point_collections={str(p.id): point_collections[str(p.id)] for p in raw_results},
+        )
+
+    def _build_memory_filter(self, filters: Any | None) -> models.Filter | None:
+        """Build the Qdrant filter for the memory collection.
+
+        Same tenant isolation and field filters as turns, except that memories
+        have no session (session_id is ignored) and may be narrowed by project.
+
+        Args:
+            filters: Search filters (must contain org_id).
+
+        Returns:
+            Qdrant filter object.
+
+        Raises:
+            ValueError: If filters is None or org_id is missing/empty.
+        """
+        if filters is None:
+            return self._build_qdrant_filter(filters)
+
+        qdrant_filter = self._build_qdrant_filter(filters.model_copy(update={"session_id": None}))
+        if qdrant_filter is not None and getattr(filters, "project", None):
+            qdrant_filter.must.append(
+                models.FieldCondition(
+                    key="project",
+                    match=models.MatchValue(value=filters.project),
+                )
+            )
+        return qdrant_filter
+
+    @staticmethod
+    def point_id(item_id: str) -> str:
+        """Map a point ID or memory node ID (ULID) to a Qdrant point ID.
+
+        Memory points are stored under ``uuid5(NAMESPACE_OID, node_id)``;
+        anything that already parses as a UUID is used as is.
+
+        Args:
+            item_id: Point ID or node ID.
+
+        Returns:
+            Qdrant point ID.
+        """
+        try:
+            return str(uuid.UUID(item_id))
+        except ValueError:
+            return str(uuid.uuid5(uuid.NAMESPACE_OID, item_id))
+
+    async def search_similar(
+        self,
+        ids: list[str],
+        filters: SearchFilters,
+        collection: str = MEMORY_COLLECTION,
+        vector: SimilarVector = SimilarVector.DENSE,
+        limit: int = 10,
+        score_threshold: float | None = None,
+    ) -> list[list[SearchResultItem]]:
+        """Find points similar to already-indexed points, by ID.
+
+        Queries Qdrant with the point IDs themselves, so the stored vectors are
+        used and nothing is embedded. All IDs go out in one
+        ``query_batch_points`` call per collection. Each source point is
+        excluded from its own results.
+
+        IDs are first looked up across every collection they may live in (both
+        turn tiers), which also drops IDs that belong to another organization
+        or do not exist; those get no results instead of failing the batch.
+
+        Args:
+            ids: Point IDs or memory node IDs.
+            filters: Search filters (must contain org_id).
+            collection: ``engram_memory`` or the turns collection.
+            vector: Stored vector to compare.
+            limit: Maximum results per ID.
+            score_threshold: Minimum similarity score.
+
+        Returns:
+            One result list per input ID, in input order, each sorted by score
+            and tagged with the collection it came from.
+
+        Raises:
+            ValueError: If org_id is missing or the collection has no such vector.
+        """
+        if collection == MEMORY_COLLECTION:
+            fields = {SimilarVector.DENSE: TEXT_DENSE_FIELD, SimilarVector.SPARSE: SPARSE_FIELD}
+            qdrant_filter = self._build_memory_filter(filters)
+            sources = [MEMORY_COLLECTION]
+            targets = sources
+        else:
+            fields = {
+                SimilarVector.DENSE: TURN_DENSE_FIELD,
+                SimilarVector.SPARSE: TURN_SPARSE_FIELD,
+                SimilarVector.COLBERT: TURN_COLBERT_FIELD,
+            }
+            qdrant_filter = self._build_qdrant_filter(filters)
+            # A source turn may already have moved to the cold tier
+            sources = self.turn_tiers.collections
+            time_range = filters.time_range
+            targets = self.turn_tiers.collections_for(time_range.start if time_range else None)
+
+        using = fields.get(vector)
+        if using is None:
+            raise ValueError(f"Collection '{collection}' has no {vector.value} vector")
+
+        shard_key = self.shard_router.shard_key(filters.org_id)
+        point_ids = [self.point_id(item_id) for item_id in ids]
+        homes = await self._locate_points(sources, point_ids, filters.org_id, shard_key)
+        found = [point_id for point_id in dict.fromkeys(point_ids) if point_id in homes]
+        if not found:
+            return [[] for _ in ids]
+
+        def similar_request(point_id: str, target: str) -> models.QueryRequest:
+            home = homes[point_id]
+            return models.QueryRequest(
+                query=point_id,
+                using=using,
+                filter=models.Filter(
+                    must=qdrant_filter.must,
+                    must_not=[models.HasIdCondition(has_id=[point_id])],
                 ),
-                models.Prefetch(
-                    query=sparse_vector,
-                    using=TURN_SPARSE_FIELD,
-                    limit=limit * 2,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=True,
+                shard_key=shard_key,
+                lookup_from=(
+                    None
+                    if home == target
+                    else models.LookupLocation(collection=home, vector=using, shard_key=shard_key)
                 ),
-            ],
-            query=models.FusionQuery(fusion=models.Fusion.RRF),
-            query_filter=qdrant_filter,
-            limit=limit,
-            with_payload=True,
+            )
+
+        try:
+            responses = await asyncio.gather(
+                *(
+                    self.qdrant_client.client.query_batch_points(
+                        collection_name=target,
+                        requests=[similar_request(point_id, target) for point_id in found],
+                    )
+                    for target in targets
+                )
+            )
+        except Exception as e:
+            logger.error(f"Similar search failed: {e}")
+            raise
+
+        by_point: dict[str, list[SearchResultItem]] = {}
+        for index, point_id in enumerate(found):
+            points, point_collections = self._merge_tiers(
+                targets, [response[index].points for response in responses], limit
+            )
+            items = self._map_raw_results(points)
+            for item in items:
+                item.collection = point_collections[str(item.id)]
+            by_point[point_id] = items
+
+        logger.debug(
+            f"Similar search: {len(found)}/{len(ids)} source points found in {sources}, "
+            f"using={using}"
         )
+        return [by_point.get(point_id, []) for point_id in point_ids]
 
-        return results.points
+    async def _locate_points(
+        self,
+        collections: list[str],
+        point_ids: list[str],
+        org_id: str,
+        shard_key: str | None,
+    ) -> dict[str, str]:
+        """Find which collection holds each point, within one organization.
+
+        Args:
+            collections: Collections to look in, in order of preference.
+            point_ids: Qdrant point IDs.
+            org_id: Organization the points must belong to.
+            shard_key: Shard key to look in (all shards if None).
+
+        Returns:
+            Point ID to collection, for points that exist and belong to org_id.
+        """
+        selector = {} if shard_key is None else {"shard_key_selector": shard_key}
+        records = await asyncio.gather(
+            *(
+                self.qdrant_client.client.retrieve(
+                    collection_name=collection,
+                    ids=point_ids,
+                    with_payload=models.PayloadSelectorInclude(include=["org_id"]),
+                    with_vectors=False,
+                    **selector,
+                )
+                for collection in collections
+            )
+        )
+
+        homes: dict[str, str] = {}
+        for collection, found in zip(collections, records, strict=True):
+            for record in found:
+                if (record.payload or {}).get("org_id") == org_id:
+                    homes.setdefault(str(record.id), collection)
+        return homes
 
     def aggregate_by_session(
         self,
@@ -28,6 +28,7 @@ from src.clients.qdrant import QdrantClientWrapper
 from src.config import Settings
 from src.embedders.factory import EmbedderFactory
 from src.rerankers.router import RerankerRouter
+from src.services.compression import PayloadCodec
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +154,7 @@ class SessionAwareRetriever:
         settings: Settings,
         reranker_router: RerankerRouter | None = None,
         config: SessionRetrieverConfig | None = None,
+        payload_codec: PayloadCodec | None = None,
     ) -> None:
         """Initialize SessionAwareRetriever.
 
@@ -162,12 +164,14 @@ class SessionAwareRetriever:
                 settings: Application settings.
                 reranker_router: Optional reranker router for result refinement.
                 config: Optional session retriever configuration.
+                payload_codec: Restores compressed payload fields in results.
         """
         self.qdrant_client = qdrant_client
         self.embedder_factory = embedder_factory
         self.settings = settings
         self.reranker_router = reranker_router
         self.config = config or SessionRetrieverConfig()
+        self.payload_codec = payload_codec or PayloadCodec()
         logger.info(
             f"SessionAwareRetriever initialized with config: "
             f"top_sessions={self.config.top_sessions}, "
@@ -403,7 +407,7 @@ class SessionAwareRetriever:
                 SessionAwareSearchResult(
                     id=r.id,
                     score=r.score or 0.0,
-                    payload=cast(dict[str, Any], r.payload or {}),
+                    payload=self.payload_codec.decode(cast(dict[str, Any], r.payload)),
                     session_id=session.session_id,
                     session_summary=session.summary,
                     session_score=session.score,
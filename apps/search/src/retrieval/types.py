@@ -24,6 +24,34 @@ class SearchStrategy(str, Enum):
     HYBRID = "hybrid"
 
 
+class FusionMethod(str, Enum):
+    """Fusion method for combining dense and sparse results in hybrid search.
+
+    Attributes:
+        RRF: Rank-based Reciprocal Rank Fusion (Qdrant built-in).
+        DBSF: Distribution-Based Score Fusion (Qdrant built-in, score-based).
+        LINEAR: Alpha-weighted linear combination of min-max normalized scores.
+    """
+
+    RRF = "rrf"
+    DBSF = "dbsf"
+    LINEAR = "linear"
+
+
+class SimilarVector(str, Enum):
+    """Stored vector used to find points similar to existing ones.
+
+    Attributes:
+        DENSE: Dense semantic embedding.
+        SPARSE: Sparse keyword embedding (SPLADE).
+        COLBERT: Late interaction multi-vector (turns only).
+    """
+
+    DENSE = "dense"
+    SPARSE = "sparse"
+    COLBERT = "colbert"
+
+
 class RerankerTier(str, Enum):
     """Reranker tier for result refinement.
 
@@ -79,6 +107,7 @@ class SearchFilters(BaseModel):
         type: Filter by memory type (e.g., thought, code, doc).
         time_range: Filter by time range.
         vt_end_after: Filter by valid time end (memories where vt_end > timestamp).
+        project: Filter memories by project (ignored for turns).
     """
 
     org_id: str = Field(description="Organization ID for tenant isolation")
@@ -89,6 +118,9 @@ class SearchFilters(BaseModel):
         default=None,
         description="Filter by valid time end (memories where vt_end > timestamp in ms)",
     )
+    project: str | None = Field(
+        default=None, description="Filter memories by project (ignored for turns)"
+    )
 
 
 class SearchQuery(BaseModel):
@@ -103,6 +135,13 @@ class SearchQuery(BaseModel):
         rerank: Whether to apply reranking.
         rerank_tier: Reranker tier to use.
         rerank_depth: Number of results to rerank before filtering to limit.
+        alpha: Dense weight for hybrid search (0=sparse, 1=dense, classifier if None).
+        fusion: Hybrid fusion method (config default if None).
+        deadline_ms: Absolute request deadline as Unix epoch milliseconds (none if None).
+        hnsw_ef: HNSW search beam size for dense search (per-strategy config if None).
+        exact: Bypass HNSW and do an exact (brute-force) dense search.
+        quantization_rescore: Rescore quantized candidates (config default if None).
+        quantization_oversampling: Quantized candidate oversampling (config default if None).
     """
 
     text: str = Field(description="Search query text")
@@ -119,6 +158,31 @@ class SearchQuery(BaseModel):
         default=None, description="Reranker tier (auto-selected if None)"
     )
     rerank_depth: int = Field(default=30, ge=1, le=100, description="Number of results to rerank")
+    alpha: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Dense weight for hybrid search (auto-selected by classifier if None)",
+    )
+    fusion: FusionMethod | None = Field(
+        default=None, description="Hybrid fusion method (config default if None)"
+    )
+    deadline_ms: int | None = Field(
+        default=None,
+        description="Absolute request deadline as Unix epoch milliseconds (no deadline if None)",
+    )
+    hnsw_ef: int | None = Field(
+        default=None, ge=1, description="HNSW ef for dense search (per-strategy config if None)"
+    )
+    exact: bool = Field(default=False, description="Exact (brute-force) dense search")
+    quantization_rescore: bool | None = Field(
+        default=None, description="Rescore quantized candidates (config default if None)"
+    )
+    quantization_oversampling: float | None = Field(
+        default=None,
+        ge=1.0,
+        description="Quantized candidate oversampling factor (config default if None)",
+    )
 
 
 class SearchResultItem(BaseModel):
@@ -133,6 +197,7 @@ class SearchResultItem(BaseModel):
         payload: Result payload with content and metadata.
         degraded: Whether result is from degraded/fallback mode.
         degraded_reason: Reason for degradation if applicable.
+        collection: Collection the result came from, when a search spans several.
     """
 
     id: str | int = Field(description="Result ID")
@@ -151,3 +216,81 @@ class SearchResultItem(BaseModel):
     degraded_reason: str | None = Field(
         default=None, description="Reason for degradation if applicable"
     )
+    collection: str | None = Field(
+        default=None, description="Collection the result came from (multi-collection search)"
+    )
+
+
+class PlanMode(str, Enum):
+    """First-stage execution plan chosen by the query planner.
+
+    Attributes:
+        EXACT: Brute-force scan over the filtered points.
+        FILTERED_HNSW: HNSW with a raised ef for restrictive filters.
+        HNSW: HNSW with the collection or per-strategy defaults.
+        MANUAL: The request set exact/hnsw_ef itself; nothing was planned.
+    """
+
+    EXACT = "exact"
+    FILTERED_HNSW = "filtered_hnsw"
+    HNSW = "hnsw"
+    MANUAL = "manual"
+
+
+class QueryPlan(BaseModel):
+    """Query planner decision for one first-stage search.
+
+    Attributes:
+        mode: Chosen execution plan.
+        fetch_limit: Candidates fetched from Qdrant.
+        estimated_matches: Estimated points matching the filter (None if not counted).
+        hnsw_ef: HNSW ef chosen by the planner (None for defaults).
+        cached: Whether the estimate came from the cardinality cache.
+    """
+
+    mode: PlanMode = Field(description="Chosen execution plan")
+    fetch_limit: int = Field(description="Candidates fetched from Qdrant")
+    estimated_matches: int | None = Field(
+        default=None, description="Estimated points matching the filter"
+    )
+    hnsw_ef: int | None = Field(default=None, description="HNSW ef chosen by the planner")
+    cached: bool = Field(default=False, description="Estimate served from cache")
+
+    @property
+    def exact(self) -> bool:
+        """Whether the plan bypasses HNSW."""
+        return self.mode == PlanMode.EXACT
+
+
+class SearchPhaseType(str, Enum):
+    """Stage of a two-phase (streaming) search.
+
+    Attributes:
+        CANDIDATES: First-stage fused results, emitted as soon as Qdrant returns.
+        RERANKED: Final reranked results.
+        RERANK_SKIPPED: Reranking was not applied; candidates are final.
+    """
+
+    CANDIDATES = "candidates"
+    RERANKED = "reranked"
+    RERANK_SKIPPED = "rerank_skipped"
+
+
+class SearchPhase(BaseModel):
+    """Results emitted at one stage of a two-phase search.
+
+    Attributes:
+        phase: Stage that produced these results.
+        results: Results for this stage (empty for rerank_skipped).
+        reason: Why reranking was skipped, if applicable.
+        plan: First-stage query plan, on the candidates phase.
+    """
+
+    phase: SearchPhaseType = Field(description="Stage that produced these results")
+    results: list[SearchResultItem] = Field(
+        default_factory=list, description="Results for this stage"
+    )
+    reason: str | None = Field(default=None, description="Why reranking was skipped")
+    plan: QueryPlan | None = Field(
+        default=None, description="First-stage query plan (candidates phase only)"
+    )
@@ -3,14 +3,34 @@
 This script reads existing Turn nodes from FalkorDB and indexes them
 into the engram_turns Qdrant collection with multi-vector embeddings.
 
+Turns are streamed in pages ordered by turn id (keyset pagination, so each
+page is an index seek rather than a growing SKIP) and fed through an
+IndexingPipeline: embedding workers and the upsert stage run concurrently,
+and the reader waits while the pipeline is full, so memory stays bounded
+regardless of how many turns an org has.
+
+Progress is checkpointed to a local JSON file after every batch that has
+been written, together with all batches before it. An interrupted run resumes
+after the last checkpointed turn; batches that failed keep the checkpoint
+behind them, so a rerun retries them (turns already indexed are skipped by
+their content hash).
+
 Usage:
     uv run python -m src.scripts.backfill_turns [--dry-run] [--batch-size=32] [--limit=100]
+        [--page-size=500] [--workers=2] [--org-id=ORG] [--checkpoint=PATH] [--restart]
 """
 
 import argparse
 import asyncio
+import json
 import logging
+import os
 import sys
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Any
 
 import redis.asyncio as redis
@@ -18,8 +38,15 @@ import redis.asyncio as redis
 from src.clients.qdrant import QdrantClientWrapper
 from src.config import Settings
 from src.embedders.factory import EmbedderFactory
+from src.embedders.scheduler import EmbeddingLane
 from src.indexing.batch import Document
+from src.indexing.pipeline import IndexingPipeline
+from src.indexing.sessions import SessionCentroidConfig
 from src.indexing.turns import TurnsIndexer, TurnsIndexerConfig
+from src.indexing.upload import UpsertConfig
+from src.services.compression import PayloadCodec
+from src.services.schema_manager import SchemaManager, late_chunks_from_settings
+from src.services.tiering import TurnTiers
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,11 +54,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+GRAPH_NAME = "EngramGraph"
+DEFAULT_CHECKPOINT = "backfill_turns.checkpoint.json"
 
-# Cypher query to get all turns with their session info
+# Cypher query for one page of turns with their session info, in turn id order
 TURNS_QUERY = """
 MATCH (s:Session)-[:HAS_TURN]->(t:Turn)
-WHERE t.vt_end IS NULL
+WHERE t.vt_end IS NULL AND t.id > $after_id{org_filter}
 RETURN
     t.id AS turn_id,
     t.user_content AS user_content,
@@ -44,10 +73,57 @@ RETURN
     t.vt_start AS timestamp,
     s.id AS session_id,
     s.org_id AS org_id
-ORDER BY s.started_at, t.sequence_index
+ORDER BY t.id
 """
 
 
+@dataclass
+class BackfillCheckpoint:
+    """Resume position of a backfill run."""
+
+    after_id: str = ""
+    scanned: int = 0
+    indexed: int = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "BackfillCheckpoint":
+        """Load a checkpoint, or start from the beginning if there is none.
+
+        Args:
+            path: Checkpoint file.
+
+        Returns:
+            Saved checkpoint, or an empty one.
+        """
+        if not path.exists():
+            return cls()
+        try:
+            return cls(**json.loads(path.read_text()))
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return cls()
+
+    def save(self, path: Path) -> None:
+        """Write the checkpoint atomically.
+
+        Args:
+            path: Checkpoint file.
+        """
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_text(json.dumps(asdict(self)))
+        os.replace(tmp, path)
+
+
+@dataclass
+class _PendingBatch:
+    """A submitted batch waiting to be written, in read order."""
+
+    last_id: str
+    rows: int
+    done: asyncio.Future[int] | None
+    size: int
+
+
 class TurnsBackfiller:
     """Backfills turn documents from FalkorDB to Qdrant."""
 
@@ -56,17 +132,32 @@ class TurnsBackfiller:
         settings: Settings,
         batch_size: int = 32,
         dry_run: bool = False,
+        page_size: int = 500,
+        workers: int = 2,
+        depth: int = 2,
+        org_id: str | None = None,
+        checkpoint_path: str | Path | None = None,
     ) -> None:
         """Initialize the backfiller.
 
         Args:
             settings: Application settings.
             batch_size: Number of documents to index per batch.
-            dry_run: If True, don't actually index documents.
+            dry_run: If True, read and convert turns without indexing them.
+            page_size: Turns fetched from FalkorDB per query.
+            workers: Batches embedded concurrently.
+            depth: Batches queued between pipeline stages.
+            org_id: Only backfill this organization's turns.
+            checkpoint_path: File to checkpoint progress to (no checkpointing if None).
         """
         self.settings = settings
         self.batch_size = batch_size
         self.dry_run = dry_run
+        self.page_size = page_size
+        self.workers = workers
+        self.depth = depth
+        self.org_id = org_id
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
         self._redis: redis.Redis | None = None
         self._indexer: TurnsIndexer | None = None
         self._qdrant: QdrantClientWrapper | None = None
@@ -92,38 +183,65 @@ class TurnsBackfiller:
             self._embedders = EmbedderFactory(self.settings)
 
             # Initialize indexer
+            turn_tiers = TurnTiers.from_settings(self.settings)
             indexer_config = TurnsIndexerConfig(
                 collection_name=self.settings.qdrant_collection,
+                cold_collection_name=turn_tiers.cold_collection if turn_tiers.enabled else None,
                 batch_size=self.batch_size,
+                enable_late_chunks=late_chunks_from_settings(self.settings),
+                late_chunk_tokens=self.settings.late_chunk_tokens,
+                late_chunk_max_tokens=self.settings.late_chunk_max_tokens,
+                upsert=UpsertConfig.from_settings(self.settings),
+                # Only orders work within this process, see src.embedders.scheduler
+                embedding_lane=EmbeddingLane.BULK,
+                sessions=SessionCentroidConfig.from_settings(self.settings),
+            )
+            self._indexer = TurnsIndexer(
+                self._qdrant,
+                self._embedders,
+                indexer_config,
+                shard_router=await SchemaManager(self._qdrant, self.settings).shard_router(),
+                payload_codec=PayloadCodec.from_settings(self.settings),
             )
-            self._indexer = TurnsIndexer(self._qdrant, self._embedders, indexer_config)
 
     async def disconnect(self) -> None:
         """Disconnect from services."""
         if self._redis:
             await self._redis.close()
 
-    async def query_turns(self, limit: int | None = None) -> list[dict[str, Any]]:
-        """Query turns from FalkorDB.
+    async def query_turns(
+        self, limit: int | None = None, after_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Query one page of turns from FalkorDB.
 
         Args:
-            limit: Maximum number of turns to fetch. None for all.
+            limit: Maximum number of turns to fetch (default: page_size).
+            after_id: Return turns with ids after this one (default: from the start).
 
         Returns:
-            List of turn records.
+            List of turn records, ordered by turn id.
         """
         if self._redis is None:
             raise RuntimeError("Not connected to FalkorDB")
 
-        query = TURNS_QUERY
-        if limit:
-            query = f"{TURNS_QUERY} LIMIT {limit}"
+        params = {"after_id": after_id or ""}
+        org_filter = ""
+        if self.org_id:
+            params["org_id"] = self.org_id
+            org_filter = " AND s.org_id = $org_id"
+
+        # FalkorDB takes query parameters as a CYPHER prefix
+        prefix = " ".join(f"{name}={json.dumps(value)}" for name, value in params.items())
+        query = (
+            f"CYPHER {prefix} {TURNS_QUERY.format(org_filter=org_filter)}"
+            f"LIMIT {int(limit or self.page_size)}"
+        )
 
-        logger.info(f"Querying turns from FalkorDB (limit={limit})")
+        logger.debug(f"Querying turns from FalkorDB (after={after_id}, limit={limit})")
 
         # Execute graph query via Redis
         # FalkorDB uses GRAPH.QUERY command
-        result = await self._redis.execute_command("GRAPH.QUERY", "EngramGraph", query)
+        result = await self._redis.execute_command("GRAPH.QUERY", GRAPH_NAME, query)
 
         # Parse FalkorDB response
         # Response format: [headers, [[row1], [row2], ...], stats]
@@ -143,9 +261,36 @@ class TurnsBackfiller:
                     turn[header_name] = value
                 turns.append(turn)
 
-        logger.info(f"Found {len(turns)} turns in FalkorDB")
         return turns
 
+    async def stream_turns(
+        self, limit: int | None = None, after_id: str | None = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream turns from FalkorDB one page at a time.
+
+        Args:
+            limit: Maximum number of turns to yield. None for all.
+            after_id: Start after this turn id.
+
+        Yields:
+            Pages of turn records, ordered by turn id.
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_size = self.page_size if remaining is None else min(self.page_size, remaining)
+            page = await self.query_turns(limit=page_size, after_id=after_id)
+            if not page:
+                return
+
+            yield page
+
+            last_id = page[-1].get("turn_id")
+            if remaining is not None:
+                remaining -= len(page)
+            if len(page) < page_size or not last_id:
+                return
+            after_id = str(last_id)
+
     def turn_to_document(self, turn: dict[str, Any]) -> Document | None:
         """Convert a FalkorDB turn record to a Document.
 
@@ -183,24 +328,11 @@ class TurnsBackfiller:
                 logger.warning(f"Turn {turn_id} has no content, skipping")
                 return None
 
-            # Parse files_touched - may be a string representation of a list
-            files_touched = turn.get("files_touched", [])
-            if isinstance(files_touched, str):
-                # Handle string representation like "['file1.ts', 'file2.ts']"
-                import ast
-
-                try:
-                    files_touched = ast.literal_eval(files_touched)
-                except (ValueError, SyntaxError):
-                    files_touched = []
-            elif files_touched is None:
-                files_touched = []
-
             # Build metadata
             metadata = {
                 "type": "turn",
                 "sequence_index": turn.get("sequence_index", 0),
-                "files_touched": files_touched,
+                "files_touched": parse_list(turn.get("files_touched")),
                 "tool_calls_count": turn.get("tool_calls_count", 0),
                 "has_code": "```" in full_content,
                 "has_reasoning": False,  # Historical data may not have reasoning
@@ -224,47 +356,166 @@ class TurnsBackfiller:
     async def backfill(self, limit: int | None = None) -> tuple[int, int]:
         """Run the backfill process.
 
+        Resumes from the checkpoint file if there is one.
+
         Args:
             limit: Maximum number of turns to process. None for all.
 
         Returns:
-            Tuple of (total_processed, successful_indexed).
+            Tuple of (total_processed, successful_indexed) for this run.
         """
-        # Query turns from FalkorDB
-        turns = await self.query_turns(limit)
-        total = len(turns)
+        if self.dry_run:
+            return await self._dry_run(limit)
+
+        if self._indexer is None:
+            raise RuntimeError("Indexer not initialized (call connect first)")
+
+        checkpoint = BackfillCheckpoint()
+        if self.checkpoint_path:
+            checkpoint = BackfillCheckpoint.load(self.checkpoint_path)
+            if checkpoint.after_id:
+                logger.info(
+                    f"Resuming after turn {checkpoint.after_id} "
+                    f"({checkpoint.scanned} turns scanned previously)"
+                )
+
+        pipeline = IndexingPipeline(
+            embed=self._indexer.embed_documents,
+            upsert=self._indexer.upsert_points,
+            depth=self.depth,
+            name="backfill",
+            embed_workers=self.workers,
+        )
+        pending: deque[_PendingBatch] = deque()
+        total = 0
+        indexed = 0
+        failed = False
+        start = time.perf_counter()
 
-        if total == 0:
-            logger.info("No turns found to backfill")
-            return 0, 0
+        await pipeline.start()
+        try:
+            async for page in self.stream_turns(limit, checkpoint.after_id or None):
+                for i in range(0, len(page), self.batch_size):
+                    rows = page[i : i + self.batch_size]
+                    total += len(rows)
+                    documents = [doc for doc in map(self.turn_to_document, rows) if doc]
+                    done = await pipeline.submit(documents) if documents else None
+                    pending.append(
+                        _PendingBatch(str(rows[-1].get("turn_id")), len(rows), done, len(documents))
+                    )
+
+                    count, failed = self._settle(pending, checkpoint, failed, wait=False)
+                    indexed += count
+
+                rate = total / (time.perf_counter() - start)
+                logger.info(f"Read {total} turns ({rate:,.1f}/s), {indexed} indexed")
+        finally:
+            # Drain what was submitted so the checkpoint covers it, even on errors
+            await pipeline.stop()
+            count, failed = self._settle(pending, checkpoint, failed, wait=True)
+            indexed += count
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"Backfill complete: {indexed}/{total} turns indexed in {elapsed:.1f}s "
+            f"({total / elapsed if elapsed else 0:,.1f} turns/s)"
+        )
+        if failed:
+            logger.warning("Some batches failed; rerun to retry from the checkpoint")
+        return total, indexed
 
-        # Convert to documents
-        documents: list[Document] = []
-        for turn in turns:
-            doc = self.turn_to_document(turn)
-            if doc:
-                documents.append(doc)
+    def _settle(
+        self,
+        pending: deque[_PendingBatch],
+        checkpoint: BackfillCheckpoint,
+        failed: bool,
+        wait: bool,
+    ) -> tuple[int, bool]:
+        """Collect finished batches in read order and advance the checkpoint.
 
-        logger.info(f"Converted {len(documents)} turns to documents")
+        The checkpoint only moves past batches that were fully written and
+        stops at the first failure, so a rerun picks up every failed batch.
 
-        if self.dry_run:
-            logger.info("[DRY RUN] Would index documents:")
-            for doc in documents[:5]:  # Show first 5
-                logger.info(f"  - {doc.id}: {doc.content[:100]}...")
-            return total, 0
+        Args:
+            pending: Submitted batches, oldest first.
+            checkpoint: Checkpoint to advance.
+            failed: Whether an earlier batch failed.
+            wait: Whether all batches are known to be finished (after the
+                pipeline stopped).
 
-        # Index in batches
+        Returns:
+            (documents indexed by the collected batches, whether any batch failed).
+        """
         indexed = 0
-        for i in range(0, len(documents), self.batch_size):
-            batch = documents[i : i + self.batch_size]
-            logger.info(f"Indexing batch {i // self.batch_size + 1} ({len(batch)} documents)")
+        advanced = False
+        while pending and (wait or pending[0].done is None or pending[0].done.done()):
+            batch = pending.popleft()
+            count = batch.done.result() if batch.done is not None else 0
+            indexed += count
+            if count < batch.size:
+                failed = True
+            if not failed:
+                checkpoint.after_id = batch.last_id
+                checkpoint.scanned += batch.rows
+                checkpoint.indexed += count
+                advanced = True
+
+        if advanced and self.checkpoint_path:
+            checkpoint.save(self.checkpoint_path)
+        return indexed, failed
+
+    async def _dry_run(self, limit: int | None) -> tuple[int, int]:
+        """Read and convert turns without indexing, reporting read throughput."""
+        total = 0
+        converted = 0
+        start = time.perf_counter()
+
+        async for page in self.stream_turns(limit):
+            documents = [doc for doc in map(self.turn_to_document, page) if doc]
+            if not total:
+                logger.info("[DRY RUN] Would index documents:")
+                for doc in documents[:5]:  # Show first 5
+                    logger.info(f"  - {doc.id}: {doc.content[:100]}...")
+            total += len(page)
+            converted += len(documents)
+
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"[DRY RUN] Read {total} turns ({converted} indexable) in {elapsed:.2f}s "
+            f"({total / elapsed if elapsed else 0:,.1f} turns/s)"
+        )
+        return total, 0
+
+
+def parse_list(value: Any) -> list[str]:
+    """Parse a list property as returned by GRAPH.QUERY.
+
+    Lists come back either as lists or as their string form, e.g.
+    ``"[src/a.ts, src/b.ts]"`` or ``"['src/a.ts']"``.
+
+    Args:
+        value: Raw property value.
+
+    Returns:
+        List of strings (empty if the value is missing or not a list).
+    """
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, str):
+        return []
+
+    text = value.strip()
+    if not (text.startswith("[") and text.endswith("]")):
+        return []
+    try:
+        parsed = json.loads(text)
+        if isinstance(parsed, list):
+            return [str(item) for item in parsed]
+    except ValueError:
+        pass
 
-            if self._indexer:
-                count = await self._indexer.index_documents(batch)
-                indexed += count
-
-        logger.info(f"Backfill complete: {indexed}/{total} turns indexed")
-        return total, indexed
+    items = (item.strip().strip("'\"") for item in text[1:-1].split(","))
+    return [item for item in items if item]
 
 
 async def main() -> int:
@@ -273,7 +524,7 @@ async def main() -> int:
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Print what would be done without actually indexing",
+        help="Read and convert turns without indexing, reporting read throughput",
     )
     parser.add_argument(
         "--batch-size",
@@ -287,15 +538,50 @@ async def main() -> int:
         default=None,
         help="Maximum number of turns to process (default: all)",
     )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=500,
+        help="Turns fetched from FalkorDB per query (default: 500)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Batches embedded concurrently (default: 2)",
+    )
+    parser.add_argument(
+        "--org-id",
+        default=None,
+        help="Only backfill this organization's turns (default: all)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=DEFAULT_CHECKPOINT,
+        help=f"Progress file used to resume interrupted runs (default: {DEFAULT_CHECKPOINT})",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore an existing checkpoint and start from the first turn",
+    )
 
     args = parser.parse_args()
 
     settings = Settings()
 
+    checkpoint_path = Path(args.checkpoint)
+    if args.restart and checkpoint_path.exists():
+        checkpoint_path.unlink()
+
     backfiller = TurnsBackfiller(
         settings=settings,
         batch_size=args.batch_size,
         dry_run=args.dry_run,
+        page_size=args.page_size,
+        workers=args.workers,
+        org_id=args.org_id,
+        checkpoint_path=checkpoint_path,
     )
 
     try:
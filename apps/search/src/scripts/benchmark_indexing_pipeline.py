@@ -0,0 +1,256 @@
+"""Benchmark sustained turn indexing throughput.
+
+Indexes a synthetic backlog of turns through TurnsIndexer in three modes:
+
+- serial: encoders one after another, each batch upserted before the next is
+  embedded (the behaviour before the indexing pipeline)
+- parallel: dense, sparse and ColBERT encoders run concurrently
+- pipelined: parallel encoders plus IndexingPipeline, overlapping the
+  embedding of batch N+1 with the upsert of batch N
+
+Encoders are simulated with fixed per-batch latencies (sleeping in worker
+threads, like model inference releasing the GIL) so the benchmark runs
+without ML dependencies; upserts go to Qdrant local mode by default, or a
+live server with --qdrant-url. Local mode writes on the event loop itself, so
+nothing can overlap with it; use --qdrant-url, or --upsert-delay-ms to add a
+simulated network round trip, to measure the pipelining gain.
+
+Usage:
+    uv run python -m src.scripts.benchmark_indexing_pipeline [--turns=2000] [--batch-size=32]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from src.indexing.batch import Document
+from src.indexing.pipeline import IndexingPipeline
+from src.indexing.turns import TurnsIndexer, TurnsIndexerConfig
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "bench_indexing_pipeline"
+DENSE_SIZE = 384
+COLBERT_SIZE = 128
+COLBERT_TOKENS = 16
+
+
+class SimulatedEmbedder:
+    """Embedder stand-in that sleeps for a fixed time per batch."""
+
+    def __init__(self, latency_ms: float, rng: np.random.Generator) -> None:
+        self.latency_s = latency_ms / 1000.0
+        self.rng = rng
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def load(self) -> None:
+        """Nothing to load."""
+
+    async def embed_batch(
+        self, texts: list[str], is_query: bool = True, lane: str | None = None
+    ) -> list[list[float]]:
+        """Dense embeddings, computed on the embedder's own executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._dense_sync, texts)
+
+    async def embed_sparse_batch_async(
+        self, texts: list[str], lane: str | None = None
+    ) -> list[dict[int, float]]:
+        """Sparse embeddings, computed on the embedder's own executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._sparse_sync, texts)
+
+    async def embed_document_batch_async(
+        self, documents: list[str], lane: str | None = None
+    ) -> list[list[list[float]]]:
+        """ColBERT embeddings, computed on the embedder's own executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._colbert_sync, documents)
+
+    def _dense_sync(self, texts: list[str]) -> list[list[float]]:
+        time.sleep(self.latency_s)
+        return self.rng.standard_normal((len(texts), DENSE_SIZE)).tolist()
+
+    def _sparse_sync(self, texts: list[str]) -> list[dict[int, float]]:
+        time.sleep(self.latency_s)
+        return [{int(i): 0.5 for i in self.rng.integers(0, 30000, size=40)} for _ in texts]
+
+    def _colbert_sync(self, documents: list[str]) -> list[list[list[float]]]:
+        time.sleep(self.latency_s)
+        return [
+            self.rng.standard_normal((COLBERT_TOKENS, COLBERT_SIZE)).tolist() for _ in documents
+        ]
+
+
+class SimulatedEmbedderFactory:
+    """EmbedderFactory stand-in returning simulated embedders."""
+
+    def __init__(self, dense_ms: float, sparse_ms: float, colbert_ms: float) -> None:
+        rng = np.random.default_rng(42)
+        self.text = SimulatedEmbedder(dense_ms, rng)
+        self.sparse = SimulatedEmbedder(sparse_ms, rng)
+        self.colbert = SimulatedEmbedder(colbert_ms, rng)
+
+    async def get_text_embedder(self) -> SimulatedEmbedder:
+        return self.text
+
+    async def get_sparse_embedder(self) -> SimulatedEmbedder:
+        return self.sparse
+
+    async def get_colbert_embedder(self) -> SimulatedEmbedder:
+        return self.colbert
+
+
+class _DelayedClient:
+    """AsyncQdrantClient proxy adding a simulated round trip to upserts."""
+
+    def __init__(self, client: AsyncQdrantClient, delay_ms: float) -> None:
+        self._client = client
+        self._delay_s = delay_ms / 1000.0
+
+    async def upsert(self, **kwargs: Any) -> Any:
+        await asyncio.sleep(self._delay_s)
+        return await self._client.upsert(**kwargs)
+
+
+class _QdrantWrapper:
+    """Minimal QdrantClientWrapper stand-in exposing ``client``."""
+
+    def __init__(self, client: AsyncQdrantClient, delay_ms: float) -> None:
+        self.client = _DelayedClient(client, delay_ms) if delay_ms else client
+
+
+async def reset_collection(client: AsyncQdrantClient) -> None:
+    """Recreate the benchmark collection with the turn vector layout."""
+    if await client.collection_exists(COLLECTION_NAME):
+        await client.delete_collection(COLLECTION_NAME)
+
+    await client.create_collection(
+        collection_name=COLLECTION_NAME,
+        vectors_config={
+            "turn_dense": models.VectorParams(size=DENSE_SIZE, distance=models.Distance.COSINE),
+            "turn_colbert": models.VectorParams(
+                size=COLBERT_SIZE,
+                distance=models.Distance.COSINE,
+                multivector_config=models.MultiVectorConfig(
+                    comparator=models.MultiVectorComparator.MAX_SIM
+                ),
+            ),
+        },
+        sparse_vectors_config={"turn_sparse": models.SparseVectorParams()},
+    )
+
+
+def build_backlog(num_turns: int) -> list[Document]:
+    """Build synthetic turn documents."""
+    return [
+        Document(
+            id=f"00000000-0000-0000-0000-{i:012d}",
+            content=f"User: question {i}\n\nAssistant: answer {i}",
+            org_id="bench-org",
+            session_id=f"session-{i % 50}",
+            metadata={"type": "turn", "timestamp": 1_700_000_000_000 + i},
+        )
+        for i in range(num_turns)
+    ]
+
+
+async def run_mode(
+    mode: str,
+    client: AsyncQdrantClient,
+    factory: Any,
+    backlog: list[Document],
+    batch_size: int,
+    depth: int,
+    upsert_delay_ms: float,
+) -> float:
+    """Index the backlog in one mode and return turns per second."""
+    await reset_collection(client)
+    indexer = TurnsIndexer(
+        qdrant_client=_QdrantWrapper(client, upsert_delay_ms),  # type: ignore[arg-type]
+        embedder_factory=factory,
+        config=TurnsIndexerConfig(
+            collection_name=COLLECTION_NAME, parallel_encoders=mode != "serial"
+        ),
+    )
+    batches = [backlog[i : i + batch_size] for i in range(0, len(backlog), batch_size)]
+
+    start = time.perf_counter()
+    if mode == "pipelined":
+        pipeline = IndexingPipeline(
+            embed=indexer.embed_documents, upsert=indexer.upsert_points, depth=depth
+        )
+        await pipeline.start()
+        for batch in batches:
+            await pipeline.submit(batch)
+        await pipeline.stop()
+    else:
+        for batch in batches:
+            await indexer.index_documents(batch)
+    elapsed = time.perf_counter() - start
+
+    indexed = (await client.count(COLLECTION_NAME)).count
+    if indexed != len(backlog):
+        raise RuntimeError(f"{mode}: indexed {indexed} of {len(backlog)} turns")
+    return len(backlog) / elapsed
+
+
+async def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark turn indexing throughput")
+    parser.add_argument("--qdrant-url", default=None, help="Qdrant URL (default: local mode)")
+    parser.add_argument("--turns", type=int, default=2000, help="Synthetic backlog size")
+    parser.add_argument("--batch-size", type=int, default=32, help="Turns per batch")
+    parser.add_argument("--depth", type=int, default=2, help="Pipeline depth")
+    parser.add_argument("--dense-ms", type=float, default=40.0, help="Dense latency per batch")
+    parser.add_argument("--sparse-ms", type=float, default=30.0, help="Sparse latency per batch")
+    parser.add_argument("--colbert-ms", type=float, default=50.0, help="ColBERT latency per batch")
+    parser.add_argument(
+        "--upsert-delay-ms", type=float, default=0.0, help="Simulated round trip per upsert"
+    )
+    args = parser.parse_args()
+
+    factory = SimulatedEmbedderFactory(args.dense_ms, args.sparse_ms, args.colbert_ms)
+    backlog = build_backlog(args.turns)
+    client = (
+        AsyncQdrantClient(url=args.qdrant_url)
+        if args.qdrant_url
+        else AsyncQdrantClient(location=":memory:")
+    )
+
+    try:
+        results = {}
+        for mode in ("serial", "parallel", "pipelined"):
+            logger.info(f"Indexing {args.turns} turns ({mode})...")
+            results[mode] = await run_mode(
+                mode, client, factory, backlog, args.batch_size, args.depth, args.upsert_delay_ms
+            )
+
+        for mode, rate in results.items():
+            speedup = rate / results["serial"]
+            logger.info(f"{mode:>9}: {rate:,.1f} turns/s ({speedup:.2f}x serial)")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}", exc_info=True)
+        return 1
+    finally:
+        if await client.collection_exists(COLLECTION_NAME):
+            await client.delete_collection(COLLECTION_NAME)
+        await client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
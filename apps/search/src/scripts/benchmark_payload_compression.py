@@ -0,0 +1,206 @@
+"""Benchmark compressed payload storage for large-payload turns.
+
+Stores the same synthetic turns plain, zstd-compressed, and zstd-compressed
+with a dictionary trained on a sample of them, then reports stored payload
+bytes and end-to-end query latency (including decoding) for each mode.
+
+Runs against Qdrant local mode by default, or a live server with --qdrant-url.
+Requires the "compression" extra (zstandard).
+
+Usage:
+    uv run python -m src.scripts.benchmark_payload_compression [--points=2000] [--queries=50]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from src.scripts.benchmark_payload_projection import (
+    VECTOR_NAME,
+    VECTOR_SIZE,
+    build_turn_payload,
+    payload_bytes,
+)
+from src.services.compression import (
+    ZSTD_AVAILABLE,
+    PayloadCodec,
+    serialize_value,
+    train_dictionary,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "bench_payload_compression"
+
+
+@dataclass
+class ModeResult:
+    """Measurements for one storage mode."""
+
+    mode: str
+    stored_bytes: int
+    avg_latency_ms: float
+    p95_latency_ms: float
+
+
+async def seed(
+    client: AsyncQdrantClient,
+    codec: PayloadCodec,
+    vectors: list[list[float]],
+    payloads: list[dict[str, Any]],
+) -> int:
+    """Recreate the benchmark collection and insert encoded turns.
+
+    Returns:
+        Total stored payload bytes.
+    """
+    if await client.collection_exists(COLLECTION_NAME):
+        await client.delete_collection(COLLECTION_NAME)
+
+    await client.create_collection(
+        collection_name=COLLECTION_NAME,
+        vectors_config={
+            VECTOR_NAME: models.VectorParams(size=VECTOR_SIZE, distance=models.Distance.COSINE)
+        },
+    )
+
+    encoded = [codec.encode(payload) for payload in payloads]
+    for start in range(0, len(encoded), 256):
+        await client.upsert(
+            collection_name=COLLECTION_NAME,
+            points=[
+                models.PointStruct(
+                    id=str(uuid.uuid4()),
+                    vector={VECTOR_NAME: vector},
+                    payload=payload,
+                )
+                for vector, payload in zip(
+                    vectors[start : start + 256], encoded[start : start + 256], strict=True
+                )
+            ],
+        )
+    return payload_bytes(encoded)
+
+
+async def run_mode(
+    client: AsyncQdrantClient,
+    codec: PayloadCodec,
+    mode: str,
+    stored_bytes: int,
+    queries: list[list[float]],
+    limit: int,
+) -> ModeResult:
+    """Query the collection and decode every returned payload."""
+    latencies: list[float] = []
+    query_filter = models.Filter(
+        must=[models.FieldCondition(key="org_id", match=models.MatchValue(value="bench-org"))]
+    )
+
+    for vector in queries:
+        start = time.perf_counter()
+        response = await client.query_points(
+            collection_name=COLLECTION_NAME,
+            query=vector,
+            using=VECTOR_NAME,
+            query_filter=query_filter,
+            limit=limit,
+            with_payload=True,
+        )
+        for point in response.points:
+            codec.decode(point.payload)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return ModeResult(
+        mode=mode,
+        stored_bytes=stored_bytes,
+        avg_latency_ms=statistics.mean(latencies),
+        p95_latency_ms=latencies[int(len(latencies) * 0.95) - 1],
+    )
+
+
+async def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark compressed payload storage")
+    parser.add_argument("--qdrant-url", default=None, help="Qdrant URL (default: local mode)")
+    parser.add_argument("--points", type=int, default=2000, help="Synthetic turns to index")
+    parser.add_argument("--queries", type=int, default=50, help="Queries per mode")
+    parser.add_argument("--limit", type=int, default=30, help="Results per query")
+    parser.add_argument("--level", type=int, default=3, help="zstd compression level")
+    parser.add_argument("--min-bytes", type=int, default=1024, help="Compression threshold")
+    parser.add_argument("--train-samples", type=int, default=500, help="Turns to train on")
+    args = parser.parse_args()
+
+    if not ZSTD_AVAILABLE:
+        logger.error("zstandard is not installed (install the 'compression' extra)")
+        return 1
+
+    rng = np.random.default_rng(42)
+    payloads = [build_turn_payload(rng, "bench-org", i) for i in range(args.points)]
+    vectors = [rng.standard_normal(VECTOR_SIZE).tolist() for _ in range(args.points)]
+    queries = [rng.standard_normal(VECTOR_SIZE).tolist() for _ in range(args.queries)]
+
+    plain = PayloadCodec()
+    fields = plain.fields
+    dictionary = train_dictionary(
+        [
+            serialize_value(payload[field])
+            for payload in payloads[: args.train_samples]
+            for field in fields.intersection(payload)
+        ]
+    )
+    modes = {
+        "plain": plain,
+        "zstd": PayloadCodec(enabled=True, min_bytes=args.min_bytes, level=args.level),
+        "zstd+dict": PayloadCodec(
+            enabled=True, min_bytes=args.min_bytes, level=args.level, dictionaries=[dictionary]
+        ),
+    }
+
+    client = (
+        AsyncQdrantClient(url=args.qdrant_url)
+        if args.qdrant_url
+        else AsyncQdrantClient(location=":memory:")
+    )
+
+    try:
+        results: list[ModeResult] = []
+        for mode, codec in modes.items():
+            logger.info(f"Seeding {args.points} synthetic turns ({mode})...")
+            stored = await seed(client, codec, vectors, payloads)
+            results.append(await run_mode(client, codec, mode, stored, queries, args.limit))
+
+        baseline = results[0].stored_bytes
+        for result in results:
+            saved = 1 - result.stored_bytes / baseline if baseline else 0.0
+            logger.info(
+                f"{result.mode:>9}: stored_bytes={result.stored_bytes:,} ({saved:.1%} saved) "
+                f"avg_latency_ms={result.avg_latency_ms:.2f} "
+                f"p95_latency_ms={result.p95_latency_ms:.2f}"
+            )
+        return 0
+
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}", exc_info=True)
+        return 1
+    finally:
+        await client.delete_collection(COLLECTION_NAME)
+        await client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,216 @@
+"""Benchmark first-stage payload projection for large-payload turns.
+
+Compares fetching full payloads for every reranking candidate against fetching
+only the first-stage fields and hydrating the final top-k with one retrieve call.
+Reports payload bytes transferred and query latency for both modes.
+
+Runs against Qdrant local mode by default, or a live server with --qdrant-url.
+
+Usage:
+    uv run python -m src.scripts.benchmark_payload_projection [--points=2000] [--queries=50]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from src.config import Settings
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "bench_payload_projection"
+VECTOR_NAME = "turn_dense"
+VECTOR_SIZE = 384
+
+
+@dataclass
+class ModeResult:
+    """Measurements for one retrieval mode."""
+
+    mode: str
+    avg_bytes: float
+    avg_latency_ms: float
+    p95_latency_ms: float
+
+
+def build_turn_payload(rng: np.random.Generator, org_id: str, index: int) -> dict[str, Any]:
+    """Build a synthetic turn payload with large tool-call and file lists.
+
+    Args:
+        rng: Random generator.
+        org_id: Organization ID.
+        index: Turn index.
+
+    Returns:
+        Payload resembling a TurnsIndexer point.
+    """
+    words = rng.integers(0, 5000, size=int(rng.integers(200, 1200)))
+    content = " ".join(f"tok{w}" for w in words)
+    return {
+        "content": f"User: question {index}\n\nAssistant: {content}",
+        "org_id": org_id,
+        "session_id": f"session-{index % 50}",
+        "type": "turn",
+        "timestamp": 1_700_000_000_000 + index,
+        "tool_calls": [
+            {"name": "Read", "args": {"path": f"src/file_{i}.py"}, "output": "x" * 400}
+            for i in range(int(rng.integers(5, 30)))
+        ],
+        "files_touched": [f"src/module_{i}/file_{i}.py" for i in range(int(rng.integers(5, 60)))],
+        "input_tokens": int(rng.integers(100, 5000)),
+        "output_tokens": int(rng.integers(100, 5000)),
+    }
+
+
+def payload_bytes(payloads: list[dict[str, Any] | None]) -> int:
+    """Approximate wire size of returned payloads as JSON bytes."""
+    return sum(len(json.dumps(p or {}).encode()) for p in payloads)
+
+
+async def seed(client: AsyncQdrantClient, num_points: int, rng: np.random.Generator) -> None:
+    """Create the benchmark collection and insert synthetic turns."""
+    if await client.collection_exists(COLLECTION_NAME):
+        await client.delete_collection(COLLECTION_NAME)
+
+    await client.create_collection(
+        collection_name=COLLECTION_NAME,
+        vectors_config={
+            VECTOR_NAME: models.VectorParams(size=VECTOR_SIZE, distance=models.Distance.COSINE)
+        },
+    )
+
+    batch: list[models.PointStruct] = []
+    for i in range(num_points):
+        batch.append(
+            models.PointStruct(
+                id=str(uuid.uuid4()),
+                vector={VECTOR_NAME: rng.standard_normal(VECTOR_SIZE).tolist()},
+                payload=build_turn_payload(rng, "bench-org", i),
+            )
+        )
+        if len(batch) == 256:
+            await client.upsert(collection_name=COLLECTION_NAME, points=batch)
+            batch = []
+    if batch:
+        await client.upsert(collection_name=COLLECTION_NAME, points=batch)
+
+
+async def run_mode(
+    client: AsyncQdrantClient,
+    queries: list[list[float]],
+    rerank_depth: int,
+    limit: int,
+    fields: list[str] | None,
+) -> ModeResult:
+    """Run queries in full-payload (fields=None) or projected mode."""
+    latencies: list[float] = []
+    transferred: list[int] = []
+    query_filter = models.Filter(
+        must=[models.FieldCondition(key="org_id", match=models.MatchValue(value="bench-org"))]
+    )
+
+    for vector in queries:
+        start = time.perf_counter()
+        with_payload: bool | models.PayloadSelector = (
+            True if fields is None else models.PayloadSelectorInclude(include=fields)
+        )
+        response = await client.query_points(
+            collection_name=COLLECTION_NAME,
+            query=vector,
+            using=VECTOR_NAME,
+            query_filter=query_filter,
+            limit=rerank_depth,
+            with_payload=with_payload,
+        )
+        size = payload_bytes([p.payload for p in response.points])
+
+        if fields is not None:
+            # Reranking would pick the top-k here; hydrate them in one call
+            top_ids = [p.id for p in response.points[:limit]]
+            records = await client.retrieve(
+                collection_name=COLLECTION_NAME,
+                ids=top_ids,
+                with_payload=True,
+                with_vectors=False,
+            )
+            size += payload_bytes([r.payload for r in records])
+
+        latencies.append((time.perf_counter() - start) * 1000)
+        transferred.append(size)
+
+    latencies.sort()
+    return ModeResult(
+        mode="full" if fields is None else "projected",
+        avg_bytes=statistics.mean(transferred),
+        avg_latency_ms=statistics.mean(latencies),
+        p95_latency_ms=latencies[int(len(latencies) * 0.95) - 1],
+    )
+
+
+async def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark first-stage payload projection")
+    parser.add_argument("--qdrant-url", default=None, help="Qdrant URL (default: local mode)")
+    parser.add_argument("--points", type=int, default=2000, help="Synthetic turns to index")
+    parser.add_argument("--queries", type=int, default=50, help="Queries per mode")
+    parser.add_argument("--rerank-depth", type=int, default=30, help="First-stage candidates")
+    parser.add_argument("--limit", type=int, default=10, help="Final results per query")
+    args = parser.parse_args()
+
+    settings = Settings()
+    rng = np.random.default_rng(42)
+    client = (
+        AsyncQdrantClient(url=args.qdrant_url)
+        if args.qdrant_url
+        else AsyncQdrantClient(location=":memory:")
+    )
+
+    try:
+        logger.info(f"Seeding {args.points} synthetic turns...")
+        await seed(client, args.points, rng)
+
+        queries = [rng.standard_normal(VECTOR_SIZE).tolist() for _ in range(args.queries)]
+        full = await run_mode(client, queries, args.rerank_depth, args.limit, None)
+        projected = await run_mode(
+            client,
+            queries,
+            args.rerank_depth,
+            args.limit,
+            list(settings.search_first_stage_payload_fields),
+        )
+
+        for result in (full, projected):
+            logger.info(
+                f"{result.mode:>9}: avg_bytes={result.avg_bytes:,.0f} "
+                f"avg_latency_ms={result.avg_latency_ms:.2f} "
+                f"p95_latency_ms={result.p95_latency_ms:.2f}"
+            )
+        saved = 1 - projected.avg_bytes / full.avg_bytes if full.avg_bytes else 0.0
+        logger.info(f"Payload bytes saved by projection: {saved:.1%}")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}", exc_info=True)
+        return 1
+    finally:
+        await client.delete_collection(COLLECTION_NAME)
+        await client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,247 @@
+"""Benchmark Qdrant vector quantization for the turn dense vector.
+
+Builds one collection per quantization mode (none, scalar, product, binary) from
+the same synthetic vectors and compares, per mode:
+- estimated vector RAM (originals on disk when quantized, quantized codes in RAM)
+- query latency with HNSW + quantized search
+- recall@k against exact (brute-force) search over the original vectors
+
+Optionally sweeps quantization oversampling to show the recall/latency trade-off.
+
+Quantization only takes effect on a Qdrant server; local mode ignores it, so run
+with --qdrant-url for meaningful numbers.
+
+Usage:
+    uv run python -m src.scripts.benchmark_quantization --qdrant-url=http://localhost:6180
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from src.services.schema_manager import QuantizationType, VectorQuantization
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+COLLECTION_PREFIX = "bench_quantization"
+VECTOR_NAME = "turn_dense"
+VECTOR_SIZE = 384
+
+# Bytes per vector in RAM for each mode (product assumes the default x16 ratio)
+BYTES_PER_VECTOR = {
+    "none": VECTOR_SIZE * 4,
+    QuantizationType.SCALAR.value: VECTOR_SIZE,
+    QuantizationType.PRODUCT.value: VECTOR_SIZE * 4 // 16,
+    QuantizationType.BINARY.value: VECTOR_SIZE // 8,
+}
+
+
+@dataclass
+class ModeResult:
+    """Measurements for one quantization mode."""
+
+    mode: str
+    oversampling: float | None
+    ram_mb: float
+    avg_latency_ms: float
+    p95_latency_ms: float
+    recall: float
+
+
+def make_vectors(rng: np.random.Generator, count: int, clusters: int = 64) -> np.ndarray:
+    """Generate clustered, L2-normalised vectors resembling sentence embeddings."""
+    centers = rng.standard_normal((clusters, VECTOR_SIZE))
+    assignments = rng.integers(0, clusters, size=count)
+    vectors = centers[assignments] + 0.5 * rng.standard_normal((count, VECTOR_SIZE))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+async def seed(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    vectors: np.ndarray,
+    ids: list[str],
+    quantization: VectorQuantization | None,
+) -> None:
+    """Create a collection for one mode and insert the shared vectors."""
+    if await client.collection_exists(collection_name):
+        await client.delete_collection(collection_name)
+
+    await client.create_collection(
+        collection_name=collection_name,
+        vectors_config={
+            VECTOR_NAME: models.VectorParams(
+                size=VECTOR_SIZE,
+                distance=models.Distance.COSINE,
+                # Quantized modes keep originals on disk, codes in RAM
+                on_disk=quantization is not None,
+                quantization_config=quantization.to_qdrant() if quantization else None,
+            )
+        },
+    )
+
+    for start in range(0, len(ids), 256):
+        await client.upsert(
+            collection_name=collection_name,
+            points=[
+                models.PointStruct(id=point_id, vector={VECTOR_NAME: vector.tolist()})
+                for point_id, vector in zip(
+                    ids[start : start + 256], vectors[start : start + 256], strict=True
+                )
+            ],
+        )
+
+
+async def wait_for_indexing(client: AsyncQdrantClient, collection_name: str) -> None:
+    """Wait until the optimizer has finished building indexes."""
+    for _ in range(600):
+        info = await client.get_collection(collection_name)
+        if info.status == models.CollectionStatus.GREEN:
+            return
+        await asyncio.sleep(0.5)
+    logger.warning(f"Collection '{collection_name}' still optimizing, results may be skewed")
+
+
+async def run_mode(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    mode: str,
+    queries: np.ndarray,
+    ground_truth: list[set[str]],
+    limit: int,
+    oversampling: float | None,
+    num_points: int,
+) -> ModeResult:
+    """Measure latency and recall@k for one mode."""
+    params = None
+    if mode != "none":
+        params = models.SearchParams(
+            quantization=models.QuantizationSearchParams(rescore=True, oversampling=oversampling)
+        )
+
+    latencies: list[float] = []
+    recalls: list[float] = []
+    for vector, expected in zip(queries, ground_truth, strict=True):
+        start = time.perf_counter()
+        response = await client.query_points(
+            collection_name=collection_name,
+            query=vector.tolist(),
+            using=VECTOR_NAME,
+            limit=limit,
+            search_params=params,
+            with_payload=False,
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        found = {str(p.id) for p in response.points}
+        recalls.append(len(found & expected) / len(expected) if expected else 1.0)
+
+    latencies.sort()
+    return ModeResult(
+        mode=mode,
+        oversampling=oversampling,
+        ram_mb=num_points * BYTES_PER_VECTOR[mode] / (1024 * 1024),
+        avg_latency_ms=statistics.mean(latencies),
+        p95_latency_ms=latencies[max(0, int(len(latencies) * 0.95) - 1)],
+        recall=statistics.mean(recalls),
+    )
+
+
+async def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark Qdrant vector quantization")
+    parser.add_argument("--qdrant-url", default=None, help="Qdrant URL (default: local mode)")
+    parser.add_argument("--points", type=int, default=20000, help="Synthetic vectors to index")
+    parser.add_argument("--queries", type=int, default=100, help="Queries per mode")
+    parser.add_argument("--limit", type=int, default=10, help="k for recall@k")
+    parser.add_argument(
+        "--oversampling",
+        type=float,
+        nargs="*",
+        default=[1.0, 2.0, 4.0],
+        help="Oversampling factors to sweep for quantized modes",
+    )
+    args = parser.parse_args()
+
+    if not args.qdrant_url:
+        logger.warning("Local mode ignores quantization; use --qdrant-url for real numbers")
+
+    rng = np.random.default_rng(42)
+    client = (
+        AsyncQdrantClient(url=args.qdrant_url)
+        if args.qdrant_url
+        else AsyncQdrantClient(location=":memory:")
+    )
+
+    vectors = make_vectors(rng, args.points)
+    ids = [str(uuid.uuid4()) for _ in range(args.points)]
+    queries = make_vectors(rng, args.queries)
+
+    # Exact ground truth from the original vectors (cosine == dot on unit vectors)
+    scores = queries @ vectors.T
+    top = np.argsort(-scores, axis=1)[:, : args.limit]
+    ground_truth = [{ids[i] for i in row} for row in top]
+
+    modes: list[tuple[str, VectorQuantization | None]] = [("none", None)] + [
+        (q.value, VectorQuantization(type=q)) for q in QuantizationType
+    ]
+    created: list[str] = []
+    results: list[ModeResult] = []
+
+    try:
+        for mode, quantization in modes:
+            collection_name = f"{COLLECTION_PREFIX}_{mode}"
+            logger.info(f"Seeding {args.points} vectors for mode={mode}...")
+            await seed(client, collection_name, vectors, ids, quantization)
+            created.append(collection_name)
+            await wait_for_indexing(client, collection_name)
+
+            sweep: list[float | None] = [None] if quantization is None else args.oversampling
+            for oversampling in sweep:
+                results.append(
+                    await run_mode(
+                        client,
+                        collection_name,
+                        mode,
+                        queries,
+                        ground_truth,
+                        args.limit,
+                        oversampling,
+                        args.points,
+                    )
+                )
+
+        for result in results:
+            oversampling = "-" if result.oversampling is None else f"{result.oversampling:g}"
+            logger.info(
+                f"{result.mode:>7} oversampling={oversampling:>3}: "
+                f"ram_mb={result.ram_mb:.2f} "
+                f"avg_latency_ms={result.avg_latency_ms:.2f} "
+                f"p95_latency_ms={result.p95_latency_ms:.2f} "
+                f"recall@{args.limit}={result.recall:.3f}"
+            )
+        return 0
+
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}", exc_info=True)
+        return 1
+    finally:
+        for collection_name in created:
+            await client.delete_collection(collection_name)
+        await client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
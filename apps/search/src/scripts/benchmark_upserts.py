@@ -0,0 +1,195 @@
+"""Benchmark Qdrant upsert throughput for ColBERT-heavy turn batches.
+
+Upserts synthetic turn points (dense, sparse and one ColBERT vector per token)
+batch by batch in two modes:
+
+- single: one upsert request per batch (the behaviour before chunked uploads)
+- chunked: ``upsert_chunked`` with --chunk-kb sized chunks, --concurrency of
+  them in flight
+
+Runs against Qdrant local mode by default, or a live server with
+--qdrant-url. Local mode applies writes on the event loop itself, so chunks
+cannot overlap there and the comparison shows the cost of chunking alone;
+use --qdrant-url, or --upsert-delay-ms and --upsert-ms-per-mb to simulate a
+round trip and size-proportional transfer per request, to measure the
+parallel gain.
+
+Usage:
+    uv run python -m src.scripts.benchmark_upserts [--turns=1000] [--tokens=256]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from typing import Any
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from src.indexing.upload import UpsertConfig, chunk_points, estimate_point_bytes, upsert_chunked
+from src.services.sharding import ShardRouter
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "bench_upserts"
+DENSE_SIZE = 384
+COLBERT_SIZE = 128
+
+
+class _DelayedClient:
+    """AsyncQdrantClient proxy adding a simulated round trip and transfer to upserts."""
+
+    def __init__(self, client: AsyncQdrantClient, delay_ms: float, ms_per_mb: float) -> None:
+        self._client = client
+        self._delay_ms = delay_ms
+        self._ms_per_mb = ms_per_mb
+
+    async def upsert(self, **kwargs: Any) -> Any:
+        size_mb = sum(estimate_point_bytes(p) for p in kwargs["points"]) / (1024 * 1024)
+        await asyncio.sleep((self._delay_ms + self._ms_per_mb * size_mb) / 1000.0)
+        return await self._client.upsert(**kwargs)
+
+
+async def reset_collection(client: AsyncQdrantClient) -> None:
+    """Recreate the benchmark collection with the turn vector layout."""
+    if await client.collection_exists(COLLECTION_NAME):
+        await client.delete_collection(COLLECTION_NAME)
+
+    await client.create_collection(
+        collection_name=COLLECTION_NAME,
+        vectors_config={
+            "turn_dense": models.VectorParams(size=DENSE_SIZE, distance=models.Distance.COSINE),
+            "turn_colbert": models.VectorParams(
+                size=COLBERT_SIZE,
+                distance=models.Distance.COSINE,
+                multivector_config=models.MultiVectorConfig(
+                    comparator=models.MultiVectorComparator.MAX_SIM
+                ),
+            ),
+        },
+        sparse_vectors_config={"turn_sparse": models.SparseVectorParams()},
+    )
+
+
+def build_points(num_turns: int, tokens: int) -> list[models.PointStruct]:
+    """Build synthetic turn points."""
+    rng = np.random.default_rng(42)
+    points = []
+    for i in range(num_turns):
+        sparse_indices = sorted({int(j) for j in rng.integers(0, 30000, size=40)})
+        points.append(
+            models.PointStruct(
+                id=i,
+                vector={
+                    "turn_dense": rng.standard_normal(DENSE_SIZE).tolist(),
+                    "turn_sparse": models.SparseVector(
+                        indices=sparse_indices, values=[0.5] * len(sparse_indices)
+                    ),
+                    "turn_colbert": rng.standard_normal((tokens, COLBERT_SIZE)).tolist(),
+                },
+                payload={"org_id": "bench-org", "session_id": f"session-{i % 50}"},
+            )
+        )
+    return points
+
+
+async def run_mode(
+    mode: str,
+    client: AsyncQdrantClient,
+    points: list[models.PointStruct],
+    batch_size: int,
+    config: UpsertConfig,
+    upsert_delay_ms: float,
+    upsert_ms_per_mb: float,
+) -> float:
+    """Upsert all points in one mode and return points per second."""
+    await reset_collection(client)
+    target: Any = client
+    if upsert_delay_ms or upsert_ms_per_mb:
+        target = _DelayedClient(client, upsert_delay_ms, upsert_ms_per_mb)
+    router = ShardRouter()
+    batches = [points[i : i + batch_size] for i in range(0, len(points), batch_size)]
+
+    start = time.perf_counter()
+    for batch in batches:
+        if mode == "single":
+            await target.upsert(collection_name=COLLECTION_NAME, points=batch, wait=config.wait)
+        else:
+            await upsert_chunked(target, COLLECTION_NAME, batch, router, config)
+    elapsed = time.perf_counter() - start
+
+    indexed = (await client.count(COLLECTION_NAME)).count
+    if indexed != len(points):
+        raise RuntimeError(f"{mode}: upserted {indexed} of {len(points)} points")
+    return len(points) / elapsed
+
+
+async def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark Qdrant upsert throughput")
+    parser.add_argument("--qdrant-url", default=None, help="Qdrant URL (default: local mode)")
+    parser.add_argument("--turns", type=int, default=1000, help="Synthetic turns")
+    parser.add_argument("--tokens", type=int, default=256, help="ColBERT vectors per turn")
+    parser.add_argument("--batch-size", type=int, default=32, help="Turns per indexing batch")
+    parser.add_argument("--chunk-kb", type=int, default=1024, help="Chunk size in KiB")
+    parser.add_argument("--concurrency", type=int, default=4, help="Chunks in flight")
+    parser.add_argument("--no-wait", action="store_true", help="Upsert with wait=false")
+    parser.add_argument(
+        "--upsert-delay-ms", type=float, default=0.0, help="Simulated round trip per request"
+    )
+    parser.add_argument(
+        "--upsert-ms-per-mb", type=float, default=0.0, help="Simulated transfer time per MiB"
+    )
+    args = parser.parse_args()
+
+    config = UpsertConfig(
+        chunk_bytes=args.chunk_kb * 1024,
+        max_concurrency=args.concurrency,
+        wait=not args.no_wait,
+    )
+    points = build_points(args.turns, args.tokens)
+    chunks = len(chunk_points(points[: args.batch_size], config.chunk_bytes))
+    logger.info(f"{args.turns} turns x {args.tokens} tokens, {chunks} chunks per batch")
+    client = (
+        AsyncQdrantClient(url=args.qdrant_url)
+        if args.qdrant_url
+        else AsyncQdrantClient(location=":memory:")
+    )
+
+    try:
+        results = {}
+        for mode in ("single", "chunked"):
+            logger.info(f"Upserting {args.turns} turns ({mode})...")
+            results[mode] = await run_mode(
+                mode,
+                client,
+                points,
+                args.batch_size,
+                config,
+                args.upsert_delay_ms,
+                args.upsert_ms_per_mb,
+            )
+
+        for mode, rate in results.items():
+            speedup = rate / results["single"]
+            logger.info(f"{mode:>7}: {rate:,.1f} turns/s ({speedup:.2f}x single)")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}", exc_info=True)
+        return 1
+    finally:
+        if await client.collection_exists(COLLECTION_NAME):
+            await client.delete_collection(COLLECTION_NAME)
+        await client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,119 @@
+"""Migrate Qdrant collections to per-tenant custom sharding.
+
+Run this after setting QDRANT_SHARD_BY_ORG=true (and, optionally,
+QDRANT_DEDICATED_SHARD_ORGS) and before starting the service with those
+settings. For each collection:
+
+- auto-sharded: copied to ``<name>_resharding`` with custom sharding, then
+  recreated under its own name with shard keys and copied back
+- already custom-sharded: missing shard keys are created and points of newly
+  dedicated orgs are moved from the default shard to their own
+
+Stop indexing while migrating; writes during the copy are not carried over.
+
+Usage:
+    uv run python -m src.scripts.migrate_sharding [--collection=engram_turns] [--batch-size=256]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from src.clients.qdrant import QdrantClientWrapper
+from src.config import Settings
+from src.retrieval.constants import TURN_CHUNKS_FIELD
+from src.services.schema_manager import (
+    CollectionSchema,
+    SchemaManager,
+    apply_storage_settings,
+    get_memory_collection_schema,
+    get_turns_collection_schema,
+    late_chunks_from_settings,
+    quantization_from_settings,
+)
+from src.services.sharding import ShardRouter
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def build_schemas(settings: Settings, manager: SchemaManager) -> dict[str, CollectionSchema]:
+    """Build the target schema of each migratable collection.
+
+    The turns schema keeps the late chunk vector if the existing collection
+    has it, so its points can be copied back.
+
+    Args:
+        settings: Application settings.
+        manager: Schema manager connected to Qdrant.
+
+    Returns:
+        Schema per collection name, before storage settings are applied.
+    """
+    quantization = quantization_from_settings(settings)
+    late_chunks = late_chunks_from_settings(settings) or await manager.has_vector(
+        settings.qdrant_collection, TURN_CHUNKS_FIELD
+    )
+    return {
+        settings.qdrant_collection: get_turns_collection_schema(
+            settings.qdrant_collection, quantization, late_chunks=late_chunks
+        ),
+        "engram_memory": get_memory_collection_schema("engram_memory", quantization),
+    }
+
+
+async def main() -> int:
+    """Main entry point."""
+    settings = Settings()
+    parser = argparse.ArgumentParser(description="Migrate Qdrant collections to custom sharding")
+    parser.add_argument(
+        "--collection",
+        action="append",
+        choices=[settings.qdrant_collection, "engram_memory"],
+        help="Collection to migrate (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=256,
+        help="Points copied per round trip (default: 256)",
+    )
+    args = parser.parse_args()
+
+    router = ShardRouter.from_settings(settings)
+    if not router.enabled:
+        logger.error("QDRANT_SHARD_BY_ORG is not enabled, nothing to migrate")
+        return 1
+
+    qdrant = QdrantClientWrapper(settings)
+    await qdrant.connect()
+    manager = SchemaManager(qdrant, settings)
+
+    try:
+        schemas = await build_schemas(settings, manager)
+        for name in args.collection or list(schemas):
+            schema = apply_storage_settings(schemas[name], settings)
+            if not await qdrant.collection_exists(name):
+                logger.info(f"Collection '{name}' does not exist, creating with shard keys")
+                await manager.create_collection(schema)
+                await manager.ensure_payload_indexes(schema)
+                continue
+
+            logger.info(f"Migrating '{name}' to shard keys {schema.shard_keys}...")
+            written = await manager.migrate_sharding(schema, router, args.batch_size)
+            logger.info(f"Migrated '{name}': {written} points written")
+        return 0
+
+    except Exception as e:
+        logger.error(f"Sharding migration failed: {e}", exc_info=True)
+        return 1
+    finally:
+        await qdrant.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
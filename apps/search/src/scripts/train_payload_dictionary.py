@@ -0,0 +1,135 @@
+"""Train a zstd dictionary for payload compression from stored payloads.
+
+Samples the compressible fields (PAYLOAD_COMPRESSION_FIELDS) of existing turns
+and memories and writes a dictionary file. Add the file to the front of
+PAYLOAD_COMPRESSION_DICTIONARIES to use it for new writes; keep older
+dictionaries listed after it while payloads compressed with them exist.
+
+Requires the "compression" extra (zstandard).
+
+Usage:
+    uv run python -m src.scripts.train_payload_dictionary --output=payload.dict [--samples=20000]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+from qdrant_client.http import models
+
+from src.clients.qdrant import QdrantClientWrapper
+from src.config import Settings
+from src.services.compression import (
+    ZSTD_AVAILABLE,
+    PayloadCodec,
+    serialize_value,
+    train_dictionary,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def collect_samples(
+    qdrant: QdrantClientWrapper,
+    codec: PayloadCodec,
+    collection: str,
+    max_samples: int,
+    batch_size: int,
+) -> list[bytes]:
+    """Collect serialized field values from a collection.
+
+    Args:
+        qdrant: Connected Qdrant client wrapper.
+        codec: Codec used to restore already-compressed values.
+        collection: Collection to sample.
+        max_samples: Stop after this many samples.
+        batch_size: Points fetched per scroll call.
+
+    Returns:
+        Serialized field values at least ``codec.min_bytes`` long.
+    """
+    samples: list[bytes] = []
+    offset = None
+    while len(samples) < max_samples:
+        records, offset = await qdrant.client.scroll(
+            collection_name=collection,
+            limit=batch_size,
+            offset=offset,
+            with_payload=models.PayloadSelectorInclude(include=sorted(codec.fields)),
+            with_vectors=False,
+        )
+        for record in records:
+            payload = codec.decode(record.payload)
+            for field in codec.fields.intersection(payload):
+                raw = serialize_value(payload[field])
+                if len(raw) >= codec.min_bytes:
+                    samples.append(raw)
+        if offset is None:
+            break
+    return samples[:max_samples]
+
+
+async def main() -> int:
+    """Main entry point."""
+    settings = Settings()
+    parser = argparse.ArgumentParser(description="Train a zstd payload compression dictionary")
+    parser.add_argument("--output", required=True, help="Dictionary file to write")
+    parser.add_argument(
+        "--collection",
+        action="append",
+        help="Collection to sample (repeatable, default: turns and memories)",
+    )
+    parser.add_argument("--samples", type=int, default=20000, help="Maximum samples to train on")
+    parser.add_argument(
+        "--dict-size", type=int, default=112_640, help="Dictionary size in bytes (default: 110KB)"
+    )
+    parser.add_argument("--batch-size", type=int, default=256, help="Points per scroll call")
+    args = parser.parse_args()
+
+    if not ZSTD_AVAILABLE:
+        logger.error("zstandard is not installed (install the 'compression' extra)")
+        return 1
+
+    codec = PayloadCodec.from_settings(settings)
+    qdrant = QdrantClientWrapper(settings)
+    await qdrant.connect()
+
+    try:
+        samples: list[bytes] = []
+        for collection in args.collection or [settings.qdrant_collection, "engram_memory"]:
+            if not await qdrant.collection_exists(collection):
+                logger.warning(f"Collection '{collection}' does not exist, skipping")
+                continue
+            collected = await collect_samples(
+                qdrant, codec, collection, args.samples - len(samples), args.batch_size
+            )
+            logger.info(f"Sampled {len(collected)} values from '{collection}'")
+            samples.extend(collected)
+
+        if not samples:
+            logger.error("No payload values large enough to train on")
+            return 1
+
+        dictionary = train_dictionary(samples, args.dict_size)
+        Path(args.output).write_bytes(dictionary)
+        logger.info(
+            f"Wrote {len(dictionary)}-byte dictionary trained on {len(samples)} samples "
+            f"to {args.output}"
+        )
+        return 0
+
+    except Exception as e:
+        logger.error(f"Dictionary training failed: {e}", exc_info=True)
+        return 1
+    finally:
+        await qdrant.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,15 +1,46 @@
 """Service layer for search operations."""
 
+from src.services.compression import PayloadCodec
 from src.services.schema_manager import (
+    MEMORY_PAYLOAD_INDEXES,
+    SESSIONS_PAYLOAD_INDEXES,
+    TURNS_PAYLOAD_INDEXES,
     CollectionSchema,
+    PayloadIndex,
+    QuantizationType,
     SchemaManager,
+    VectorPlacement,
+    VectorQuantization,
+    apply_storage_settings,
     get_memory_collection_schema,
+    get_sessions_collection_schema,
     get_turns_collection_schema,
+    late_chunks_from_settings,
+    quantization_from_settings,
 )
+from src.services.sharding import DEFAULT_SHARD_KEY, ShardRouter
+from src.services.tiering import TierMigrator, TurnTiers, get_cold_turns_schema
 
 __all__ = [
     "SchemaManager",
+    "ShardRouter",
+    "DEFAULT_SHARD_KEY",
+    "TurnTiers",
+    "TierMigrator",
+    "PayloadCodec",
     "CollectionSchema",
+    "PayloadIndex",
+    "TURNS_PAYLOAD_INDEXES",
+    "MEMORY_PAYLOAD_INDEXES",
+    "SESSIONS_PAYLOAD_INDEXES",
+    "QuantizationType",
+    "VectorPlacement",
+    "VectorQuantization",
+    "apply_storage_settings",
+    "late_chunks_from_settings",
+    "quantization_from_settings",
     "get_memory_collection_schema",
+    "get_sessions_collection_schema",
     "get_turns_collection_schema",
+    "get_cold_turns_schema",
 ]
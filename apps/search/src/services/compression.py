@@ -0,0 +1,231 @@
+"""Optional zstd compression of large payload fields.
+
+Turn payloads carry the full user, assistant and reasoning text plus tool-call
+data, and those bytes dominate Qdrant disk usage and transfer time. With
+compression enabled, large values of the configured fields are stored as
+zstd frames, compressed with a dictionary trained on existing payloads when
+one is configured (see ``src.scripts.train_payload_dictionary``):
+
+    {"zstd": "<base64 frame>", "dict_id": 1234, "json": false}
+
+Filterable (payload-indexed) fields are never compressed, so filters and
+payload indexes are unaffected. Values below ``payload_compression_min_bytes``
+or that do not shrink are stored as is. Decoding is transparent and also
+handles payloads written before compression was enabled.
+
+Every dictionary ever used for writing must stay listed in
+``payload_compression_dictionaries`` (newest first) for as long as payloads
+compressed with it exist; the first one is used for new writes.
+"""
+
+import base64
+import json
+import logging
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from src.config import Settings
+from src.services.schema_manager import MEMORY_PAYLOAD_INDEXES, TURNS_PAYLOAD_INDEXES
+
+logger = logging.getLogger(__name__)
+
+# Optional zstandard import (install the "compression" extra)
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None  # type: ignore
+
+# Payload-indexed fields stay plain so filters keep working
+PROTECTED_FIELDS = frozenset(
+    index.field_name for index in (*TURNS_PAYLOAD_INDEXES, *MEMORY_PAYLOAD_INDEXES)
+)
+
+# Marker key of an encoded field value
+ENCODED_KEY = "zstd"
+
+
+def serialize_value(value: Any) -> bytes:
+    """Serialize a payload field value the way it is compressed.
+
+    Args:
+        value: Field value (text or JSON-serializable data).
+
+    Returns:
+        UTF-8 bytes for text, compact JSON bytes otherwise.
+    """
+    if isinstance(value, str):
+        return value.encode()
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+def train_dictionary(samples: Sequence[bytes], dict_size: int = 112_640) -> bytes:
+    """Train a zstd dictionary on sample payload values.
+
+    Args:
+        samples: Encoded field values (UTF-8 text or JSON).
+        dict_size: Maximum dictionary size in bytes.
+
+    Returns:
+        Serialized dictionary, loadable via ``payload_compression_dictionaries``.
+
+    Raises:
+        RuntimeError: If zstandard is not installed.
+    """
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("zstandard is not installed (install the 'compression' extra)")
+    return zstandard.train_dictionary(dict_size, list(samples)).as_bytes()
+
+
+class PayloadCodec:
+    """Compresses large payload fields on write and restores them on read.
+
+    Example:
+            >>> codec = PayloadCodec(enabled=True, min_bytes=16)
+            >>> stored = codec.encode({"content": "x" * 1000, "org_id": "acme"})
+            >>> codec.decode(stored)["content"] == "x" * 1000
+            True
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        fields: Iterable[str] = ("content", "tool_calls"),
+        min_bytes: int = 1024,
+        level: int = 3,
+        dictionaries: Sequence[bytes] = (),
+    ) -> None:
+        """Initialize the codec.
+
+        Args:
+            enabled: Compress fields on write (decoding always works).
+            fields: Payload fields eligible for compression.
+            min_bytes: Only compress values at least this large when serialized.
+            level: zstd compression level.
+            dictionaries: Serialized zstd dictionaries, newest (used for writes) first.
+        """
+        protected = PROTECTED_FIELDS.intersection(fields)
+        if protected:
+            raise ValueError(f"Filterable payload fields cannot be compressed: {sorted(protected)}")
+
+        if enabled and not ZSTD_AVAILABLE:
+            logger.warning("Payload compression enabled but zstandard is not installed; disabled")
+            enabled = False
+
+        self.enabled = enabled
+        self.fields = frozenset(fields)
+        self.min_bytes = min_bytes
+        self.level = level
+
+        self.dict_id = 0
+        self._dicts: dict[int, Any] = {}
+        self._compressor: Any = None
+        self._decompressors: dict[int, Any] = {}
+        if not ZSTD_AVAILABLE:
+            return
+
+        write_dict = None
+        for data in dictionaries:
+            zdict = zstandard.ZstdCompressionDict(data)
+            self._dicts[zdict.dict_id()] = zdict
+            write_dict = write_dict or zdict
+        self.dict_id = write_dict.dict_id() if write_dict is not None else 0
+        if enabled:
+            self._compressor = zstandard.ZstdCompressor(level=level, dict_data=write_dict)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "PayloadCodec":
+        """Create a codec from application settings, loading dictionary files.
+
+        Args:
+            settings: Application settings.
+
+        Returns:
+            Configured codec (decode-only unless payload_compression_enabled is set).
+        """
+        return cls(
+            enabled=settings.payload_compression_enabled,
+            fields=settings.payload_compression_fields,
+            min_bytes=settings.payload_compression_min_bytes,
+            level=settings.payload_compression_level,
+            dictionaries=[
+                Path(path).read_bytes() for path in settings.payload_compression_dictionaries
+            ],
+        )
+
+    def encode(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Compress eligible fields of a payload about to be written.
+
+        Args:
+            payload: Point payload.
+
+        Returns:
+            Payload with large eligible fields replaced by encoded values (the
+            input itself if compression is disabled).
+        """
+        if not self.enabled:
+            return payload
+
+        encoded = dict(payload)
+        for field in self.fields.intersection(payload):
+            value = payload[field]
+            raw = serialize_value(value)
+            if len(raw) < self.min_bytes:
+                continue
+
+            frame = base64.b64encode(self._compressor.compress(raw)).decode("ascii")
+            if len(frame) >= len(raw):
+                continue
+            encoded[field] = {
+                ENCODED_KEY: frame,
+                "dict_id": self.dict_id,
+                "json": not isinstance(value, str),
+            }
+        return encoded
+
+    def decode(self, payload: dict[str, Any] | None) -> dict[str, Any]:
+        """Restore compressed fields of a payload read from Qdrant.
+
+        Fields that cannot be decoded (missing dictionary or library) are
+        replaced by an empty string and logged, rather than failing the search.
+
+        Args:
+            payload: Point payload (may be None or only partially projected).
+
+        Returns:
+            Payload with plain field values (the input itself if nothing was encoded).
+        """
+        if not payload:
+            return payload or {}
+
+        decoded: dict[str, Any] | None = None
+        for field, value in payload.items():
+            if not (isinstance(value, dict) and ENCODED_KEY in value):
+                continue
+            if decoded is None:
+                decoded = dict(payload)
+            decoded[field] = self._decode_value(field, value)
+        return payload if decoded is None else decoded
+
+    def _decode_value(self, field: str, value: dict[str, Any]) -> Any:
+        dict_id = int(value.get("dict_id", 0))
+        try:
+            raw = self._decompressor(dict_id).decompress(base64.b64decode(value[ENCODED_KEY]))
+        except Exception as e:
+            logger.warning(f"Cannot decode compressed payload field '{field}': {e}")
+            return ""
+        return json.loads(raw) if value.get("json") else raw.decode()
+
+    def _decompressor(self, dict_id: int) -> Any:
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is not installed")
+        decompressor = self._decompressors.get(dict_id)
+        if decompressor is None:
+            if dict_id and dict_id not in self._dicts:
+                raise KeyError(f"zstd dictionary {dict_id} is not configured")
+            decompressor = zstandard.ZstdDecompressor(dict_data=self._dicts.get(dict_id))
+            self._decompressors[dict_id] = decompressor
+        return decompressor
@@ -1,26 +1,231 @@
 """Qdrant collection schema management."""
 
 import logging
+from collections.abc import Iterable
+from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from qdrant_client.http import models
 from qdrant_client.http.models import (
     Distance,
     KeywordIndexParams,
     PayloadSchemaType,
+    SparseIndexParams,
     SparseVectorParams,
     VectorParams,
 )
 
 from src.clients.qdrant import QdrantClientWrapper
 from src.config import Settings
+from src.services.sharding import ShardRouter
 
 logger = logging.getLogger(__name__)
 
 
+class QuantizationType(str, Enum):
+    """Qdrant vector quantization method.
+
+    Attributes:
+        SCALAR: float32 -> int8 per dimension (4x smaller, minimal recall loss).
+        PRODUCT: Sub-vector codebooks (up to 64x smaller, larger recall loss).
+        BINARY: 1 bit per dimension (32x smaller, best with rescoring and oversampling).
+    """
+
+    SCALAR = "scalar"
+    PRODUCT = "product"
+    BINARY = "binary"
+
+
+class VectorQuantization(BaseModel):
+    """Quantization settings for one named vector."""
+
+    type: QuantizationType = Field(description="Quantization method")
+    always_ram: bool = Field(
+        default=True,
+        description="Keep quantized vectors in RAM even when originals are on disk",
+    )
+    quantile: float = Field(
+        default=0.99,
+        ge=0.5,
+        le=1.0,
+        description="Scalar only: quantile used to clip outliers before int8 mapping",
+    )
+    compression: models.CompressionRatio = Field(
+        default=models.CompressionRatio.X16,
+        description="Product only: compression ratio",
+    )
+
+    def to_qdrant(self) -> models.QuantizationConfig:
+        """Build the Qdrant quantization config.
+
+        Returns:
+            Scalar, product or binary quantization config.
+        """
+        if self.type == QuantizationType.SCALAR:
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=self.quantile,
+                    always_ram=self.always_ram,
+                )
+            )
+        if self.type == QuantizationType.PRODUCT:
+            return models.ProductQuantization(
+                product=models.ProductQuantizationConfig(
+                    compression=self.compression,
+                    always_ram=self.always_ram,
+                )
+            )
+        return models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=self.always_ram)
+        )
+
+
+class PayloadIndex(BaseModel):
+    """Declarative payload index on one filtered field."""
+
+    field_name: str = Field(description="Payload field to index")
+    type: PayloadSchemaType = Field(description="Index type (keyword, integer, datetime, ...)")
+    is_tenant: bool = Field(
+        default=False, description="Keyword only: co-locate points by this tenant field"
+    )
+    lookup: bool = Field(default=False, description="Integer only: support exact-match lookups")
+    range: bool = Field(default=True, description="Integer only: support range filters")
+
+    def to_qdrant(self) -> models.PayloadSchemaParams | PayloadSchemaType:
+        """Build the Qdrant field schema for this index."""
+        if self.type == PayloadSchemaType.KEYWORD and self.is_tenant:
+            return KeywordIndexParams(type=PayloadSchemaType.KEYWORD, is_tenant=True)
+        if self.type == PayloadSchemaType.INTEGER:
+            return models.IntegerIndexParams(
+                type=models.IntegerIndexType.INTEGER,
+                lookup=self.lookup,
+                range=self.range,
+            )
+        return self.type
+
+
+# Fields filtered by SearchRetriever._build_qdrant_filter and SessionAwareRetriever
+TURNS_PAYLOAD_INDEXES = [
+    PayloadIndex(field_name="org_id", type=PayloadSchemaType.KEYWORD, is_tenant=True),
+    PayloadIndex(field_name="session_id", type=PayloadSchemaType.KEYWORD),
+    PayloadIndex(field_name="type", type=PayloadSchemaType.KEYWORD),
+    PayloadIndex(field_name="timestamp", type=PayloadSchemaType.INTEGER),
+    PayloadIndex(field_name="vt_end", type=PayloadSchemaType.INTEGER),
+]
+
+# Fields filtered by SessionAwareRetriever stage 1 on the sessions collection
+SESSIONS_PAYLOAD_INDEXES = [
+    PayloadIndex(field_name="org_id", type=PayloadSchemaType.KEYWORD, is_tenant=True),
+    PayloadIndex(field_name="session_id", type=PayloadSchemaType.KEYWORD),
+    PayloadIndex(field_name="timestamp", type=PayloadSchemaType.INTEGER),
+]
+
+# Fields filtered by /query and /conflict-candidates on the memory collection
+MEMORY_PAYLOAD_INDEXES = [
+    PayloadIndex(field_name="org_id", type=PayloadSchemaType.KEYWORD, is_tenant=True),
+    PayloadIndex(field_name="type", type=PayloadSchemaType.KEYWORD),
+    PayloadIndex(field_name="project", type=PayloadSchemaType.KEYWORD),
+    PayloadIndex(field_name="timestamp", type=PayloadSchemaType.INTEGER),
+    PayloadIndex(field_name="vt_end", type=PayloadSchemaType.INTEGER),
+]
+
+
+class VectorPlacement(BaseModel):
+    """RAM or disk (mmap) placement for one named vector and its HNSW graph."""
+
+    on_disk: bool | None = Field(
+        default=None, description="Store original vectors on disk (schema on_disk if None)"
+    )
+    hnsw_on_disk: bool | None = Field(
+        default=None, description="Store the HNSW graph on disk (Qdrant default if None)"
+    )
+
+
+def quantization_from_settings(settings: Settings) -> VectorQuantization | None:
+    """Build the configured vector quantization, if enabled.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        Quantization for dense and ColBERT vectors, or None if disabled.
+    """
+    if not settings.qdrant_quantization:
+        return None
+    return VectorQuantization(
+        type=QuantizationType(settings.qdrant_quantization),
+        always_ram=settings.qdrant_quantization_always_ram,
+    )
+
+
+def late_chunks_from_settings(settings: Settings) -> bool:
+    """Whether turn collections get the late chunk vector.
+
+    Late chunking pools token embeddings, so it needs local inference.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        True if late chunking is enabled with a local embedder backend.
+    """
+    return settings.late_chunking_enabled and settings.embedder_backend != "huggingface"
+
+
+def apply_storage_settings(schema: "CollectionSchema", settings: Settings) -> "CollectionSchema":
+    """Apply configured storage placement and sharding to a collection schema.
+
+    Maps the dense/ColBERT placement settings onto the schema's vector names,
+    so the same settings work for every built-in collection. With
+    ``qdrant_shard_by_org`` the schema gets the default plus one shard key per
+    dedicated org.
+
+    Args:
+        schema: Collection schema to place.
+        settings: Application settings.
+
+    Returns:
+        Copy of the schema with storage placement applied.
+    """
+    placement = {
+        schema.dense_vector_name: VectorPlacement(
+            on_disk=settings.qdrant_dense_on_disk,
+            hnsw_on_disk=settings.qdrant_dense_hnsw_on_disk,
+        )
+    }
+    if schema.enable_colbert:
+        placement[schema.colbert_vector_name] = VectorPlacement(
+            on_disk=settings.qdrant_colbert_on_disk,
+            hnsw_on_disk=settings.qdrant_colbert_hnsw_on_disk,
+        )
+    if schema.late_chunk_vector_name:
+        # Late chunks are dense vectors, placed like the dense vector
+        placement[schema.late_chunk_vector_name] = placement[schema.dense_vector_name]
+
+    return schema.model_copy(
+        update={
+            "vector_placement": placement,
+            "sparse_index_on_disk": settings.qdrant_sparse_index_on_disk,
+            "on_disk_payload": settings.qdrant_payload_on_disk,
+            "memmap_threshold_kb": settings.qdrant_memmap_threshold_kb,
+            "indexing_threshold_kb": settings.qdrant_indexing_threshold_kb,
+            "shard_keys": (
+                ShardRouter.from_settings(settings).shard_keys
+                if settings.qdrant_shard_by_org
+                else []
+            ),
+            "shards_per_key": settings.qdrant_shards_per_key,
+        }
+    )
+
+
 # Pre-defined collection schemas
-def get_memory_collection_schema(collection_name: str = "engram_memory") -> "CollectionSchema":
+def get_memory_collection_schema(
+    collection_name: str = "engram_memory",
+    quantization: VectorQuantization | None = None,
+) -> "CollectionSchema":
     """Get schema for memory node indexing.
 
     Memory indexing stores explicit memories (decisions, facts, preferences, etc.)
@@ -28,6 +233,7 @@ def get_memory_collection_schema(collection_name: str = "engram_memory") -> "Col
 
     Args:
         collection_name: Name for the collection (default: engram_memory)
+        quantization: Optional quantization for the dense vector.
 
     Returns:
         CollectionSchema configured for memory documents with:
@@ -43,10 +249,16 @@ def get_memory_collection_schema(collection_name: str = "engram_memory") -> "Col
         colbert_vector_size=128,
         enable_colbert=False,  # Simpler for memories, ColBERT not needed
         distance=Distance.COSINE,
+        quantization={"text_dense": quantization} if quantization else {},
+        payload_indexes=list(MEMORY_PAYLOAD_INDEXES),
     )
 
 
-def get_turns_collection_schema(collection_name: str = "engram_turns") -> "CollectionSchema":
+def get_turns_collection_schema(
+    collection_name: str = "engram_turns",
+    quantization: VectorQuantization | None = None,
+    late_chunks: bool = False,
+) -> "CollectionSchema":
     """Get schema for turn-level conversation indexing.
 
     Turn-level indexing provides complete conversation turns for semantic search,
@@ -54,13 +266,20 @@ def get_turns_collection_schema(collection_name: str = "engram_turns") -> "Colle
 
     Args:
         collection_name: Name for the collection (default: engram_turns)
+        quantization: Optional quantization for the dense, ColBERT and late chunk vectors.
+        late_chunks: Add the late-chunked multi-vector for long turns.
 
     Returns:
         CollectionSchema configured for turn-level documents with:
         - turn_dense: BGE-small dense vectors (384 dims)
         - turn_sparse: SPLADE sparse vectors
         - turn_colbert: ColBERT multi-vectors (128 dims)
+        - turn_chunks: late-chunked BGE-small multi-vectors (384 dims), if enabled
     """
+    late_chunk_vector_name = "turn_chunks" if late_chunks else None
+    named = ["turn_dense", "turn_colbert"]
+    if late_chunk_vector_name:
+        named.append(late_chunk_vector_name)
     return CollectionSchema(
         collection_name=collection_name,
         dense_vector_size=384,  # BGE-small-en-v1.5
@@ -70,6 +289,40 @@ def get_turns_collection_schema(collection_name: str = "engram_turns") -> "Colle
         colbert_vector_size=128,
         enable_colbert=True,
         distance=Distance.COSINE,
+        late_chunk_vector_name=late_chunk_vector_name,
+        quantization=dict.fromkeys(named, quantization) if quantization else {},
+        payload_indexes=list(TURNS_PAYLOAD_INDEXES),
+    )
+
+
+def get_sessions_collection_schema(
+    collection_name: str = "sessions",
+    quantization: VectorQuantization | None = None,
+) -> "CollectionSchema":
+    """Get schema for session centroids.
+
+    One point per session, holding the running mean of its turn vectors (see
+    ``src.indexing.sessions``) for stage 1 of session-aware retrieval.
+
+    Args:
+        collection_name: Name for the collection (default: sessions)
+        quantization: Optional quantization for the dense vector.
+
+    Returns:
+        CollectionSchema configured for session centroids with:
+        - text_dense: mean turn vector (384 dims) - matches SessionAwareRetriever
+        - text_sparse: mean sparse turn vector, top terms only
+    """
+    return CollectionSchema(
+        collection_name=collection_name,
+        dense_vector_size=384,  # BGE-small-en-v1.5
+        dense_vector_name="text_dense",
+        sparse_vector_name="text_sparse",
+        colbert_vector_name="text_colbert",
+        enable_colbert=False,  # A mean of token vectors is not meaningful
+        distance=Distance.COSINE,
+        quantization={"text_dense": quantization} if quantization else {},
+        payload_indexes=list(SESSIONS_PAYLOAD_INDEXES),
     )
 
 
@@ -85,11 +338,111 @@ class CollectionSchema(BaseModel):
     )
     colbert_vector_size: int = Field(default=128, description="ColBERT token vector dimensions")
     enable_colbert: bool = Field(default=True, description="Enable ColBERT multi-vector")
+    late_chunk_vector_name: str | None = Field(
+        default=None,
+        description="Multi-vector of late-chunked dense vectors (dense size, none if None)",
+    )
     distance: Distance = Field(default=Distance.COSINE, description="Distance metric")
     # Index settings
     on_disk: bool = Field(default=False, description="Store vectors on disk")
     hnsw_m: int = Field(default=16, description="HNSW M parameter")
     hnsw_ef_construct: int = Field(default=100, description="HNSW ef_construct parameter")
+    quantization: dict[str, VectorQuantization] = Field(
+        default_factory=dict,
+        description="Quantization per named dense/ColBERT vector (none by default)",
+    )
+    # Storage placement
+    vector_placement: dict[str, VectorPlacement] = Field(
+        default_factory=dict,
+        description="RAM/disk placement per named dense/ColBERT vector and its HNSW graph",
+    )
+    sparse_index_on_disk: bool | None = Field(
+        default=None, description="Store the sparse inverted index on disk (Qdrant default if None)"
+    )
+    on_disk_payload: bool | None = Field(
+        default=None, description="Store payloads on disk (Qdrant default if None)"
+    )
+    memmap_threshold_kb: int | None = Field(
+        default=None,
+        ge=0,
+        description="Segment size above which vectors are mmapped (Qdrant default if None)",
+    )
+    indexing_threshold_kb: int | None = Field(
+        default=None,
+        ge=0,
+        description="Segment size above which HNSW is built (Qdrant default if None)",
+    )
+    # Payload indexes for filtered fields
+    payload_indexes: list[PayloadIndex] = Field(
+        default_factory=list, description="Payload indexes reconciled at startup"
+    )
+    # Custom sharding (automatic sharding if no shard keys)
+    shard_keys: list[str] = Field(
+        default_factory=list, description="Custom shard keys to create (auto sharding if empty)"
+    )
+    shards_per_key: int = Field(default=1, ge=1, description="Physical shards per shard key")
+
+    @model_validator(mode="after")
+    def _check_configured_vectors(self) -> "CollectionSchema":
+        """Reject quantization or placement for vectors the schema doesn't define."""
+        named = set(self.named_vectors())
+        unknown = set(self.quantization) - named
+        if unknown:
+            raise ValueError(
+                f"Quantization configured for unknown or sparse vectors: {sorted(unknown)}"
+            )
+        unknown = set(self.vector_placement) - named
+        if unknown:
+            raise ValueError(
+                f"Placement configured for unknown or sparse vectors: {sorted(unknown)}"
+            )
+        return self
+
+    def named_vectors(self) -> list[str]:
+        """Names of the dense and multi-vectors (everything but the sparse vector)."""
+        named = [self.dense_vector_name]
+        if self.enable_colbert:
+            named.append(self.colbert_vector_name)
+        if self.late_chunk_vector_name:
+            named.append(self.late_chunk_vector_name)
+        return named
+
+    def vector_on_disk(self, vector_name: str) -> bool:
+        """Whether a named vector's originals are stored on disk."""
+        placement = self.vector_placement.get(vector_name)
+        if placement is None or placement.on_disk is None:
+            return self.on_disk
+        return placement.on_disk
+
+    def hnsw_on_disk(self, vector_name: str) -> bool | None:
+        """Whether a named vector's HNSW graph is stored on disk (None: Qdrant default)."""
+        placement = self.vector_placement.get(vector_name)
+        return placement.hnsw_on_disk if placement else None
+
+    def sparse_vector_params(self) -> SparseVectorParams:
+        """Build the sparse vector params with the configured index placement."""
+        if self.sparse_index_on_disk is None:
+            return SparseVectorParams()
+        return SparseVectorParams(index=SparseIndexParams(on_disk=self.sparse_index_on_disk))
+
+    def optimizers_config(self) -> models.OptimizersConfigDiff | None:
+        """Build the optimizer thresholds, or None to keep Qdrant defaults."""
+        if self.memmap_threshold_kb is None and self.indexing_threshold_kb is None:
+            return None
+        return models.OptimizersConfigDiff(
+            memmap_threshold=self.memmap_threshold_kb,
+            indexing_threshold=self.indexing_threshold_kb,
+        )
+
+    @property
+    def custom_sharding(self) -> bool:
+        """Whether the collection routes points by custom shard key."""
+        return bool(self.shard_keys)
+
+    def quantization_config(self, vector_name: str) -> models.QuantizationConfig | None:
+        """Get the Qdrant quantization config for a named vector, if any."""
+        quantization = self.quantization.get(vector_name)
+        return quantization.to_qdrant() if quantization else None
 
 
 class SchemaManager:
@@ -157,11 +510,13 @@ class SchemaManager:
                 schema.dense_vector_name: VectorParams(
                     size=schema.dense_vector_size,
                     distance=schema.distance,
-                    on_disk=schema.on_disk,
+                    on_disk=schema.vector_on_disk(schema.dense_vector_name),
                     hnsw_config=models.HnswConfigDiff(
                         m=schema.hnsw_m,
                         ef_construct=schema.hnsw_ef_construct,
+                        on_disk=schema.hnsw_on_disk(schema.dense_vector_name),
                     ),
+                    quantization_config=schema.quantization_config(schema.dense_vector_name),
                 ),
             }
 
@@ -172,20 +527,39 @@ class SchemaManager:
                 vectors_config[schema.colbert_vector_name] = VectorParams(
                     size=schema.colbert_vector_size,
                     distance=schema.distance,
-                    on_disk=schema.on_disk,
+                    on_disk=schema.vector_on_disk(schema.colbert_vector_name),
                     multivector_config=models.MultiVectorConfig(
                         comparator=models.MultiVectorComparator.MAX_SIM,
                     ),
                     hnsw_config=models.HnswConfigDiff(
                         m=schema.hnsw_m,
                         ef_construct=schema.hnsw_ef_construct,
+                        on_disk=schema.hnsw_on_disk(schema.colbert_vector_name),
                     ),
+                    quantization_config=schema.quantization_config(schema.colbert_vector_name),
+                )
+
+            # Late-chunked dense vectors, one per chunk, scored by their best match
+            if schema.late_chunk_vector_name:
+                vectors_config[schema.late_chunk_vector_name] = VectorParams(
+                    size=schema.dense_vector_size,
+                    distance=schema.distance,
+                    on_disk=schema.vector_on_disk(schema.late_chunk_vector_name),
+                    multivector_config=models.MultiVectorConfig(
+                        comparator=models.MultiVectorComparator.MAX_SIM,
+                    ),
+                    hnsw_config=models.HnswConfigDiff(
+                        m=schema.hnsw_m,
+                        ef_construct=schema.hnsw_ef_construct,
+                        on_disk=schema.hnsw_on_disk(schema.late_chunk_vector_name),
+                    ),
+                    quantization_config=schema.quantization_config(schema.late_chunk_vector_name),
                 )
 
             # Build sparse_vectors_config
             # Sparse vectors must be named and always use dot product distance
             sparse_vectors_config: dict[str, SparseVectorParams] = {
-                schema.sparse_vector_name: SparseVectorParams(),
+                schema.sparse_vector_name: schema.sparse_vector_params(),
             }
 
             # Create collection with named dense, sparse, and multi-vectors
@@ -193,7 +567,13 @@ class SchemaManager:
                 collection_name=schema.collection_name,
                 vectors_config=vectors_config,
                 sparse_vectors_config=sparse_vectors_config,
+                on_disk_payload=schema.on_disk_payload,
+                optimizers_config=schema.optimizers_config(),
+                sharding_method=models.ShardingMethod.CUSTOM if schema.custom_sharding else None,
+                shard_number=schema.shards_per_key if schema.custom_sharding else None,
             )
+            for shard_key in schema.shard_keys:
+                await self._create_shard_key(schema, shard_key)
 
             logger.info(
                 f"Successfully created collection '{schema.collection_name}' with "
@@ -205,6 +585,17 @@ class SchemaManager:
                     if schema.enable_colbert
                     else ""
                 )
+                + (
+                    f", late chunk multi-vector '{schema.late_chunk_vector_name}'"
+                    if schema.late_chunk_vector_name
+                    else ""
+                )
+                + (
+                    f", quantization {_quantization_summary(schema.quantization)}"
+                    if schema.quantization
+                    else ""
+                )
+                + (f", shard keys {schema.shard_keys}" if schema.custom_sharding else "")
             )
 
         except Exception as e:
@@ -269,6 +660,7 @@ class SchemaManager:
                             "distance": vec_config.distance.value,
                             "on_disk": vec_config.on_disk if vec_config.on_disk else False,
                             "multivector": vec_config.multivector_config is not None,
+                            "quantization": _quantization_name(vec_config.quantization_config),
                         }
                         for name, vec_config in vectors_config.items()
                     }
@@ -282,6 +674,7 @@ class SchemaManager:
                                 vectors_config.on_disk if vectors_config.on_disk else False
                             ),
                             "multivector": vectors_config.multivector_config is not None,
+                            "quantization": _quantization_name(vectors_config.quantization_config),
                         }
                     }
 
@@ -313,18 +706,42 @@ class SchemaManager:
             logger.error(f"Failed to get collection info for '{collection_name}': {e}")
             return None
 
+    async def has_vector(self, collection_name: str, vector_name: str) -> bool:
+        """Check whether an existing collection defines a named dense or multi-vector.
+
+        Qdrant cannot add named vectors to an existing collection, so features
+        writing a new vector check for it first.
+
+        Args:
+                collection_name: Collection to inspect.
+                vector_name: Named vector to look for.
+
+        Returns:
+                True if the collection exists and defines the vector.
+        """
+        info = await self.qdrant.get_collection_info(collection_name)
+        if info is None:
+            return False
+        vectors = info.config.params.vectors
+        return isinstance(vectors, dict) and vector_name in vectors
+
     async def update_collection_params(
         self,
         collection_name: str,
         hnsw_m: int | None = None,
         hnsw_ef_construct: int | None = None,
+        quantization: dict[str, VectorQuantization] | None = None,
     ) -> None:
-        """Update collection HNSW parameters.
+        """Update collection HNSW and quantization parameters.
+
+        Changing quantization triggers a background rebuild of the quantized
+        vectors; the collection stays searchable meanwhile.
 
         Args:
                 collection_name: Name of the collection to update.
                 hnsw_m: HNSW M parameter (optional).
                 hnsw_ef_construct: HNSW ef_construct parameter (optional).
+                quantization: Quantization per named vector (optional).
 
         Raises:
                 Exception: If update fails.
@@ -345,21 +762,464 @@ class SchemaManager:
             if hnsw_ef_construct is not None:
                 hnsw_config.ef_construct = hnsw_ef_construct
 
+            # Per-vector quantization goes through the named vectors config
+            vectors_config = (
+                {
+                    name: models.VectorParamsDiff(quantization_config=q.to_qdrant())
+                    for name, q in quantization.items()
+                }
+                if quantization
+                else None
+            )
+
             # Update collection
             await self.qdrant.client.update_collection(
                 collection_name=collection_name,
                 hnsw_config=hnsw_config,
+                vectors_config=vectors_config,
             )
 
             logger.info(
                 f"Successfully updated collection '{collection_name}' parameters: "
-                f"m={hnsw_m}, ef_construct={hnsw_ef_construct}"
+                f"m={hnsw_m}, ef_construct={hnsw_ef_construct}, "
+                f"quantization={_quantization_summary(quantization or {})}"
             )
 
         except Exception as e:
             logger.error(f"Failed to update collection '{collection_name}' parameters: {e}")
             raise
 
+    async def reconcile_storage(self, schema: CollectionSchema) -> bool:
+        """Apply the schema's storage placement to an existing collection.
+
+        Compares vector, HNSW, sparse index and payload placement and the
+        optimizer thresholds against the live collection and sends a single
+        update with only the settings that differ. Qdrant moves the data in the
+        background; the collection stays searchable meanwhile.
+
+        Args:
+                schema: Collection schema with the desired placement.
+
+        Returns:
+                True if an update was sent, False if placement already matched.
+
+        Raises:
+                Exception: If the collection is missing or the update fails.
+        """
+        try:
+            info = await self.qdrant.get_collection_info(schema.collection_name)
+            if info is None:
+                raise ValueError(f"Collection '{schema.collection_name}' does not exist")
+
+            params = info.config.params
+            current_vectors = params.vectors if isinstance(params.vectors, dict) else {}
+            collection_hnsw_on_disk = bool(info.config.hnsw_config.on_disk)
+
+            # Named dense/ColBERT vectors and their HNSW graphs
+            vectors_diff: dict[str, models.VectorParamsDiff] = {}
+            for name, current in current_vectors.items():
+                on_disk = schema.vector_on_disk(name)
+                hnsw_on_disk = schema.hnsw_on_disk(name)
+                current_hnsw_on_disk = (
+                    current.hnsw_config.on_disk
+                    if current.hnsw_config and current.hnsw_config.on_disk is not None
+                    else collection_hnsw_on_disk
+                )
+
+                diff = models.VectorParamsDiff()
+                if bool(current.on_disk) != on_disk:
+                    diff.on_disk = on_disk
+                if hnsw_on_disk is not None and current_hnsw_on_disk != hnsw_on_disk:
+                    diff.hnsw_config = models.HnswConfigDiff(on_disk=hnsw_on_disk)
+                if diff.on_disk is not None or diff.hnsw_config is not None:
+                    vectors_diff[name] = diff
+
+            # Sparse inverted index
+            sparse_diff: dict[str, SparseVectorParams] = {}
+            current_sparse = (params.sparse_vectors or {}).get(schema.sparse_vector_name)
+            if schema.sparse_index_on_disk is not None and current_sparse is not None:
+                current_on_disk = bool(current_sparse.index and current_sparse.index.on_disk)
+                if current_on_disk != schema.sparse_index_on_disk:
+                    sparse_diff[schema.sparse_vector_name] = schema.sparse_vector_params()
+
+            # Payload storage
+            collection_params = None
+            if (
+                schema.on_disk_payload is not None
+                and bool(params.on_disk_payload) != schema.on_disk_payload
+            ):
+                collection_params = models.CollectionParamsDiff(
+                    on_disk_payload=schema.on_disk_payload
+                )
+
+            # Memmap and indexing thresholds
+            optimizers_config = None
+            optimizer = info.config.optimizer_config
+            if (
+                schema.memmap_threshold_kb is not None
+                and optimizer.memmap_threshold != schema.memmap_threshold_kb
+            ) or (
+                schema.indexing_threshold_kb is not None
+                and optimizer.indexing_threshold != schema.indexing_threshold_kb
+            ):
+                optimizers_config = schema.optimizers_config()
+
+            if not (vectors_diff or sparse_diff or collection_params or optimizers_config):
+                logger.info(f"Storage placement for '{schema.collection_name}' is up to date")
+                return False
+
+            await self.qdrant.client.update_collection(
+                collection_name=schema.collection_name,
+                vectors_config=vectors_diff or None,
+                sparse_vectors_config=sparse_diff or None,
+                collection_params=collection_params,
+                optimizers_config=optimizers_config,
+            )
+
+            logger.info(
+                f"Updated storage placement for '{schema.collection_name}': "
+                f"vectors={list(vectors_diff)}, sparse={list(sparse_diff)}, "
+                f"on_disk_payload={schema.on_disk_payload if collection_params else 'unchanged'}, "
+                f"optimizers={'updated' if optimizers_config else 'unchanged'}"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"Failed to reconcile storage placement for '{schema.collection_name}': {e}"
+            )
+            raise
+
+    async def ensure_payload_indexes(self, schema: CollectionSchema) -> list[str]:
+        """Reconcile the schema's declared payload indexes with the collection.
+
+        Creates missing indexes and rebuilds indexes whose type changed. Index
+        builds run in the background so startup isn't blocked on large
+        collections; filters fall back to payload scans until they finish.
+
+        Args:
+                schema: Collection schema with payload index definitions.
+
+        Returns:
+                Names of the fields whose index was created or rebuilt.
+
+        Raises:
+                Exception: If the collection is missing or index creation fails.
+        """
+        try:
+            info = await self.qdrant.get_collection_info(schema.collection_name)
+            if info is None:
+                raise ValueError(f"Collection '{schema.collection_name}' does not exist")
+
+            existing = info.payload_schema or {}
+            changed: list[str] = []
+
+            for index in schema.payload_indexes:
+                current = existing.get(index.field_name)
+                if current is not None and current.data_type == index.type:
+                    continue
+
+                if current is not None:
+                    logger.warning(
+                        f"Payload index '{index.field_name}' on '{schema.collection_name}' "
+                        f"is {current.data_type}, rebuilding as {index.type}"
+                    )
+                    await self.qdrant.client.delete_payload_index(
+                        collection_name=schema.collection_name,
+                        field_name=index.field_name,
+                        wait=True,
+                    )
+
+                await self.qdrant.client.create_payload_index(
+                    collection_name=schema.collection_name,
+                    field_name=index.field_name,
+                    field_schema=index.to_qdrant(),
+                    wait=False,
+                )
+                changed.append(index.field_name)
+
+            if changed:
+                logger.info(
+                    f"Created payload indexes on '{schema.collection_name}': {', '.join(changed)}"
+                )
+            return changed
+
+        except Exception as e:
+            logger.error(f"Failed to ensure payload indexes for '{schema.collection_name}': {e}")
+            raise
+
+    async def is_custom_sharded(self, collection_name: str) -> bool:
+        """Check whether an existing collection uses custom sharding.
+
+        Args:
+                collection_name: Name of the collection.
+
+        Returns:
+                True if the collection routes points by shard key.
+
+        Raises:
+                ValueError: If the collection does not exist.
+        """
+        info = await self.qdrant.get_collection_info(collection_name)
+        if info is None:
+            raise ValueError(f"Collection '{collection_name}' does not exist")
+        return info.config.params.sharding_method == models.ShardingMethod.CUSTOM
+
+    async def ensure_shard_keys(self, schema: CollectionSchema) -> list[str]:
+        """Create the schema's shard keys that the collection is missing.
+
+        New dedicated tenants only need their shard key created; their existing
+        points stay on the default shard until migrate_sharding moves them.
+
+        Args:
+                schema: Collection schema with shard keys.
+
+        Returns:
+                Shard keys that were created.
+
+        Raises:
+                ValueError: If the collection does not use custom sharding.
+        """
+        if not schema.custom_sharding:
+            return []
+        if not await self.is_custom_sharded(schema.collection_name):
+            raise ValueError(
+                f"Collection '{schema.collection_name}' uses automatic sharding; "
+                f"run src.scripts.migrate_sharding to enable shard keys"
+            )
+
+        existing = await self._existing_shard_keys(schema.collection_name)
+        created = [key for key in schema.shard_keys if key not in existing]
+        for shard_key in created:
+            await self._create_shard_key(schema, shard_key)
+        return created
+
+    async def shard_router(self, collection_names: Iterable[str] | None = None) -> ShardRouter:
+        """Create the shard router from settings, if the collections allow it.
+
+        Requests with a shard key fail on automatically sharded collections, so
+        until migrate_sharding has run the router falls back to unrouted
+        requests. Collections that do not exist yet are skipped: the search
+        server creates them with the configured shard keys.
+
+        Args:
+                collection_names: Collections the caller reads or writes (the
+                        turns, memory, sessions and cold tier collections in use
+                        if None).
+
+        Returns:
+                The configured router, or a disabled one.
+        """
+        router = ShardRouter.from_settings(self.settings)
+        if not router.enabled:
+            return router
+
+        if collection_names is None:
+            collection_names = self._routed_collections()
+        for collection_name in collection_names:
+            try:
+                custom = await self.is_custom_sharded(collection_name)
+            except ValueError:
+                continue
+            if not custom:
+                logger.error(
+                    f"Shard routing disabled: collection '{collection_name}' uses automatic "
+                    f"sharding; run src.scripts.migrate_sharding to enable shard keys"
+                )
+                return ShardRouter()
+        return router
+
+    def _routed_collections(self) -> list[str]:
+        settings = self.settings
+        names = [settings.qdrant_collection, "engram_memory"]
+        if settings.session_centroids_enabled:
+            names.append(settings.session_centroids_collection)
+        if settings.qdrant_turns_tiering_enabled:
+            names.append(settings.qdrant_turns_cold_collection)
+        return names
+
+    async def migrate_sharding(
+        self,
+        schema: CollectionSchema,
+        router: ShardRouter,
+        batch_size: int = 256,
+    ) -> int:
+        """Migrate an existing collection to the router's shard layout.
+
+        Qdrant cannot switch a collection's sharding method in place, so an
+        auto-sharded collection is copied to a staging collection with custom
+        sharding, recreated under its own name and copied back. For a collection
+        that is already custom-sharded, points of newly dedicated tenants are
+        moved from the default shard to their own shard key.
+
+        Args:
+                schema: Target collection schema (with shard keys).
+                router: Shard router deciding each point's shard key.
+                batch_size: Points copied per scroll/upsert round trip.
+
+        Returns:
+                Number of points written.
+
+        Raises:
+                ValueError: If the schema has no shard keys or the collection is missing.
+        """
+        if not schema.custom_sharding or not router.enabled:
+            raise ValueError("Sharding migration needs shard keys and an enabled shard router")
+
+        name = schema.collection_name
+        if await self.is_custom_sharded(name):
+            await self.ensure_shard_keys(schema)
+            moved = 0
+            for org_id in sorted(router.dedicated_orgs):
+                moved += await self._copy_points(
+                    name,
+                    name,
+                    router,
+                    batch_size,
+                    scroll_filter=models.Filter(
+                        must=[
+                            models.FieldCondition(
+                                key="org_id", match=models.MatchValue(value=org_id)
+                            )
+                        ]
+                    ),
+                    source_shard_key=router.default_key,
+                    delete_from_source=True,
+                )
+            logger.info(f"Moved {moved} points of dedicated tenants on '{name}' to own shards")
+            return moved
+
+        staging = schema.model_copy(update={"collection_name": f"{name}_resharding"})
+        await self.delete_collection(staging.collection_name)
+        await self.create_collection(staging)
+        copied = await self._copy_points(name, staging.collection_name, router, batch_size)
+
+        await self.delete_collection(name)
+        await self.create_collection(schema)
+        await self.ensure_payload_indexes(schema)
+        restored = await self._copy_points(staging.collection_name, name, router, batch_size)
+        await self.delete_collection(staging.collection_name)
+
+        logger.info(
+            f"Migrated '{name}' to custom sharding: {restored} points across {schema.shard_keys}"
+        )
+        return copied + restored
+
+    async def move_points(
+        self,
+        source: str,
+        target: str,
+        router: ShardRouter,
+        scroll_filter: models.Filter,
+        batch_size: int = 256,
+    ) -> int:
+        """Move points matching a filter from one collection to another.
+
+        Each page is written to the target before it is deleted from the
+        source. Custom-sharded sources are drained one shard key at a time.
+
+        Args:
+                source: Collection to move points out of.
+                target: Collection to move points into.
+                router: Shard router deciding each point's shard key.
+                scroll_filter: Filter selecting the points to move.
+                batch_size: Points moved per scroll/upsert/delete round trip.
+
+        Returns:
+                Number of points moved.
+        """
+        shard_keys: list[str | None] = list(router.shard_keys) if router.enabled else [None]
+        moved = 0
+        for shard_key in shard_keys:
+            moved += await self._copy_points(
+                source,
+                target,
+                router,
+                batch_size,
+                scroll_filter=scroll_filter,
+                source_shard_key=shard_key,
+                delete_from_source=True,
+            )
+        return moved
+
+    async def _create_shard_key(self, schema: CollectionSchema, shard_key: str) -> None:
+        """Create one shard key with the schema's shard count."""
+        await self.qdrant.client.create_shard_key(
+            collection_name=schema.collection_name,
+            shard_key=shard_key,
+            shards_number=schema.shards_per_key,
+        )
+        logger.info(f"Created shard key '{shard_key}' on '{schema.collection_name}'")
+
+    async def _existing_shard_keys(self, collection_name: str) -> set[str]:
+        """Get the shard keys a custom-sharded collection already has."""
+        cluster = await self.qdrant.client.collection_cluster_info(collection_name)
+        shards = [*cluster.local_shards, *cluster.remote_shards]
+        return {str(shard.shard_key) for shard in shards if shard.shard_key is not None}
+
+    async def _copy_points(
+        self,
+        source: str,
+        target: str,
+        router: ShardRouter,
+        batch_size: int,
+        scroll_filter: models.Filter | None = None,
+        source_shard_key: str | None = None,
+        delete_from_source: bool = False,
+    ) -> int:
+        """Copy points with vectors between collections, routed by shard key.
+
+        Args:
+                source: Collection to read from.
+                target: Collection to write to (may equal source).
+                router: Shard router deciding each point's target shard key.
+                batch_size: Points per scroll page.
+                scroll_filter: Optional filter on the points to copy.
+                source_shard_key: Only read from this shard key.
+                delete_from_source: Delete each page from the source shard after writing.
+
+        Returns:
+                Number of points written.
+        """
+        source_kwargs = {} if source_shard_key is None else {"shard_key_selector": source_shard_key}
+        written = 0
+        offset = None
+        while True:
+            records, next_offset = await self.qdrant.client.scroll(
+                collection_name=source,
+                scroll_filter=scroll_filter,
+                limit=batch_size,
+                offset=None if delete_from_source else offset,
+                with_payload=True,
+                with_vectors=True,
+                **source_kwargs,
+            )
+            if not records:
+                break
+
+            points = [
+                models.PointStruct(id=r.id, vector=r.vector or {}, payload=r.payload)
+                for r in records
+            ]
+            for shard_kwargs, shard_points in router.partition(points):
+                await self.qdrant.client.upsert(
+                    collection_name=target, points=shard_points, **shard_kwargs
+                )
+            written += len(points)
+
+            if delete_from_source:
+                # Pages shrink as we delete, so always rescan from the start
+                await self.qdrant.client.delete(
+                    collection_name=source,
+                    points_selector=models.PointIdsList(points=[r.id for r in records]),
+                    **source_kwargs,
+                )
+            elif next_offset is None:
+                break
+            offset = next_offset
+
+        return written
+
     async def ensure_tenant_index(self, collection_name: str) -> None:
         """Create tenant-aware index for efficient filtering.
 
@@ -398,3 +1258,19 @@ class SchemaManager:
         except Exception as e:
             logger.error(f"Failed to create tenant index for collection '{collection_name}': {e}")
             raise
+
+
+def _quantization_summary(quantization: dict[str, VectorQuantization]) -> dict[str, str]:
+    """Map named vectors to their quantization method for logging."""
+    return {name: q.type.value for name, q in quantization.items()}
+
+
+def _quantization_name(config: Any) -> str | None:
+    """Get the quantization method name from a Qdrant quantization config."""
+    if isinstance(config, models.ScalarQuantization):
+        return QuantizationType.SCALAR.value
+    if isinstance(config, models.ProductQuantization):
+        return QuantizationType.PRODUCT.value
+    if isinstance(config, models.BinaryQuantization):
+        return QuantizationType.BINARY.value
+    return None
@@ -0,0 +1,125 @@
+"""Per-tenant shard-key routing for Qdrant collections.
+
+With custom sharding, each collection is split into named shard keys. Large
+tenants listed in ``qdrant_dedicated_shard_orgs`` get a shard key of their own,
+so their searches touch only their shards and their load stays off everyone
+else's. All other tenants share the default shard key, where the org_id
+payload filter still separates them.
+
+When sharding is disabled the router is a no-op and callers pass no shard key
+selector at all, so Qdrant keeps its automatic sharding.
+"""
+
+import logging
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from qdrant_client.http import models
+
+from src.config import Settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_KEY = "default"
+
+
+class ShardRouter:
+    """Maps organizations to Qdrant shard keys.
+
+    Example:
+            >>> router = ShardRouter(enabled=True, dedicated_orgs=["acme"])
+            >>> router.shard_key("acme")
+            'acme'
+            >>> router.shard_key("small-org")
+            'default'
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        dedicated_orgs: Iterable[str] = (),
+        default_key: str = DEFAULT_SHARD_KEY,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+                enabled: Route by shard key (collections must use custom sharding).
+                dedicated_orgs: Organizations that get their own shard key.
+                default_key: Shared shard key for all other organizations.
+        """
+        self.enabled = enabled
+        self.dedicated_orgs = frozenset(dedicated_orgs)
+        self.default_key = default_key
+
+        if default_key in self.dedicated_orgs:
+            raise ValueError(f"Default shard key '{default_key}' collides with a dedicated org")
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ShardRouter":
+        """Create a router from application settings.
+
+        Args:
+                settings: Application settings.
+
+        Returns:
+                Configured shard router (disabled unless qdrant_shard_by_org is set).
+        """
+        return cls(
+            enabled=settings.qdrant_shard_by_org,
+            dedicated_orgs=settings.qdrant_dedicated_shard_orgs,
+            default_key=settings.qdrant_default_shard_key,
+        )
+
+    @property
+    def shard_keys(self) -> list[str]:
+        """All shard keys the router can route to, default first."""
+        return [self.default_key, *sorted(self.dedicated_orgs)]
+
+    def shard_key(self, org_id: str | None) -> str | None:
+        """Get the shard key for an organization.
+
+        Args:
+                org_id: Organization ID.
+
+        Returns:
+                Shard key, or None when sharding is disabled.
+        """
+        if not self.enabled:
+            return None
+        if org_id in self.dedicated_orgs:
+            return org_id
+        return self.default_key
+
+    def selector_kwargs(self, org_id: str | None) -> dict[str, Any]:
+        """Build Qdrant request kwargs that route a request to the org's shard.
+
+        Args:
+                org_id: Organization ID.
+
+        Returns:
+                ``{"shard_key_selector": key}``, or an empty dict when disabled.
+        """
+        key = self.shard_key(org_id)
+        return {} if key is None else {"shard_key_selector": key}
+
+    def partition(
+        self, points: Sequence[models.PointStruct]
+    ) -> list[tuple[dict[str, Any], list[models.PointStruct]]]:
+        """Group points by the shard key of their payload org_id.
+
+        Args:
+                points: Points to upsert.
+
+        Returns:
+                (request kwargs, points) pairs, one per shard key. A single pair
+                with empty kwargs when sharding is disabled.
+        """
+        if not self.enabled:
+            return [({}, list(points))]
+
+        groups: dict[str, list[models.PointStruct]] = {}
+        for point in points:
+            org_id = (point.payload or {}).get("org_id")
+            key = self.shard_key(org_id) or self.default_key
+            groups.setdefault(key, []).append(point)
+        return [({"shard_key_selector": key}, group) for key, group in groups.items()]
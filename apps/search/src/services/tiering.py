@@ -0,0 +1,264 @@
+"""Hot/cold time tiers for the turns collection.
+
+Most searches target the last few days of conversation, yet every turn ever
+recorded would otherwise share one collection and one set of HNSW and storage
+parameters. With tiering enabled, new turns are indexed into the hot
+collection (``qdrant_collection``, RAM-resident), and a background migration
+moves turns older than ``qdrant_turns_hot_window_hours`` into a cold
+collection whose vectors, HNSW graphs and payloads live on disk with
+quantized vectors kept in RAM. Searches fan out to both tiers and skip the
+cold tier when the query's time range starts inside the hot window.
+
+When tiering is disabled the tiers collapse to the single hot collection.
+
+The migration must run in exactly one process: every search server replica
+and every uvicorn worker runs the same startup, so the server only starts a
+TierMigrator with ``qdrant_turns_tier_migration_enabled``. Set it on a single
+server process (one replica with one uvicorn worker) and leave it off on the
+search replicas.
+"""
+
+import asyncio
+import logging
+import time
+
+from qdrant_client.http import models
+
+from src.config import Settings
+from src.services.schema_manager import (
+    CollectionSchema,
+    QuantizationType,
+    SchemaManager,
+    VectorPlacement,
+    VectorQuantization,
+)
+from src.services.sharding import ShardRouter
+from src.utils.metrics import record_tier_migration
+
+logger = logging.getLogger(__name__)
+
+MS_PER_HOUR = 3_600_000
+
+
+class TurnTiers:
+    """Maps turn timestamps to the hot and cold turn collections.
+
+    Example:
+            >>> tiers = TurnTiers(enabled=True, hot_window_ms=MS_PER_HOUR)
+            >>> tiers.collections_for(start_ms=None)
+            ['engram_turns', 'engram_turns_cold']
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        hot_collection: str = "engram_turns",
+        cold_collection: str = "engram_turns_cold",
+        hot_window_ms: int = 168 * MS_PER_HOUR,
+    ) -> None:
+        """Initialize the tiers.
+
+        Args:
+                enabled: Split turns across a hot and a cold collection.
+                hot_collection: Collection holding recent turns (and all turns if disabled).
+                cold_collection: Collection holding turns older than the hot window.
+                hot_window_ms: Age in milliseconds after which turns become cold.
+        """
+        self.enabled = enabled
+        self.hot_collection = hot_collection
+        self.cold_collection = cold_collection
+        self.hot_window_ms = hot_window_ms
+
+        if enabled and hot_collection == cold_collection:
+            raise ValueError(f"Hot and cold tiers must differ, both are '{hot_collection}'")
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "TurnTiers":
+        """Create tiers from application settings.
+
+        Args:
+                settings: Application settings.
+
+        Returns:
+                Configured tiers (hot collection only unless tiering is enabled).
+        """
+        return cls(
+            enabled=settings.qdrant_turns_tiering_enabled,
+            hot_collection=settings.qdrant_collection,
+            cold_collection=settings.qdrant_turns_cold_collection,
+            hot_window_ms=int(settings.qdrant_turns_hot_window_hours * MS_PER_HOUR),
+        )
+
+    @property
+    def collections(self) -> list[str]:
+        """All tier collections, hot first."""
+        if not self.enabled:
+            return [self.hot_collection]
+        return [self.hot_collection, self.cold_collection]
+
+    def boundary_ms(self, now_ms: int | None = None) -> int:
+        """Timestamp (Unix epoch ms) separating cold turns from hot ones.
+
+        Args:
+                now_ms: Current time in milliseconds (wall clock if None).
+
+        Returns:
+                Turns with an older timestamp belong to the cold tier.
+        """
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        return now_ms - self.hot_window_ms
+
+    def collections_for(self, start_ms: int | None, now_ms: int | None = None) -> list[str]:
+        """Collections a search must cover, hot first.
+
+        The cold tier only ever holds turns older than the boundary at the time
+        they were migrated, which is never later than the current boundary, so
+        a time range starting at or after the boundary cannot match it.
+
+        Args:
+                start_ms: Start of the query's time range (None if unbounded).
+                now_ms: Current time in milliseconds (wall clock if None).
+
+        Returns:
+                Collection names to search.
+        """
+        if not self.enabled:
+            return [self.hot_collection]
+        if start_ms is not None and start_ms >= self.boundary_ms(now_ms):
+            return [self.hot_collection]
+        return [self.hot_collection, self.cold_collection]
+
+    def cold_filter(self, now_ms: int | None = None) -> models.Filter:
+        """Filter matching hot-tier turns that are due to move to the cold tier.
+
+        Args:
+                now_ms: Current time in milliseconds (wall clock if None).
+
+        Returns:
+                Filter on the indexed ``timestamp`` payload field.
+        """
+        return models.Filter(
+            must=[
+                models.FieldCondition(
+                    key="timestamp", range=models.Range(lt=self.boundary_ms(now_ms))
+                )
+            ]
+        )
+
+
+def get_cold_turns_schema(schema: CollectionSchema, settings: Settings) -> CollectionSchema:
+    """Derive the cold-tier schema from the (storage-placed) turns schema.
+
+    The cold tier trades latency for RAM: original vectors, HNSW graphs, the
+    sparse index and payloads go to disk, and only quantized dense/ColBERT
+    vectors stay in RAM. Payload indexes and shard keys are kept, so filters
+    and shard routing work the same on both tiers.
+
+    Args:
+            schema: Hot turns collection schema.
+            settings: Application settings.
+
+    Returns:
+            Copy of the schema named after the cold collection.
+    """
+    named = schema.named_vectors()
+
+    quantization: dict[str, VectorQuantization] = {}
+    if settings.qdrant_turns_cold_quantization:
+        quantization = dict.fromkeys(
+            named,
+            VectorQuantization(
+                type=QuantizationType(settings.qdrant_turns_cold_quantization), always_ram=True
+            ),
+        )
+
+    return schema.model_copy(
+        update={
+            "collection_name": settings.qdrant_turns_cold_collection,
+            "on_disk": True,
+            "quantization": quantization,
+            "vector_placement": {
+                name: VectorPlacement(on_disk=True, hnsw_on_disk=True) for name in named
+            },
+            "sparse_index_on_disk": True,
+            "on_disk_payload": True,
+        }
+    )
+
+
+class TierMigrator:
+    """Periodically moves turns past the hot window into the cold tier.
+
+    Points are copied (with vectors) before they are deleted from the hot
+    tier, so a crash mid-batch leaves duplicates rather than gaps; searches
+    deduplicate across tiers by point ID.
+
+    Attributes:
+            schema_manager: Schema manager used to move points.
+            tiers: Hot/cold tier layout.
+            shard_router: Routes moved points to their org's shard key.
+            interval_s: Seconds between migration runs.
+            batch_size: Points moved per round trip.
+    """
+
+    def __init__(
+        self,
+        schema_manager: SchemaManager,
+        tiers: TurnTiers,
+        shard_router: ShardRouter | None = None,
+        interval_s: float = 900.0,
+        batch_size: int = 256,
+    ) -> None:
+        """Initialize the migrator.
+
+        Args:
+                schema_manager: Schema manager used to move points.
+                tiers: Hot/cold tier layout (must be enabled).
+                shard_router: Routes moved points to their org's shard key.
+                interval_s: Seconds between migration runs.
+                batch_size: Points moved per round trip.
+        """
+        self.schema_manager = schema_manager
+        self.tiers = tiers
+        self.shard_router = shard_router or ShardRouter()
+        self.interval_s = interval_s
+        self.batch_size = batch_size
+
+    async def migrate_once(self, now_ms: int | None = None) -> int:
+        """Move every hot-tier turn older than the boundary to the cold tier.
+
+        Args:
+                now_ms: Current time in milliseconds (wall clock if None).
+
+        Returns:
+                Number of points moved.
+        """
+        if not self.tiers.enabled:
+            return 0
+
+        moved = await self.schema_manager.move_points(
+            self.tiers.hot_collection,
+            self.tiers.cold_collection,
+            self.shard_router,
+            scroll_filter=self.tiers.cold_filter(now_ms),
+            batch_size=self.batch_size,
+        )
+        record_tier_migration(moved)
+        if moved:
+            logger.info(
+                f"Moved {moved} turns from '{self.tiers.hot_collection}' "
+                f"to '{self.tiers.cold_collection}'"
+            )
+        return moved
+
+    async def run(self) -> None:
+        """Run migrations forever, every ``interval_s`` seconds, until cancelled."""
+        while True:
+            try:
+                await self.migrate_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Turn tier migration failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_s)
@@ -0,0 +1,124 @@
+"""Request deadlines propagated across search stages.
+
+A deadline is an absolute wall-clock instant (Unix epoch milliseconds) by which
+the caller needs an answer. Stages ask the deadline how much budget remains and
+bound their own work accordingly, instead of each applying a fixed timeout.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable
+from typing import TypeVar
+
+from src.utils.metrics import record_deadline_miss
+
+# Relative budget from the caller, in milliseconds
+DEADLINE_TIMEOUT_HEADER = "X-Request-Timeout-Ms"
+# Absolute deadline propagated by upstream services, in Unix epoch milliseconds
+DEADLINE_HEADER = "X-Request-Deadline"
+
+T = TypeVar("T")
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a request deadline expires before or during a stage."""
+
+    def __init__(self, stage: str) -> None:
+        """Initialize the error.
+
+        Args:
+                stage: Search stage that ran out of budget.
+        """
+        super().__init__(f"Request deadline exceeded during {stage}")
+        self.stage = stage
+
+
+class Deadline:
+    """Absolute request deadline.
+
+    Attributes:
+            deadline_ms: Deadline as Unix epoch milliseconds.
+    """
+
+    def __init__(self, deadline_ms: float) -> None:
+        """Initialize deadline.
+
+        Args:
+                deadline_ms: Deadline as Unix epoch milliseconds.
+        """
+        self.deadline_ms = deadline_ms
+
+    @classmethod
+    def from_timeout_ms(cls, timeout_ms: float) -> "Deadline":
+        """Create a deadline the given number of milliseconds from now.
+
+        Args:
+                timeout_ms: Budget in milliseconds.
+
+        Returns:
+                Deadline instance.
+        """
+        return cls(time.time() * 1000 + timeout_ms)
+
+    def remaining_ms(self) -> float:
+        """Get the remaining budget in milliseconds (negative once expired)."""
+        return self.deadline_ms - time.time() * 1000
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining_ms() <= 0
+
+    def allocate_ms(self, fraction: float, cap_ms: float | None = None) -> float:
+        """Allocate a share of the remaining budget to a stage.
+
+        Args:
+                fraction: Share of the remaining budget (0-1).
+                cap_ms: Optional upper bound, e.g. the stage's own configured timeout.
+
+        Returns:
+                Budget in milliseconds (0 if the deadline has passed).
+        """
+        budget = max(0.0, self.remaining_ms() * fraction)
+        if cap_ms is not None:
+            budget = min(budget, cap_ms)
+        return budget
+
+    def check(self, stage: str) -> None:
+        """Raise if the deadline has passed.
+
+        Args:
+                stage: Stage about to start, for metrics and the error message.
+
+        Raises:
+                DeadlineExceededError: If the deadline has passed.
+        """
+        if self.expired:
+            record_deadline_miss(stage)
+            raise DeadlineExceededError(stage)
+
+    async def run(self, awaitable: Awaitable[T], stage: str, budget_ms: float | None = None) -> T:
+        """Await a stage within its budget.
+
+        Args:
+                awaitable: Stage coroutine.
+                stage: Stage name, for metrics and the error message.
+                budget_ms: Stage budget in milliseconds (all remaining budget if None).
+
+        Returns:
+                The stage result.
+
+        Raises:
+                DeadlineExceededError: If the stage does not finish within budget.
+        """
+        if self.expired:
+            # Close the never-started coroutine so it isn't reported as unawaited
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            self.check(stage)
+        timeout_ms = self.remaining_ms() if budget_ms is None else budget_ms
+        try:
+            return await asyncio.wait_for(awaitable, timeout=max(timeout_ms, 0.0) / 1000.0)
+        except TimeoutError as e:
+            record_deadline_miss(stage)
+            raise DeadlineExceededError(stage) from e
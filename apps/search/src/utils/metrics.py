@@ -47,6 +47,41 @@ SEARCH_RESULTS = Histogram(
     buckets=[0, 1, 5, 10, 25, 50, 100],
 )
 
+SEARCH_DEADLINE_MISSES = Counter(
+    "search_deadline_misses_total",
+    "Search requests whose deadline expired, by stage",
+    ["stage"],
+)
+
+SEARCH_DEADLINE_DEGRADATIONS = Counter(
+    "search_deadline_degradations_total",
+    "Search stages degraded to fit the remaining deadline budget",
+    ["action"],
+)
+
+SEARCH_QUERY_PLANS = Counter(
+    "search_query_plans_total",
+    "First-stage query plans chosen by the cost-based planner",
+    ["mode"],
+)
+
+SEARCH_PLANNER_CACHE = Counter(
+    "search_planner_cache_total",
+    "Filter cardinality cache lookups by the query planner",
+    ["result"],
+)
+
+SEARCH_PAGE_CACHE = Counter(
+    "search_page_cache_total",
+    "Paginated search result list lookups by cursor",
+    ["result"],
+)
+
+TURNS_TIER_MIGRATED = Counter(
+    "turns_tier_migrated_total",
+    "Turns moved from the hot to the cold turns collection",
+)
+
 # ==================== Reranker Metrics ====================
 
 RERANKER_REQUESTS = Counter(
@@ -115,6 +150,19 @@ EMBEDDING_ERRORS = Counter(
     ["embedder_type", "error_type"],
 )
 
+EMBEDDING_QUEUE_DEPTH = Gauge(
+    "embedding_queue_depth",
+    "Embedding jobs waiting for an embedder, by priority lane",
+    ["embedder_type", "lane"],
+)
+
+EMBEDDING_QUEUE_WAIT = Histogram(
+    "embedding_queue_wait_seconds",
+    "Time embedding jobs wait before an embedder runs them, by priority lane",
+    ["embedder_type", "lane"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
 # ==================== Indexing Metrics ====================
 
 INDEXED_DOCUMENTS = Counter(
@@ -129,6 +177,12 @@ INDEXING_LATENCY = Histogram(
     buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
 )
 
+INDEXING_DEDUP = Counter(
+    "indexing_dedup_documents_total",
+    "Documents checked against stored content hashes before embedding",
+    ["collection", "outcome"],
+)
+
 BATCH_QUEUE_SIZE = Gauge(
     "batch_queue_size",
     "Current batch queue size",
@@ -405,6 +459,76 @@ def record_embedding_cache_miss(embedder_type: str) -> None:
     EMBEDDING_CACHE_MISSES.labels(embedder_type=embedder_type).inc()
 
 
+def set_embedding_queue_depth(embedder_type: str, lane: str, depth: int) -> None:
+    """Set the number of embedding jobs waiting in a priority lane.
+
+    Args:
+            embedder_type: Embedder the jobs wait for.
+            lane: Priority lane (query, live, bulk).
+            depth: Jobs waiting.
+    """
+    EMBEDDING_QUEUE_DEPTH.labels(embedder_type=embedder_type, lane=lane).set(depth)
+
+
+def record_embedding_queue_wait(embedder_type: str, lane: str, wait_seconds: float) -> None:
+    """Record how long an embedding job waited to be scheduled.
+
+    Args:
+            embedder_type: Embedder that ran the job.
+            lane: Priority lane (query, live, bulk).
+            wait_seconds: Time between submission and start.
+    """
+    EMBEDDING_QUEUE_WAIT.labels(embedder_type=embedder_type, lane=lane).observe(wait_seconds)
+
+
+def record_deadline_miss(stage: str) -> None:
+    """Record a search request whose deadline expired.
+
+    Args:
+            stage: Stage that ran out of budget (admission, first_stage, rerank, hydrate).
+    """
+    SEARCH_DEADLINE_MISSES.labels(stage=stage).inc()
+
+
+def record_deadline_degradation(action: str) -> None:
+    """Record a stage degraded to fit the remaining deadline budget.
+
+    Args:
+            action: Degradation applied (skip_rerank, reduce_prefetch, skip_hydrate).
+    """
+    SEARCH_DEADLINE_DEGRADATIONS.labels(action=action).inc()
+
+
+def record_query_plan(mode: str, cache_result: str | None = None) -> None:
+    """Record a query plan chosen for a filtered search.
+
+    Args:
+            mode: Plan mode (exact, filtered_hnsw, hnsw, manual).
+            cache_result: Cardinality cache lookup result (hit, miss) if a count was needed.
+    """
+    SEARCH_QUERY_PLANS.labels(mode=mode).inc()
+    if cache_result is not None:
+        SEARCH_PLANNER_CACHE.labels(result=cache_result).inc()
+
+
+def record_page_cache(result: str) -> None:
+    """Record a cursor lookup of a cached result list.
+
+    Args:
+            result: Lookup result (hit, expired, forbidden).
+    """
+    SEARCH_PAGE_CACHE.labels(result=result).inc()
+
+
+def record_tier_migration(moved: int) -> None:
+    """Record turns moved from the hot to the cold tier.
+
+    Args:
+            moved: Number of points moved in one migration run.
+    """
+    TURNS_TIER_MIGRATED.inc(moved)
+
+
 def record_reranker_cost(tier: str, cost_cents: float) -> None:
     """Record reranker cost.
 
@@ -445,6 +569,20 @@ def record_indexed_document(success: bool) -> None:
     INDEXED_DOCUMENTS.labels(status=status).inc()
 
 
+def record_indexing_dedup(collection: str, embedded: int, updated: int, skipped: int) -> None:
+    """Record the content-hash outcome of an indexing batch.
+
+    Args:
+            collection: Qdrant collection.
+            embedded: Documents that were (re-)embedded.
+            updated: Unchanged documents whose payload was overwritten.
+            skipped: Unchanged documents that were not written.
+    """
+    INDEXING_DEDUP.labels(collection=collection, outcome="embedded").inc(embedded)
+    INDEXING_DEDUP.labels(collection=collection, outcome="payload_updated").inc(updated)
+    INDEXING_DEDUP.labels(collection=collection, outcome="skipped").inc(skipped)
+
+
 def record_nats_message(topic: str, success: bool) -> None:
     """Record a NATS message processing event.
 
@@ -0,0 +1,321 @@
+"""Engram Search indexing worker - NATS indexing consumers without the search API.
+
+The search server runs the indexing consumers in its own event loop by
+default, so a burst of ingestion (embedding on the same CPU and loop) shows
+up in search p99. This entry point runs only the consumers and indexers; pair
+it with ``SERVICE_MODE=search`` on the servers so search and indexing scale
+independently. Both read the same settings from ``src.config``.
+
+With ``--workers N`` the worker starts N processes. Each process binds its
+pull subscriptions to the same durable JetStream consumers, so messages are
+spread across processes without duplicate delivery. Collections and shard
+keys are created by the search server; until they exist, failed batches are
+nak'ed and redelivered.
+
+Usage:
+    uv run search-indexer [--workers=2] [--metrics-port=9464]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import multiprocessing
+import multiprocessing.connection
+import signal
+import sys
+from typing import Any
+
+from prometheus_client import start_http_server
+
+from src.clients import NatsClient, NatsClientConfig, NatsPubSubPublisher, QdrantClientWrapper
+from src.config import Settings, get_settings
+from src.embedders import EmbedderFactory
+from src.indexing.consumer import MemoryConsumerConfig, MemoryEventConsumer
+from src.indexing.indexer import DocumentIndexer, IndexerConfig
+from src.indexing.sessions import SessionCentroidConfig
+from src.indexing.turns import (
+    TurnFinalizedConsumer,
+    TurnFinalizedConsumerConfig,
+    TurnsIndexer,
+    TurnsIndexerConfig,
+)
+from src.indexing.upload import UpsertConfig
+from src.services import PayloadCodec, SchemaManager, TurnTiers, late_chunks_from_settings
+from src.utils.logging import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+
+class IndexingWorker:
+    """Runs the indexing consumers of one worker process."""
+
+    def __init__(self, settings: Settings, worker_id: int = 0) -> None:
+        """Initialize the worker.
+
+        Args:
+            settings: Application settings shared with the search server.
+            worker_id: Index of this process, used in client names and logs.
+        """
+        self.settings = settings
+        self.worker_id = worker_id
+        self.qdrant: QdrantClientWrapper | None = None
+        self.embedder_factory: EmbedderFactory | None = None
+        self.nats_client: NatsClient | None = None
+        self.nats_pubsub: NatsPubSubPublisher | None = None
+        self.consumers: list[TurnFinalizedConsumer | MemoryEventConsumer] = []
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Connect to Qdrant and NATS and start the consumers.
+
+        Raises:
+            Exception: If Qdrant or NATS cannot be reached.
+        """
+        settings = self.settings
+        logger.info(f"Starting indexing worker {self.worker_id}...")
+
+        self.qdrant = QdrantClientWrapper(settings)
+        await self.qdrant.connect()
+        self.embedder_factory = EmbedderFactory(settings)
+        shard_router = await SchemaManager(self.qdrant, settings).shard_router()
+        payload_codec = PayloadCodec.from_settings(settings)
+
+        self.nats_client = NatsClient(
+            config=NatsClientConfig(
+                servers=settings.nats_url,
+                client_name=f"search-indexer-{self.worker_id}",
+                pull_workers=settings.nats_pull_workers,
+                fetch_max_batch=settings.nats_fetch_max_batch,
+                ack_wait_s=settings.nats_ack_wait_s,
+                max_deliver=settings.nats_max_deliver,
+            )
+        )
+        self.nats_pubsub = NatsPubSubPublisher(settings.nats_url)
+        await self.nats_pubsub.connect()
+
+        # Disable sparse/colbert for HuggingFace API backend, as the server does
+        use_local_embeddings = settings.embedder_backend != "huggingface"
+        upsert_config = UpsertConfig.from_settings(settings)
+        turn_tiers = TurnTiers.from_settings(settings)
+        turns_indexer = TurnsIndexer(
+            qdrant_client=self.qdrant,
+            embedder_factory=self.embedder_factory,
+            config=TurnsIndexerConfig(
+                cold_collection_name=turn_tiers.cold_collection if turn_tiers.enabled else None,
+                enable_sparse=use_local_embeddings,
+                enable_colbert=use_local_embeddings,
+                enable_late_chunks=late_chunks_from_settings(settings),
+                late_chunk_tokens=settings.late_chunk_tokens,
+                late_chunk_max_tokens=settings.late_chunk_max_tokens,
+                upsert=upsert_config,
+                sessions=SessionCentroidConfig.from_settings(settings),
+            ),
+            shard_router=shard_router,
+            payload_codec=payload_codec,
+        )
+        self.consumers.append(
+            TurnFinalizedConsumer(
+                nats_client=self.nats_client,
+                indexer=turns_indexer,
+                nats_pubsub=self.nats_pubsub,
+                config=TurnFinalizedConsumerConfig(
+                    group_id=settings.nats_consumer_group,
+                    pipeline_depth=settings.indexing_pipeline_depth,
+                ),
+            )
+        )
+
+        if settings.nats_memory_consumer_enabled:
+            memory_indexer = DocumentIndexer(
+                qdrant_client=self.qdrant,
+                embedder_factory=self.embedder_factory,
+                config=IndexerConfig(
+                    collection_name="engram_memory", enable_colbert=False, upsert=upsert_config
+                ),
+                shard_router=shard_router,
+            )
+            self.consumers.append(
+                MemoryEventConsumer(
+                    nats_client=self.nats_client,
+                    indexer=memory_indexer,
+                    nats_pubsub=self.nats_pubsub,
+                    config=MemoryConsumerConfig(
+                        pipeline_depth=settings.indexing_pipeline_depth,
+                    ),
+                )
+            )
+
+        if settings.embedder_preload:
+            try:
+                await self.embedder_factory.preload_all()
+            except Exception as e:
+                logger.error(f"Failed to preload embedder models: {e}")
+
+        self._tasks = [asyncio.create_task(consumer.start()) for consumer in self.consumers]
+        logger.info(
+            f"Indexing worker {self.worker_id} started with {len(self.consumers)} consumer(s) "
+            f"(group: {settings.nats_consumer_group})"
+        )
+
+    async def run_until(self, stop: asyncio.Event) -> bool:
+        """Wait until ``stop`` is set or a consumer exits on its own.
+
+        Args:
+            stop: Event set on shutdown signals.
+
+        Returns:
+            True if stopped by request, False if a consumer exited early.
+        """
+        stop_task = asyncio.create_task(stop.wait())
+        try:
+            await asyncio.wait([stop_task, *self._tasks], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop_task.cancel()
+        if not stop.is_set():
+            logger.error(f"Indexing worker {self.worker_id}: consumer exited unexpectedly")
+            return False
+        return True
+
+    async def stop(self) -> None:
+        """Drain the consumers and close all connections."""
+        logger.info(f"Stopping indexing worker {self.worker_id}...")
+
+        for consumer in self.consumers:
+            try:
+                await consumer.stop()
+            except Exception as e:
+                logger.error(f"Error stopping consumer: {e}")
+
+        for task in self._tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+        if self.nats_pubsub is not None:
+            try:
+                await self.nats_pubsub.disconnect()
+            except Exception as e:
+                logger.error(f"Error closing NATS pub/sub publisher: {e}")
+
+        if self.nats_client is not None:
+            try:
+                await self.nats_client.close()
+            except Exception as e:
+                logger.error(f"Error closing NATS client: {e}")
+
+        if self.embedder_factory is not None:
+            try:
+                await self.embedder_factory.unload_all()
+            except Exception as e:
+                logger.error(f"Error unloading embedder models: {e}")
+
+        if self.qdrant is not None:
+            try:
+                await self.qdrant.close()
+            except Exception as e:
+                logger.error(f"Error closing Qdrant client: {e}")
+
+        logger.info(f"Indexing worker {self.worker_id} stopped")
+
+
+async def serve(settings: Settings, worker_id: int = 0) -> int:
+    """Run one indexing worker until SIGINT/SIGTERM.
+
+    Args:
+        settings: Application settings.
+        worker_id: Index of this process.
+
+    Returns:
+        Process exit code: 0 after a requested shutdown, 1 on failure.
+    """
+    worker = IndexingWorker(settings, worker_id)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await worker.start()
+        stopped = await worker.run_until(stop)
+    except Exception as e:
+        logger.error(f"Indexing worker {worker_id} failed: {e}", exc_info=True)
+        stopped = False
+    finally:
+        await worker.stop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
+    return 0 if stopped else 1
+
+
+def _worker_main(worker_id: int, metrics_port: int | None) -> None:
+    settings = get_settings()
+    configure_logging(level="DEBUG" if settings.debug else "INFO", json_format=not settings.debug)
+    if metrics_port is not None:
+        start_http_server(metrics_port + worker_id)
+    sys.exit(asyncio.run(serve(settings, worker_id)))
+
+
+def _supervise(processes: list[Any]) -> int:
+    # Stop every worker when the supervisor is signalled or any worker fails,
+    # so the orchestrator restarts the whole group
+    def terminate(*_: Any) -> None:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, terminate)
+    signal.signal(signal.SIGINT, terminate)
+
+    running = list(processes)
+    while running:
+        multiprocessing.connection.wait([p.sentinel for p in running])
+        for process in [p for p in running if not p.is_alive()]:
+            running.remove(process)
+            if process.exitcode:
+                logger.error(f"{process.name} exited with code {process.exitcode}")
+                terminate()
+
+    return 1 if any(p.exitcode for p in processes) else 0
+
+
+def run() -> None:
+    """Run the indexing workers.
+
+    This is the entry point for the 'search-indexer' command defined in pyproject.toml.
+    """
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run Engram search indexing workers")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.indexing_workers,
+        help="Worker processes (default: INDEXING_WORKERS)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Expose Prometheus metrics on this port (+ worker index)",
+    )
+    args = parser.parse_args()
+
+    if args.workers <= 1:
+        _worker_main(0, args.metrics_port)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=_worker_main, args=(i, args.metrics_port), name=f"search-indexer-{i}"
+        )
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    logger.info(f"Started {len(processes)} indexing worker processes")
+    sys.exit(_supervise(processes))
+
+
+if __name__ == "__main__":
+    run()
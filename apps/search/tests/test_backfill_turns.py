@@ -1,11 +1,47 @@
 """Tests for turn backfill script."""
 
+import re
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.config import Settings
-from src.scripts.backfill_turns import TurnsBackfiller, main
+from src.scripts.backfill_turns import BackfillCheckpoint, TurnsBackfiller, main, parse_list
+
+HEADERS = [b"turn_id", b"user_content", b"assistant_preview", b"session_id", b"org_id"]
+
+
+class FakeGraph:
+    """FalkorDB stand-in serving turns for keyset-paginated GRAPH.QUERY calls."""
+
+    def __init__(self, count: int) -> None:
+        self.rows = [
+            [f"turn-{i}".encode(), f"User {i}".encode(), b"Answer", b"session-1", b"org-123"]
+            for i in range(count)
+        ]
+        self.queries: list[str] = []
+        self.after_ids: list[str] = []
+        self.limits: list[int] = []
+
+    async def execute_command(self, command: str, graph: str, query: str) -> list:
+        self.queries.append(query)
+        after_id = re.search(r'after_id="([^"]*)"', query).group(1)
+        limit = int(re.search(r"LIMIT (\d+)$", query).group(1))
+        self.after_ids.append(after_id)
+        self.limits.append(limit)
+        rows = [row for row in self.rows if row[0].decode() > after_id][:limit]
+        return [HEADERS, rows, [b"Stats"]]
+
+    async def close(self) -> None:
+        pass
+
+
+def _fake_indexer() -> MagicMock:
+    indexer = MagicMock()
+    indexer.embed_documents = AsyncMock(side_effect=lambda docs: [MagicMock() for _ in docs])
+    indexer.upsert_points = AsyncMock()
+    return indexer
 
 
 class TestTurnsBackfiller:
@@ -552,59 +588,116 @@ class TestTurnsBackfillerEdgeCases:
         assert indexed == 0  # Dry run doesn't index
 
     @pytest.mark.asyncio
-    async def test_backfill_with_batching(self, mock_settings: Settings) -> None:
-        """Test backfill indexes in batches."""
-        backfiller = TurnsBackfiller(settings=mock_settings, batch_size=2, dry_run=False)
-
-        # Create multiple valid turns
-        turns_data = []
-        for i in range(5):
-            turns_data.append(
-                [
-                    f"turn-{i}".encode(),
-                    f"User {i}".encode(),
-                    f"Assistant {i}".encode(),
-                    b"session-1",
-                    b"org-123",
-                ]
-            )
+    async def test_backfill_streams_pages_in_batches(self, mock_settings: Settings) -> None:
+        """Test turns are read with keyset pagination and indexed batch by batch."""
+        graph = FakeGraph(5)
+        indexer = _fake_indexer()
+        backfiller = TurnsBackfiller(settings=mock_settings, batch_size=2, page_size=2)
+        backfiller._redis = graph
+        backfiller._indexer = indexer
 
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock()
-        mock_redis.execute_command = AsyncMock(
-            return_value=[
-                [b"turn_id", b"user_content", b"assistant_preview", b"session_id", b"org_id"],
-                turns_data,
-                [b"Stats"],
-            ]
+        total, indexed = await backfiller.backfill()
+
+        assert (total, indexed) == (5, 5)
+        assert graph.after_ids == ["", "turn-1", "turn-3"]
+        assert graph.limits == [2, 2, 2]
+        assert indexer.embed_documents.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_backfill_resumes_from_checkpoint(
+        self, mock_settings: Settings, tmp_path: Path
+    ) -> None:
+        """Test an interrupted run resumes after the last checkpointed turn."""
+        checkpoint_path = tmp_path / "backfill.json"
+        graph = FakeGraph(5)
+
+        first = TurnsBackfiller(
+            settings=mock_settings, batch_size=2, page_size=2, checkpoint_path=checkpoint_path
+        )
+        first._redis = graph
+        first._indexer = _fake_indexer()
+        assert await first.backfill(limit=3) == (3, 3)
+        assert BackfillCheckpoint.load(checkpoint_path) == BackfillCheckpoint(
+            after_id="turn-2", scanned=3, indexed=3
         )
-        mock_redis.close = AsyncMock()
 
-        mock_qdrant = MagicMock()
-        mock_qdrant.connect = AsyncMock()
+        second = TurnsBackfiller(
+            settings=mock_settings, batch_size=2, page_size=2, checkpoint_path=checkpoint_path
+        )
+        second._redis = graph
+        indexer = _fake_indexer()
+        second._indexer = indexer
+        assert await second.backfill() == (2, 2)
 
-        mock_embedders = MagicMock()
+        indexed_ids = [
+            doc.id for call in indexer.embed_documents.call_args_list for doc in call[0][0]
+        ]
+        assert indexed_ids == ["turn-3", "turn-4"]
+        assert BackfillCheckpoint.load(checkpoint_path).after_id == "turn-4"
 
-        mock_indexer = MagicMock()
-        mock_indexer.index_documents = AsyncMock(return_value=2)  # Return batch size
+    @pytest.mark.asyncio
+    async def test_failed_batch_holds_checkpoint(
+        self, mock_settings: Settings, tmp_path: Path
+    ) -> None:
+        """Test the checkpoint stops before a failed batch so a rerun retries it."""
+        checkpoint_path = tmp_path / "backfill.json"
+        indexer = _fake_indexer()
+        indexer.upsert_points = AsyncMock(side_effect=[None, RuntimeError("qdrant down"), None])
+        backfiller = TurnsBackfiller(
+            settings=mock_settings, batch_size=2, page_size=10, checkpoint_path=checkpoint_path
+        )
+        backfiller._redis = FakeGraph(6)
+        backfiller._indexer = indexer
 
-        with (
-            patch("src.scripts.backfill_turns.redis.from_url", return_value=mock_redis),
-            patch(
-                "src.scripts.backfill_turns.QdrantClientWrapper",
-                return_value=mock_qdrant,
-            ),
-            patch("src.scripts.backfill_turns.EmbedderFactory", return_value=mock_embedders),
-            patch("src.scripts.backfill_turns.TurnsIndexer", return_value=mock_indexer),
-        ):
-            await backfiller.connect()
-            total, indexed = await backfiller.backfill()
-            await backfiller.disconnect()
+        total, indexed = await backfiller.backfill()
+
+        assert (total, indexed) == (6, 4)
+        assert BackfillCheckpoint.load(checkpoint_path).after_id == "turn-1"
 
-        assert total == 5
-        assert indexed == 6  # 3 batches: 2 + 2 + 2 (last batch returns 2 even though only 1 doc)
-        # index_documents should be called 3 times (ceiling of 5/2)
-        assert mock_indexer.index_documents.call_count == 3
+    @pytest.mark.asyncio
+    async def test_query_turns_keyset_parameters(self, mock_settings: Settings) -> None:
+        """Test pages are selected by turn id and optionally by org."""
+        graph = FakeGraph(0)
+        backfiller = TurnsBackfiller(settings=mock_settings, org_id="org-9")
+        backfiller._redis = graph
+
+        await backfiller.query_turns(limit=50, after_id="turn-7")
+
+        query = graph.queries[0]
+        assert query.startswith('CYPHER after_id="turn-7" org_id="org-9" ')
+        assert "t.id > $after_id AND s.org_id = $org_id" in query
+        assert "ORDER BY t.id" in query
+        assert query.endswith("LIMIT 50")
+
+    @pytest.mark.asyncio
+    async def test_dry_run_streams_without_indexing(self, mock_settings: Settings) -> None:
+        """Test dry runs read every page without an indexer."""
+        graph = FakeGraph(5)
+        backfiller = TurnsBackfiller(settings=mock_settings, dry_run=True, page_size=2)
+        backfiller._redis = graph
+
+        assert await backfiller.backfill() == (5, 0)
+        assert graph.after_ids == ["", "turn-1", "turn-3"]
+
+
+class TestParseList:
+    """Tests for parse_list."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (["a.ts"], ["a.ts"]),
+            ('["a.ts", "b.ts"]', ["a.ts", "b.ts"]),
+            ("['a.ts', 'b.ts']", ["a.ts", "b.ts"]),
+            ("[src/a.ts, src/b.ts]", ["src/a.ts", "src/b.ts"]),
+            ("[]", []),
+            ("not a list", []),
+            (None, []),
+        ],
+    )
+    def test_parse_list(self, value: object, expected: list[str]) -> None:
+        """Test list properties in their different GRAPH.QUERY forms."""
+        assert parse_list(value) == expected
 
 
 class TestMainFunction:
@@ -693,7 +786,7 @@ class TestMainFunction:
         mock_redis.close.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_main_partial_success(self) -> None:
+    async def test_main_partial_success(self, tmp_path: Path) -> None:
         """Test main function with partial indexing success."""
         mock_redis = AsyncMock()
         mock_redis.ping = AsyncMock()
@@ -725,7 +818,7 @@ class TestMainFunction:
             ),
             patch("src.scripts.backfill_turns.EmbedderFactory", return_value=mock_embedders),
             patch("src.scripts.backfill_turns.TurnsIndexer", return_value=mock_indexer),
-            patch("sys.argv", ["backfill_turns.py"]),
+            patch("sys.argv", ["backfill_turns.py", f"--checkpoint={tmp_path / 'cp.json'}"]),
         ):
             exit_code = await main()
 
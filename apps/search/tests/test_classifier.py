@@ -26,12 +26,26 @@ class TestQueryClassifier:
         assert result["strategy"] == SearchStrategy.SPARSE
         assert result["alpha"] == 0.1
 
-    def test_classify_code_syntax_as_hybrid_sparse(self, classifier: QueryClassifier) -> None:
-        """Test that code-like queries are classified as hybrid (lean sparse)."""
-        code_queries = [
+    def test_classify_bare_identifiers_as_sparse_only(self, classifier: QueryClassifier) -> None:
+        """Test identifier-only queries get an alpha that skips the dense branch."""
+        identifier_queries = [
             "findUser(id)",
             "user.getName()",
             "obj.method",  # property access pattern
+            "src/api/routes.py",
+            "ECONNREFUSED",
+        ]
+
+        for query in identifier_queries:
+            result = classifier.classify(query)
+            assert result["strategy"] == SearchStrategy.HYBRID
+            assert result["alpha"] == 0.1
+
+    def test_classify_code_syntax_as_hybrid_sparse(self, classifier: QueryClassifier) -> None:
+        """Test that code-like queries with prose are classified as hybrid (lean sparse)."""
+        code_queries = [
+            "why does findUser(id) return None",
+            "user.getName() is empty after login",
         ]
 
         for query in code_queries:
@@ -39,6 +53,25 @@ class TestQueryClassifier:
             assert result["strategy"] == SearchStrategy.HYBRID
             assert result["alpha"] == 0.3
 
+    def test_classify_long_question_as_dense_only(self, classifier: QueryClassifier) -> None:
+        """Test long plain-word questions get an alpha that skips the sparse branch."""
+        result = classifier.classify(
+            "how should I structure retries for flaky network calls in general?"
+        )
+
+        assert result["strategy"] == SearchStrategy.HYBRID
+        assert result["alpha"] == 0.9
+
+    def test_classify_long_question_with_names_keeps_sparse(
+        self, classifier: QueryClassifier
+    ) -> None:
+        """Test names and identifiers keep long questions on both branches."""
+        for query in [
+            "How does the Qdrant client handle timeouts when the server is down?",
+            "what happens to retries when the worker hits error 503 during indexing?",
+        ]:
+            assert classifier.classify(query)["alpha"] == 0.7
+
     def test_classify_natural_language_as_hybrid_dense(self, classifier: QueryClassifier) -> None:
         """Test that natural language queries are hybrid (lean dense)."""
         result = classifier.classify("How do I implement authentication?")
@@ -4,10 +4,13 @@ Note: Full integration tests require loading PyLate models which is slow.
 These tests focus on the interface and edge cases that can be tested without model loading.
 """
 
+import asyncio
+
 import numpy as np
 import pytest
 
 from src.embedders.colbert import ColBERTEmbedder
+from src.embedders.scheduler import EmbeddingLane
 
 
 class TestColBERTEmbedder:
@@ -245,3 +248,35 @@ class TestColBERTEmbedder:
         results = embedder.embed_document_batch(["doc1", "doc2"])
 
         assert len(results) == 2
+
+    async def test_embed_document_batch_async_uses_lane(self) -> None:
+        """Test a queued bulk document batch yields to a query-lane job."""
+        from unittest.mock import MagicMock
+
+        embedder = ColBERTEmbedder(model_name="test-model")
+        embedder._model = MagicMock()
+        embedder._model.encode.side_effect = lambda docs, is_query: [np.array([[0.1]])] * len(docs)
+        embedder._model_loaded = True
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def hold() -> None:
+            await release.wait()
+
+        async def query() -> None:
+            order.append("query")
+
+        async def bulk() -> None:
+            await embedder.embed_document_batch_async(["doc"] * 4, lane=EmbeddingLane.BULK)
+            order.append("bulk")
+
+        holder = asyncio.create_task(embedder.scheduler.run(EmbeddingLane.LIVE, hold))
+        await asyncio.sleep(0)
+        bulk_task = asyncio.create_task(bulk())
+        await asyncio.sleep(0)
+        query_task = asyncio.create_task(embedder.scheduler.run(EmbeddingLane.QUERY, query))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, bulk_task, query_task)
+
+        assert order == ["query", "bulk"]
@@ -0,0 +1,99 @@
+"""Tests for payload field compression."""
+
+import pytest
+
+from src.services.compression import ENCODED_KEY, ZSTD_AVAILABLE, PayloadCodec, train_dictionary
+
+requires_zstd = pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+
+
+def _turn_payload(index: int) -> dict:
+    content = " ".join(
+        f"line {index} of the assistant answer about module_{i % 7}" for i in range(60)
+    )
+    return {
+        "content": content,
+        "org_id": "org-1",
+        "session_id": "session-1",
+        "tool_calls": [{"name": "Read", "args": {"path": f"src/file_{i}.py"}} for i in range(40)],
+    }
+
+
+class TestPayloadCodec:
+    """Tests for PayloadCodec."""
+
+    def test_filterable_fields_rejected(self) -> None:
+        """Test payload-indexed fields cannot be configured for compression."""
+        with pytest.raises(ValueError, match="org_id"):
+            PayloadCodec(fields=("content", "org_id"))
+
+    def test_disabled_passes_through(self) -> None:
+        """Test a disabled codec stores payloads unchanged."""
+        payload = _turn_payload(0)
+        assert PayloadCodec().encode(payload) is payload
+
+    def test_decode_plain_payload(self) -> None:
+        """Test payloads written without compression decode unchanged."""
+        payload = _turn_payload(0)
+        codec = PayloadCodec()
+
+        assert codec.decode(payload) is payload
+        assert codec.decode(None) == {}
+
+    @pytest.mark.skipif(ZSTD_AVAILABLE, reason="zstandard installed")
+    def test_enabled_without_zstd_disables(self) -> None:
+        """Test enabling compression without zstandard falls back to plain storage."""
+        codec = PayloadCodec(enabled=True)
+        payload = _turn_payload(0)
+
+        assert codec.enabled is False
+        assert codec.encode(payload) is payload
+
+    @requires_zstd
+    def test_round_trip(self) -> None:
+        """Test large fields are compressed and restored, small fields stay plain."""
+        codec = PayloadCodec(enabled=True, min_bytes=64)
+        payload = _turn_payload(0)
+
+        stored = codec.encode(payload)
+
+        assert ENCODED_KEY in stored["content"]
+        assert ENCODED_KEY in stored["tool_calls"]
+        assert stored["org_id"] == "org-1"
+        assert codec.decode(stored) == payload
+
+    @requires_zstd
+    def test_small_values_stay_plain(self) -> None:
+        """Test values below min_bytes are not compressed."""
+        codec = PayloadCodec(enabled=True, min_bytes=1024)
+        payload = {"content": "short", "org_id": "org-1"}
+
+        assert codec.encode(payload) == payload
+
+    @requires_zstd
+    def test_round_trip_with_dictionary(self) -> None:
+        """Test a trained dictionary is used for writes and reads."""
+        samples = [_turn_payload(i)["content"].encode() for i in range(200)]
+        codec = PayloadCodec(
+            enabled=True, min_bytes=64, dictionaries=[train_dictionary(samples, 4096)]
+        )
+        payload = _turn_payload(1000)
+
+        stored = codec.encode(payload)
+
+        assert stored["content"]["dict_id"] == codec.dict_id != 0
+        assert codec.decode(stored) == payload
+
+    @requires_zstd
+    def test_missing_dictionary_degrades(self) -> None:
+        """Test fields compressed with an unknown dictionary decode to empty content."""
+        samples = [_turn_payload(i)["content"].encode() for i in range(200)]
+        writer = PayloadCodec(
+            enabled=True, min_bytes=64, dictionaries=[train_dictionary(samples, 4096)]
+        )
+        stored = writer.encode(_turn_payload(1000))
+
+        decoded = PayloadCodec().decode(stored)
+
+        assert decoded["content"] == ""
+        assert decoded["org_id"] == "org-1"
@@ -60,6 +60,22 @@ class TestSettings:
                 embedder_backend="invalid",
             )
 
+    def test_service_mode_invalid(self) -> None:
+        """Test that an unknown service mode raises an error."""
+        with pytest.raises(ValueError, match="Service mode must be"):
+            Settings(
+                _env_file=None,
+                service_mode="indexer",
+            )
+
+    def test_hybrid_fusion_invalid(self) -> None:
+        """Test that an unknown hybrid fusion method fails at startup."""
+        with pytest.raises(ValueError, match="Hybrid fusion must be"):
+            Settings(
+                _env_file=None,
+                search_hybrid_fusion="rfr",
+            )
+
     def test_reranker_backend_invalid(self) -> None:
         """Test that invalid reranker backend raises an error."""
         with pytest.raises(ValueError, match="Backend must be"):
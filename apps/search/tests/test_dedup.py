@@ -0,0 +1,156 @@
+"""Tests for content-hash based indexing deduplication."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from qdrant_client.http import models
+
+from src.indexing.dedup import (
+    CONTENT_HASH_FIELD,
+    PAYLOAD_HASH_FIELD,
+    DedupPlan,
+    content_hash,
+    fingerprint_payload,
+    overwrite_payloads,
+    payload_hash,
+    plan_batch,
+)
+from src.services.sharding import ShardRouter
+
+POINT_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def _payload(content: str = "hello", **extra: object) -> dict:
+    return fingerprint_payload(
+        {"content": content, "org_id": "org-1", **extra}, content_hash(content, ["model-a"])
+    )
+
+
+def _client(records: list[models.Record]) -> MagicMock:
+    client = MagicMock()
+    client.retrieve = AsyncMock(return_value=records)
+    client.batch_update_points = AsyncMock()
+    return client
+
+
+class TestFingerprints:
+    """Tests for the hash helpers."""
+
+    def test_content_hash_covers_models(self) -> None:
+        """Test the content hash changes with the text and with the models."""
+        base = content_hash("hello", ["model-a", "model-b"])
+
+        assert content_hash("hello", ["model-a", "model-b"]) == base
+        assert content_hash("hello!", ["model-a", "model-b"]) != base
+        assert content_hash("hello", ["model-a", "model-c"]) != base
+
+    def test_payload_hash_ignores_key_order(self) -> None:
+        """Test payload hashes are independent of dict ordering."""
+        assert payload_hash({"a": 1, "b": [1, 2]}) == payload_hash({"b": [1, 2], "a": 1})
+        assert payload_hash({"a": 1}) != payload_hash({"a": 2})
+
+    def test_fingerprint_payload(self) -> None:
+        """Test both hash fields are added without changing the input."""
+        payload = {"content": "hello", "org_id": "org-1"}
+
+        stored = fingerprint_payload(payload, "abc")
+
+        assert stored[CONTENT_HASH_FIELD] == "abc"
+        assert stored[PAYLOAD_HASH_FIELD] == payload_hash(payload)
+        assert CONTENT_HASH_FIELD not in payload
+
+
+class TestPlanBatch:
+    """Tests for plan_batch."""
+
+    async def test_classifies_documents(self) -> None:
+        """Test new/changed, payload-only and unchanged documents are told apart."""
+        unchanged = _payload("same")
+        retagged = _payload("same", tags=["new"])
+        changed = _payload("edited")
+        client = _client(
+            [
+                models.Record(id="a", payload=_payload("same")),
+                models.Record(id="b", payload=_payload("same")),
+                models.Record(id="c", payload=_payload("original")),
+            ]
+        )
+
+        plan = await plan_batch(
+            client,
+            "turns",
+            ShardRouter(),
+            ["a", "b", "c", "d"],
+            [unchanged, retagged, changed, _payload("new")],
+        )
+
+        assert plan.skip == [0]
+        assert plan.update_payload == [1]
+        assert plan.embed == [2, 3]
+        assert plan.skip_ratio == 0.5
+        kwargs = client.retrieve.call_args.kwargs
+        assert kwargs["ids"] == ["a", "b", "c", "d"]
+        assert kwargs["with_vectors"] is False
+        assert kwargs["with_payload"].include == [CONTENT_HASH_FIELD, PAYLOAD_HASH_FIELD]
+
+    async def test_repeated_id_in_batch(self) -> None:
+        """Test a redelivered document later in the same batch is skipped."""
+        payload = _payload()
+
+        plan = await plan_batch(
+            _client([]), "turns", ShardRouter(), [POINT_ID, POINT_ID.upper()], [payload, payload]
+        )
+
+        assert plan.embed == [0]
+        assert plan.skip == [1]
+
+    async def test_lookup_failure_embeds_all(self) -> None:
+        """Test a failed lookup falls back to embedding the whole batch."""
+        client = MagicMock()
+        client.retrieve = AsyncMock(side_effect=RuntimeError("qdrant down"))
+
+        plan = await plan_batch(client, "turns", ShardRouter(), ["a", "b"], [_payload()] * 2)
+
+        assert plan.embed == [0, 1]
+        assert plan.skip_ratio == 0.0
+
+    async def test_lookups_routed_by_shard_key(self) -> None:
+        """Test one retrieve per shard key when sharding is enabled."""
+        client = _client([])
+        router = ShardRouter(enabled=True, dedicated_orgs=["acme"])
+        payloads = [_payload(), {**_payload(), "org_id": "acme"}, _payload()]
+
+        await plan_batch(client, "turns", router, ["a", "b", "c"], payloads)
+
+        calls = {
+            call.kwargs["shard_key_selector"]: call.kwargs["ids"]
+            for call in client.retrieve.call_args_list
+        }
+        assert calls == {"default": ["a", "c"], "acme": ["b"]}
+
+    def test_empty_plan_ratio(self) -> None:
+        """Test an empty plan reports no skips."""
+        assert DedupPlan().skip_ratio == 0.0
+
+
+class TestOverwritePayloads:
+    """Tests for overwrite_payloads."""
+
+    async def test_single_batch_request(self) -> None:
+        """Test all payload updates go out in one batch_update_points call."""
+        client = _client([])
+        router = ShardRouter(enabled=True)
+
+        await overwrite_payloads(client, "turns", router, ["a", "b"], [_payload(), _payload("x")])
+
+        client.batch_update_points.assert_called_once()
+        operations = client.batch_update_points.call_args.kwargs["update_operations"]
+        assert [op.overwrite_payload.points for op in operations] == [["a"], ["b"]]
+        assert operations[0].overwrite_payload.shard_key == "default"
+
+    async def test_nothing_to_update(self) -> None:
+        """Test no request is made without updates."""
+        client = _client([])
+
+        await overwrite_payloads(client, "turns", ShardRouter(), [], [])
+
+        client.batch_update_points.assert_not_called()
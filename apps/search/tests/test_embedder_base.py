@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.embedders.base import TORCH_AVAILABLE, BaseEmbedder
+from src.embedders.scheduler import EmbeddingLane
 
 
 class ConcreteEmbedder(BaseEmbedder):
@@ -272,6 +273,22 @@ class TestBaseEmbedder:
         results = await embedder.embed_batch(["text1", "text2"])
         assert len(results) == 2
 
+    @pytest.mark.asyncio
+    async def test_embed_batch_uses_lane(self) -> None:
+        """Test batches go through the scheduler in the caller's lane, costed by size."""
+        embedder = ConcreteEmbedder(model_name="test")
+        await embedder.load()
+        run = embedder.scheduler.run
+
+        with patch.object(embedder.scheduler, "run", side_effect=run) as mock_run:
+            await embedder.embed_batch(["a", "b", "c"], is_query=False, lane="bulk")
+            await embedder.embed("query")
+
+        assert mock_run.call_args_list[0].args[0] == "bulk"
+        assert mock_run.call_args_list[0].kwargs["cost"] == 3
+        assert mock_run.call_args_list[1].args[0] == EmbeddingLane.QUERY
+        assert embedder.scheduler.name == "concrete"
+
 
 class TestBaseEmbedderWithoutTorch:
     """Tests for when torch is not available."""
@@ -33,6 +33,7 @@ class TestEmbedderFactory:
         settings.embedder_device = "cpu"
         settings.embedder_batch_size = 32
         settings.embedder_cache_size = 1000
+        settings.embedder_lane_weights = {"query": 8.0, "live": 4.0, "bulk": 1.0}
         settings.hf_api_token = "test-token"
         return settings
 
@@ -50,6 +51,17 @@ class TestEmbedderFactory:
         assert "sparse" in factory._locks
         assert "colbert" in factory._locks
 
+    def test_model_versions(self, factory: EmbedderFactory, mock_settings: MagicMock) -> None:
+        """Test model versions follow the backend's sparse model."""
+        assert factory.model_versions() == {
+            "text": "BAAI/bge-small-en-v1.5",
+            "sparse": "prithvida/Splade_PP_en_v1",
+            "colbert": "answerdotai/ModernBERT-base",
+        }
+
+        mock_settings.embedder_backend = "huggingface"
+        assert factory.model_versions()["sparse"] == "Qdrant/bm25"
+
     def test_len_empty(self, factory: EmbedderFactory) -> None:
         """Test __len__ with no embedders."""
         assert len(factory) == 0
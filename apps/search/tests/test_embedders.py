@@ -1,10 +1,14 @@
 """Tests for embedder implementations."""
 
+import asyncio
+import threading
+
 import numpy as np
 import pytest
 
 from src.config import Settings
 from src.embedders import EmbedderFactory
+from src.embedders.scheduler import EmbeddingLane
 
 # Skip entire module if optional ML dependencies are not installed
 pytest.importorskip("sentence_transformers", reason="sentence-transformers not installed")
@@ -191,6 +195,38 @@ class TestSparseEmbedder:
         assert len(results) == 2
         assert all(isinstance(r, dict) for r in results)
 
+    async def test_query_overtakes_queued_bulk_batch(self) -> None:
+        """Test a query-lane sparse call runs before a queued bulk batch."""
+        embedder = SparseEmbedder(model_name="naver/splade-cocondenser-ensembledistil")
+        embedder._model_loaded = True
+        running = threading.Event()
+        release = threading.Event()
+        order: list[str] = []
+
+        def compute(text: str) -> dict[int, float]:
+            if text == "running":
+                running.set()
+                release.wait(timeout=5)
+            order.append(text)
+            return {1: 1.0}
+
+        embedder._compute_sparse_vector = compute  # type: ignore[method-assign]
+
+        first = asyncio.create_task(
+            embedder.embed_sparse_batch_async(["running"], lane=EmbeddingLane.BULK)
+        )
+        await asyncio.to_thread(running.wait, 5)
+        bulk = asyncio.create_task(
+            embedder.embed_sparse_batch_async(["bulk"] * 4, lane=EmbeddingLane.BULK)
+        )
+        await asyncio.sleep(0)
+        query = asyncio.create_task(embedder.embed_sparse_async("query", lane=EmbeddingLane.QUERY))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, bulk, query)
+
+        assert order == ["running", "query", "bulk", "bulk", "bulk", "bulk"]
+
 
 @pytest.mark.skip(reason="ragatouille has langchain import compatibility issue with langchain>=1.0")
 class TestColBERTEmbedder:
@@ -0,0 +1,138 @@
+"""Tests for the embedding priority scheduler."""
+
+import asyncio
+
+import pytest
+
+from src.embedders.scheduler import (
+    EmbeddingLane,
+    EmbeddingScheduler,
+    default_lane,
+)
+from src.utils.metrics import EMBEDDING_QUEUE_DEPTH
+
+
+async def _hold(scheduler: EmbeddingScheduler) -> tuple[asyncio.Event, asyncio.Task[None]]:
+    """Occupy the scheduler's only slot until the returned event is set."""
+    release = asyncio.Event()
+    task = asyncio.create_task(scheduler.run(EmbeddingLane.QUERY, release.wait))
+    await asyncio.sleep(0)
+    return release, task
+
+
+def _submit(
+    scheduler: EmbeddingScheduler, lane: EmbeddingLane, label: str, order: list[str], cost: int = 1
+) -> asyncio.Task[None]:
+    async def job() -> None:
+        order.append(label)
+
+    return asyncio.create_task(scheduler.run(lane, job, cost=cost))
+
+
+class TestEmbeddingScheduler:
+    """Tests for EmbeddingScheduler."""
+
+    async def test_runs_immediately_when_idle(self) -> None:
+        """Test a job runs without queueing when a slot is free."""
+        scheduler = EmbeddingScheduler("test")
+
+        async def job() -> str:
+            return "done"
+
+        assert await scheduler.run(EmbeddingLane.QUERY, job) == "done"
+
+    async def test_query_overtakes_queued_bulk(self) -> None:
+        """Test a query submitted behind a bulk backlog runs next."""
+        scheduler = EmbeddingScheduler("test")
+        release, holder = await _hold(scheduler)
+        order: list[str] = []
+        tasks = [
+            _submit(scheduler, EmbeddingLane.BULK, f"bulk-{i}", order, cost=32) for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        tasks.append(_submit(scheduler, EmbeddingLane.QUERY, "query", order))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holder, *tasks)
+
+        assert order[0] == "query"
+
+    async def test_weighted_share(self) -> None:
+        """Test busy lanes share the embedder in proportion to their weights."""
+        scheduler = EmbeddingScheduler("test", weights={"live": 4, "bulk": 1})
+        release, holder = await _hold(scheduler)
+        order: list[str] = []
+        tasks = [_submit(scheduler, EmbeddingLane.BULK, "bulk", order) for _ in range(10)]
+        tasks += [_submit(scheduler, EmbeddingLane.LIVE, "live", order) for _ in range(10)]
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holder, *tasks)
+
+        assert order[:10].count("live") == 8
+
+    async def test_idle_lane_banks_no_credit(self) -> None:
+        """Test a lane that was idle does not get a burst of catch-up priority."""
+        scheduler = EmbeddingScheduler("test", weights={"live": 1, "bulk": 1})
+        order: list[str] = []
+        for _ in range(20):
+            await _submit(scheduler, EmbeddingLane.BULK, "warmup", order)
+        release, holder = await _hold(scheduler)
+        order.clear()
+        tasks = [_submit(scheduler, EmbeddingLane.LIVE, "live", order) for _ in range(4)]
+        tasks += [_submit(scheduler, EmbeddingLane.BULK, "bulk", order) for _ in range(4)]
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holder, *tasks)
+
+        # Without the reset, live would run all four first
+        assert "bulk" in order[:3]
+
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        """Test cancelling a queued job frees its place and updates the depth gauge."""
+        scheduler = EmbeddingScheduler("test-cancel")
+        release, holder = await _hold(scheduler)
+        waiter = _submit(scheduler, EmbeddingLane.LIVE, "live", [])
+        await asyncio.sleep(0)
+        gauge = EMBEDDING_QUEUE_DEPTH.labels(embedder_type="test-cancel", lane="live")
+        assert scheduler.queue_depth("live") == 1
+        assert gauge._value.get() == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert scheduler.queue_depth("live") == 0
+        assert gauge._value.get() == 0
+        release.set()
+        await holder
+
+    async def test_concurrency(self) -> None:
+        """Test up to ``concurrency`` jobs run at once."""
+        scheduler = EmbeddingScheduler("test", concurrency=2)
+        running = peak = 0
+
+        async def job() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(scheduler.run(EmbeddingLane.LIVE, job) for _ in range(5)))
+
+        assert peak == 2
+
+    def test_invalid_weights(self) -> None:
+        """Test unknown lanes and non-positive weights are rejected."""
+        with pytest.raises(ValueError):
+            EmbeddingScheduler("test", weights={"batch": 1})
+        with pytest.raises(ValueError, match="positive"):
+            EmbeddingScheduler("test", weights={"bulk": 0})
+
+    def test_default_lane(self) -> None:
+        """Test queries default to the query lane and documents to live."""
+        assert default_lane(is_query=True) == EmbeddingLane.QUERY
+        assert default_lane(is_query=False) == EmbeddingLane.LIVE
@@ -5,10 +5,13 @@ import contextlib
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from qdrant_client.http import models
 
+from src.embedders.scheduler import EmbeddingLane
 from src.indexing.batch import BatchConfig, BatchQueue, Document
 from src.indexing.consumer import MemoryConsumerConfig, MemoryEventConsumer
 from src.indexing.indexer import DocumentIndexer, IndexerConfig
+from src.indexing.pipeline import IndexingPipeline
 
 
 class TestBatchConfig:
@@ -247,6 +250,68 @@ class TestBatchQueue:
 
         await queue.stop()
 
+    async def test_free_capacity(self, config: BatchConfig, mock_callback: MagicMock) -> None:
+        """Test free_capacity counts down as documents are queued."""
+        queue = BatchQueue(config, mock_callback)
+
+        await queue.add(Document(id="1", content="test", org_id="org-123"))
+
+        assert queue.free_capacity == config.max_queue_size - 1
+
+    @staticmethod
+    def _delivery() -> MagicMock:
+        delivery = MagicMock()
+        delivery.ack = AsyncMock()
+        delivery.nak = AsyncMock()
+        return delivery
+
+    async def test_acks_after_successful_flush(self, config: BatchConfig) -> None:
+        """Test deliveries are acked only once their batch is indexed."""
+        callback = AsyncMock(return_value=2)
+        queue = BatchQueue(config, callback)
+        deliveries = [self._delivery(), self._delivery()]
+
+        for i, delivery in enumerate(deliveries):
+            await queue.add(Document(id=str(i), content="test", org_id="org-123"), delivery)
+        deliveries[0].ack.assert_not_called()
+
+        await queue._flush()
+
+        for delivery in deliveries:
+            delivery.ack.assert_awaited_once()
+            delivery.nak.assert_not_called()
+
+    @pytest.mark.parametrize("outcome", [0, Exception("Flush error")])
+    async def test_naks_after_failed_flush(
+        self, config: BatchConfig, outcome: int | Exception
+    ) -> None:
+        """Test deliveries are nak'ed when indexing fails or raises."""
+        callback = AsyncMock(side_effect=[outcome])
+        queue = BatchQueue(config, callback)
+        delivery = self._delivery()
+
+        await queue.add(Document(id="1", content="test", org_id="org-123"), delivery)
+        await queue._flush()
+
+        delivery.nak.assert_awaited_once()
+        delivery.ack.assert_not_called()
+
+    async def test_settles_when_pipelined_write_completes(self, config: BatchConfig) -> None:
+        """Test a callback returning a future defers the ack until it resolves."""
+        written: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        queue = BatchQueue(config, AsyncMock(return_value=written))
+        delivery = self._delivery()
+
+        await queue.add(Document(id="1", content="test", org_id="org-123"), delivery)
+        await queue._flush()
+        await asyncio.sleep(0)
+        delivery.ack.assert_not_called()
+
+        written.set_result(1)
+        await queue.wait_settled()
+
+        delivery.ack.assert_awaited_once()
+
     async def test_flush_loop_handles_exception(self, config: BatchConfig) -> None:
         """Test that flush loop handles exceptions gracefully."""
         call_count = 0
@@ -746,13 +811,15 @@ class TestDocumentIndexer:
         # Sparse embedder
         sparse_embedder = MagicMock()
         sparse_embedder.load = AsyncMock()
-        sparse_embedder.embed_sparse_batch = MagicMock(return_value=[{1: 0.5, 2: 0.3}])
+        sparse_embedder.embed_sparse_batch_async = AsyncMock(return_value=[{1: 0.5, 2: 0.3}])
         factory.get_sparse_embedder = AsyncMock(return_value=sparse_embedder)
 
         # ColBERT embedder
         colbert_embedder = MagicMock()
         colbert_embedder.load = AsyncMock()
-        colbert_embedder.embed_document_batch = MagicMock(return_value=[[[0.1, 0.2], [0.3, 0.4]]])
+        colbert_embedder.embed_document_batch_async = AsyncMock(
+            return_value=[[[0.1, 0.2], [0.3, 0.4]]]
+        )
         factory.get_colbert_embedder = AsyncMock(return_value=colbert_embedder)
 
         return factory
@@ -815,6 +882,33 @@ class TestDocumentIndexer:
         assert result == 1
         mock_qdrant.client.upsert.assert_called_once()
 
+    async def test_index_documents_skips_unchanged(
+        self,
+        mock_qdrant: MagicMock,
+        mock_embedder_factory: MagicMock,
+        config: IndexerConfig,
+    ) -> None:
+        """Test documents with a matching stored content hash are not re-embedded."""
+        mock_embedder_factory.model_versions = MagicMock(
+            return_value={"text": "bge", "sparse": "splade", "colbert": "colbert"}
+        )
+        mock_qdrant.client.retrieve = AsyncMock(return_value=[])
+        indexer = DocumentIndexer(
+            qdrant_client=mock_qdrant,
+            embedder_factory=mock_embedder_factory,
+            config=config,
+        )
+        doc = Document(id="doc-1", content="test content", org_id="org-123")
+
+        assert await indexer.index_documents([doc]) == 1
+        stored = mock_qdrant.client.upsert.call_args.kwargs["points"][0]
+        mock_qdrant.client.retrieve = AsyncMock(
+            return_value=[models.Record(id="doc-1", payload=stored.payload)]
+        )
+
+        assert await indexer.index_documents([doc]) == 1
+        mock_qdrant.client.upsert.assert_called_once()
+
     async def test_index_documents_without_colbert(
         self,
         mock_qdrant: MagicMock,
@@ -835,6 +929,51 @@ class TestDocumentIndexer:
         # Should not call ColBERT embedder
         mock_embedder_factory.get_colbert_embedder.assert_not_called()
 
+    async def test_index_documents_encoders_use_lane(
+        self,
+        mock_qdrant: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test sparse and ColBERT batches are scheduled in the indexer's lane."""
+        indexer = DocumentIndexer(
+            qdrant_client=mock_qdrant,
+            embedder_factory=mock_embedder_factory,
+            config=IndexerConfig(embedding_lane=EmbeddingLane.BULK),
+        )
+
+        doc = Document(id="doc-1", content="test content", org_id="org-123")
+        assert await indexer.index_documents([doc]) == 1
+
+        sparse_embedder = mock_embedder_factory.get_sparse_embedder.return_value
+        sparse_embedder.embed_sparse_batch_async.assert_awaited_once_with(
+            ["test content"], lane=EmbeddingLane.BULK
+        )
+        colbert_embedder = mock_embedder_factory.get_colbert_embedder.return_value
+        colbert_embedder.embed_document_batch_async.assert_awaited_once_with(
+            ["test content"], lane=EmbeddingLane.BULK
+        )
+
+    async def test_embed_and_upsert_stages(
+        self,
+        mock_qdrant: MagicMock,
+        mock_embedder_factory: MagicMock,
+        config: IndexerConfig,
+    ) -> None:
+        """Test embed_documents builds points that upsert_points writes."""
+        indexer = DocumentIndexer(
+            qdrant_client=mock_qdrant,
+            embedder_factory=mock_embedder_factory,
+            config=config,
+        )
+
+        doc = Document(id="doc-1", content="test content", org_id="org-123")
+        points = await indexer.embed_documents([doc])
+        mock_qdrant.client.upsert.assert_not_called()
+
+        await indexer.upsert_points(points)
+
+        assert mock_qdrant.client.upsert.call_args.kwargs["points"] == points
+
     async def test_index_documents_error(
         self,
         mock_qdrant: MagicMock,
@@ -996,13 +1135,13 @@ class TestDocumentIndexer:
 
         sparse_embedder = MagicMock()
         sparse_embedder.load = AsyncMock()
-        sparse_embedder.embed_sparse_batch = MagicMock(return_value=[{1: 0.5}])
+        sparse_embedder.embed_sparse_batch_async = AsyncMock(return_value=[{1: 0.5}])
         factory.get_sparse_embedder = AsyncMock(return_value=sparse_embedder)
 
         # ColBERT returns empty embeddings
         colbert_embedder = MagicMock()
         colbert_embedder.load = AsyncMock()
-        colbert_embedder.embed_document_batch = MagicMock(return_value=[[]])
+        colbert_embedder.embed_document_batch_async = AsyncMock(return_value=[[]])
         factory.get_colbert_embedder = AsyncMock(return_value=colbert_embedder)
 
         indexer = DocumentIndexer(
@@ -1015,3 +1154,135 @@ class TestDocumentIndexer:
         result = await indexer.index_documents([doc])
 
         assert result == 1
+
+
+class TestIndexingPipeline:
+    """Tests for IndexingPipeline."""
+
+    @staticmethod
+    def _docs(*ids: str) -> list[Document]:
+        return [Document(id=i, content=f"content {i}", org_id="org-123") for i in ids]
+
+    async def test_indexes_batches_in_order(self) -> None:
+        """Test each submitted batch is embedded, then upserted, in order."""
+        upserted: list[list[str]] = []
+
+        async def embed(documents: list[Document]) -> list[str]:
+            return [doc.id for doc in documents]
+
+        async def upsert(points: list[str]) -> None:
+            upserted.append(points)
+
+        pipeline = IndexingPipeline(embed=embed, upsert=upsert)  # type: ignore[arg-type]
+        await pipeline.start()
+        first = await pipeline.submit(self._docs("a", "b"))
+        second = await pipeline.submit(self._docs("c"))
+        await pipeline.stop()
+
+        assert upserted == [["a", "b"], ["c"]]
+        assert first.result() == 2
+        assert second.result() == 1
+        assert pipeline.running is False
+
+    async def test_embedding_overlaps_upsert(self) -> None:
+        """Test the next batch is embedded while the previous one is upserted."""
+        upsert_started = asyncio.Event()
+        release_upsert = asyncio.Event()
+        embedded: list[str] = []
+
+        async def embed(documents: list[Document]) -> list[str]:
+            embedded.extend(doc.id for doc in documents)
+            return [doc.id for doc in documents]
+
+        async def upsert(points: list[str]) -> None:
+            upsert_started.set()
+            await release_upsert.wait()
+
+        pipeline = IndexingPipeline(embed=embed, upsert=upsert)  # type: ignore[arg-type]
+        await pipeline.start()
+        await pipeline.submit(self._docs("a"))
+        await upsert_started.wait()
+
+        await pipeline.submit(self._docs("b"))
+        await asyncio.sleep(0.01)
+        assert embedded == ["a", "b"]
+
+        release_upsert.set()
+        await pipeline.stop()
+
+    async def test_parallel_embed_workers(self) -> None:
+        """Test several embed workers embed batches concurrently and all get upserted."""
+        in_flight = 0
+        peak = 0
+        upserted: list[str] = []
+
+        async def embed(documents: list[Document]) -> list[str]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [doc.id for doc in documents]
+
+        async def upsert(points: list[str]) -> None:
+            upserted.extend(points)
+
+        pipeline = IndexingPipeline(embed=embed, upsert=upsert, embed_workers=3)  # type: ignore[arg-type]
+        await pipeline.start()
+        futures = [await pipeline.submit(self._docs(i)) for i in "abcde"]
+        await pipeline.stop()
+
+        assert peak == 3
+        assert sorted(upserted) == list("abcde")
+        assert [future.result() for future in futures] == [1] * 5
+
+    async def test_submit_waits_when_full(self) -> None:
+        """Test submit applies backpressure once the queues are full."""
+        release_upsert = asyncio.Event()
+
+        async def embed(documents: list[Document]) -> list[str]:
+            return []
+
+        async def upsert(points: list[str]) -> None:
+            await release_upsert.wait()
+
+        pipeline = IndexingPipeline(embed=embed, upsert=upsert, depth=1)  # type: ignore[arg-type]
+        await pipeline.start()
+        # One batch in the upsert stage, one per queue, one held by the embed worker
+        for i in range(4):
+            await asyncio.wait_for(pipeline.submit(self._docs(str(i))), timeout=1)
+
+        blocked = asyncio.create_task(pipeline.submit(self._docs("overflow")))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release_upsert.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await pipeline.stop()
+
+    async def test_failed_batch_resolves_zero(self) -> None:
+        """Test embed and upsert failures resolve to 0 without stopping the pipeline."""
+
+        async def embed(documents: list[Document]) -> list[str]:
+            if documents[0].id == "bad-embed":
+                raise RuntimeError("model error")
+            return [doc.id for doc in documents]
+
+        async def upsert(points: list[str]) -> None:
+            if points == ["bad-upsert"]:
+                raise RuntimeError("qdrant error")
+
+        pipeline = IndexingPipeline(embed=embed, upsert=upsert)  # type: ignore[arg-type]
+        await pipeline.start()
+
+        assert await pipeline.index(self._docs("bad-embed")) == 0
+        assert await pipeline.index(self._docs("bad-upsert")) == 0
+        assert await pipeline.index(self._docs("ok")) == 1
+        await pipeline.stop()
+
+    async def test_submit_requires_start(self) -> None:
+        """Test submitting to a stopped pipeline raises."""
+        pipeline = IndexingPipeline(embed=AsyncMock(), upsert=AsyncMock())
+
+        with pytest.raises(RuntimeError, match="not running"):
+            await pipeline.submit(self._docs("a"))
@@ -252,6 +252,68 @@ class TestLateChunker:
         assert boundaries[0].end_token == 5
 
 
+class TestLateChunkerLong:
+    """Tests for windowed late chunking of long texts."""
+
+    @pytest.fixture
+    def mock_model(self) -> MagicMock:
+        """Create a mock model with a 6-token window and one token per word."""
+        model = MagicMock()
+        model.device = "cpu"
+        model.max_seq_length = 6
+
+        def tokenizer_side_effect(text: str, **kwargs: object) -> dict:
+            words, offsets, pos = text.split(), [], 0
+            for word in words:
+                start = text.index(word, pos)
+                pos = start + len(word)
+                offsets.append((start, pos))
+            return {"input_ids": list(range(1, len(words) + 1)), "offset_mapping": offsets}
+
+        model.tokenizer.side_effect = tokenizer_side_effect
+        model.tokenizer.num_special_tokens_to_add.return_value = 2
+        model.tokenizer.build_inputs_with_special_tokens.side_effect = lambda ids: [
+            101,
+            *ids,
+            102,
+        ]
+        model.tokenizer.pad_token_id = 0
+
+        def forward_side_effect(inputs: dict) -> dict:
+            return {"token_embeddings": torch.randn(*inputs["input_ids"].shape, 384)}
+
+        model.forward.side_effect = forward_side_effect
+        return model
+
+    def test_windows_and_chunks(self, mock_model: MagicMock) -> None:
+        """Test chunks cover the text in order, one forward pass per window batch."""
+        chunker = LateChunker(mock_model)
+        text = "a b c d e f g h i j"
+
+        results = chunker.embed_long(text, chunk_tokens=2, window_batch_size=2)
+
+        assert [r.text for r in results] == ["a b", "c d", "e f", "g h", "i j"]
+        assert results[2].boundary.start_token == 4
+        assert results[2].boundary.end_token == 6
+        assert all(r.embedding.shape == (384,) for r in results)
+        # Windows of 4 tokens: [a-d, e-h] then [i-j]
+        assert mock_model.forward.call_count == 2
+        last_batch = mock_model.forward.call_args.args[0]
+        assert last_batch["input_ids"].tolist() == [[101, 9, 10, 102]]
+
+    def test_max_tokens(self, mock_model: MagicMock) -> None:
+        """Test tokens past max_tokens are not embedded."""
+        chunker = LateChunker(mock_model)
+
+        results = chunker.embed_long("a b c d e f g h i j", chunk_tokens=2, max_tokens=3)
+
+        assert [r.text for r in results] == ["a b", "c"]
+
+    def test_empty_text(self, mock_model: MagicMock) -> None:
+        """Test empty text returns no chunks."""
+        assert LateChunker(mock_model).embed_long("") == []
+
+
 class TestLateChunkerIntegration:
     """Integration tests for LateChunker with more realistic scenarios."""
 
@@ -6,6 +6,7 @@ import pytest
 from fastapi import FastAPI
 
 from src.main import create_app, lifespan
+from src.services.sharding import ShardRouter
 
 
 class TestCreateApp:
@@ -74,6 +75,7 @@ class TestLifespan:
         ):
             mock_manager = MagicMock()
             mock_manager.ensure_collection = AsyncMock(return_value=False)
+            mock_manager.shard_router = AsyncMock(return_value=ShardRouter())
             mock_cls.return_value = mock_manager
             mock_schema.return_value = MagicMock()
             yield mock_manager
@@ -129,6 +131,16 @@ class TestLifespan:
             settings.auth_enabled = False  # Disable auth for tests
             settings.qdrant_url = "http://localhost:6333"
             settings.qdrant_collection = "test_collection"
+            settings.session_centroids_enabled = True
+            settings.session_centroids_collection = "sessions"
+            settings.session_centroid_sparse_terms = 256
+            settings.late_chunking_enabled = False
+            settings.late_chunk_tokens = 128
+            settings.late_chunk_max_tokens = 8192
+            settings.qdrant_quantization = None
+            settings.qdrant_shard_by_org = False
+            settings.qdrant_turns_tiering_enabled = False
+            settings.payload_compression_enabled = False
             settings.embedder_device = "cpu"
             settings.embedder_preload = False
             settings.reranker_llm_model = "gpt-4o-mini"
@@ -232,6 +244,12 @@ class TestLifespan:
             settings.auth_enabled = False
             settings.qdrant_url = "http://localhost:6333"
             settings.qdrant_collection = "test"
+            settings.session_centroids_enabled = True
+            settings.session_centroids_collection = "sessions"
+            settings.session_centroid_sparse_terms = 256
+            settings.late_chunking_enabled = False
+            settings.late_chunk_tokens = 128
+            settings.late_chunk_max_tokens = 8192
             settings.embedder_device = "cpu"
             settings.embedder_preload = True  # Enable preload
             settings.reranker_llm_model = "gpt-4o-mini"
@@ -269,6 +287,12 @@ class TestLifespan:
             settings.auth_enabled = False
             settings.qdrant_url = "http://localhost:6333"
             settings.qdrant_collection = "test"
+            settings.session_centroids_enabled = True
+            settings.session_centroids_collection = "sessions"
+            settings.session_centroid_sparse_terms = 256
+            settings.late_chunking_enabled = False
+            settings.late_chunk_tokens = 128
+            settings.late_chunk_max_tokens = 8192
             settings.embedder_device = "cpu"
             settings.embedder_preload = True
             settings.reranker_llm_model = "gpt-4o-mini"
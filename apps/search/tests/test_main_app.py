@@ -6,6 +6,7 @@ import pytest
 from fastapi import FastAPI
 
 from src.main import create_app, lifespan
+from src.services.sharding import ShardRouter
 
 
 class TestLifespanWithConsumer:
@@ -31,6 +32,7 @@ class TestLifespanWithConsumer:
         ):
             mock_manager = MagicMock()
             mock_manager.ensure_collection = AsyncMock(return_value=True)
+            mock_manager.shard_router = AsyncMock(return_value=ShardRouter())
             mock_cls.return_value = mock_manager
             mock_schema.return_value = MagicMock()
             yield mock_manager
@@ -85,6 +87,16 @@ class TestLifespanWithConsumer:
             settings.debug = False
             settings.qdrant_url = "http://localhost:6333"
             settings.qdrant_collection = "test_collection"
+            settings.session_centroids_enabled = True
+            settings.session_centroids_collection = "sessions"
+            settings.session_centroid_sparse_terms = 256
+            settings.late_chunking_enabled = False
+            settings.late_chunk_tokens = 128
+            settings.late_chunk_max_tokens = 8192
+            settings.qdrant_quantization = None
+            settings.qdrant_shard_by_org = False
+            settings.qdrant_turns_tiering_enabled = False
+            settings.payload_compression_enabled = False
             settings.embedder_device = "cpu"
             settings.embedder_preload = False
             settings.embedder_backend = "local"
@@ -92,9 +104,20 @@ class TestLifespanWithConsumer:
             settings.search_host = "0.0.0.0"
             settings.search_port = 5002
             settings.cors_origins = ["*"]
+            settings.service_mode = "all"
             settings.nats_consumer_enabled = True
             settings.nats_url = "nats://localhost:4222"
             settings.nats_consumer_group = "test-group"
+            settings.nats_pull_workers = 4
+            settings.nats_fetch_max_batch = 256
+            settings.nats_ack_wait_s = 60.0
+            settings.nats_max_deliver = 10
+            settings.indexing_pipeline_depth = 2
+            settings.indexing_upsert_chunk_bytes = 4 * 1024 * 1024
+            settings.indexing_upsert_concurrency = 4
+            settings.indexing_upsert_wait = True
+            settings.indexing_upsert_ordering = None
+            settings.indexing_upsert_retries = 3
             settings.auth_enabled = False
             mock_fn.return_value = settings
             yield settings
@@ -107,6 +130,16 @@ class TestLifespanWithConsumer:
             settings.debug = False
             settings.qdrant_url = "http://localhost:6333"
             settings.qdrant_collection = "test_collection"
+            settings.session_centroids_enabled = True
+            settings.session_centroids_collection = "sessions"
+            settings.session_centroid_sparse_terms = 256
+            settings.late_chunking_enabled = False
+            settings.late_chunk_tokens = 128
+            settings.late_chunk_max_tokens = 8192
+            settings.qdrant_quantization = None
+            settings.qdrant_shard_by_org = False
+            settings.qdrant_turns_tiering_enabled = False
+            settings.payload_compression_enabled = False
             settings.embedder_device = "cpu"
             settings.embedder_preload = False
             settings.reranker_llm_model = "gpt-4o-mini"
@@ -187,6 +220,62 @@ class TestLifespanWithConsumer:
         mock_nats_pubsub.disconnect.assert_called_once()
         mock_nats_client.close.assert_called_once()
 
+    async def test_lifespan_search_only_mode(
+        self,
+        mock_qdrant_client,
+        mock_schema_manager,
+        mock_embedder_factory,
+        mock_reranker_router,
+        mock_search_retriever,
+        mock_multi_query_retriever,
+        mock_session_retriever,
+        mock_settings_consumer_enabled,
+        mock_nats_client,
+        mock_turns_consumer,
+    ) -> None:
+        """Test search-only mode leaves indexing to the standalone workers."""
+        mock_settings_consumer_enabled.service_mode = "search"
+        app = FastAPI()
+
+        async with lifespan(app):
+            assert app.state.turns_consumer is None
+            assert app.state.search_retriever is not None
+
+        mock_turns_consumer.start.assert_not_called()
+        mock_nats_client.close.assert_not_called()
+
+    @pytest.mark.parametrize("migration_enabled", [True, False])
+    async def test_lifespan_tier_migration_owner(
+        self,
+        mock_qdrant_client,
+        mock_schema_manager,
+        mock_embedder_factory,
+        mock_reranker_router,
+        mock_search_retriever,
+        mock_multi_query_retriever,
+        mock_session_retriever,
+        mock_settings_consumer_enabled,
+        migration_enabled: bool,
+    ) -> None:
+        """Test only the server that owns the tier migration starts it."""
+        mock_settings_consumer_enabled.service_mode = "search"
+        mock_settings_consumer_enabled.qdrant_turns_tier_migration_enabled = migration_enabled
+        mock_settings_consumer_enabled.qdrant_turns_tier_migration_interval_s = 900.0
+        mock_settings_consumer_enabled.qdrant_turns_tier_migration_batch_size = 256
+        with (
+            patch("src.main.TurnTiers") as mock_tiers_cls,
+            patch("src.main.get_cold_turns_schema"),
+            patch("src.main.TierMigrator") as mock_migrator_cls,
+        ):
+            mock_tiers_cls.from_settings.return_value = MagicMock(enabled=True)
+            mock_migrator_cls.return_value.run = AsyncMock()
+            app = FastAPI()
+
+            async with lifespan(app):
+                pass
+
+        assert mock_migrator_cls.called is migration_enabled
+
     async def test_lifespan_with_consumer_disabled(
         self,
         mock_qdrant_client,
@@ -359,6 +448,16 @@ class TestLifespanWithConsumer:
             settings.debug = False
             settings.qdrant_url = "http://localhost:6333"
             settings.qdrant_collection = "test_collection"
+            settings.session_centroids_enabled = True
+            settings.session_centroids_collection = "sessions"
+            settings.session_centroid_sparse_terms = 256
+            settings.late_chunking_enabled = False
+            settings.late_chunk_tokens = 128
+            settings.late_chunk_max_tokens = 8192
+            settings.qdrant_quantization = None
+            settings.qdrant_shard_by_org = False
+            settings.qdrant_turns_tiering_enabled = False
+            settings.payload_compression_enabled = False
             settings.embedder_device = "cpu"
             settings.embedder_preload = False
             settings.embedder_backend = "huggingface"  # HF backend
@@ -366,9 +465,20 @@ class TestLifespanWithConsumer:
             settings.search_host = "0.0.0.0"
             settings.search_port = 5002
             settings.cors_origins = ["*"]
+            settings.service_mode = "all"
             settings.nats_consumer_enabled = True
             settings.nats_url = "nats://localhost:4222"
             settings.nats_consumer_group = "test-group"
+            settings.nats_pull_workers = 4
+            settings.nats_fetch_max_batch = 256
+            settings.nats_ack_wait_s = 60.0
+            settings.nats_max_deliver = 10
+            settings.indexing_pipeline_depth = 2
+            settings.indexing_upsert_chunk_bytes = 4 * 1024 * 1024
+            settings.indexing_upsert_concurrency = 4
+            settings.indexing_upsert_wait = True
+            settings.indexing_upsert_ordering = None
+            settings.indexing_upsert_retries = 3
             settings.auth_enabled = False
             mock_settings_fn.return_value = settings
 
@@ -430,6 +540,16 @@ class TestLifespanWithConsumer:
             settings.debug = False
             settings.qdrant_url = "http://localhost:6333"
             settings.qdrant_collection = "test_collection"
+            settings.session_centroids_enabled = True
+            settings.session_centroids_collection = "sessions"
+            settings.session_centroid_sparse_terms = 256
+            settings.late_chunking_enabled = False
+            settings.late_chunk_tokens = 128
+            settings.late_chunk_max_tokens = 8192
+            settings.qdrant_quantization = None
+            settings.qdrant_shard_by_org = False
+            settings.qdrant_turns_tiering_enabled = False
+            settings.payload_compression_enabled = False
             settings.embedder_device = "cpu"
             settings.embedder_preload = False
             settings.reranker_llm_model = "gpt-4o-mini"
@@ -476,6 +596,16 @@ class TestLifespanWithConsumer:
             settings.debug = False
             settings.qdrant_url = "http://localhost:6333"
             settings.qdrant_collection = "test_collection"
+            settings.session_centroids_enabled = True
+            settings.session_centroids_collection = "sessions"
+            settings.session_centroid_sparse_terms = 256
+            settings.late_chunking_enabled = False
+            settings.late_chunk_tokens = 128
+            settings.late_chunk_max_tokens = 8192
+            settings.qdrant_quantization = None
+            settings.qdrant_shard_by_org = False
+            settings.qdrant_turns_tiering_enabled = False
+            settings.payload_compression_enabled = False
             settings.embedder_device = "cpu"
             settings.embedder_preload = False
             settings.reranker_llm_model = "gpt-4o-mini"
@@ -518,6 +648,16 @@ class TestLifespanWithConsumer:
             settings.debug = False
             settings.qdrant_url = "http://localhost:6333"
             settings.qdrant_collection = "test_collection"
+            settings.session_centroids_enabled = True
+            settings.session_centroids_collection = "sessions"
+            settings.session_centroid_sparse_terms = 256
+            settings.late_chunking_enabled = False
+            settings.late_chunk_tokens = 128
+            settings.late_chunk_max_tokens = 8192
+            settings.qdrant_quantization = None
+            settings.qdrant_shard_by_org = False
+            settings.qdrant_turns_tiering_enabled = False
+            settings.payload_compression_enabled = False
             settings.embedder_device = "cpu"
             settings.embedder_preload = False
             settings.reranker_llm_model = "gpt-4o-mini"
@@ -550,14 +690,17 @@ class TestLifespanWithConsumer:
         mock_session_retriever,
         mock_settings_consumer_disabled,
     ) -> None:
-        """Test lifespan creates turns and memory collections."""
+        """Test lifespan creates turns, memory and sessions collections."""
         with (
             patch("src.main.SchemaManager") as mock_manager_cls,
             patch("src.main.get_turns_collection_schema") as mock_turns_schema_fn,
             patch("src.main.get_memory_collection_schema") as mock_memory_schema_fn,
+            patch("src.main.get_sessions_collection_schema") as mock_sessions_schema_fn,
+            patch("src.main.apply_storage_settings", side_effect=lambda schema, _: schema),
         ):
             mock_manager = MagicMock()
             mock_manager.ensure_collection = AsyncMock(return_value=True)
+            mock_manager.shard_router = AsyncMock(return_value=ShardRouter())
             mock_manager_cls.return_value = mock_manager
 
             mock_turns_schema = MagicMock()
@@ -566,15 +709,20 @@ class TestLifespanWithConsumer:
             mock_memory_schema = MagicMock()
             mock_memory_schema_fn.return_value = mock_memory_schema
 
+            mock_sessions_schema = MagicMock()
+            mock_sessions_schema_fn.return_value = mock_sessions_schema
+
             app = FastAPI()
 
             async with lifespan(app):
                 pass
 
-            # Should call ensure_collection for both turns and memory collections
-            assert mock_manager.ensure_collection.call_count == 2
+            # Should call ensure_collection for the turns, memory and sessions collections
+            assert mock_manager.ensure_collection.call_count == 3
             mock_manager.ensure_collection.assert_any_call(mock_turns_schema)
             mock_manager.ensure_collection.assert_any_call(mock_memory_schema)
+            mock_manager.ensure_collection.assert_any_call(mock_sessions_schema)
+            mock_sessions_schema_fn.assert_called_once_with("sessions", None)
 
 
 class TestAppCreation:
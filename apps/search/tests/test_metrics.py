@@ -10,9 +10,13 @@ from src.utils.metrics import (
     RERANKER_COST_CENTS,
     RERANKER_DEGRADED,
     RERANKER_REQUESTS,
+    SEARCH_DEADLINE_DEGRADATIONS,
+    SEARCH_DEADLINE_MISSES,
     SEARCH_REQUESTS,
     get_content_type,
     get_metrics,
+    record_deadline_degradation,
+    record_deadline_miss,
     record_embedding_cache_hit,
     record_embedding_cache_miss,
     record_reranker_cost,
@@ -112,6 +116,28 @@ class TestSearchMetrics:
         assert final_success > initial_success
 
 
+class TestDeadlineMetrics:
+    """Test request deadline metrics."""
+
+    def test_record_deadline_miss(self):
+        """Test recording a deadline miss by stage."""
+        initial = SEARCH_DEADLINE_MISSES.labels(stage="admission")._value._value
+
+        record_deadline_miss(stage="admission")
+
+        final = SEARCH_DEADLINE_MISSES.labels(stage="admission")._value._value
+        assert final == initial + 1
+
+    def test_record_deadline_degradation(self):
+        """Test recording a deadline-driven degradation."""
+        initial = SEARCH_DEADLINE_DEGRADATIONS.labels(action="skip_rerank")._value._value
+
+        record_deadline_degradation(action="skip_rerank")
+
+        final = SEARCH_DEADLINE_DEGRADATIONS.labels(action="skip_rerank")._value._value
+        assert final == initial + 1
+
+
 class TestEmbeddingMetrics:
     """Test embedding-related metrics."""
 
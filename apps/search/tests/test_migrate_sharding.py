@@ -0,0 +1,41 @@
+"""Tests for the sharding migration script."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.config import Settings
+from src.scripts.migrate_sharding import build_schemas
+
+
+class TestBuildSchemas:
+    """Tests for migration target schemas."""
+
+    async def test_keeps_existing_late_chunk_vector(self) -> None:
+        """Test a turns collection with late chunks is rebuilt with them."""
+        manager = MagicMock()
+        manager.has_vector = AsyncMock(return_value=True)
+
+        schemas = await build_schemas(Settings(_env_file=None), manager)
+
+        assert schemas["engram_turns"].late_chunk_vector_name == "turn_chunks"
+        manager.has_vector.assert_awaited_once_with("engram_turns", "turn_chunks")
+
+    async def test_late_chunks_from_settings(self) -> None:
+        """Test enabling late chunking adds the vector without checking Qdrant."""
+        manager = MagicMock()
+        manager.has_vector = AsyncMock(return_value=False)
+        settings = Settings(_env_file=None, late_chunking_enabled=True)
+
+        schemas = await build_schemas(settings, manager)
+
+        assert schemas["engram_turns"].late_chunk_vector_name == "turn_chunks"
+        manager.has_vector.assert_not_called()
+
+    async def test_without_late_chunks(self) -> None:
+        """Test collections without late chunks are rebuilt without them."""
+        manager = MagicMock()
+        manager.has_vector = AsyncMock(return_value=False)
+
+        schemas = await build_schemas(Settings(_env_file=None), manager)
+
+        assert schemas["engram_turns"].late_chunk_vector_name is None
+        assert set(schemas) == {"engram_turns", "engram_memory"}
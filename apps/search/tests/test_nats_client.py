@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.clients.nats import NatsClient, NatsClientConfig
+from src.clients.nats import AdaptiveFetchSize, MessageDelivery, NatsClient, NatsClientConfig
 
 
 class TestNatsClientConfig:
@@ -255,6 +255,8 @@ class TestNatsClient:
         assert call_args[1]["subject"] == "events.parsed"
         assert call_args[1]["durable"] == "test-consumer"
         assert call_args[1]["stream"] == "EVENTS"
+        assert call_args[1]["config"].ack_wait == 60.0
+        assert call_args[1]["config"].max_deliver == 10
 
         # Verify messages were processed
         assert len(handler_calls) == 2
@@ -345,6 +347,7 @@ class TestNatsClient:
         mock_msg.data = b"not-valid-json"
         mock_msg.ack = AsyncMock()
         mock_msg.nak = AsyncMock()
+        mock_msg.term = AsyncMock()
 
         # Create mock pull subscription
         mock_psub = AsyncMock()
@@ -391,8 +394,9 @@ class TestNatsClient:
 
         # Verify handler was not called due to JSON error
         assert not handler_called
-        # Verify message was negatively acknowledged
-        mock_msg.nak.assert_called_once()
+        # Malformed bodies are terminated, never redelivered
+        mock_msg.term.assert_called_once()
+        mock_msg.nak.assert_not_called()
         mock_msg.ack.assert_not_called()
 
     @pytest.mark.asyncio
@@ -457,6 +461,126 @@ class TestNatsClient:
         # Verify fetch was called multiple times (error recovery)
         assert fetch_count >= 2
 
+    @pytest.mark.asyncio
+    async def test_subscribe_manual_ack_with_capacity(self, client: NatsClient) -> None:
+        """Test manual-ack handlers get the delivery and fetches fit the capacity."""
+        import asyncio
+
+        import nats.errors
+
+        mock_nc = AsyncMock()
+        mock_js = AsyncMock()
+        mock_nc.jetstream = MagicMock(return_value=mock_js)
+
+        mock_msg = MagicMock()
+        mock_msg.subject = "memory.turns.finalized"
+        mock_msg.data = b'{"id": "turn-1"}'
+        mock_msg.ack = AsyncMock()
+        mock_msg.nak = AsyncMock()
+
+        fetch_sizes: list[int] = []
+        processed_event = asyncio.Event()
+
+        async def mock_fetch(batch: int, timeout: float) -> list:
+            fetch_sizes.append(batch)
+            if len(fetch_sizes) == 1:
+                return [mock_msg]
+            processed_event.set()
+            await asyncio.sleep(10)
+            raise nats.errors.TimeoutError()
+
+        mock_psub = AsyncMock()
+        mock_psub.fetch = mock_fetch
+        mock_js.pull_subscribe = AsyncMock(return_value=mock_psub)
+
+        # Full for the first two checks, then room for 3 messages
+        capacities = iter([0, 0, 3, 3])
+        deliveries: list[MessageDelivery] = []
+
+        async def test_handler(subject: str, data: dict, delivery: MessageDelivery) -> None:
+            deliveries.append(delivery)
+
+        client.config.fetch_pause_ms = 1
+        with patch("src.clients.nats.nats.connect", return_value=mock_nc):
+            task = asyncio.create_task(
+                client.subscribe(
+                    topic="memory.turn_finalized",
+                    group_id="test-consumer",
+                    handler=test_handler,
+                    manual_ack=True,
+                    capacity=lambda: next(capacities, 3),
+                )
+            )
+            try:
+                await asyncio.wait_for(processed_event.wait(), timeout=1.0)
+            finally:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+        assert fetch_sizes[:2] == [3, 3]
+        assert deliveries[0].msg is mock_msg
+        # The handler owns the ack
+        mock_msg.ack.assert_not_called()
+        mock_msg.nak.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_parallel_workers_report_lag(self) -> None:
+        """Test each pull worker binds the durable consumer and lag is exported."""
+        import asyncio
+
+        import nats.errors
+
+        client = NatsClient(config=NatsClientConfig(pull_workers=3, lag_report_interval_s=10))
+        mock_nc = AsyncMock()
+        mock_js = AsyncMock()
+        mock_nc.jetstream = MagicMock(return_value=mock_js)
+
+        fetch_sizes: list[int] = []
+        lag_reported = asyncio.Event()
+
+        async def mock_fetch(batch: int, timeout: float) -> list:
+            fetch_sizes.append(batch)
+            await asyncio.sleep(10)
+            raise nats.errors.TimeoutError()
+
+        mock_psub = AsyncMock()
+        mock_psub.fetch = mock_fetch
+        mock_psub.consumer_info = AsyncMock(return_value=MagicMock(num_pending=42))
+        mock_js.pull_subscribe = AsyncMock(return_value=mock_psub)
+
+        async def test_handler(subject: str, data: dict) -> None:
+            pass
+
+        with (
+            patch("src.clients.nats.nats.connect", return_value=mock_nc),
+            patch(
+                "src.clients.nats.set_nats_consumer_lag",
+                side_effect=lambda *args: lag_reported.set(),
+            ) as mock_lag,
+        ):
+            task = asyncio.create_task(
+                client.subscribe(
+                    topic="memory.turn_finalized",
+                    group_id="test-consumer",
+                    handler=test_handler,
+                    capacity=lambda: 4,
+                )
+            )
+            try:
+                await asyncio.wait_for(lag_reported.wait(), timeout=1.0)
+                await asyncio.sleep(0)
+            finally:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+        assert mock_js.pull_subscribe.call_count == 3
+        assert {c[1]["durable"] for c in mock_js.pull_subscribe.call_args_list} == {"test-consumer"}
+        # Each worker fetches its share of the capacity
+        assert fetch_sizes == [2, 2, 2]
+        mock_lag.assert_called_with("memory.turn_finalized", 0, 42)
+
     @pytest.mark.asyncio
     async def test_context_manager_with_exception(self, client: NatsClient) -> None:
         """Test async context manager closes connection even on exception."""
@@ -477,6 +601,116 @@ class TestNatsClient:
         mock_nc.close.assert_called_once()
 
 
+class TestAdaptiveFetchSize:
+    """Tests for AdaptiveFetchSize."""
+
+    def test_grows_on_fast_full_batches(self) -> None:
+        """Test the size doubles up to the maximum while full batches are fast."""
+        size = AdaptiveFetchSize(initial=10, maximum=32, target_ms=100)
+
+        size.record(requested=10, received=10, elapsed_ms=5)
+        assert size.size == 20
+        size.record(requested=20, received=20, elapsed_ms=5)
+        assert size.size == 32
+
+    def test_shrinks_on_slow_batches(self) -> None:
+        """Test the size halves when a batch takes longer than the target."""
+        size = AdaptiveFetchSize(initial=8, maximum=32, target_ms=100)
+
+        size.record(requested=8, received=8, elapsed_ms=250)
+        assert size.size == 4
+        for _ in range(5):
+            size.record(requested=4, received=4, elapsed_ms=250)
+        assert size.size == 1
+
+    def test_partial_and_empty_batches_keep_size(self) -> None:
+        """Test partial (drained backlog) and empty fetches leave the size alone."""
+        size = AdaptiveFetchSize(initial=8, maximum=32, target_ms=100)
+
+        size.record(requested=8, received=3, elapsed_ms=5)
+        size.record(requested=8, received=0, elapsed_ms=500)
+        assert size.size == 8
+
+
+class TestMessageDelivery:
+    """Tests for MessageDelivery."""
+
+    @staticmethod
+    def _msg(num_delivered: int) -> MagicMock:
+        msg = MagicMock()
+        msg.metadata.num_delivered = num_delivered
+        msg.ack = AsyncMock()
+        msg.nak = AsyncMock()
+        msg.term = AsyncMock()
+        msg.in_progress = AsyncMock()
+        return msg
+
+    @pytest.mark.parametrize(
+        ("num_delivered", "expected_s"), [(1, 1.0), (2, 2.0), (4, 8.0), (20, 60.0)]
+    )
+    async def test_nak_backs_off_exponentially(self, num_delivered: int, expected_s: float) -> None:
+        """Test the redelivery delay doubles per delivery, up to the cap."""
+        msg = self._msg(num_delivered)
+        delivery = MessageDelivery(msg, nak_delay_ms=1000, nak_max_delay_ms=60000)
+
+        await delivery.nak()
+
+        msg.nak.assert_awaited_once_with(expected_s)
+
+    async def test_settles_once(self) -> None:
+        """Test only the first settlement reaches the server."""
+        msg = self._msg(1)
+        delivery = MessageDelivery(msg)
+
+        await delivery.ack()
+        await delivery.nak()
+        await delivery.term()
+
+        msg.ack.assert_awaited_once()
+        msg.nak.assert_not_called()
+        msg.term.assert_not_called()
+        assert delivery.settled
+
+    async def test_in_progress_until_settled(self) -> None:
+        """Test in-progress acks stop once the message is settled."""
+        msg = self._msg(1)
+        delivery = MessageDelivery(msg)
+
+        await delivery.in_progress()
+        await delivery.ack()
+        await delivery.in_progress()
+
+        msg.in_progress.assert_awaited_once()
+
+    async def test_extend_in_flight(self) -> None:
+        """Test unsettled deliveries get in-progress acks and settled ones are dropped."""
+        import asyncio
+
+        client = NatsClient(config=NatsClientConfig(ack_wait_s=0.03))
+        pending, done = self._msg(1), self._msg(1)
+        in_flight = {MessageDelivery(pending), MessageDelivery(done)}
+        for delivery in in_flight:
+            if delivery.msg is done:
+                await delivery.ack()
+
+        task = asyncio.create_task(client._extend_in_flight(in_flight))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        pending.in_progress.assert_awaited()
+        done.in_progress.assert_not_called()
+        assert [d.msg for d in in_flight] == [pending]
+
+    async def test_settle_error_logged(self) -> None:
+        """Test a failed ack is logged rather than raised."""
+        msg = self._msg(1)
+        msg.ack = AsyncMock(side_effect=Exception("connection closed"))
+
+        await MessageDelivery(msg).ack()
+
+
 class TestNatsClientTopicMappings:
     """Tests for NATS topic mappings."""
 
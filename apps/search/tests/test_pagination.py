@@ -0,0 +1,123 @@
+"""Tests for cursor pagination over cached result lists."""
+
+import pytest
+
+from src.retrieval.pagination import (
+    InvalidCursorError,
+    PageCursor,
+    ResultPageCache,
+)
+from src.retrieval.types import SearchResultItem
+
+
+def _items(count: int) -> list[SearchResultItem]:
+    return [SearchResultItem(id=f"r{i}", score=1.0 - i / 100, payload={}) for i in range(count)]
+
+
+@pytest.fixture
+def cache() -> ResultPageCache:
+    """Create a small cache."""
+    return ResultPageCache(max_entries=4, max_results=100, ttl_s=60.0)
+
+
+class TestPageCursor:
+    """Tests for PageCursor encoding."""
+
+    def test_round_trip(self) -> None:
+        """Test a cursor decodes to what was encoded."""
+        cursor = PageCursor(key="abc", org_id="org", offset=20)
+        assert PageCursor.decode(cursor.encode()) == cursor
+
+    @pytest.mark.parametrize("raw", ["", "not-a-cursor", "e30", "!!!"])
+    def test_malformed(self, raw: str) -> None:
+        """Test garbage cursors are rejected."""
+        with pytest.raises(InvalidCursorError):
+            PageCursor.decode(raw)
+
+    def test_negative_offset(self) -> None:
+        """Test a tampered negative offset is rejected."""
+        cursor = PageCursor(key="abc", org_id="org", offset=-5).encode()
+        with pytest.raises(InvalidCursorError):
+            PageCursor.decode(cursor)
+
+
+class TestResultPageCache:
+    """Tests for ResultPageCache."""
+
+    def test_pages_through_cached_list(self, cache: ResultPageCache) -> None:
+        """Test pages are consecutive slices and the last page has no cursor."""
+        first = cache.first_page("org", _items(25), limit=10)
+        assert [r.id for r in first.items] == [f"r{i}" for i in range(10)]
+
+        second = cache.page(first.next_cursor, "org", limit=10)
+        assert [r.id for r in second.items] == [f"r{i}" for i in range(10, 20)]
+
+        third = cache.page(second.next_cursor, "org", limit=10)
+        assert [r.id for r in third.items] == [f"r{i}" for i in range(20, 25)]
+        assert third.next_cursor is None
+
+    def test_single_page_not_cached(self, cache: ResultPageCache) -> None:
+        """Test results that fit in one page get no cursor and no cache entry."""
+        page = cache.first_page("org", _items(5), limit=10)
+
+        assert len(page.items) == 5
+        assert page.next_cursor is None
+        assert len(cache) == 0
+
+    def test_other_org_rejected(self, cache: ResultPageCache) -> None:
+        """Test a cursor cannot be used by another org."""
+        first = cache.first_page("org", _items(25), limit=10)
+
+        with pytest.raises(InvalidCursorError):
+            cache.page(first.next_cursor, "other-org", limit=10)
+
+    def test_forged_cursor_for_other_org_rejected(self, cache: ResultPageCache) -> None:
+        """Test rewriting the org in a cursor does not unlock another org's list."""
+        first = cache.first_page("org", _items(25), limit=10)
+        key = PageCursor.decode(first.next_cursor).key
+        forged = PageCursor(key=key, org_id="attacker", offset=0).encode()
+
+        with pytest.raises(InvalidCursorError):
+            cache.page(forged, "attacker", limit=10)
+
+    def test_expired(self, cache: ResultPageCache, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test lists expire after the TTL."""
+        now = [1000.0]
+        monkeypatch.setattr("src.retrieval.pagination.time.monotonic", lambda: now[0])
+        first = cache.first_page("org", _items(25), limit=10)
+
+        now[0] += 61.0
+        with pytest.raises(InvalidCursorError, match="expired"):
+            cache.page(first.next_cursor, "org", limit=10)
+        assert len(cache) == 0
+
+    def test_entry_bound_evicts_lru(self, cache: ResultPageCache) -> None:
+        """Test the least recently used list is evicted past max_entries."""
+        cursors = [cache.first_page("org", _items(11), limit=10).next_cursor for _ in range(4)]
+        cache.page(cursors[0], "org", limit=10)  # touch the oldest
+
+        cache.first_page("org", _items(11), limit=10)
+
+        assert len(cache) == 4
+        cache.page(cursors[0], "org", limit=10)
+        with pytest.raises(InvalidCursorError):
+            cache.page(cursors[1], "org", limit=10)
+
+    def test_result_bound(self) -> None:
+        """Test total cached results stay under max_results."""
+        cache = ResultPageCache(max_entries=10, max_results=50, ttl_s=60.0)
+        first = cache.first_page("org", _items(30), limit=10)
+        cache.first_page("org", _items(30), limit=10)
+
+        assert len(cache) == 1
+        with pytest.raises(InvalidCursorError):
+            cache.page(first.next_cursor, "org", limit=10)
+
+        oversized = cache.first_page("org", _items(60), limit=10)
+        assert oversized.next_cursor is None
+        assert len(oversized.items) == 10
+
+    def test_disabled(self) -> None:
+        """Test a zero-size cache never issues cursors."""
+        cache = ResultPageCache(max_entries=0, max_results=100, ttl_s=60.0)
+        assert cache.first_page("org", _items(25), limit=10).next_cursor is None
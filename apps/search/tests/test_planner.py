@@ -0,0 +1,220 @@
+"""Tests for the cost-based query planner."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from qdrant_client.http import models
+
+from src.config import Settings
+from src.retrieval.planner import CardinalityCache, QueryPlanner, current_query_plan
+from src.retrieval.types import PlanMode, SearchFilters, SearchQuery
+
+
+def _filter(*keys: str) -> models.Filter:
+    return models.Filter(
+        must=[models.FieldCondition(key=key, match=models.MatchValue(value="x")) for key in keys]
+    )
+
+
+@pytest.fixture
+def mock_settings() -> Settings:
+    """Create settings with small planner thresholds."""
+    return Settings(
+        search_planner_exact_threshold=100,
+        search_planner_filtered_threshold=1000,
+        search_planner_filtered_hnsw_ef=200,
+    )
+
+
+@pytest.fixture
+def mock_qdrant_client() -> MagicMock:
+    """Create a mock Qdrant client wrapper."""
+    client = MagicMock()
+    client.client = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def planner(mock_qdrant_client: MagicMock, mock_settings: Settings) -> QueryPlanner:
+    """Create a planner over the mock client."""
+    return QueryPlanner(mock_qdrant_client, mock_settings)
+
+
+@pytest.fixture
+def query() -> SearchQuery:
+    """Create a filtered query."""
+    return SearchQuery(text="test", limit=10, filters=SearchFilters(org_id="org"))
+
+
+def _set_count(client: MagicMock, count: int) -> None:
+    client.client.count = AsyncMock(return_value=models.CountResult(count=count))
+
+
+class TestQueryPlanner:
+    """Tests for QueryPlanner."""
+
+    def test_is_selective(self) -> None:
+        """Test that only filters narrower than the tenant are selective."""
+        assert not QueryPlanner.is_selective(None)
+        assert not QueryPlanner.is_selective(models.Filter())
+        assert not QueryPlanner.is_selective(_filter("org_id"))
+        assert QueryPlanner.is_selective(_filter("org_id", "session_id"))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("count", "mode", "fetch_limit", "hnsw_ef"),
+        [
+            (40, PlanMode.EXACT, 40, None),
+            (3, PlanMode.EXACT, 10, None),
+            (500, PlanMode.FILTERED_HNSW, 300, 200),
+            (5000, PlanMode.HNSW, 300, None),
+        ],
+    )
+    async def test_plan_by_cardinality(
+        self,
+        planner: QueryPlanner,
+        mock_qdrant_client: MagicMock,
+        query: SearchQuery,
+        count: int,
+        mode: PlanMode,
+        fetch_limit: int,
+        hnsw_ef: int | None,
+    ) -> None:
+        """Test mode, ef and fetch cap chosen from the estimated match count."""
+        _set_count(mock_qdrant_client, count)
+
+        plan = await planner.plan(query, "turns", _filter("org_id", "session_id"), 300)
+
+        assert plan.mode == mode
+        assert plan.fetch_limit == fetch_limit
+        assert plan.hnsw_ef == hnsw_ef
+        assert plan.estimated_matches == count
+        assert current_query_plan.get() == plan
+
+    @pytest.mark.asyncio
+    async def test_estimate_cached(
+        self, planner: QueryPlanner, mock_qdrant_client: MagicMock, query: SearchQuery
+    ) -> None:
+        """Test that repeated filters reuse the cached estimate."""
+        _set_count(mock_qdrant_client, 500)
+        qdrant_filter = _filter("org_id", "session_id")
+
+        first = await planner.plan(query, "turns", qdrant_filter, 300, shard_key="default")
+        second = await planner.plan(query, "turns", qdrant_filter, 300, shard_key="default")
+
+        assert not first.cached
+        assert second.cached
+        mock_qdrant_client.client.count.assert_awaited_once()
+        kwargs = mock_qdrant_client.client.count.call_args.kwargs
+        assert kwargs["exact"] is False
+        assert kwargs["shard_key_selector"] == "default"
+
+    @pytest.mark.asyncio
+    async def test_fetch_capped_by_fresh_exact_count(
+        self, planner: QueryPlanner, mock_qdrant_client: MagicMock, query: SearchQuery
+    ) -> None:
+        """Test a low approximate estimate is recounted exactly before capping."""
+        mock_qdrant_client.client.count = AsyncMock(
+            side_effect=[models.CountResult(count=40), models.CountResult(count=250)] * 2
+        )
+        qdrant_filter = _filter("org_id", "session_id")
+
+        first = await planner.plan(query, "turns", qdrant_filter, 300)
+        second = await planner.plan(query, "turns", qdrant_filter, 300)
+
+        assert first.fetch_limit == 250
+        assert first.estimated_matches == 250
+        assert first.mode == PlanMode.FILTERED_HNSW
+        # The estimate is cached, the exact count is not
+        assert second.cached
+        assert second.fetch_limit == 40
+        calls = mock_qdrant_client.client.count.call_args_list
+        assert [c.kwargs["exact"] for c in calls] == [False, True, True]
+
+    @pytest.mark.asyncio
+    async def test_estimate_does_not_cap_fetch(
+        self, planner: QueryPlanner, mock_qdrant_client: MagicMock, query: SearchQuery
+    ) -> None:
+        """Test approximate estimates above the exact threshold never cap the fetch."""
+        _set_count(mock_qdrant_client, 150)
+
+        plan = await planner.plan(query, "turns", _filter("org_id", "session_id"), 300)
+
+        assert plan.fetch_limit == 300
+        mock_qdrant_client.client.count.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_exact_count_failure_does_not_cap(
+        self, planner: QueryPlanner, mock_qdrant_client: MagicMock, query: SearchQuery
+    ) -> None:
+        """Test a failed exact count keeps the uncapped fetch size."""
+        mock_qdrant_client.client.count = AsyncMock(
+            side_effect=[models.CountResult(count=40), Exception("boom")]
+        )
+
+        plan = await planner.plan(query, "turns", _filter("org_id", "session_id"), 300)
+
+        assert plan.mode == PlanMode.EXACT
+        assert plan.fetch_limit == 300
+
+    @pytest.mark.asyncio
+    async def test_count_failure_falls_back_to_hnsw(
+        self, planner: QueryPlanner, mock_qdrant_client: MagicMock, query: SearchQuery
+    ) -> None:
+        """Test that a failed count plans default HNSW without capping."""
+        mock_qdrant_client.client.count = AsyncMock(side_effect=Exception("boom"))
+
+        plan = await planner.plan(query, "turns", _filter("session_id"), 300)
+
+        assert plan.mode == PlanMode.HNSW
+        assert plan.fetch_limit == 300
+        assert plan.estimated_matches is None
+
+    @pytest.mark.asyncio
+    async def test_manual_search_params_skip_planning(
+        self, planner: QueryPlanner, mock_qdrant_client: MagicMock
+    ) -> None:
+        """Test that explicit exact/hnsw_ef requests are not planned."""
+        query = SearchQuery(text="test", hnsw_ef=64, filters=SearchFilters(org_id="org"))
+
+        plan = await planner.plan(query, "turns", _filter("session_id"), 300)
+
+        assert plan.mode == PlanMode.MANUAL
+        mock_qdrant_client.client.count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_disabled_planner(
+        self, mock_qdrant_client: MagicMock, query: SearchQuery
+    ) -> None:
+        """Test that a disabled planner always plans default HNSW."""
+        planner = QueryPlanner(mock_qdrant_client, Settings(search_planner_enabled=False))
+
+        plan = await planner.plan(query, "turns", _filter("session_id"), 300)
+
+        assert plan.mode == PlanMode.HNSW
+        mock_qdrant_client.client.count.assert_not_called()
+
+
+class TestCardinalityCache:
+    """Tests for CardinalityCache."""
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        cache = CardinalityCache(max_size=2, ttl_s=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that expired entries are dropped."""
+        cache = CardinalityCache(max_size=2, ttl_s=30)
+        monkeypatch.setattr("src.retrieval.planner.time.monotonic", lambda: 100.0)
+        cache.put("a", 1)
+        monkeypatch.setattr("src.retrieval.planner.time.monotonic", lambda: 131.0)
+
+        assert cache.get("a") is None
@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from qdrant_client.http import models
 
 from src.config import Settings
 from src.retrieval import (
@@ -28,6 +29,8 @@ def mock_qdrant_client() -> MagicMock:
     """Create a mock Qdrant client."""
     client = MagicMock()
     client.client = AsyncMock()
+    # Large filter cardinality: the query planner keeps default HNSW search
+    client.client.count = AsyncMock(return_value=models.CountResult(count=1_000_000))
     return client
 
 
@@ -46,9 +49,9 @@ def mock_embedder_factory() -> MagicMock:
     code_embedder.embed = AsyncMock(return_value=[0.2] * 768)
     factory.get_code_embedder = AsyncMock(return_value=code_embedder)
 
-    # Mock sparse embedder (embed_sparse is sync, called via asyncio.to_thread)
+    # Mock sparse embedder
     sparse_embedder = MagicMock()
-    sparse_embedder.embed_sparse = MagicMock(return_value={1: 0.5, 10: 0.3, 100: 0.2})
+    sparse_embedder.embed_sparse_async = AsyncMock(return_value={1: 0.5, 10: 0.3, 100: 0.2})
     factory.get_sparse_embedder = AsyncMock(return_value=sparse_embedder)
 
     return factory
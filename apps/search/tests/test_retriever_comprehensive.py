@@ -10,6 +10,9 @@ This test suite provides comprehensive coverage of SearchRetriever functionality
 - Strategy auto-selection
 """
 
+import asyncio
+import time
+import uuid
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -22,7 +25,19 @@ from src.retrieval import (
     SearchRetriever,
     SearchStrategy,
 )
-from src.retrieval.types import SearchFilters, SearchResultItem, TimeRange
+from src.retrieval.retriever import FirstStageResult
+from src.retrieval.types import (
+    FusionMethod,
+    SearchFilters,
+    SearchPhaseType,
+    SearchResultItem,
+    SimilarVector,
+    TimeRange,
+)
+from src.services.sharding import ShardRouter
+from src.services.tiering import TurnTiers
+from src.utils.deadline import DeadlineExceededError
+from src.utils.metrics import SEARCH_DEADLINE_DEGRADATIONS, SEARCH_DEADLINE_MISSES
 
 
 @pytest.fixture
@@ -44,6 +59,8 @@ def mock_qdrant_client() -> MagicMock:
     """Create a mock Qdrant client."""
     client = MagicMock()
     client.client = AsyncMock()
+    # Large filter cardinality: the query planner keeps default HNSW search
+    client.client.count = AsyncMock(return_value=models.CountResult(count=1_000_000))
     return client
 
 
@@ -62,9 +79,9 @@ def mock_embedder_factory() -> MagicMock:
     code_embedder.embed = AsyncMock(return_value=[0.2] * 768)
     factory.get_code_embedder = AsyncMock(return_value=code_embedder)
 
-    # Mock sparse embedder (embed_sparse is sync, called via asyncio.to_thread)
+    # Mock sparse embedder
     sparse_embedder = MagicMock()
-    sparse_embedder.embed_sparse = MagicMock(return_value={1: 0.5, 10: 0.3, 100: 0.2})
+    sparse_embedder.embed_sparse_async = AsyncMock(return_value={1: 0.5, 10: 0.3, 100: 0.2})
     factory.get_sparse_embedder = AsyncMock(return_value=sparse_embedder)
 
     return factory
@@ -108,238 +125,1395 @@ def create_mock_point(point_id: str | int, score: float, payload: dict[str, Any]
     return point
 
 
-class TestSearchRetrieverDense:
-    """Test dense search strategy."""
+class TestSearchRetrieverDense:
+    """Test dense search strategy."""
+
+    @pytest.mark.asyncio
+    async def test_search_dense_basic(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test basic dense search."""
+        mock_result = create_mock_point(
+            "test-id-1", 0.95, {"content": "test content", "session_id": "session-1"}
+        )
+
+        mock_response = MagicMock()
+        mock_response.points = [mock_result]
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test query",
+            limit=10,
+            strategy=SearchStrategy.DENSE,
+            rerank=False,
+            filters=test_filters,
+        )
+        results = await retriever.search(query)
+
+        assert len(results) == 1
+        assert results[0].id == "test-id-1"
+        assert results[0].score == 0.95
+        mock_qdrant_client.client.query_points.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_search_dense_code_filter(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test dense search with code type filter uses code embedder."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="function definition",
+            limit=10,
+            strategy=SearchStrategy.DENSE,
+            filters=SearchFilters(org_id="test-org-123", type="code"),
+            rerank=False,
+        )
+        await retriever.search(query)
+
+        # Verify code embedder was used
+        mock_embedder_factory.get_code_embedder.assert_called_once()
+        # Verify text embedder was NOT used
+        mock_embedder_factory.get_text_embedder.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_dense_threshold(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test dense search applies custom threshold."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        custom_threshold = 0.8
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.DENSE,
+            threshold=custom_threshold,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search(query)
+
+        call_args = mock_qdrant_client.client.query_points.call_args
+        assert call_args.kwargs["score_threshold"] == custom_threshold
+
+
+class TestSearchRetrieverSparse:
+    """Test sparse search strategy."""
+
+    @pytest.mark.asyncio
+    async def test_search_sparse_basic(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test basic sparse search."""
+        mock_result = create_mock_point("test-id-2", 0.8, {"content": "sparse result"})
+
+        mock_response = MagicMock()
+        mock_response.points = [mock_result]
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="exact keyword search",
+            limit=5,
+            strategy=SearchStrategy.SPARSE,
+            rerank=False,
+            filters=test_filters,
+        )
+        results = await retriever.search(query)
+
+        assert len(results) == 1
+        assert results[0].id == "test-id-2"
+
+    @pytest.mark.asyncio
+    async def test_search_sparse_vector_format(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test sparse search creates correct Qdrant SparseVector format."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        # Set up sparse embedder to return known indices/values
+        sparse_embedder = await mock_embedder_factory.get_sparse_embedder()
+        sparse_embedder.embed_sparse_async.return_value = {5: 0.9, 15: 0.7, 25: 0.5}
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.SPARSE,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search(query)
+
+        # Verify query_points was called with SparseVector
+        call_args = mock_qdrant_client.client.query_points.call_args
+        query_param = call_args.kwargs["query"]
+        assert isinstance(query_param, models.SparseVector)
+        assert query_param.indices == [5, 15, 25]
+        assert query_param.values == [0.9, 0.7, 0.5]
+
+
+class TestSearchRetrieverHybrid:
+    """Test hybrid search strategy."""
+
+    @pytest.mark.asyncio
+    async def test_search_hybrid_basic(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test hybrid search with RRF fusion."""
+        mock_result = create_mock_point("test-id-3", 0.85, {"content": "hybrid result"})
+
+        mock_response = MagicMock()
+        mock_response.points = [mock_result]
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="semantic and keyword search",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            rerank=False,
+            filters=test_filters,
+        )
+        results = await retriever.search(query)
+
+        # Verify hybrid uses prefetch
+        assert len(results) == 1
+        call_args = mock_qdrant_client.client.query_points.call_args
+        assert call_args.kwargs.get("prefetch") is not None
+        assert len(call_args.kwargs["prefetch"]) == 2  # Dense + Sparse
+
+    @pytest.mark.asyncio
+    async def test_search_hybrid_rrf_fusion_query(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test hybrid search uses RRF fusion query."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search(query)
+
+        call_args = mock_qdrant_client.client.query_points.call_args
+        query_param = call_args.kwargs["query"]
+        assert isinstance(query_param, models.FusionQuery)
+        assert query_param.fusion == models.Fusion.RRF
+
+    @pytest.mark.asyncio
+    async def test_search_hybrid_code_filter(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test hybrid search with code filter uses code embedder."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="code search",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            filters=SearchFilters(org_id="test-org-123", type="code"),
+            rerank=False,
+        )
+        await retriever.search(query)
+
+        # Verify code embedder was used
+        mock_embedder_factory.get_code_embedder.assert_called_once()
+
+
+class TestSearchRetrieverHybridWeighting:
+    """Test alpha-weighted prefetch budgets and fusion methods."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_limits_scale_with_alpha(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test dense-leaning alpha gives the dense branch a larger prefetch."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            alpha=0.7,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search(query)
+
+        prefetch = mock_query_prefetch(mock_qdrant_client)
+        assert prefetch[0].limit == 28  # dense: 10 * 2 * 2 * 0.7
+        assert prefetch[1].limit == 12  # sparse: 10 * 2 * 2 * 0.3
+
+    @pytest.mark.asyncio
+    async def test_prefetch_limits_never_below_limit(
+        self,
+        retriever: SearchRetriever,
+    ) -> None:
+        """Test a low-weight branch above the skip threshold still fetches limit."""
+        dense_limit, sparse_limit = retriever._hybrid_prefetch_limits(10, 0.8)
+        assert dense_limit == 32
+        assert sparse_limit == 10
+
+    @pytest.mark.asyncio
+    async def test_low_weight_sparse_branch_skipped(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test strongly semantic queries skip the sparse encoder entirely."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            alpha=0.95,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search(query)
+
+        mock_embedder_factory.get_sparse_embedder.assert_not_called()
+        call_args = mock_qdrant_client.client.query_points.call_args
+        assert call_args.kwargs.get("prefetch") is None
+        assert call_args.kwargs["using"] == "text_dense"
+
+    @pytest.mark.asyncio
+    async def test_low_weight_dense_branch_skipped(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test strongly lexical turn queries skip the dense encoder entirely."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            alpha=0.05,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search_turns(query)
+
+        mock_embedder_factory.get_text_embedder.assert_not_called()
+        call_args = mock_qdrant_client.client.query_points.call_args
+        assert isinstance(call_args.kwargs["query"], models.SparseVector)
+        assert call_args.kwargs["using"] == "turn_sparse"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("text", "skipped_factory", "using"),
+        [
+            ("user.getName()", "get_text_embedder", "text_sparse"),
+            (
+                "how should I structure retries for flaky network calls in general?",
+                "get_sparse_embedder",
+                "text_dense",
+            ),
+        ],
+    )
+    async def test_classified_query_skips_branch(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
+        text: str,
+        skipped_factory: str,
+        using: str,
+    ) -> None:
+        """Test classifier alphas are decisive enough to skip a hybrid branch."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(text=text, limit=10, rerank=False, filters=test_filters)
+        await retriever.search(query)
+
+        getattr(mock_embedder_factory, skipped_factory).assert_not_called()
+        call_args = mock_qdrant_client.client.query_points.call_args
+        assert call_args.kwargs.get("prefetch") is None
+        assert call_args.kwargs["using"] == using
+
+    @pytest.mark.asyncio
+    async def test_dbsf_fusion(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test DBSF fusion is passed through to Qdrant."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            fusion=FusionMethod.DBSF,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search(query)
+
+        query_param = mock_qdrant_client.client.query_points.call_args.kwargs["query"]
+        assert query_param.fusion == models.Fusion.DBSF
+
+    @pytest.mark.asyncio
+    async def test_linear_fusion_weights_scores(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test linear fusion blends normalized branch scores by alpha."""
+        dense = MagicMock()
+        dense.points = [
+            models.ScoredPoint(id=1, version=0, score=0.9, payload={"content": "a"}),
+            models.ScoredPoint(id=2, version=0, score=0.5, payload={"content": "b"}),
+        ]
+        sparse = MagicMock()
+        sparse.points = [
+            models.ScoredPoint(id=2, version=0, score=12.0, payload={"content": "b"}),
+            models.ScoredPoint(id=3, version=0, score=2.0, payload={"content": "c"}),
+        ]
+        mock_qdrant_client.client.query_batch_points = AsyncMock(return_value=[dense, sparse])
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            alpha=0.3,
+            fusion=FusionMethod.LINEAR,
+            rerank=False,
+            filters=test_filters,
+        )
+        results = await retriever.search(query)
+
+        # id=2: 0.3 * 0 + 0.7 * 1 = 0.7; id=1: 0.3 * 1 = 0.3; id=3: 0
+        assert [r.id for r in results] == [2, 1, 3]
+        assert results[0].score == pytest.approx(0.7)
+        assert results[1].score == pytest.approx(0.3)
+        mock_qdrant_client.client.query_points.assert_not_called()
+
+
+def mock_query_prefetch(mock_qdrant_client: MagicMock) -> list[models.Prefetch]:
+    """Helper to extract the prefetch list from the last query_points call."""
+    return mock_qdrant_client.client.query_points.call_args.kwargs["prefetch"]
+
+
+class TestSearchRetrieverPayloadProjection:
+    """Test first-stage payload projection and final hydration."""
+
+    @pytest.mark.asyncio
+    async def test_projection_and_hydration_when_reranking(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+        mock_reranker_router: MagicMock,
+    ) -> None:
+        """Test reranking candidates are projected and the top-k is hydrated."""
+        mock_response = MagicMock()
+        mock_response.points = [
+            create_mock_point("a", 0.9, {"content": "first"}),
+            create_mock_point("b", 0.8, {"content": "second"}),
+        ]
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        mock_qdrant_client.client.retrieve = AsyncMock(
+            return_value=[
+                models.Record(id="b", payload={"content": "second", "tool_calls": ["Read"]}),
+            ]
+        )
+
+        ranked = MagicMock()
+        ranked.original_index = 1
+        ranked.score = 0.99
+        mock_reranker_router.rerank = AsyncMock(return_value=([ranked], "fast", False))
+
+        query = SearchQuery(
+            text="test",
+            limit=1,
+            strategy=SearchStrategy.DENSE,
+            rerank=True,
+            rerank_depth=30,
+            filters=test_filters,
+        )
+        results = await retriever.search_turns(query)
+
+        selector = mock_qdrant_client.client.query_points.call_args.kwargs["with_payload"]
+        assert isinstance(selector, models.PayloadSelectorInclude)
+        assert "content" in selector.include
+        assert "tool_calls" not in selector.include
+
+        retrieve_kwargs = mock_qdrant_client.client.retrieve.call_args.kwargs
+        assert retrieve_kwargs["ids"] == ["b"]
+        assert retrieve_kwargs["collection_name"] == "test_collection"
+        assert results[0].payload == {"content": "second", "tool_calls": ["Read"]}
+
+    @pytest.mark.asyncio
+    async def test_no_projection_without_oversampling(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test full payloads are fetched directly when no reranking oversample."""
+        mock_response = MagicMock()
+        mock_response.points = [create_mock_point("a", 0.9, {"content": "first"})]
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        mock_qdrant_client.client.retrieve = AsyncMock()
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.DENSE,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search(query)
+
+        assert mock_qdrant_client.client.query_points.call_args.kwargs["with_payload"] is True
+        mock_qdrant_client.client.retrieve.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hydration_failure_keeps_projected_payloads(
+        self,
+        retriever: SearchRetriever,
+    ) -> None:
+        """Test hydration errors degrade to the projected payloads."""
+        retriever.qdrant_client.client.retrieve = AsyncMock(side_effect=Exception("timeout"))
+        items = [SearchResultItem(id="a", score=0.5, payload={"content": "projected"})]
+
+        hydrated = await retriever._hydrate_payloads("test_collection", items)
+
+        assert hydrated[0].payload == {"content": "projected"}
+
+    @pytest.mark.asyncio
+    async def test_search_decodes_payloads(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test compressed payload fields are decoded before results are returned."""
+        stored = {"content": {"zstd": "frame", "dict_id": 0, "json": False}}
+        mock_response = MagicMock()
+        mock_response.points = [create_mock_point("a", 0.9, stored)]
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        retriever.payload_codec = MagicMock()
+        retriever.payload_codec.decode.return_value = {"content": "restored"}
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.DENSE,
+            rerank=False,
+            filters=test_filters,
+        )
+        results = await retriever.search(query)
+
+        retriever.payload_codec.decode.assert_called_with(stored)
+        assert results[0].payload == {"content": "restored"}
+
+
+class TestSearchRetrieverPhases:
+    """Test two-phase search used for streaming responses."""
+
+    @pytest.mark.asyncio
+    async def test_phases_candidates_then_reranked(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+        mock_reranker_router: MagicMock,
+    ) -> None:
+        """Test candidates are yielded before reranking runs."""
+        mock_response = MagicMock()
+        mock_response.points = [
+            create_mock_point("a", 0.9, {"content": "first"}),
+            create_mock_point("b", 0.8, {"content": "second"}),
+        ]
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        mock_qdrant_client.client.retrieve = AsyncMock(return_value=[])
+
+        ranked = MagicMock()
+        ranked.original_index = 1
+        ranked.score = 0.99
+        mock_reranker_router.rerank = AsyncMock(return_value=([ranked], "fast", False))
+
+        query = SearchQuery(
+            text="test",
+            limit=1,
+            strategy=SearchStrategy.DENSE,
+            rerank=True,
+            filters=test_filters,
+        )
+        phases = retriever.search_phases(query)
+
+        candidates = await anext(phases)
+        assert candidates.phase == SearchPhaseType.CANDIDATES
+        assert [r.id for r in candidates.results] == ["a"]
+        mock_reranker_router.rerank.assert_not_called()
+
+        reranked = await anext(phases)
+        assert reranked.phase == SearchPhaseType.RERANKED
+        assert [r.id for r in reranked.results] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_phases_rerank_skipped(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test a rerank_skipped marker follows candidates when rerank is off."""
+        mock_response = MagicMock()
+        mock_response.points = [create_mock_point("a", 0.9, {"content": "first"})]
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            limit=5,
+            strategy=SearchStrategy.DENSE,
+            rerank=False,
+            filters=test_filters,
+        )
+        phases = [phase async for phase in retriever.search_phases(query, turns=False)]
+
+        assert [p.phase for p in phases] == [
+            SearchPhaseType.CANDIDATES,
+            SearchPhaseType.RERANK_SKIPPED,
+        ]
+        assert phases[1].reason == "rerank_disabled"
+
+
+class TestSearchRetrieverSearchParams:
+    """Test per-request and per-strategy Qdrant search parameters."""
+
+    @pytest.mark.asyncio
+    async def test_no_search_params_by_default(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test collection defaults are used when nothing is overridden."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test", strategy=SearchStrategy.DENSE, rerank=False, filters=test_filters
+        )
+        await retriever.search_turns(query)
+
+        assert mock_qdrant_client.client.query_points.call_args.kwargs["search_params"] is None
+
+    @pytest.mark.asyncio
+    async def test_request_search_params(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test request overrides reach the dense query."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            strategy=SearchStrategy.DENSE,
+            rerank=False,
+            filters=test_filters,
+            hnsw_ef=256,
+            quantization_oversampling=3.0,
+        )
+        await retriever.search(query)
+
+        params = mock_qdrant_client.client.query_points.call_args.kwargs["search_params"]
+        assert params.hnsw_ef == 256
+        assert params.exact is False
+        assert params.quantization.rescore is True
+        assert params.quantization.oversampling == 3.0
+
+    @pytest.mark.asyncio
+    async def test_strategy_hnsw_ef_applies_to_dense_prefetch(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test per-strategy config sets hnsw_ef on the hybrid dense prefetch only."""
+        retriever.settings.search_hnsw_ef = {"hybrid": 64}
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            strategy=SearchStrategy.HYBRID,
+            alpha=0.5,
+            fusion=FusionMethod.RRF,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search_turns(query)
+
+        dense_prefetch, sparse_prefetch = mock_query_prefetch(mock_qdrant_client)
+        assert dense_prefetch.params.hnsw_ef == 64
+        assert sparse_prefetch.params is None
+
+    def test_exact_search_without_rescore(
+        self, retriever: SearchRetriever, test_filters: SearchFilters
+    ) -> None:
+        """Test exact search and disabled rescoring are passed through."""
+        query = SearchQuery(
+            text="test", filters=test_filters, exact=True, quantization_rescore=False
+        )
+
+        params = retriever._search_params(query, SearchStrategy.DENSE)
+
+        assert params is not None
+        assert params.exact is True
+        assert params.quantization.rescore is False
+
+
+class TestSearchRetrieverShardRouting:
+    """Test per-tenant shard-key routing of first-stage queries."""
+
+    @pytest.mark.asyncio
+    async def test_no_shard_key_by_default(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test queries fan out to all shards when sharding is off."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test", strategy=SearchStrategy.DENSE, rerank=False, filters=test_filters
+        )
+        await retriever.search_turns(query)
+
+        kwargs = mock_qdrant_client.client.query_points.call_args.kwargs
+        assert kwargs["shard_key_selector"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("org_id", "expected"), [("big-org", "big-org"), ("test-org-123", "default")]
+    )
+    async def test_query_routed_to_org_shard(
+        self,
+        retriever: SearchRetriever,
+        mock_qdrant_client: MagicMock,
+        org_id: str,
+        expected: str,
+    ) -> None:
+        """Test dedicated orgs hit their own shard and others the default shard."""
+        retriever.shard_router = ShardRouter(enabled=True, dedicated_orgs=["big-org"])
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            strategy=SearchStrategy.HYBRID,
+            fusion=FusionMethod.RRF,
+            rerank=False,
+            filters=SearchFilters(org_id=org_id),
+        )
+        await retriever.search(query)
+
+        kwargs = mock_qdrant_client.client.query_points.call_args.kwargs
+        assert kwargs["shard_key_selector"] == expected
+
+
+class TestSearchRetrieverQueryPlan:
+    """Test cost-based planning of filtered first-stage queries."""
+
+    @pytest.mark.asyncio
+    async def test_small_filter_uses_exact_search(
+        self,
+        retriever: SearchRetriever,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test a filter matching few points is scanned exactly."""
+        mock_qdrant_client.client.count = AsyncMock(return_value=models.CountResult(count=12))
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            strategy=SearchStrategy.DENSE,
+            limit=5,
+            rerank=False,
+            filters=SearchFilters(org_id="test-org-123", session_id="sess-1"),
+        )
+        await retriever.search_turns(query)
+
+        kwargs = mock_qdrant_client.client.query_points.call_args.kwargs
+        assert kwargs["search_params"].exact is True
+        # Estimated first, then recounted exactly before capping the fetch
+        counts = mock_qdrant_client.client.count.call_args_list
+        assert [c.kwargs["exact"] for c in counts] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_tenant_only_filter_skips_count(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test an org_id-only filter is not counted and keeps default HNSW."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test", strategy=SearchStrategy.DENSE, rerank=False, filters=test_filters
+        )
+        phases = [phase async for phase in retriever.search_phases(query, turns=True)]
+
+        mock_qdrant_client.client.count.assert_not_called()
+        assert mock_qdrant_client.client.query_points.call_args.kwargs["search_params"] is None
+        assert phases[0].plan is not None
+        assert phases[0].plan.mode.value == "hnsw"
+
+
+class TestSearchRetrieverTurnTiers:
+    """Test fan-out of turn searches across hot and cold tiers."""
+
+    @pytest.fixture
+    def tiered_retriever(self, retriever: SearchRetriever) -> SearchRetriever:
+        """Retriever with hot/cold turn tiers enabled."""
+        retriever.turn_tiers = TurnTiers(
+            enabled=True,
+            hot_collection="test_collection",
+            cold_collection="test_cold",
+            hot_window_ms=24 * 3_600_000,
+        )
+        return retriever
+
+    @staticmethod
+    def point(point_id: str, score: float) -> models.ScoredPoint:
+        return models.ScoredPoint(id=point_id, version=0, score=score, payload={"id": point_id})
+
+    @pytest.mark.asyncio
+    async def test_fan_out_merges_tiers(
+        self,
+        tiered_retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test both tiers are searched with one embedding and merged by score."""
+        tier_points = {
+            "test_collection": [self.point("a", 0.9), self.point("b", 0.6)],
+            "test_cold": [self.point("c", 0.8), self.point("b", 0.7)],
+        }
+
+        async def query_points(**kwargs):
+            response = MagicMock()
+            response.points = tier_points[kwargs["collection_name"]]
+            return response
+
+        mock_qdrant_client.client.query_points = AsyncMock(side_effect=query_points)
+
+        query = SearchQuery(
+            text="test", strategy=SearchStrategy.DENSE, rerank=False, filters=test_filters
+        )
+        results = await tiered_retriever.search_turns(query)
+
+        assert [r.id for r in results] == ["a", "c", "b"]
+        assert results[2].score == 0.7
+        searched = {
+            c.kwargs["collection_name"]
+            for c in mock_qdrant_client.client.query_points.call_args_list
+        }
+        assert searched == {"test_collection", "test_cold"}
+        text_embedder = await mock_embedder_factory.get_text_embedder()
+        text_embedder.embed.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_recent_time_range_skips_cold_tier(
+        self,
+        tiered_retriever: SearchRetriever,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test a time range inside the hot window only searches the hot tier."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        now_ms = int(time.time() * 1000)
+
+        query = SearchQuery(
+            text="test",
+            strategy=SearchStrategy.DENSE,
+            rerank=False,
+            filters=SearchFilters(
+                org_id="test-org-123", time_range=TimeRange(start=now_ms - 3_600_000, end=now_ms)
+            ),
+        )
+        await tiered_retriever.search_turns(query)
+
+        mock_qdrant_client.client.query_points.assert_awaited_once()
+        kwargs = mock_qdrant_client.client.query_points.call_args.kwargs
+        assert kwargs["collection_name"] == "test_collection"
+
+    @pytest.mark.asyncio
+    async def test_projected_payloads_hydrated_per_tier(
+        self,
+        tiered_retriever: SearchRetriever,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test fanned-out candidates are hydrated from the tier they came from."""
+
+        async def retrieve(**kwargs):
+            return [
+                models.Record(id=point_id, payload={"tier": kwargs["collection_name"]})
+                for point_id in kwargs["ids"]
+            ]
+
+        mock_qdrant_client.client.retrieve = AsyncMock(side_effect=retrieve)
+        stage = FirstStageResult(
+            raw_results=[self.point("a", 0.9), self.point("c", 0.8)],
+            strategy=SearchStrategy.DENSE,
+            collection_name="test_collection",
+            payload_selector=models.PayloadSelectorInclude(include=["id"]),
+            point_collections={"a": "test_collection", "c": "test_cold"},
+        )
+
+        results = await tiered_retriever._finalize(SearchQuery(text="test", rerank=False), stage)
+
+        assert {r.id: r.payload["tier"] for r in results} == {
+            "a": "test_collection",
+            "c": "test_cold",
+        }
+
+
+class TestSearchRetrieverFederated:
+    """Test federated search across the turns and memory collections."""
+
+    @staticmethod
+    def point(point_id: str, score: float) -> models.ScoredPoint:
+        return models.ScoredPoint(id=point_id, version=0, score=score, payload={"id": point_id})
+
+    @staticmethod
+    def batch(*points: models.ScoredPoint) -> MagicMock:
+        response = MagicMock()
+        response.points = list(points)
+        return response
+
+    @pytest.mark.asyncio
+    async def test_one_batch_per_collection_with_normalised_scores(
+        self,
+        retriever: SearchRetriever,
+        mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test both collections are queried once each and merged on a shared scale."""
+        batches = {
+            "test_collection": [
+                self.batch(self.point("t1", 0.9), self.point("t2", 0.7)),
+                self.batch(self.point("t1", 12.0)),
+            ],
+            "engram_memory": [
+                self.batch(self.point("m1", 0.6), self.point("m2", 0.5)),
+                self.batch(self.point("m1", 3.0), self.point("m2", 1.0)),
+            ],
+        }
+
+        async def query_batch_points(collection_name, requests):
+            return batches[collection_name]
+
+        mock_qdrant_client.client.query_batch_points = AsyncMock(side_effect=query_batch_points)
+
+        query = SearchQuery(
+            text="test",
+            strategy=SearchStrategy.HYBRID,
+            rerank=False,
+            filters=SearchFilters(org_id="test-org-123", session_id="s1", project="engram"),
+        )
+        results = await retriever.search_federated(query)
+
+        assert [(r.id, r.collection) for r in results] == [
+            ("t1", "test_collection"),
+            ("t2", "test_collection"),
+            ("m1", "engram_memory"),
+            ("m2", "engram_memory"),
+        ]
+        # Normalised over both sources: the best memory no longer scores 1.0
+        assert results[0].score == pytest.approx(1.0)
+        assert results[2].score < 0.5
+
+        calls = {
+            c.kwargs["collection_name"]: c.kwargs["requests"]
+            for c in mock_qdrant_client.client.query_batch_points.call_args_list
+        }
+        assert [r.using for r in calls["test_collection"]] == ["turn_dense", "turn_sparse"]
+        assert [r.using for r in calls["engram_memory"]] == ["text_dense", "text_sparse"]
+        memory_keys = {c.key for c in calls["engram_memory"][0].filter.must}
+        assert memory_keys == {"org_id", "project"}
+        text_embedder = await mock_embedder_factory.get_text_embedder()
+        text_embedder.embed.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_weak_source_does_not_outrank_strong_hits(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test a source's only, weak hit is not promoted to the top score."""
+        batches = {
+            "test_collection": [self.batch(self.point("t1", 0.9), self.point("t2", 0.8))],
+            "engram_memory": [self.batch(self.point("m1", 0.3))],
+        }
+
+        async def query_batch_points(collection_name, requests):
+            return batches[collection_name]
+
+        mock_qdrant_client.client.query_batch_points = AsyncMock(side_effect=query_batch_points)
+
+        query = SearchQuery(
+            text="test", strategy=SearchStrategy.DENSE, rerank=False, filters=test_filters
+        )
+        results = await retriever.search_federated(query)
+
+        assert [r.id for r in results] == ["t1", "t2", "m1"]
+        assert results[2].score == pytest.approx(0.0)
+
+    @pytest.mark.asyncio
+    async def test_combined_candidates_reranked_once(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test turn and memory candidates go through a single rerank pass."""
+        batches = {
+            "test_collection": [self.batch(self.point("t1", 0.9))],
+            "engram_memory": [self.batch(self.point("m1", 0.8))],
+        }
+
+        async def query_batch_points(collection_name, requests):
+            return batches[collection_name]
+
+        mock_qdrant_client.client.query_batch_points = AsyncMock(side_effect=query_batch_points)
+        mock_qdrant_client.client.retrieve = AsyncMock(return_value=[])
+        retriever._apply_reranking = AsyncMock(  # type: ignore[method-assign]
+            return_value=[SearchResultItem(id="m1", score=0.99, payload={})]
+        )
+
+        query = SearchQuery(
+            text="test", strategy=SearchStrategy.DENSE, rerank=True, filters=test_filters
+        )
+        results = await retriever.search_federated(query)
+
+        retriever._apply_reranking.assert_awaited_once()
+        reranked = retriever._apply_reranking.call_args.kwargs["raw_results"]
+        assert {str(p.id) for p in reranked} == {"t1", "m1"}
+        assert results[0].collection == "engram_memory"
+
+
+class TestSearchRetrieverSimilar:
+    """Test similar-by-id search over stored vectors."""
+
+    MEMORY_ID = "01JGABCD1111111111111111111"
+
+    @staticmethod
+    def record(point_id: str, org_id: str = "test-org-123") -> models.Record:
+        return models.Record(id=point_id, payload={"org_id": org_id})
+
+    @staticmethod
+    def point(point_id: str, score: float) -> models.ScoredPoint:
+        return models.ScoredPoint(id=point_id, version=0, score=score, payload={"id": point_id})
+
+    @staticmethod
+    def batch(*points: models.ScoredPoint) -> MagicMock:
+        response = MagicMock()
+        response.points = list(points)
+        return response
+
+    def test_point_id_maps_node_ids(self) -> None:
+        """Test ULID node IDs map to their uuid5 point IDs and UUIDs pass through."""
+        point_id = "5c56c793-69f3-4fbf-87e6-c4bf54c28c26"
+        assert SearchRetriever.point_id(point_id) == point_id
+        assert SearchRetriever.point_id(self.MEMORY_ID) == str(
+            uuid.uuid5(uuid.NAMESPACE_OID, self.MEMORY_ID)
+        )
 
     @pytest.mark.asyncio
-    async def test_search_dense_basic(
+    async def test_batch_queries_stored_vectors_without_embedding(
         self,
         retriever: SearchRetriever,
         test_filters: SearchFilters,
         mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
     ) -> None:
-        """Test basic dense search."""
-        mock_result = create_mock_point(
-            "test-id-1", 0.95, {"content": "test content", "session_id": "session-1"}
+        """Test all IDs go out in one batch by point ID, excluding each source."""
+        first = SearchRetriever.point_id(self.MEMORY_ID)
+        second = str(uuid.uuid4())
+        mock_qdrant_client.client.retrieve = AsyncMock(
+            return_value=[self.record(first), self.record(second)]
+        )
+        mock_qdrant_client.client.query_batch_points = AsyncMock(
+            return_value=[
+                self.batch(self.point("m2", 0.9), self.point("m3", 0.7)),
+                self.batch(self.point("m4", 0.8)),
+            ]
         )
 
-        mock_response = MagicMock()
-        mock_response.points = [mock_result]
-        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
-
-        query = SearchQuery(
-            text="test query",
-            limit=10,
-            strategy=SearchStrategy.DENSE,
-            rerank=False,
-            filters=test_filters,
+        results = await retriever.search_similar(
+            [self.MEMORY_ID, second], test_filters, limit=5, score_threshold=0.65
         )
-        results = await retriever.search(query)
 
-        assert len(results) == 1
-        assert results[0].id == "test-id-1"
-        assert results[0].score == 0.95
-        mock_qdrant_client.client.query_points.assert_called_once()
+        assert [[r.id for r in items] for items in results] == [["m2", "m3"], ["m4"]]
+        assert all(r.collection == "engram_memory" for items in results for r in items)
+
+        mock_qdrant_client.client.query_batch_points.assert_awaited_once()
+        call = mock_qdrant_client.client.query_batch_points.call_args
+        assert call.kwargs["collection_name"] == "engram_memory"
+        requests = call.kwargs["requests"]
+        assert [r.query for r in requests] == [first, second]
+        assert {r.using for r in requests} == {"text_dense"}
+        assert requests[0].limit == 5
+        assert requests[0].score_threshold == 0.65
+        assert requests[0].filter.must_not[0].has_id == [first]
+        assert requests[0].lookup_from is None
+        mock_embedder_factory.get_text_embedder.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_search_dense_code_filter(
+    async def test_unknown_and_foreign_ids_get_no_results(
         self,
         retriever: SearchRetriever,
         test_filters: SearchFilters,
         mock_qdrant_client: MagicMock,
-        mock_embedder_factory: MagicMock,
     ) -> None:
-        """Test dense search with code type filter uses code embedder."""
-        mock_response = MagicMock()
-        mock_response.points = []
-        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
-
-        query = SearchQuery(
-            text="function definition",
-            limit=10,
-            strategy=SearchStrategy.DENSE,
-            filters=SearchFilters(org_id="test-org-123", type="code"),
-            rerank=False,
+        """Test IDs missing or owned by another org are dropped instead of queried."""
+        foreign = str(uuid.uuid4())
+        missing = str(uuid.uuid4())
+        mock_qdrant_client.client.retrieve = AsyncMock(
+            return_value=[self.record(foreign, org_id="other-org")]
         )
-        await retriever.search(query)
+        mock_qdrant_client.client.query_batch_points = AsyncMock()
 
-        # Verify code embedder was used
-        mock_embedder_factory.get_code_embedder.assert_called_once()
-        # Verify text embedder was NOT used
-        mock_embedder_factory.get_text_embedder.assert_not_called()
+        results = await retriever.search_similar([foreign, missing], test_filters)
+
+        assert results == [[], []]
+        mock_qdrant_client.client.query_batch_points.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_search_dense_threshold(
+    async def test_turns_look_up_cold_sources_across_tiers(
         self,
         retriever: SearchRetriever,
         test_filters: SearchFilters,
         mock_qdrant_client: MagicMock,
     ) -> None:
-        """Test dense search applies custom threshold."""
-        mock_response = MagicMock()
-        mock_response.points = []
-        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        """Test a cold-tier source is looked up from the hot tier and results merged."""
+        retriever.turn_tiers = TurnTiers(
+            enabled=True, hot_collection="test_collection", cold_collection="test_cold"
+        )
+        source = str(uuid.uuid4())
 
-        custom_threshold = 0.8
+        async def retrieve(collection_name, **kwargs):
+            return [self.record(source)] if collection_name == "test_cold" else []
+
+        batches = {
+            "test_collection": [self.batch(self.point("a", 0.6))],
+            "test_cold": [self.batch(self.point("b", 0.8))],
+        }
+
+        async def query_batch_points(collection_name, requests):
+            return batches[collection_name]
+
+        mock_qdrant_client.client.retrieve = AsyncMock(side_effect=retrieve)
+        mock_qdrant_client.client.query_batch_points = AsyncMock(side_effect=query_batch_points)
+
+        results = await retriever.search_similar(
+            [source], test_filters, collection="test_collection", vector=SimilarVector.COLBERT
+        )
+
+        assert [(r.id, r.collection) for r in results[0]] == [
+            ("b", "test_cold"),
+            ("a", "test_collection"),
+        ]
+        calls = {
+            c.kwargs["collection_name"]: c.kwargs["requests"][0]
+            for c in mock_qdrant_client.client.query_batch_points.call_args_list
+        }
+        assert calls["test_collection"].using == "turn_colbert"
+        assert calls["test_collection"].lookup_from.collection == "test_cold"
+        assert calls["test_cold"].lookup_from is None
+
+    @pytest.mark.asyncio
+    async def test_memory_has_no_colbert_vector(
+        self, retriever: SearchRetriever, test_filters: SearchFilters
+    ) -> None:
+        """Test asking for a vector the collection lacks is rejected."""
+        with pytest.raises(ValueError, match="colbert"):
+            await retriever.search_similar(
+                ["01JGABCD1111111111111111111"], test_filters, vector=SimilarVector.COLBERT
+            )
+
+
+class TestSearchRetrieverPagination:
+    """Test cursor pagination over cached reranked lists."""
+
+    @pytest.mark.asyncio
+    async def test_later_pages_served_from_cache(
+        self, retriever: SearchRetriever, test_filters: SearchFilters
+    ) -> None:
+        """Test the first page searches to rerank depth once and later pages reuse it."""
+        ranked = [SearchResultItem(id=f"r{i}", score=1.0 - i / 100, payload={}) for i in range(30)]
+        retriever.search_turns = AsyncMock(return_value=ranked)  # type: ignore[method-assign]
         query = SearchQuery(
-            text="test",
-            limit=10,
-            strategy=SearchStrategy.DENSE,
-            threshold=custom_threshold,
-            rerank=False,
-            filters=test_filters,
+            text="test", limit=10, rerank=True, rerank_depth=30, filters=test_filters
         )
-        await retriever.search(query)
 
-        call_args = mock_qdrant_client.client.query_points.call_args
-        assert call_args.kwargs["score_threshold"] == custom_threshold
+        first = await retriever.search_page(query)
+        second = await retriever.search_page(query, cursor=first.next_cursor)
 
+        assert [r.id for r in first.items] == [f"r{i}" for i in range(10)]
+        assert [r.id for r in second.items] == [f"r{i}" for i in range(10, 20)]
+        retriever.search_turns.assert_awaited_once()
+        assert retriever.search_turns.call_args.args[0].limit == 30
 
-class TestSearchRetrieverSparse:
-    """Test sparse search strategy."""
+    @pytest.mark.asyncio
+    async def test_federated_first_page(
+        self, retriever: SearchRetriever, test_filters: SearchFilters
+    ) -> None:
+        """Test federated pagination runs the federated search."""
+        retriever.search_federated = AsyncMock(return_value=[])  # type: ignore[method-assign]
+        query = SearchQuery(text="test", filters=test_filters)
+
+        page = await retriever.search_page(query, federated=True)
+
+        assert page.items == []
+        assert page.next_cursor is None
+        retriever.search_federated.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_search_sparse_basic(
+    async def test_cursor_requires_org(self, retriever: SearchRetriever) -> None:
+        """Test paging without an org_id fails tenant isolation before any lookup."""
+        with pytest.raises(ValueError, match="org_id"):
+            await retriever.search_page(SearchQuery(text="test"), cursor="anything")
+
+
+class TestSearchRetrieverDeadline:
+    """Test request deadline budgeting across search stages."""
+
+    @staticmethod
+    def deadline_in(ms: float) -> int:
+        """Absolute deadline the given number of milliseconds from now."""
+        return int(time.time() * 1000 + ms)
+
+    @staticmethod
+    def mock_candidates(mock_qdrant_client: MagicMock) -> None:
+        mock_response = MagicMock()
+        mock_response.points = [
+            create_mock_point("a", 0.9, {"content": "first"}),
+            create_mock_point("b", 0.8, {"content": "second"}),
+        ]
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        mock_qdrant_client.client.retrieve = AsyncMock(return_value=[])
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_rejected_before_work(
         self,
         retriever: SearchRetriever,
         test_filters: SearchFilters,
         mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
     ) -> None:
-        """Test basic sparse search."""
-        mock_result = create_mock_point("test-id-2", 0.8, {"content": "sparse result"})
-
-        mock_response = MagicMock()
-        mock_response.points = [mock_result]
-        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
-
+        """Test an expired deadline fails fast without embedding or querying."""
+        initial = SEARCH_DEADLINE_MISSES.labels(stage="first_stage")._value._value
         query = SearchQuery(
-            text="exact keyword search",
-            limit=5,
-            strategy=SearchStrategy.SPARSE,
-            rerank=False,
+            text="test",
+            strategy=SearchStrategy.DENSE,
             filters=test_filters,
+            deadline_ms=self.deadline_in(-10),
         )
-        results = await retriever.search(query)
 
-        assert len(results) == 1
-        assert results[0].id == "test-id-2"
+        with pytest.raises(DeadlineExceededError):
+            await retriever.search_turns(query)
+
+        mock_embedder_factory.get_text_embedder.assert_not_called()
+        mock_qdrant_client.client.query_points.assert_not_called()
+        assert SEARCH_DEADLINE_MISSES.labels(stage="first_stage")._value._value == initial + 1
 
     @pytest.mark.asyncio
-    async def test_search_sparse_vector_format(
+    async def test_slow_first_stage_exceeds_deadline(
         self,
         retriever: SearchRetriever,
         test_filters: SearchFilters,
-        mock_qdrant_client: MagicMock,
         mock_embedder_factory: MagicMock,
     ) -> None:
-        """Test sparse search creates correct Qdrant SparseVector format."""
-        mock_response = MagicMock()
-        mock_response.points = []
-        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        """Test a first stage that outruns its budget raises instead of finishing."""
 
-        # Set up sparse embedder to return known indices/values
-        sparse_embedder = await mock_embedder_factory.get_sparse_embedder()
-        sparse_embedder.embed_sparse.return_value = {5: 0.9, 15: 0.7, 25: 0.5}
+        async def slow_embed(*args: Any, **kwargs: Any) -> list[float]:
+            await asyncio.sleep(1)
+            return [0.1] * 768
 
+        text_embedder = await mock_embedder_factory.get_text_embedder()
+        text_embedder.embed = AsyncMock(side_effect=slow_embed)
         query = SearchQuery(
             text="test",
-            limit=10,
-            strategy=SearchStrategy.SPARSE,
+            strategy=SearchStrategy.DENSE,
             rerank=False,
             filters=test_filters,
+            deadline_ms=self.deadline_in(50),
         )
-        await retriever.search(query)
-
-        # Verify query_points was called with SparseVector
-        call_args = mock_qdrant_client.client.query_points.call_args
-        query_param = call_args.kwargs["query"]
-        assert isinstance(query_param, models.SparseVector)
-        assert query_param.indices == [5, 15, 25]
-        assert query_param.values == [0.9, 0.7, 0.5]
-
 
-class TestSearchRetrieverHybrid:
-    """Test hybrid search strategy."""
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            await retriever.search_turns(query)
+        assert exc_info.value.stage == "first_stage"
 
     @pytest.mark.asyncio
-    async def test_search_hybrid_basic(
+    async def test_tight_deadline_skips_oversampling_and_reranking(
         self,
         retriever: SearchRetriever,
         test_filters: SearchFilters,
         mock_qdrant_client: MagicMock,
+        mock_reranker_router: MagicMock,
     ) -> None:
-        """Test hybrid search with RRF fusion."""
-        mock_result = create_mock_point("test-id-3", 0.85, {"content": "hybrid result"})
-
-        mock_response = MagicMock()
-        mock_response.points = [mock_result]
-        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        """Test a budget too small to rerank fetches only top-k and skips reranking."""
+        self.mock_candidates(mock_qdrant_client)
+        mock_reranker_router.rerank = AsyncMock()
+        initial = SEARCH_DEADLINE_DEGRADATIONS.labels(action="skip_rerank")._value._value
 
         query = SearchQuery(
-            text="semantic and keyword search",
-            limit=10,
-            strategy=SearchStrategy.HYBRID,
-            rerank=False,
+            text="test",
+            limit=2,
+            strategy=SearchStrategy.DENSE,
+            rerank=True,
+            rerank_depth=30,
             filters=test_filters,
+            deadline_ms=self.deadline_in(30),
         )
-        results = await retriever.search(query)
+        results = await retriever.search_turns(query)
 
-        # Verify hybrid uses prefetch
-        assert len(results) == 1
-        call_args = mock_qdrant_client.client.query_points.call_args
-        assert call_args.kwargs.get("prefetch") is not None
-        assert len(call_args.kwargs["prefetch"]) == 2  # Dense + Sparse
+        assert mock_qdrant_client.client.query_points.call_args.kwargs["limit"] == 2
+        mock_reranker_router.rerank.assert_not_called()
+        assert all(r.degraded for r in results)
+        assert (
+            SEARCH_DEADLINE_DEGRADATIONS.labels(action="skip_rerank")._value._value == initial + 1
+        )
 
     @pytest.mark.asyncio
-    async def test_search_hybrid_rrf_fusion_query(
+    async def test_reranker_timeout_capped_by_remaining_budget(
         self,
         retriever: SearchRetriever,
         test_filters: SearchFilters,
         mock_qdrant_client: MagicMock,
+        mock_reranker_router: MagicMock,
     ) -> None:
-        """Test hybrid search uses RRF fusion query."""
-        mock_response = MagicMock()
-        mock_response.points = []
-        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+        """Test the reranker gets the remaining budget rather than its fixed timeout."""
+        self.mock_candidates(mock_qdrant_client)
+        ranked = MagicMock()
+        ranked.original_index = 0
+        ranked.score = 0.95
+        mock_reranker_router.rerank = AsyncMock(return_value=([ranked], "fast", False))
 
         query = SearchQuery(
             text="test",
-            limit=10,
-            strategy=SearchStrategy.HYBRID,
-            rerank=False,
+            limit=1,
+            strategy=SearchStrategy.DENSE,
+            rerank=True,
+            rerank_tier="fast",
             filters=test_filters,
+            deadline_ms=self.deadline_in(1000),
         )
-        await retriever.search(query)
+        await retriever.search_turns(query)
 
-        call_args = mock_qdrant_client.client.query_points.call_args
-        query_param = call_args.kwargs["query"]
-        assert isinstance(query_param, models.FusionQuery)
-        assert query_param.fusion == models.Fusion.RRF
+        kwargs = mock_reranker_router.rerank.call_args.kwargs
+        # Fixture reranker timeout is 5000ms; the deadline leaves at most 1000ms
+        assert 0 < kwargs["timeout_ms"] <= 1000
+        # Not enough budget for a second attempt on the fallback tier
+        assert kwargs["fallback_tier"] is None
 
     @pytest.mark.asyncio
-    async def test_search_hybrid_code_filter(
+    async def test_phases_report_deadline_rerank_skip(
         self,
         retriever: SearchRetriever,
         test_filters: SearchFilters,
         mock_qdrant_client: MagicMock,
-        mock_embedder_factory: MagicMock,
     ) -> None:
-        """Test hybrid search with code filter uses code embedder."""
-        mock_response = MagicMock()
-        mock_response.points = []
-        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
-
+        """Test streaming phases mark reranking as skipped for the deadline."""
+        self.mock_candidates(mock_qdrant_client)
         query = SearchQuery(
-            text="code search",
-            limit=10,
-            strategy=SearchStrategy.HYBRID,
-            filters=SearchFilters(org_id="test-org-123", type="code"),
-            rerank=False,
+            text="test",
+            strategy=SearchStrategy.DENSE,
+            rerank=True,
+            filters=test_filters,
+            deadline_ms=self.deadline_in(20),
         )
-        await retriever.search(query)
 
-        # Verify code embedder was used
-        mock_embedder_factory.get_code_embedder.assert_called_once()
+        phases = [phase async for phase in retriever.search_phases(query)]
+
+        assert phases[-1].phase == SearchPhaseType.RERANK_SKIPPED
+        assert phases[-1].reason == "deadline"
 
 
 class TestSearchRetrieverReranking:
@@ -544,6 +1718,108 @@ class TestSearchRetrieverTurns:
         assert results[0].id == "turn-1"
 
 
+class TestSearchRetrieverTurnChunks:
+    """Test turn search over late-chunked turn vectors."""
+
+    @pytest.fixture
+    def chunk_retriever(
+        self,
+        mock_qdrant_client: MagicMock,
+        mock_embedder_factory: MagicMock,
+        mock_reranker_router: MagicMock,
+        mock_settings: Settings,
+    ) -> SearchRetriever:
+        """Create a retriever that matches late chunk vectors."""
+        return SearchRetriever(
+            qdrant_client=mock_qdrant_client,
+            embedder_factory=mock_embedder_factory,
+            reranker_router=mock_reranker_router,
+            settings=mock_settings,
+            turn_chunks=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_dense_keeps_best_score_per_turn(
+        self,
+        chunk_retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test whole-turn and best-chunk matches merge by max score."""
+        dense = MagicMock()
+        dense.points = [
+            models.ScoredPoint(id=1, version=0, score=0.6, payload={"content": "a"}),
+            models.ScoredPoint(id=2, version=0, score=0.7, payload={"content": "b"}),
+        ]
+        chunks = MagicMock()
+        chunks.points = [
+            models.ScoredPoint(id=1, version=0, score=0.9, payload={"content": "a"}),
+            models.ScoredPoint(id=3, version=0, score=0.65, payload={"content": "c"}),
+        ]
+        mock_qdrant_client.client.query_batch_points = AsyncMock(return_value=[dense, chunks])
+
+        query = SearchQuery(
+            text="test", limit=10, strategy=SearchStrategy.DENSE, rerank=False, filters=test_filters
+        )
+        results = await chunk_retriever.search_turns(query)
+
+        assert [r.id for r in results] == [1, 2, 3]
+        assert results[0].score == pytest.approx(0.9)
+        requests = mock_qdrant_client.client.query_batch_points.call_args.kwargs["requests"]
+        assert [r.using for r in requests] == ["turn_dense", "turn_chunks"]
+        assert requests[1].query == [requests[0].query]
+        mock_qdrant_client.client.query_points.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hybrid_fuses_chunks_into_dense_branch(
+        self,
+        chunk_retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test server-side fusion nests the chunk prefetch under the dense branch."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            rerank=False,
+            filters=test_filters,
+        )
+        await chunk_retriever.search_turns(query)
+
+        dense_branch, sparse_branch = mock_query_prefetch(mock_qdrant_client)
+        assert [p.using for p in dense_branch.prefetch] == ["turn_dense", "turn_chunks"]
+        assert dense_branch.query.fusion == models.Fusion.RRF
+        assert sparse_branch.using == "turn_sparse"
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(
+        self,
+        retriever: SearchRetriever,
+        test_filters: SearchFilters,
+        mock_qdrant_client: MagicMock,
+    ) -> None:
+        """Test turn search does not query chunk vectors unless enabled."""
+        mock_response = MagicMock()
+        mock_response.points = []
+        mock_qdrant_client.client.query_points = AsyncMock(return_value=mock_response)
+
+        query = SearchQuery(
+            text="test",
+            limit=10,
+            strategy=SearchStrategy.HYBRID,
+            rerank=False,
+            filters=test_filters,
+        )
+        await retriever.search_turns(query)
+
+        assert all(p.prefetch is None for p in mock_query_prefetch(mock_qdrant_client))
+
+
 class TestSearchRetrieverAggregation:
     """Test result aggregation and deduplication."""
 
@@ -699,7 +1975,9 @@ class TestSearchRetrieverFilters:
             text="test",
             limit=10,
             strategy=SearchStrategy.DENSE,
-            filters=SearchFilters(org_id="test-org-123", time_range=TimeRange(start=1000, end=2000)),
+            filters=SearchFilters(
+                org_id="test-org-123", time_range=TimeRange(start=1000, end=2000)
+            ),
             rerank=False,
         )
         await retriever.search(query)
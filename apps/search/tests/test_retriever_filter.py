@@ -11,6 +11,10 @@ from qdrant_client.http import models
 
 from src.config import Settings
 from src.retrieval import SearchFilters, SearchRetriever, TimeRange
+from src.services.schema_manager import (
+    get_memory_collection_schema,
+    get_turns_collection_schema,
+)
 
 
 @pytest.fixture
@@ -350,3 +354,48 @@ class TestBuildQdrantFilter:
         # Count org_id conditions
         org_conditions = [c for c in result.must if c.key == "org_id"]
         assert len(org_conditions) == 1, "Should only have exactly one org_id condition"
+
+
+class TestFilteredFieldsAreIndexed:
+    """Every field the retriever filters on must have a payload index."""
+
+    @staticmethod
+    def _all_filters() -> SearchFilters:
+        return SearchFilters(
+            org_id="test-org-123",
+            session_id="session-456",
+            type="code",
+            time_range=TimeRange(start=1000, end=2000),
+            vt_end_after=1500,
+            project="engram",
+        )
+
+    def test_all_search_filter_fields_set(self) -> None:
+        """Guard: the filter above must exercise every SearchFilters field."""
+        filters = self._all_filters()
+        assert all(getattr(filters, name) is not None for name in SearchFilters.model_fields)
+
+    def test_build_qdrant_filter_fields_indexed(self, retriever: SearchRetriever) -> None:
+        """Test that _build_qdrant_filter only uses indexed payload fields."""
+        schema = get_turns_collection_schema(retriever.collection_name)
+        result = retriever._build_qdrant_filter(self._all_filters())
+
+        filtered = {condition.key for condition in result.must}
+        indexed = {index.field_name for index in schema.payload_indexes}
+        assert filtered - indexed == set()
+
+    def test_build_memory_filter_fields_indexed(self, retriever: SearchRetriever) -> None:
+        """Test that _build_memory_filter only uses fields indexed on memories."""
+        schema = get_memory_collection_schema()
+        result = retriever._build_memory_filter(self._all_filters())
+
+        filtered = {condition.key for condition in result.must}
+        indexed = {index.field_name for index in schema.payload_indexes}
+        assert "session_id" not in filtered
+        assert "project" in filtered
+        assert filtered - indexed == set()
+
+    def test_session_retriever_fields_indexed(self) -> None:
+        """Test that the session-aware retriever's filter fields are indexed."""
+        indexed = {index.field_name for index in get_turns_collection_schema().payload_indexes}
+        assert {"org_id", "session_id"} <= indexed
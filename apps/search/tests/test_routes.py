@@ -1,14 +1,29 @@
 """Comprehensive tests for API routes."""
 
+import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from qdrant_client.http import models as qdrant_models
 
 from src.api.router import router
+from src.config import Settings
 from src.middleware.auth import AuthContext
-from src.retrieval.types import RerankerTier
+from src.retrieval.pagination import InvalidCursorError, SearchPage
+from src.retrieval.planner import current_query_plan
+from src.retrieval.types import (
+    PlanMode,
+    QueryPlan,
+    RerankerTier,
+    SearchPhase,
+    SearchPhaseType,
+    SearchResultItem,
+)
+from src.services.sharding import ShardRouter
+from src.utils.deadline import DeadlineExceededError
 
 # Mock auth context for authenticated requests (OAuth format)
 MOCK_AUTH_CONTEXT = AuthContext(
@@ -231,6 +246,7 @@ class TestSearchEndpoint:
         mock_result.rerank_tier = None
         mock_result.payload = {"content": "test"}
         mock_result.degraded = False
+        mock_result.collection = None
 
         mock_search_retriever.search_turns.return_value = [mock_result]
 
@@ -265,6 +281,33 @@ class TestSearchEndpoint:
 
         assert response.status_code == 200
 
+    async def test_search_reports_query_plan(
+        self, client: AsyncClient, mock_search_retriever
+    ) -> None:
+        """Test the planner's first-stage decision is returned with the results."""
+
+        async def search_turns(query):
+            current_query_plan.set(
+                QueryPlan(mode=PlanMode.EXACT, fetch_limit=40, estimated_matches=40)
+            )
+            return []
+
+        mock_search_retriever.search_turns = AsyncMock(side_effect=search_turns)
+
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query", "filters": {"session_id": "session-123"}},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["plan"] == {
+            "mode": "exact",
+            "fetch_limit": 40,
+            "estimated_matches": 40,
+            "hnsw_ef": None,
+            "cached": False,
+        }
+
     async def test_search_with_reranking(self, client: AsyncClient, mock_search_retriever) -> None:
         """Test search with reranking enabled."""
         mock_result = MagicMock()
@@ -275,6 +318,7 @@ class TestSearchEndpoint:
         mock_result.rerank_tier = RerankerTier.FAST
         mock_result.payload = {}
         mock_result.degraded = False
+        mock_result.collection = None
 
         mock_search_retriever.search_turns.return_value = [mock_result]
 
@@ -332,6 +376,267 @@ class TestSearchEndpoint:
         assert "Search failed" in data["detail"]
 
 
+class TestSearchPagination:
+    """Tests for cursor pagination on /query."""
+
+    async def test_first_page_returns_cursor(
+        self, client: AsyncClient, mock_search_retriever
+    ) -> None:
+        """Test a paginated search returns the page and a next cursor."""
+        mock_search_retriever.search_page = AsyncMock(
+            return_value=SearchPage(
+                items=[SearchResultItem(id="r0", score=0.9, payload={})], next_cursor="next"
+            )
+        )
+
+        response = await client.post(
+            "/v1/search/query", json={"text": "q", "limit": 1, "paginate": True}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["id"] for r in data["results"]] == ["r0"]
+        assert data["next_cursor"] == "next"
+        call = mock_search_retriever.search_page.call_args
+        assert call.kwargs["cursor"] is None
+        assert call.kwargs["turns"] is True
+        assert call.args[0].filters.org_id == "test-org"
+        mock_search_retriever.search_turns.assert_not_called()
+
+    async def test_cursor_page(self, client: AsyncClient, mock_search_retriever) -> None:
+        """Test a cursor is passed through to the retriever."""
+        mock_search_retriever.search_page = AsyncMock(return_value=SearchPage(items=[]))
+
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "q", "cursor": "abc", "collection": "federated"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] is None
+        call = mock_search_retriever.search_page.call_args
+        assert call.kwargs["cursor"] == "abc"
+        assert call.kwargs["federated"] is True
+
+    async def test_invalid_cursor(self, client: AsyncClient, mock_search_retriever) -> None:
+        """Test expired or foreign cursors map to 400."""
+        mock_search_retriever.search_page = AsyncMock(
+            side_effect=InvalidCursorError("Cursor expired")
+        )
+
+        response = await client.post("/v1/search/query", json={"text": "q", "cursor": "abc"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Cursor expired"
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"text": "q", "paginate": True, "stream": True},
+            {"text": "q", "cursor": "abc", "collection": "engram_memory"},
+        ],
+    )
+    async def test_pagination_unsupported(
+        self, client: AsyncClient, mock_search_retriever, body: dict
+    ) -> None:
+        """Test pagination is rejected for streaming and the memory collection."""
+        mock_search_retriever.search_page = AsyncMock()
+
+        response = await client.post("/v1/search/query", json=body)
+
+        assert response.status_code == 400
+        mock_search_retriever.search_page.assert_not_called()
+
+
+class TestStreamingSearchEndpoint:
+    """Tests for /query with stream=true (NDJSON phases)."""
+
+    async def test_stream_candidates_then_reranked(
+        self, client: AsyncClient, mock_search_retriever
+    ) -> None:
+        """Test streaming emits candidates followed by reranked results."""
+
+        async def phases(query, turns=True):
+            yield SearchPhase(
+                phase=SearchPhaseType.CANDIDATES,
+                results=[SearchResultItem(id="a", score=0.5, payload={"content": "x"})],
+            )
+            yield SearchPhase(
+                phase=SearchPhaseType.RERANKED,
+                results=[
+                    SearchResultItem(
+                        id="a",
+                        score=0.9,
+                        reranker_score=0.9,
+                        rerank_tier=RerankerTier.FAST,
+                        payload={"content": "x"},
+                    )
+                ],
+            )
+
+        mock_search_retriever.search_phases = MagicMock(side_effect=phases)
+
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query", "limit": 10, "rerank": True, "stream": True},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.strip().split("\n")]
+        assert [line["phase"] for line in lines] == ["candidates", "reranked"]
+        assert lines[0]["results"][0]["score"] == 0.5
+        assert lines[1]["results"][0]["rerank_tier"] == "fast"
+        assert mock_search_retriever.search_phases.call_args.kwargs["turns"] is True
+
+    async def test_stream_rerank_skipped(self, client: AsyncClient, mock_search_retriever) -> None:
+        """Test streaming emits a rerank_skipped marker when reranking is off."""
+
+        async def phases(query, turns=True):
+            yield SearchPhase(phase=SearchPhaseType.CANDIDATES, results=[])
+            yield SearchPhase(phase=SearchPhaseType.RERANK_SKIPPED, reason="rerank_disabled")
+
+        mock_search_retriever.search_phases = MagicMock(side_effect=phases)
+
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query", "stream": True},
+        )
+
+        lines = [json.loads(line) for line in response.text.strip().split("\n")]
+        assert lines[1] == {
+            "phase": "rerank_skipped",
+            "results": [],
+            "total": 0,
+            "took_ms": lines[1]["took_ms"],
+            "reason": "rerank_disabled",
+            "plan": None,
+        }
+
+    async def test_stream_first_stage_error_returns_500(
+        self, client: AsyncClient, mock_search_retriever
+    ) -> None:
+        """Test first-stage failures still surface as HTTP errors."""
+
+        async def phases(query, turns=True):
+            raise Exception("Qdrant down")
+            yield  # pragma: no cover
+
+        mock_search_retriever.search_phases = MagicMock(side_effect=phases)
+
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query", "stream": True},
+        )
+
+        assert response.status_code == 500
+
+    async def test_stream_memory_collection_rejected(self, client: AsyncClient) -> None:
+        """Test streaming is rejected for the memory collection."""
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query", "stream": True, "collection": "engram_memory"},
+        )
+
+        assert response.status_code == 400
+
+    async def test_stream_federated_rejected(self, client: AsyncClient) -> None:
+        """Test streaming is rejected for federated search."""
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query", "stream": True, "collection": "federated"},
+        )
+
+        assert response.status_code == 400
+
+
+class TestSearchDeadline:
+    """Tests for request deadlines on /query."""
+
+    async def test_expired_deadline_header_rejected(
+        self, client: AsyncClient, mock_search_retriever
+    ) -> None:
+        """Test an already-expired deadline returns 504 without searching."""
+        expired = str(int(time.time() * 1000) - 1000)
+
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query"},
+            headers={"X-Request-Deadline": expired},
+        )
+
+        assert response.status_code == 504
+        mock_search_retriever.search_turns.assert_not_called()
+
+    async def test_timeout_propagated_to_query(
+        self, client: AsyncClient, mock_search_retriever
+    ) -> None:
+        """Test the earliest of header and body budgets becomes the query deadline."""
+        before_ms = time.time() * 1000
+
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query", "timeout_ms": 5000},
+            headers={"X-Request-Timeout-Ms": "200"},
+        )
+
+        assert response.status_code == 200
+        query = mock_search_retriever.search_turns.call_args.args[0]
+        assert before_ms + 200 - 1 <= query.deadline_ms < before_ms + 5000
+
+    async def test_no_deadline_by_default(self, client: AsyncClient, mock_search_retriever) -> None:
+        """Test queries carry no deadline unless the caller sets one."""
+        await client.post("/v1/search/query", json={"text": "test query"})
+
+        query = mock_search_retriever.search_turns.call_args.args[0]
+        assert query.deadline_ms is None
+
+    async def test_invalid_deadline_header(self, client: AsyncClient) -> None:
+        """Test a malformed deadline header is rejected."""
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query"},
+            headers={"X-Request-Deadline": "soon"},
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        ("header", "value"),
+        [
+            ("X-Request-Deadline", "nan"),
+            ("X-Request-Deadline", "inf"),
+            ("X-Request-Timeout-Ms", "-inf"),
+            ("X-Request-Timeout-Ms", "nan"),
+        ],
+    )
+    async def test_non_finite_deadline_header(
+        self, client: AsyncClient, mock_search_retriever, header: str, value: str
+    ) -> None:
+        """Test NaN and infinite deadline headers are rejected before searching."""
+        response = await client.post(
+            "/v1/search/query", json={"text": "test query"}, headers={header: value}
+        )
+
+        assert response.status_code == 400
+        mock_search_retriever.search_turns.assert_not_called()
+
+    async def test_deadline_exceeded_mid_search(
+        self, client: AsyncClient, mock_search_retriever
+    ) -> None:
+        """Test a deadline hit during search maps to 504."""
+        mock_search_retriever.search_turns = AsyncMock(
+            side_effect=DeadlineExceededError("first_stage")
+        )
+
+        response = await client.post(
+            "/v1/search/query",
+            json={"text": "test query", "timeout_ms": 100},
+        )
+
+        assert response.status_code == 504
+
+
 class TestEmbedEndpoint:
     """Tests for /embed endpoint."""
 
@@ -621,7 +926,7 @@ class TestMemoryIndexEndpoint:
 
         # Mock sparse embedder (BM25)
         mock_sparse_embedder = MagicMock()
-        mock_sparse_embedder.embed_sparse = MagicMock(return_value={10: 0.5, 20: 0.3})
+        mock_sparse_embedder.embed_sparse_async = AsyncMock(return_value={10: 0.5, 20: 0.3})
 
         async def get_embedder_mock(embedder_type):
             if embedder_type == "text":
@@ -656,6 +961,57 @@ class TestMemoryIndexEndpoint:
         # Verify upsert was called
         mock_qdrant.client.upsert.assert_called_once()
 
+    async def test_index_memory_routes_to_org_shard(
+        self, client: AsyncClient, app_with_mocks, mock_qdrant, mock_embedder_factory
+    ) -> None:
+        """Test memory upserts carry the caller's shard key when sharding is on."""
+        app_with_mocks.state.shard_router = ShardRouter(enabled=True)
+        mock_text_embedder = AsyncMock()
+        mock_text_embedder.embed = AsyncMock(return_value=[0.1, 0.2, 0.3])
+        mock_embedder_factory.get_embedder = AsyncMock(return_value=mock_text_embedder)
+        mock_embedder_factory.get_sparse_embedder = AsyncMock(side_effect=ImportError("none"))
+        mock_qdrant.client = MagicMock()
+        mock_qdrant.client.upsert = AsyncMock()
+
+        response = await client.post(
+            "/v1/search/index-memory",
+            json={"id": "01JGABCDEFGHIJKLMNOPQRSTUV", "content": "Test", "type": "fact"},
+        )
+
+        assert response.status_code == 200
+        kwargs = mock_qdrant.client.upsert.call_args.kwargs
+        assert kwargs["shard_key_selector"] == "default"
+
+    async def test_index_memory_unchanged_skips_embedding(
+        self, client: AsyncClient, mock_qdrant, mock_embedder_factory
+    ) -> None:
+        """Test re-indexing identical memory content skips embedding and upsert."""
+        mock_text_embedder = AsyncMock()
+        mock_text_embedder.embed = AsyncMock(return_value=[0.1, 0.2, 0.3])
+        mock_embedder_factory.get_embedder = AsyncMock(return_value=mock_text_embedder)
+        mock_embedder_factory.get_sparse_embedder = AsyncMock(side_effect=ImportError("none"))
+        mock_embedder_factory.model_versions = MagicMock(
+            return_value={"text": "bge", "sparse": "bm25", "colbert": "colbert"}
+        )
+        mock_qdrant.client = MagicMock()
+        mock_qdrant.client.upsert = AsyncMock()
+        mock_qdrant.client.retrieve = AsyncMock(return_value=[])
+        body = {"id": "01JGABCDEFGHIJKLMNOPQRSTUV", "content": "Test", "type": "fact"}
+
+        first = await client.post("/v1/search/index-memory", json=body)
+        stored = mock_qdrant.client.upsert.call_args.kwargs["points"][0]
+        mock_qdrant.client.retrieve = AsyncMock(
+            return_value=[qdrant_models.Record(id=stored.id, payload=stored.payload)]
+        )
+        second = await client.post("/v1/search/index-memory", json=body)
+
+        assert first.json()["unchanged"] is False
+        assert second.status_code == 200
+        assert second.json()["indexed"] is True
+        assert second.json()["unchanged"] is True
+        mock_text_embedder.embed.assert_called_once()
+        mock_qdrant.client.upsert.assert_called_once()
+
     async def test_index_memory_no_sparse_embedder(
         self, client: AsyncClient, mock_qdrant, mock_embedder_factory
     ) -> None:
@@ -792,6 +1148,7 @@ class TestRecreateCollectionEndpoint:
             mock_schema_manager = MagicMock()
             mock_schema_manager.delete_collection = AsyncMock(return_value=True)
             mock_schema_manager.create_collection = AsyncMock()
+            mock_schema_manager.ensure_payload_indexes = AsyncMock(return_value=[])
             mock_schema_manager_cls.return_value = mock_schema_manager
 
             response = await client.post("/v1/search/admin/engram_memory/recreate")
@@ -816,6 +1173,8 @@ class TestRecreateCollectionEndpoint:
             mock_schema_manager = MagicMock()
             mock_schema_manager.delete_collection = AsyncMock(return_value=False)
             mock_schema_manager.create_collection = AsyncMock()
+            mock_schema_manager.ensure_payload_indexes = AsyncMock(return_value=[])
+            mock_schema_manager.has_vector = AsyncMock(return_value=False)
             mock_schema_manager_cls.return_value = mock_schema_manager
 
             response = await client.post("/v1/search/admin/engram_turns/recreate")
@@ -826,6 +1185,55 @@ class TestRecreateCollectionEndpoint:
             assert data["collection"] == "engram_turns"
             assert data["deleted"] is False
             assert data["created"] is True
+            schema = mock_schema_manager.create_collection.call_args.args[0]
+            assert schema.late_chunk_vector_name is None
+
+    async def test_recreate_turns_collection_keeps_late_chunks(
+        self, client: AsyncClient, mock_qdrant
+    ) -> None:
+        """Test recreating a turns collection keeps its late chunk vector."""
+        with patch("src.api.routes.SchemaManager") as mock_schema_manager_cls:
+            mock_schema_manager = MagicMock()
+            mock_schema_manager.delete_collection = AsyncMock(return_value=True)
+            mock_schema_manager.create_collection = AsyncMock()
+            mock_schema_manager.ensure_payload_indexes = AsyncMock(return_value=[])
+            mock_schema_manager.has_vector = AsyncMock(return_value=True)
+            mock_schema_manager_cls.return_value = mock_schema_manager
+
+            response = await client.post("/v1/search/admin/engram_turns/recreate")
+
+            assert response.status_code == 200
+            schema = mock_schema_manager.create_collection.call_args.args[0]
+            assert schema.late_chunk_vector_name == "turn_chunks"
+            mock_schema_manager.has_vector.assert_awaited_once_with("engram_turns", "turn_chunks")
+
+    @pytest.mark.parametrize(("routing_enabled", "shard_keys"), [(True, ["default"]), (False, [])])
+    async def test_recreate_collection_matches_shard_routing(
+        self,
+        client: AsyncClient,
+        app_with_mocks: FastAPI,
+        mock_qdrant,
+        routing_enabled: bool,
+        shard_keys: list[str],
+    ) -> None:
+        """Test the collection only gets shard keys if this server routes by them."""
+        app_with_mocks.state.shard_router = ShardRouter(enabled=routing_enabled)
+        settings = Settings(_env_file=None, qdrant_shard_by_org=True)
+        with (
+            patch("src.api.routes.SchemaManager") as mock_schema_manager_cls,
+            patch("src.api.routes.get_settings", return_value=settings),
+        ):
+            mock_schema_manager = MagicMock()
+            mock_schema_manager.delete_collection = AsyncMock(return_value=True)
+            mock_schema_manager.create_collection = AsyncMock()
+            mock_schema_manager.ensure_payload_indexes = AsyncMock(return_value=[])
+            mock_schema_manager_cls.return_value = mock_schema_manager
+
+            response = await client.post("/v1/search/admin/engram_memory/recreate")
+
+            assert response.status_code == 200
+            schema = mock_schema_manager.create_collection.call_args.args[0]
+            assert schema.shard_keys == shard_keys
 
     async def test_recreate_collection_invalid_name(self, client: AsyncClient) -> None:
         """Test recreation with invalid collection name."""
@@ -955,6 +1363,31 @@ class TestSearchMemoryCollection:
         # Should call search_turns for default collection
         mock_search_retriever.search_turns.assert_called_once()
 
+    async def test_search_federated(self, client: AsyncClient, mock_search_retriever) -> None:
+        """Test federated search returns turns and memories tagged by collection."""
+        mock_search_retriever.search_federated = AsyncMock(
+            return_value=[
+                SearchResultItem(id="m1", score=0.9, payload={}, collection="engram_memory"),
+                SearchResultItem(id="t1", score=0.8, payload={}, collection="engram_turns"),
+            ]
+        )
+
+        response = await client.post(
+            "/v1/search/query",
+            json={
+                "text": "test query",
+                "collection": "federated",
+                "filters": {"project": "engram"},
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["collection"] for r in data["results"]] == ["engram_memory", "engram_turns"]
+        query = mock_search_retriever.search_federated.call_args.args[0]
+        assert query.filters.project == "engram"
+        mock_search_retriever.search_turns.assert_not_called()
+
 
 class TestMultiQueryWithTimeRange:
     """Tests for multi-query search with time range filters."""
@@ -1433,3 +1866,251 @@ class TestConflictCandidatesEndpoint:
         assert data[0]["type"] == "context"
         # vt_start defaults to 0 when missing
         assert data[0]["vt_start"] == 0
+
+    async def test_conflict_candidates_by_id_skips_embedding(
+        self, client: AsyncClient, mock_search_retriever, mock_embedder_factory
+    ) -> None:
+        """Test an indexed memory's stored vector is used instead of embedding content."""
+        mock_search_retriever.search_similar = AsyncMock(
+            return_value=[
+                [
+                    SearchResultItem(
+                        id="candidate-1",
+                        score=0.9,
+                        payload={
+                            "node_id": "01JGABCD2222222222222222222",
+                            "content": "Similar memory",
+                            "type": "fact",
+                            "vt_start": 1704067200000,
+                        },
+                    )
+                ]
+            ]
+        )
+        mock_embedder_factory.get_embedder = AsyncMock()
+
+        response = await client.post(
+            "/v1/search/conflict-candidates",
+            json={"id": "01JGABCD1111111111111111111", "project": "engram"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["id"] for c in data] == ["01JGABCD2222222222222222222"]
+        mock_embedder_factory.get_embedder.assert_not_called()
+
+        call = mock_search_retriever.search_similar.call_args
+        assert call.args[0] == ["01JGABCD1111111111111111111"]
+        assert call.args[1].org_id == "test-org"
+        assert call.args[1].project == "engram"
+        assert call.kwargs["score_threshold"] == 0.65
+
+    async def test_conflict_candidates_requires_content_or_id(self, client: AsyncClient) -> None:
+        """Test a request with neither content nor id is rejected."""
+        response = await client.post("/v1/search/conflict-candidates", json={})
+
+        assert response.status_code == 400
+
+
+class TestConflictCandidatesBatchEndpoint:
+    """Tests for /conflict-candidates/batch endpoint."""
+
+    @staticmethod
+    def memory_point(node_id: str, score: float) -> MagicMock:
+        point = MagicMock()
+        point.id = f"uuid-{node_id}"
+        point.score = score
+        point.payload = {"node_id": node_id, "content": node_id, "type": "fact", "vt_start": 1}
+        return point
+
+    async def test_batch_one_embedding_and_one_query(
+        self, client: AsyncClient, mock_qdrant, mock_embedder_factory
+    ) -> None:
+        """Test all items are embedded together and searched in one batch call."""
+        mock_embedder = AsyncMock()
+        # Items 0 and 2 are near-identical, item 1 is orthogonal to both
+        mock_embedder.embed_batch = AsyncMock(
+            return_value=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.9, 0.1, 0.0]]
+        )
+        mock_embedder_factory.get_embedder = AsyncMock(return_value=mock_embedder)
+
+        first, second, third = MagicMock(), MagicMock(), MagicMock()
+        first.points = [self.memory_point("existing-1", 0.91)]
+        second.points = []
+        third.points = [self.memory_point("existing-2", 0.7)]
+        mock_qdrant.client = MagicMock()
+        mock_qdrant.client.query_batch_points = AsyncMock(return_value=[first, second, third])
+
+        response = await client.post(
+            "/v1/search/conflict-candidates/batch",
+            json={
+                "items": [
+                    {"content": "a", "project": "engram"},
+                    {"content": "b"},
+                    {"content": "a again"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert [c["id"] for c in results[0]["candidates"]] == ["existing-1"]
+        assert results[1]["candidates"] == []
+        assert [c["index"] for c in results[0]["batch_conflicts"]] == [2]
+        assert [c["index"] for c in results[2]["batch_conflicts"]] == [0]
+        assert results[0]["batch_conflicts"][0]["score"] == pytest.approx(0.9939, abs=1e-3)
+        assert results[1]["batch_conflicts"] == []
+
+        mock_embedder.embed_batch.assert_awaited_once_with(["a", "b", "a again"], is_query=True)
+        mock_qdrant.client.query_batch_points.assert_awaited_once()
+        requests = mock_qdrant.client.query_batch_points.call_args.kwargs["requests"]
+        assert len(requests) == 3
+        assert {r.score_threshold for r in requests} == {0.65}
+        assert {c.key for c in requests[0].filter.must} == {"org_id", "project"}
+        assert {c.key for c in requests[1].filter.must} == {"org_id"}
+
+    async def test_batch_conflicts_scoped_by_project(
+        self, client: AsyncClient, mock_qdrant, mock_embedder_factory
+    ) -> None:
+        """Test identical items in different projects do not conflict with each other."""
+        mock_embedder = AsyncMock()
+        mock_embedder.embed_batch = AsyncMock(return_value=[[1.0, 0.0]] * 4)
+        mock_embedder_factory.get_embedder = AsyncMock(return_value=mock_embedder)
+        empty = MagicMock()
+        empty.points = []
+        mock_qdrant.client = MagicMock()
+        mock_qdrant.client.query_batch_points = AsyncMock(return_value=[empty] * 4)
+
+        response = await client.post(
+            "/v1/search/conflict-candidates/batch",
+            json={
+                "items": [
+                    {"content": "a", "project": "engram"},
+                    {"content": "a", "project": "other"},
+                    {"content": "a"},
+                    {"content": "a", "project": "engram"},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        conflicts = [
+            sorted(c["index"] for c in r["batch_conflicts"]) for r in response.json()["results"]
+        ]
+        assert conflicts == [[2, 3], [2], [0, 1, 3], [0, 2]]
+
+    async def test_batch_search_failure(
+        self, client: AsyncClient, mock_qdrant, mock_embedder_factory
+    ) -> None:
+        """Test Qdrant failures map to 500."""
+        mock_embedder = AsyncMock()
+        mock_embedder.embed_batch = AsyncMock(return_value=[[1.0, 0.0]])
+        mock_embedder_factory.get_embedder = AsyncMock(return_value=mock_embedder)
+        mock_qdrant.client = MagicMock()
+        mock_qdrant.client.query_batch_points = AsyncMock(side_effect=RuntimeError("boom"))
+
+        response = await client.post(
+            "/v1/search/conflict-candidates/batch", json={"items": [{"content": "a"}]}
+        )
+
+        assert response.status_code == 500
+
+    async def test_batch_rejects_empty(self, client: AsyncClient) -> None:
+        """Test an empty batch fails validation."""
+        response = await client.post("/v1/search/conflict-candidates/batch", json={"items": []})
+
+        assert response.status_code == 422
+
+
+class TestSimilarEndpoint:
+    """Tests for /similar endpoint."""
+
+    async def test_similar_batch(self, client: AsyncClient, mock_search_retriever) -> None:
+        """Test one result list per source ID, in request order."""
+        mock_search_retriever.search_similar = AsyncMock(
+            return_value=[
+                [
+                    SearchResultItem(
+                        id="m2", score=0.9, payload={"content": "x"}, collection="engram_memory"
+                    )
+                ],
+                [],
+            ]
+        )
+
+        response = await client.post(
+            "/v1/search/similar",
+            json={"ids": ["a", "b"], "limit": 3, "threshold": 0.7, "filters": {"type": "fact"}},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [group["id"] for group in data["results"]] == ["a", "b"]
+        assert data["results"][0]["results"][0]["id"] == "m2"
+        assert data["results"][0]["results"][0]["collection"] == "engram_memory"
+        assert data["results"][1]["results"] == []
+
+        call = mock_search_retriever.search_similar.call_args
+        assert call.args[0] == ["a", "b"]
+        assert call.args[1].org_id == "test-org"
+        assert call.args[1].type == "fact"
+        assert call.kwargs["collection"] == "engram_memory"
+        assert call.kwargs["limit"] == 3
+        assert call.kwargs["score_threshold"] == 0.7
+
+    async def test_similar_turns_use_retriever_collection(
+        self, client: AsyncClient, mock_search_retriever
+    ) -> None:
+        """Test turn lookups go to the retriever's turns collection with the chosen vector."""
+        mock_search_retriever.turns_collection_name = "engram_turns"
+        mock_search_retriever.search_similar = AsyncMock(return_value=[[]])
+
+        response = await client.post(
+            "/v1/search/similar",
+            json={"ids": ["t1"], "collection": "engram_turns", "vector": "colbert"},
+        )
+
+        assert response.status_code == 200
+        call = mock_search_retriever.search_similar.call_args
+        assert call.kwargs["collection"] == "engram_turns"
+        assert call.kwargs["vector"].value == "colbert"
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"ids": ["a"], "collection": "federated"},
+            {"ids": ["a"], "vector": "code"},
+        ],
+    )
+    async def test_similar_rejects_invalid_request(
+        self, client: AsyncClient, mock_search_retriever, body: dict
+    ) -> None:
+        """Test unsupported collections and vectors return 400."""
+        mock_search_retriever.search_similar = AsyncMock()
+
+        response = await client.post("/v1/search/similar", json=body)
+
+        assert response.status_code == 400
+        mock_search_retriever.search_similar.assert_not_called()
+
+    async def test_similar_missing_vector_is_bad_request(
+        self, client: AsyncClient, mock_search_retriever
+    ) -> None:
+        """Test a vector the collection lacks maps to 400."""
+        mock_search_retriever.search_similar = AsyncMock(
+            side_effect=ValueError("Collection 'engram_memory' has no colbert vector")
+        )
+
+        response = await client.post("/v1/search/similar", json={"ids": ["a"], "vector": "colbert"})
+
+        assert response.status_code == 400
+        assert "colbert" in response.json()["detail"]
+
+    async def test_similar_failure(self, client: AsyncClient, mock_search_retriever) -> None:
+        """Test Qdrant failures map to 500."""
+        mock_search_retriever.search_similar = AsyncMock(side_effect=RuntimeError("boom"))
+
+        response = await client.post("/v1/search/similar", json={"ids": ["a"]})
+
+        assert response.status_code == 500
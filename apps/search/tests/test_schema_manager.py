@@ -7,7 +7,18 @@ from qdrant_client.http import models
 
 from src.clients.qdrant import QdrantClientWrapper
 from src.config import Settings
-from src.services.schema_manager import CollectionSchema, SchemaManager, get_turns_collection_schema
+from src.services.schema_manager import (
+    CollectionSchema,
+    PayloadIndex,
+    QuantizationType,
+    SchemaManager,
+    VectorPlacement,
+    VectorQuantization,
+    apply_storage_settings,
+    get_turns_collection_schema,
+    quantization_from_settings,
+)
+from src.services.sharding import ShardRouter
 
 
 class TestSchemaManager:
@@ -140,6 +151,517 @@ class TestSchemaManager:
         assert "text_colbert" not in vectors_config
         assert "text_dense" in vectors_config
 
+    @pytest.mark.asyncio
+    async def test_create_collection_with_quantization(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test quantization is configured per named vector."""
+        schema = CollectionSchema(
+            collection_name="test_collection",
+            quantization={
+                "text_dense": VectorQuantization(type=QuantizationType.SCALAR),
+                "text_colbert": VectorQuantization(type=QuantizationType.BINARY),
+            },
+        )
+        mock_qdrant_wrapper.client.create_collection = AsyncMock()  # type: ignore[method-assign]
+
+        await schema_manager.create_collection(schema)
+
+        vectors_config = mock_qdrant_wrapper.client.create_collection.call_args.kwargs[
+            "vectors_config"
+        ]
+        dense_quantization = vectors_config["text_dense"].quantization_config
+        assert isinstance(dense_quantization, models.ScalarQuantization)
+        assert dense_quantization.scalar.type == models.ScalarType.INT8
+        assert dense_quantization.scalar.always_ram is True
+        assert isinstance(
+            vectors_config["text_colbert"].quantization_config, models.BinaryQuantization
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_collection_without_quantization(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+        default_schema: CollectionSchema,
+    ) -> None:
+        """Test vectors are unquantized by default."""
+        mock_qdrant_wrapper.client.create_collection = AsyncMock()  # type: ignore[method-assign]
+
+        await schema_manager.create_collection(default_schema)
+
+        vectors_config = mock_qdrant_wrapper.client.create_collection.call_args.kwargs[
+            "vectors_config"
+        ]
+        assert vectors_config["text_dense"].quantization_config is None
+        assert vectors_config["text_colbert"].quantization_config is None
+
+    def test_quantization_rejected_for_sparse_vector(self) -> None:
+        """Test quantization can only target dense or ColBERT vectors."""
+        with pytest.raises(ValueError, match="unknown or sparse"):
+            CollectionSchema(
+                collection_name="test",
+                quantization={"text_sparse": VectorQuantization(type=QuantizationType.SCALAR)},
+            )
+
+    def test_product_quantization_config(self) -> None:
+        """Test product quantization carries its compression ratio."""
+        config = VectorQuantization(
+            type=QuantizationType.PRODUCT,
+            compression=models.CompressionRatio.X32,
+            always_ram=False,
+        ).to_qdrant()
+
+        assert isinstance(config, models.ProductQuantization)
+        assert config.product.compression == models.CompressionRatio.X32
+        assert config.product.always_ram is False
+
+    def test_quantization_from_settings(self) -> None:
+        """Test quantization is built from settings and off by default."""
+        assert quantization_from_settings(Settings()) is None
+
+        quantization = quantization_from_settings(Settings(qdrant_quantization="binary"))
+        assert quantization is not None
+        assert quantization.type == QuantizationType.BINARY
+
+    def test_invalid_quantization_setting(self) -> None:
+        """Test unknown quantization methods are rejected."""
+        with pytest.raises(ValueError):
+            Settings(qdrant_quantization="float8")
+
+    @pytest.mark.asyncio
+    async def test_create_collection_with_tiered_placement(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test dense stays in RAM while ColBERT, sparse index and payload go to disk."""
+        schema = CollectionSchema(
+            collection_name="test_collection",
+            vector_placement={
+                "text_dense": VectorPlacement(on_disk=False, hnsw_on_disk=False),
+                "text_colbert": VectorPlacement(on_disk=True, hnsw_on_disk=True),
+            },
+            sparse_index_on_disk=True,
+            on_disk_payload=True,
+            memmap_threshold_kb=20000,
+            indexing_threshold_kb=10000,
+        )
+        mock_qdrant_wrapper.client.create_collection = AsyncMock()  # type: ignore[method-assign]
+
+        await schema_manager.create_collection(schema)
+
+        kwargs = mock_qdrant_wrapper.client.create_collection.call_args.kwargs
+        dense = kwargs["vectors_config"]["text_dense"]
+        colbert = kwargs["vectors_config"]["text_colbert"]
+        assert dense.on_disk is False
+        assert dense.hnsw_config.on_disk is False
+        assert colbert.on_disk is True
+        assert colbert.hnsw_config.on_disk is True
+        assert kwargs["sparse_vectors_config"]["text_sparse"].index.on_disk is True
+        assert kwargs["on_disk_payload"] is True
+        assert kwargs["optimizers_config"].memmap_threshold == 20000
+        assert kwargs["optimizers_config"].indexing_threshold == 10000
+
+    @pytest.mark.asyncio
+    async def test_create_collection_default_placement(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+        default_schema: CollectionSchema,
+    ) -> None:
+        """Test placement falls back to the schema-wide flag and Qdrant defaults."""
+        mock_qdrant_wrapper.client.create_collection = AsyncMock()  # type: ignore[method-assign]
+
+        await schema_manager.create_collection(default_schema)
+
+        kwargs = mock_qdrant_wrapper.client.create_collection.call_args.kwargs
+        assert kwargs["vectors_config"]["text_colbert"].on_disk is False
+        assert kwargs["vectors_config"]["text_colbert"].hnsw_config.on_disk is None
+        assert kwargs["sparse_vectors_config"]["text_sparse"].index is None
+        assert kwargs["on_disk_payload"] is None
+        assert kwargs["optimizers_config"] is None
+
+    @staticmethod
+    def mock_live_collection(colbert_on_disk: bool, payload_on_disk: bool) -> MagicMock:
+        """Build collection info for an existing collection."""
+        info = MagicMock()
+        info.config.params.vectors = {
+            "text_dense": models.VectorParams(size=768, distance=models.Distance.COSINE),
+            "text_colbert": models.VectorParams(
+                size=128, distance=models.Distance.COSINE, on_disk=colbert_on_disk
+            ),
+        }
+        info.config.params.sparse_vectors = {"text_sparse": models.SparseVectorParams()}
+        info.config.params.on_disk_payload = payload_on_disk
+        info.config.hnsw_config.on_disk = False
+        info.config.optimizer_config.memmap_threshold = None
+        info.config.optimizer_config.indexing_threshold = 20000
+        return info
+
+    @pytest.mark.asyncio
+    async def test_reconcile_storage_updates_changed_placement(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test only settings that differ from the live collection are updated."""
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(  # type: ignore[method-assign]
+            return_value=self.mock_live_collection(colbert_on_disk=False, payload_on_disk=True)
+        )
+        mock_qdrant_wrapper.client.update_collection = AsyncMock()  # type: ignore[method-assign]
+        schema = CollectionSchema(
+            collection_name="test_collection",
+            vector_placement={"text_colbert": VectorPlacement(on_disk=True, hnsw_on_disk=True)},
+            on_disk_payload=True,
+            indexing_threshold_kb=20000,
+        )
+
+        updated = await schema_manager.reconcile_storage(schema)
+
+        assert updated is True
+        kwargs = mock_qdrant_wrapper.client.update_collection.call_args.kwargs
+        assert set(kwargs["vectors_config"]) == {"text_colbert"}
+        assert kwargs["vectors_config"]["text_colbert"].on_disk is True
+        assert kwargs["vectors_config"]["text_colbert"].hnsw_config.on_disk is True
+        assert kwargs["sparse_vectors_config"] is None
+        assert kwargs["collection_params"] is None
+        assert kwargs["optimizers_config"] is None
+
+    @pytest.mark.asyncio
+    async def test_reconcile_storage_noop_when_matching(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test no update is sent when placement already matches."""
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(  # type: ignore[method-assign]
+            return_value=self.mock_live_collection(colbert_on_disk=True, payload_on_disk=True)
+        )
+        mock_qdrant_wrapper.client.update_collection = AsyncMock()  # type: ignore[method-assign]
+        schema = CollectionSchema(
+            collection_name="test_collection",
+            vector_placement={"text_colbert": VectorPlacement(on_disk=True)},
+            on_disk_payload=True,
+        )
+
+        assert await schema_manager.reconcile_storage(schema) is False
+        mock_qdrant_wrapper.client.update_collection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_storage_missing_collection(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test reconciling a missing collection raises."""
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=None)  # type: ignore[method-assign]
+
+        with pytest.raises(ValueError, match="does not exist"):
+            await schema_manager.reconcile_storage(CollectionSchema(collection_name="missing"))
+
+    def test_apply_storage_settings(self) -> None:
+        """Test placement settings map onto the schema's vector names."""
+        settings = Settings(
+            qdrant_colbert_on_disk=True,
+            qdrant_payload_on_disk=True,
+            qdrant_memmap_threshold_kb=50000,
+        )
+
+        schema = apply_storage_settings(get_turns_collection_schema(), settings)
+
+        assert schema.vector_on_disk("turn_dense") is False
+        assert schema.vector_on_disk("turn_colbert") is True
+        assert schema.on_disk_payload is True
+        assert schema.memmap_threshold_kb == 50000
+
+    def test_apply_storage_settings_sharding(self) -> None:
+        """Test shard-by-org settings give the schema default + dedicated shard keys."""
+        settings = Settings(
+            qdrant_shard_by_org=True,
+            qdrant_dedicated_shard_orgs=["big-org"],
+            qdrant_shards_per_key=2,
+        )
+
+        schema = apply_storage_settings(get_turns_collection_schema(), settings)
+
+        assert schema.custom_sharding is True
+        assert schema.shard_keys == ["default", "big-org"]
+        assert schema.shards_per_key == 2
+        assert apply_storage_settings(get_turns_collection_schema(), Settings()).shard_keys == []
+
+    @pytest.mark.asyncio
+    async def test_create_collection_with_shard_keys(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test custom sharding and shard key creation."""
+        schema = CollectionSchema(
+            collection_name="test_collection", shard_keys=["default", "big-org"], shards_per_key=2
+        )
+        mock_qdrant_wrapper.client.create_collection = AsyncMock()  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.create_shard_key = AsyncMock()  # type: ignore[method-assign]
+
+        await schema_manager.create_collection(schema)
+
+        kwargs = mock_qdrant_wrapper.client.create_collection.call_args.kwargs
+        assert kwargs["sharding_method"] == models.ShardingMethod.CUSTOM
+        assert kwargs["shard_number"] == 2
+        created = [
+            c.kwargs["shard_key"]
+            for c in mock_qdrant_wrapper.client.create_shard_key.call_args_list
+        ]
+        assert created == ["default", "big-org"]
+
+    @pytest.mark.asyncio
+    async def test_create_collection_auto_sharding_by_default(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+        default_schema: CollectionSchema,
+    ) -> None:
+        """Test that schemas without shard keys keep automatic sharding."""
+        mock_qdrant_wrapper.client.create_collection = AsyncMock()  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.create_shard_key = AsyncMock()  # type: ignore[method-assign]
+
+        await schema_manager.create_collection(default_schema)
+
+        kwargs = mock_qdrant_wrapper.client.create_collection.call_args.kwargs
+        assert kwargs["sharding_method"] is None
+        mock_qdrant_wrapper.client.create_shard_key.assert_not_called()
+
+    @staticmethod
+    def mock_sharded_collection(
+        mock_qdrant_wrapper: QdrantClientWrapper, custom: bool, shard_keys: list[str]
+    ) -> None:
+        """Mock an existing collection's sharding method and shard keys."""
+        info = MagicMock()
+        info.config.params.sharding_method = (
+            models.ShardingMethod.CUSTOM if custom else models.ShardingMethod.AUTO
+        )
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=info)  # type: ignore[method-assign]
+        cluster = MagicMock()
+        cluster.local_shards = [MagicMock(shard_key=key) for key in shard_keys]
+        cluster.remote_shards = []
+        mock_qdrant_wrapper.client.collection_cluster_info = AsyncMock(return_value=cluster)  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.create_shard_key = AsyncMock()  # type: ignore[method-assign]
+
+    @pytest.mark.asyncio
+    async def test_ensure_shard_keys_creates_missing(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that only shard keys for newly dedicated orgs are created."""
+        self.mock_sharded_collection(mock_qdrant_wrapper, custom=True, shard_keys=["default"])
+        schema = CollectionSchema(collection_name="test_collection", shard_keys=["default", "big"])
+
+        assert await schema_manager.ensure_shard_keys(schema) == ["big"]
+        mock_qdrant_wrapper.client.create_shard_key.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_ensure_shard_keys_requires_migration(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that auto-sharded collections must be migrated first."""
+        self.mock_sharded_collection(mock_qdrant_wrapper, custom=False, shard_keys=[])
+        schema = CollectionSchema(collection_name="test_collection", shard_keys=["default"])
+
+        with pytest.raises(ValueError, match="migrate_sharding"):
+            await schema_manager.ensure_shard_keys(schema)
+
+    @pytest.mark.asyncio
+    async def test_shard_router_disabled_by_settings(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test no collection is checked when sharding is off."""
+        mock_qdrant_wrapper.get_collection_info = AsyncMock()  # type: ignore[method-assign]
+
+        router = await schema_manager.shard_router()
+
+        assert not router.enabled
+        mock_qdrant_wrapper.get_collection_info.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shard_router_custom_sharded(
+        self, mock_qdrant_wrapper: QdrantClientWrapper
+    ) -> None:
+        """Test the configured router is used when every collection has shard keys."""
+        settings = Settings(
+            _env_file=None,
+            qdrant_collection="test_collection",
+            qdrant_shard_by_org=True,
+            qdrant_dedicated_shard_orgs=["big"],
+            session_centroids_enabled=True,
+        )
+        self.mock_sharded_collection(mock_qdrant_wrapper, custom=True, shard_keys=["default"])
+
+        router = await SchemaManager(mock_qdrant_wrapper, settings).shard_router()
+
+        assert router.enabled
+        assert router.shard_key("big") == "big"
+        checked = [c.args[0] for c in mock_qdrant_wrapper.get_collection_info.call_args_list]
+        assert checked == ["test_collection", "engram_memory", "sessions"]
+
+    @pytest.mark.asyncio
+    async def test_shard_router_falls_back_for_auto_sharded(
+        self, mock_qdrant_wrapper: QdrantClientWrapper
+    ) -> None:
+        """Test an auto-sharded collection disables routing until it is migrated."""
+        settings = Settings(_env_file=None, qdrant_shard_by_org=True)
+        self.mock_sharded_collection(mock_qdrant_wrapper, custom=False, shard_keys=[])
+
+        router = await SchemaManager(mock_qdrant_wrapper, settings).shard_router(["engram_turns"])
+
+        assert not router.enabled
+        assert router.selector_kwargs("org-1") == {}
+
+    @pytest.mark.asyncio
+    async def test_shard_router_skips_missing_collections(
+        self, mock_qdrant_wrapper: QdrantClientWrapper
+    ) -> None:
+        """Test collections the server has not created yet keep routing enabled."""
+        settings = Settings(_env_file=None, qdrant_shard_by_org=True)
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=None)  # type: ignore[method-assign]
+
+        router = await SchemaManager(mock_qdrant_wrapper, settings).shard_router(["engram_turns"])
+
+        assert router.enabled
+
+    @pytest.mark.asyncio
+    async def test_migrate_sharding_moves_dedicated_org_points(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that a dedicated org's points move from the default shard to its own."""
+        self.mock_sharded_collection(mock_qdrant_wrapper, custom=True, shard_keys=["default"])
+        record = models.Record(id=1, payload={"org_id": "big"}, vector={"text_dense": [0.1]})
+        mock_qdrant_wrapper.client.scroll = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[([record], None), ([], None)]
+        )
+        mock_qdrant_wrapper.client.upsert = AsyncMock()  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.delete = AsyncMock()  # type: ignore[method-assign]
+        schema = CollectionSchema(collection_name="test_collection", shard_keys=["default", "big"])
+        router = ShardRouter(enabled=True, dedicated_orgs=["big"])
+
+        assert await schema_manager.migrate_sharding(schema, router) == 1
+
+        scroll_kwargs = mock_qdrant_wrapper.client.scroll.call_args.kwargs
+        assert scroll_kwargs["shard_key_selector"] == "default"
+        assert scroll_kwargs["scroll_filter"].must[0].match.value == "big"
+        upsert_kwargs = mock_qdrant_wrapper.client.upsert.call_args.kwargs
+        assert upsert_kwargs["shard_key_selector"] == "big"
+        delete_kwargs = mock_qdrant_wrapper.client.delete.call_args.kwargs
+        assert delete_kwargs["shard_key_selector"] == "default"
+        assert delete_kwargs["points_selector"].points == [1]
+
+    @pytest.mark.asyncio
+    async def test_move_points_copies_then_deletes(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that matching points are written to the target before leaving the source."""
+        record = models.Record(id=1, payload={"org_id": "org"}, vector={"turn_dense": [0.1]})
+        mock_qdrant_wrapper.client.scroll = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[([record], None), ([], None)]
+        )
+        mock_qdrant_wrapper.client.upsert = AsyncMock()  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.delete = AsyncMock()  # type: ignore[method-assign]
+        scroll_filter = models.Filter(
+            must=[models.FieldCondition(key="timestamp", range=models.Range(lt=100))]
+        )
+
+        moved = await schema_manager.move_points("hot", "cold", ShardRouter(), scroll_filter)
+
+        assert moved == 1
+        assert mock_qdrant_wrapper.client.scroll.call_args.kwargs["scroll_filter"] == scroll_filter
+        assert mock_qdrant_wrapper.client.upsert.call_args.kwargs["collection_name"] == "cold"
+        delete_kwargs = mock_qdrant_wrapper.client.delete.call_args.kwargs
+        assert delete_kwargs["collection_name"] == "hot"
+        assert delete_kwargs["points_selector"].points == [1]
+
+    @pytest.mark.asyncio
+    async def test_move_points_drains_each_shard_key(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that custom-sharded sources are drained one shard key at a time."""
+        mock_qdrant_wrapper.client.scroll = AsyncMock(  # type: ignore[method-assign]
+            return_value=([], None)
+        )
+        router = ShardRouter(enabled=True, dedicated_orgs=["big"])
+
+        assert await schema_manager.move_points("hot", "cold", router, models.Filter()) == 0
+
+        selectors = [
+            c.kwargs["shard_key_selector"] for c in mock_qdrant_wrapper.client.scroll.call_args_list
+        ]
+        assert selectors == ["default", "big"]
+
+    @pytest.mark.asyncio
+    async def test_migrate_sharding_rebuilds_auto_sharded_collection(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that an auto-sharded collection is copied out and back with shard keys."""
+        self.mock_sharded_collection(mock_qdrant_wrapper, custom=False, shard_keys=[])
+        records = [
+            models.Record(id=1, payload={"org_id": "big"}, vector={"text_dense": [0.1]}),
+            models.Record(id=2, payload={"org_id": "small"}, vector={"text_dense": [0.2]}),
+        ]
+        mock_qdrant_wrapper.client.scroll = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[(records, None), (records, None)]
+        )
+        mock_qdrant_wrapper.client.upsert = AsyncMock()  # type: ignore[method-assign]
+        schema_manager.delete_collection = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        schema_manager.create_collection = AsyncMock()  # type: ignore[method-assign]
+        schema_manager.ensure_payload_indexes = AsyncMock(return_value=[])  # type: ignore[method-assign]
+        schema = CollectionSchema(collection_name="test_collection", shard_keys=["default", "big"])
+        router = ShardRouter(enabled=True, dedicated_orgs=["big"])
+
+        assert await schema_manager.migrate_sharding(schema, router) == 4
+
+        created = [
+            c.args[0].collection_name for c in schema_manager.create_collection.call_args_list
+        ]
+        assert created == ["test_collection_resharding", "test_collection"]
+        deleted = [c.args[0] for c in schema_manager.delete_collection.call_args_list]
+        assert deleted == [
+            "test_collection_resharding",
+            "test_collection",
+            "test_collection_resharding",
+        ]
+        targets = [
+            (c.kwargs["collection_name"], c.kwargs["shard_key_selector"])
+            for c in mock_qdrant_wrapper.client.upsert.call_args_list
+        ]
+        assert targets == [
+            ("test_collection_resharding", "big"),
+            ("test_collection_resharding", "default"),
+            ("test_collection", "big"),
+            ("test_collection", "default"),
+        ]
+
+    def test_placement_rejected_for_unknown_vector(self) -> None:
+        """Test placement can only target dense or ColBERT vectors."""
+        with pytest.raises(ValueError, match="unknown or sparse"):
+            CollectionSchema(
+                collection_name="test",
+                enable_colbert=False,
+                vector_placement={"text_colbert": VectorPlacement(on_disk=True)},
+            )
+
     @pytest.mark.asyncio
     async def test_delete_collection_success(
         self,
@@ -231,6 +753,25 @@ class TestSchemaManager:
         sparse = info["config"]["params"]["sparse_vectors"]
         assert "text_sparse" in sparse
 
+    @pytest.mark.asyncio
+    async def test_has_vector(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test has_vector checks the collection's named vectors."""
+        mock_info = MagicMock()
+        mock_info.config.params.vectors = {
+            "turn_dense": models.VectorParams(size=384, distance=models.Distance.COSINE)
+        }
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=mock_info)  # type: ignore[method-assign]
+
+        assert await schema_manager.has_vector("engram_turns", "turn_dense") is True
+        assert await schema_manager.has_vector("engram_turns", "turn_chunks") is False
+
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=None)  # type: ignore[method-assign]
+        assert await schema_manager.has_vector("missing", "turn_dense") is False
+
     @pytest.mark.asyncio
     async def test_get_collection_info_not_found(
         self,
@@ -269,6 +810,29 @@ class TestSchemaManager:
         assert hnsw_config.m == 32
         assert hnsw_config.ef_construct == 200
 
+    @pytest.mark.asyncio
+    async def test_update_collection_quantization(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test enabling quantization on an existing collection."""
+        mock_qdrant_wrapper.collection_exists = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.update_collection = AsyncMock()  # type: ignore[method-assign]
+
+        await schema_manager.update_collection_params(
+            collection_name="test_collection",
+            quantization={"text_dense": VectorQuantization(type=QuantizationType.SCALAR)},
+        )
+
+        vectors_config = mock_qdrant_wrapper.client.update_collection.call_args.kwargs[
+            "vectors_config"
+        ]
+        assert isinstance(vectors_config["text_dense"], models.VectorParamsDiff)
+        assert isinstance(
+            vectors_config["text_dense"].quantization_config, models.ScalarQuantization
+        )
+
     @pytest.mark.asyncio
     async def test_update_collection_params_not_exists(
         self,
@@ -321,6 +885,103 @@ class TestSchemaManager:
         with pytest.raises(ValueError, match="does not exist"):
             await schema_manager.ensure_tenant_index("nonexistent")
 
+    @pytest.mark.asyncio
+    async def test_ensure_payload_indexes_creates_missing(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that missing payload indexes are created in the background."""
+        info = MagicMock()
+        info.payload_schema = {
+            "org_id": models.PayloadIndexInfo(data_type=models.PayloadSchemaType.KEYWORD, points=0),
+        }
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=info)  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.create_payload_index = AsyncMock()  # type: ignore[method-assign]
+
+        created = await schema_manager.ensure_payload_indexes(get_turns_collection_schema())
+
+        assert created == ["session_id", "type", "timestamp", "vt_end"]
+        calls = {
+            c.kwargs["field_name"]: c.kwargs
+            for c in mock_qdrant_wrapper.client.create_payload_index.call_args_list
+        }
+        assert all(kwargs["wait"] is False for kwargs in calls.values())
+        assert calls["session_id"]["field_schema"] == models.PayloadSchemaType.KEYWORD
+        timestamp_schema = calls["timestamp"]["field_schema"]
+        assert timestamp_schema.type == models.IntegerIndexType.INTEGER
+        assert timestamp_schema.range is True
+        assert timestamp_schema.lookup is False
+
+    @pytest.mark.asyncio
+    async def test_ensure_payload_indexes_noop_when_matching(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that existing indexes of the right type are left alone."""
+        schema = get_turns_collection_schema()
+        info = MagicMock()
+        info.payload_schema = {
+            index.field_name: models.PayloadIndexInfo(data_type=index.type, points=0)
+            for index in schema.payload_indexes
+        }
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=info)  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.create_payload_index = AsyncMock()  # type: ignore[method-assign]
+
+        assert await schema_manager.ensure_payload_indexes(schema) == []
+        mock_qdrant_wrapper.client.create_payload_index.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ensure_payload_indexes_rebuilds_mismatched_type(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that an index with the wrong type is dropped and recreated."""
+        schema = CollectionSchema(
+            collection_name="test_collection",
+            payload_indexes=[
+                PayloadIndex(field_name="timestamp", type=models.PayloadSchemaType.INTEGER)
+            ],
+        )
+        info = MagicMock()
+        info.payload_schema = {
+            "timestamp": models.PayloadIndexInfo(
+                data_type=models.PayloadSchemaType.KEYWORD, points=0
+            ),
+        }
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=info)  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.create_payload_index = AsyncMock()  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.delete_payload_index = AsyncMock()  # type: ignore[method-assign]
+
+        assert await schema_manager.ensure_payload_indexes(schema) == ["timestamp"]
+        mock_qdrant_wrapper.client.delete_payload_index.assert_called_once_with(
+            collection_name="test_collection", field_name="timestamp", wait=True
+        )
+        mock_qdrant_wrapper.client.create_payload_index.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_ensure_payload_indexes_missing_collection(
+        self,
+        schema_manager: SchemaManager,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+    ) -> None:
+        """Test that a missing collection raises."""
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=None)  # type: ignore[method-assign]
+
+        with pytest.raises(ValueError, match="does not exist"):
+            await schema_manager.ensure_payload_indexes(get_turns_collection_schema())
+
+    def test_tenant_payload_index_to_qdrant(self) -> None:
+        """Test that tenant keyword indexes carry is_tenant."""
+        field_schema = PayloadIndex(
+            field_name="org_id", type=models.PayloadSchemaType.KEYWORD, is_tenant=True
+        ).to_qdrant()
+
+        assert isinstance(field_schema, models.KeywordIndexParams)
+        assert field_schema.is_tenant is True
+
     def test_collection_schema_defaults(self) -> None:
         """Test CollectionSchema default values."""
         schema = CollectionSchema(collection_name="test")
@@ -389,3 +1050,37 @@ class TestTurnsCollectionSchema:
         assert schema.collection_name == "my_custom_turns"
         assert schema.dense_vector_size == 384  # Should still use BGE-small dims
         assert schema.dense_vector_name == "turn_dense"
+
+    def test_quantization_applied_to_dense_and_colbert(self) -> None:
+        """Test turn schema quantization covers dense and ColBERT vectors."""
+        schema = get_turns_collection_schema(
+            quantization=VectorQuantization(type=QuantizationType.SCALAR)
+        )
+
+        assert set(schema.quantization) == {"turn_dense", "turn_colbert"}
+
+    def test_late_chunk_vector(self) -> None:
+        """Test late chunks add a quantized multi-vector field."""
+        schema = get_turns_collection_schema(
+            quantization=VectorQuantization(type=QuantizationType.SCALAR), late_chunks=True
+        )
+
+        assert schema.late_chunk_vector_name == "turn_chunks"
+        assert "turn_chunks" in schema.named_vectors()
+        assert set(schema.quantization) == {"turn_dense", "turn_colbert", "turn_chunks"}
+        assert get_turns_collection_schema().late_chunk_vector_name is None
+
+    @pytest.mark.asyncio
+    async def test_create_collection_with_late_chunks(self) -> None:
+        """Test the late chunk field is created as a MAX_SIM dense multi-vector."""
+        wrapper = QdrantClientWrapper(Settings())
+        wrapper._client = AsyncMock()
+        manager = SchemaManager(wrapper, Settings())
+
+        await manager.create_collection(get_turns_collection_schema(late_chunks=True))
+
+        vectors_config = wrapper.client.create_collection.call_args.kwargs["vectors_config"]
+        chunks = vectors_config["turn_chunks"]
+        assert chunks.size == 384
+        assert chunks.distance == models.Distance.COSINE
+        assert chunks.multivector_config.comparator == models.MultiVectorComparator.MAX_SIM
@@ -0,0 +1,180 @@
+"""Tests for incremental session centroids."""
+
+import math
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from qdrant_client.http import models
+
+from src.config import Settings
+from src.indexing.sessions import (
+    SessionCentroidConfig,
+    SessionCentroidIndexer,
+    session_point_id,
+)
+from src.indexing.turns import TurnsIndexer, TurnsIndexerConfig
+
+
+def _turn(i: int, dense: list[float], session_id: str | None = "s1", **sparse: float):
+    return models.PointStruct(
+        id=i,
+        vector={
+            "turn_dense": dense,
+            "turn_sparse": models.SparseVector(
+                indices=[int(k[1:]) for k in sparse], values=list(sparse.values())
+            ),
+        },
+        payload={"org_id": "org-1", "session_id": session_id, "timestamp": 100 + i},
+    )
+
+
+@pytest.fixture
+def qdrant() -> MagicMock:
+    """Create a mock Qdrant wrapper with no stored sessions."""
+    wrapper = MagicMock()
+    wrapper.client.retrieve = AsyncMock(return_value=[])
+    wrapper.client.upsert = AsyncMock()
+    return wrapper
+
+
+def _indexer(qdrant: MagicMock, max_sparse_terms: int = 256) -> SessionCentroidIndexer:
+    config = SessionCentroidConfig(enabled=True, max_sparse_terms=max_sparse_terms)
+    return SessionCentroidIndexer(qdrant, config)
+
+
+def _upserted(qdrant: MagicMock) -> dict[str, models.PointStruct]:
+    return {
+        point.payload["session_id"]: point
+        for call in qdrant.client.upsert.call_args_list
+        for point in call.kwargs["points"]
+    }
+
+
+class TestSessionCentroidIndexer:
+    """Tests for SessionCentroidIndexer."""
+
+    async def test_new_sessions(self, qdrant: MagicMock) -> None:
+        """Test a batch creates one mean point per session."""
+        points = [
+            _turn(1, [1.0, 0.0], t1=1.0),
+            _turn(2, [0.0, 1.0], t1=1.0, t2=2.0),
+            _turn(3, [0.5, 0.5], session_id="s2"),
+            _turn(4, [0.5, 0.5], session_id=None),
+        ]
+
+        updated = await _indexer(qdrant).update(points, "turn_dense", "turn_sparse")
+
+        assert updated == 2
+        sessions = _upserted(qdrant)
+        s1 = sessions["s1"]
+        assert s1.id == session_point_id("org-1", "s1")
+        assert s1.vector["text_dense"] == [0.5, 0.5]
+        assert s1.vector["text_sparse"].indices == [1, 2]
+        assert s1.vector["text_sparse"].values == [1.0, 1.0]
+        assert s1.payload["turn_count"] == 2
+        assert s1.payload["timestamp"] == 102
+        assert s1.payload["centroid_norm"] == pytest.approx(math.sqrt(0.5))
+
+    async def test_continues_stored_mean(self, qdrant: MagicMock) -> None:
+        """Test the stored unit vector is rescaled by its norm before averaging."""
+        qdrant.client.retrieve.return_value = [
+            models.Record(
+                id=session_point_id("org-1", "s1"),
+                # Mean [2, 0] over 3 turns, stored normalized by Qdrant
+                vector={
+                    "text_dense": [1.0, 0.0],
+                    "text_sparse": models.SparseVector(indices=[1], values=[3.0]),
+                },
+                payload={
+                    "org_id": "org-1",
+                    "session_id": "s1",
+                    "turn_count": 3,
+                    "centroid_norm": 2.0,
+                    "summary": "kept",
+                },
+            )
+        ]
+
+        await _indexer(qdrant).update([_turn(1, [0.0, 4.0], t1=1.0)], "turn_dense", "turn_sparse")
+
+        s1 = _upserted(qdrant)["s1"]
+        assert s1.vector["text_dense"] == [1.5, 1.0]
+        assert s1.vector["text_sparse"].values == [2.5]
+        assert s1.payload["turn_count"] == 4
+        assert s1.payload["summary"] == "kept"
+
+    async def test_sparse_terms_truncated(self, qdrant: MagicMock) -> None:
+        """Test only the heaviest sparse terms are kept, in index order."""
+        points = [_turn(1, [1.0, 0.0], t5=0.1, t7=0.9, t3=0.5)]
+
+        await _indexer(qdrant, max_sparse_terms=2).update(points, "turn_dense", "turn_sparse")
+
+        sparse = _upserted(qdrant)["s1"].vector["text_sparse"]
+        assert sparse.indices == [3, 7]
+        assert sparse.values == [0.5, 0.9]
+
+    async def test_sparse_disabled(self, qdrant: MagicMock) -> None:
+        """Test no sparse aggregate is stored or fetched when disabled."""
+        await _indexer(qdrant, max_sparse_terms=0).update(
+            [_turn(1, [1.0, 0.0], t1=1.0)], "turn_dense", "turn_sparse"
+        )
+
+        assert set(_upserted(qdrant)["s1"].vector) == {"text_dense"}
+        assert qdrant.client.retrieve.call_args.kwargs["with_vectors"] == ["text_dense"]
+
+    async def test_no_sessions_in_batch(self, qdrant: MagicMock) -> None:
+        """Test a batch without sessions makes no requests."""
+        points = [_turn(1, [1.0, 0.0], session_id=None)]
+
+        assert await _indexer(qdrant).update(points, "turn_dense", "turn_sparse") == 0
+        qdrant.client.retrieve.assert_not_called()
+        qdrant.client.upsert.assert_not_called()
+
+
+class TestTurnsIndexerSessions:
+    """Tests for session centroid updates from the turns indexer."""
+
+    def _turns_indexer(self, qdrant: MagicMock, enabled: bool = True) -> TurnsIndexer:
+        config = TurnsIndexerConfig(sessions=SessionCentroidConfig(enabled=enabled))
+        return TurnsIndexer(qdrant, MagicMock(), config)
+
+    async def test_upsert_updates_sessions(self, qdrant: MagicMock) -> None:
+        """Test upserted turns are folded into their sessions."""
+        await self._turns_indexer(qdrant).upsert_points([_turn(1, [1.0, 0.0])])
+
+        collections = [c.kwargs["collection_name"] for c in qdrant.client.upsert.call_args_list]
+        assert collections == ["engram_turns", "sessions"]
+
+    async def test_disabled(self, qdrant: MagicMock) -> None:
+        """Test sessions are not touched when disabled."""
+        indexer = self._turns_indexer(qdrant, enabled=False)
+
+        await indexer.upsert_points([_turn(1, [1.0, 0.0])])
+
+        assert indexer.sessions is None
+        qdrant.client.upsert.assert_called_once()
+
+    async def test_session_failure_does_not_fail_batch(self, qdrant: MagicMock) -> None:
+        """Test a failed centroid update is logged, not raised."""
+        qdrant.client.retrieve.side_effect = ConnectionError("qdrant down")
+
+        await self._turns_indexer(qdrant).upsert_points([_turn(1, [1.0, 0.0])])
+
+        qdrant.client.upsert.assert_called_once()
+
+
+def test_from_settings() -> None:
+    """Test the session centroid configuration is read from settings."""
+    settings = Settings(
+        _env_file=None,
+        session_centroids_enabled=True,
+        session_centroids_collection="session_centroids",
+        session_centroid_sparse_terms=0,
+    )
+
+    config = SessionCentroidConfig.from_settings(settings)
+
+    assert config.enabled is True
+    assert config.collection_name == "session_centroids"
+    assert config.max_sparse_terms == 0
+    assert SessionCentroidConfig.from_settings(Settings(_env_file=None)).enabled is False
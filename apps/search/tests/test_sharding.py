@@ -0,0 +1,64 @@
+"""Tests for per-tenant shard-key routing."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client.http import models
+
+from src.services.sharding import ShardRouter
+
+
+def _point(point_id: int, org_id: str) -> models.PointStruct:
+    return models.PointStruct(id=point_id, vector=[0.1], payload={"org_id": org_id})
+
+
+class TestShardRouter:
+    """Tests for ShardRouter."""
+
+    def test_disabled_router_is_noop(self) -> None:
+        """Test that a disabled router adds no shard key selector."""
+        router = ShardRouter(dedicated_orgs=["big-org"])
+
+        assert router.shard_key("big-org") is None
+        assert router.selector_kwargs("big-org") == {}
+        points = [_point(1, "big-org"), _point(2, "small-org")]
+        assert router.partition(points) == [({}, points)]
+
+    def test_dedicated_and_default_keys(self) -> None:
+        """Test that dedicated orgs get their own key and others share the default."""
+        router = ShardRouter(enabled=True, dedicated_orgs=["big-org"])
+
+        assert router.shard_key("big-org") == "big-org"
+        assert router.shard_key("small-org") == "default"
+        assert router.selector_kwargs("small-org") == {"shard_key_selector": "default"}
+        assert router.shard_keys == ["default", "big-org"]
+
+    def test_partition_groups_points_by_shard_key(self) -> None:
+        """Test that points are grouped by their payload org_id's shard key."""
+        router = ShardRouter(enabled=True, dedicated_orgs=["big-org"])
+
+        groups = router.partition(
+            [_point(1, "big-org"), _point(2, "small-org"), _point(3, "other-org")]
+        )
+
+        assert [(kwargs, [p.id for p in points]) for kwargs, points in groups] == [
+            ({"shard_key_selector": "big-org"}, [1]),
+            ({"shard_key_selector": "default"}, [2, 3]),
+        ]
+
+    def test_default_key_collision_rejected(self) -> None:
+        """Test that an org named like the default shard key is rejected."""
+        with pytest.raises(ValueError, match="collides"):
+            ShardRouter(enabled=True, dedicated_orgs=["default"])
+
+    def test_from_settings(self) -> None:
+        """Test building the router from settings."""
+        settings = MagicMock()
+        settings.qdrant_shard_by_org = True
+        settings.qdrant_dedicated_shard_orgs = ["big-org"]
+        settings.qdrant_default_shard_key = "shared"
+
+        router = ShardRouter.from_settings(settings)
+
+        assert router.enabled is True
+        assert router.shard_key("small-org") == "shared"
@@ -0,0 +1,143 @@
+"""Tests for hot/cold time tiers of the turns collection."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.config import Settings
+from src.services.schema_manager import (
+    QuantizationType,
+    apply_storage_settings,
+    get_turns_collection_schema,
+)
+from src.services.sharding import ShardRouter
+from src.services.tiering import (
+    MS_PER_HOUR,
+    TierMigrator,
+    TurnTiers,
+    get_cold_turns_schema,
+)
+
+NOW_MS = 1_700_000_000_000
+
+
+class TestTurnTiers:
+    """Tests for TurnTiers."""
+
+    def test_disabled_tiers_search_hot_only(self) -> None:
+        """Test that disabled tiering keeps the single turns collection."""
+        tiers = TurnTiers(hot_collection="turns")
+
+        assert tiers.collections == ["turns"]
+        assert tiers.collections_for(start_ms=None) == ["turns"]
+
+    def test_from_settings(self) -> None:
+        """Test that tiers are built from settings."""
+        tiers = TurnTiers.from_settings(
+            Settings(
+                qdrant_collection="turns",
+                qdrant_turns_tiering_enabled=True,
+                qdrant_turns_cold_collection="turns_cold",
+                qdrant_turns_hot_window_hours=24,
+            )
+        )
+
+        assert tiers.collections == ["turns", "turns_cold"]
+        assert tiers.boundary_ms(NOW_MS) == NOW_MS - 24 * MS_PER_HOUR
+
+    @pytest.mark.parametrize(
+        ("start_ms", "expected"),
+        [
+            (None, ["hot", "cold"]),
+            (NOW_MS - 48 * MS_PER_HOUR, ["hot", "cold"]),
+            (NOW_MS - 24 * MS_PER_HOUR, ["hot"]),
+            (NOW_MS - MS_PER_HOUR, ["hot"]),
+        ],
+    )
+    def test_cold_tier_skipped_for_recent_ranges(
+        self, start_ms: int | None, expected: list[str]
+    ) -> None:
+        """Test that ranges starting inside the hot window skip the cold tier."""
+        tiers = TurnTiers(
+            enabled=True,
+            hot_collection="hot",
+            cold_collection="cold",
+            hot_window_ms=24 * MS_PER_HOUR,
+        )
+
+        assert tiers.collections_for(start_ms, now_ms=NOW_MS) == expected
+
+    def test_cold_filter(self) -> None:
+        """Test that the migration filter selects turns older than the boundary."""
+        tiers = TurnTiers(enabled=True, hot_window_ms=MS_PER_HOUR)
+
+        condition = tiers.cold_filter(NOW_MS).must[0]
+
+        assert condition.key == "timestamp"
+        assert condition.range.lt == NOW_MS - MS_PER_HOUR
+
+    def test_same_hot_and_cold_rejected(self) -> None:
+        """Test that tiers must use distinct collections."""
+        with pytest.raises(ValueError, match="must differ"):
+            TurnTiers(enabled=True, hot_collection="turns", cold_collection="turns")
+
+
+class TestColdTurnsSchema:
+    """Tests for get_cold_turns_schema."""
+
+    def test_cold_schema_on_disk_and_quantized(self) -> None:
+        """Test that the cold tier keeps only quantized vectors in RAM."""
+        settings = Settings(qdrant_shard_by_org=True)
+        hot = apply_storage_settings(get_turns_collection_schema(), settings)
+
+        cold = get_cold_turns_schema(hot, settings)
+
+        assert cold.collection_name == "engram_turns_cold"
+        assert cold.vector_on_disk("turn_dense")
+        assert cold.hnsw_on_disk("turn_colbert")
+        assert cold.on_disk_payload is True
+        assert cold.sparse_index_on_disk is True
+        assert cold.quantization["turn_dense"].type == QuantizationType.SCALAR
+        assert cold.quantization["turn_dense"].always_ram is True
+        assert cold.payload_indexes == hot.payload_indexes
+        assert cold.shard_keys == hot.shard_keys
+
+    def test_cold_schema_without_quantization(self) -> None:
+        """Test that cold-tier quantization can be turned off."""
+        settings = Settings(qdrant_turns_cold_quantization=None)
+
+        cold = get_cold_turns_schema(get_turns_collection_schema(), settings)
+
+        assert cold.quantization == {}
+
+
+class TestTierMigrator:
+    """Tests for TierMigrator."""
+
+    @pytest.mark.asyncio
+    async def test_migrate_once_moves_cold_turns(self) -> None:
+        """Test that turns past the boundary are moved hot to cold with shard routing."""
+        schema_manager = MagicMock()
+        schema_manager.move_points = AsyncMock(return_value=3)
+        tiers = TurnTiers(
+            enabled=True, hot_collection="hot", cold_collection="cold", hot_window_ms=1000
+        )
+        router = ShardRouter(enabled=True)
+        migrator = TierMigrator(schema_manager, tiers, router, batch_size=50)
+
+        assert await migrator.migrate_once(now_ms=NOW_MS) == 3
+
+        call = schema_manager.move_points.call_args
+        assert call.args == ("hot", "cold", router)
+        assert call.kwargs["scroll_filter"].must[0].range.lt == NOW_MS - 1000
+        assert call.kwargs["batch_size"] == 50
+
+    @pytest.mark.asyncio
+    async def test_migrate_once_noop_when_disabled(self) -> None:
+        """Test that nothing moves when tiering is disabled."""
+        schema_manager = MagicMock()
+        schema_manager.move_points = AsyncMock()
+        migrator = TierMigrator(schema_manager, TurnTiers())
+
+        assert await migrator.migrate_once() == 0
+        schema_manager.move_points.assert_not_called()
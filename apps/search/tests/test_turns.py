@@ -1,10 +1,14 @@
 """Tests for turns indexing module."""
 
+import asyncio
 import contextlib
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from qdrant_client.http import models
 
+from src.embedders.scheduler import EmbeddingLane
 from src.indexing.batch import Document
 from src.indexing.turns import (
     TurnFinalizedConsumer,
@@ -12,6 +16,7 @@ from src.indexing.turns import (
     TurnsIndexer,
     TurnsIndexerConfig,
 )
+from src.services.sharding import ShardRouter
 
 
 class TestTurnsIndexerConfig:
@@ -62,13 +67,15 @@ class TestTurnsIndexer:
         # Sparse embedder
         sparse_embedder = MagicMock()
         sparse_embedder.load = AsyncMock()
-        sparse_embedder.embed_sparse_batch = MagicMock(return_value=[{1: 0.5, 2: 0.3}])
+        sparse_embedder.embed_sparse_batch_async = AsyncMock(return_value=[{1: 0.5, 2: 0.3}])
         factory.get_sparse_embedder = AsyncMock(return_value=sparse_embedder)
 
         # ColBERT embedder
         colbert_embedder = MagicMock()
         colbert_embedder.load = AsyncMock()
-        colbert_embedder.embed_document_batch = MagicMock(return_value=[[[0.1, 0.2], [0.3, 0.4]]])
+        colbert_embedder.embed_document_batch_async = AsyncMock(
+            return_value=[[[0.1, 0.2], [0.3, 0.4]]]
+        )
         factory.get_colbert_embedder = AsyncMock(return_value=colbert_embedder)
 
         return factory
@@ -110,13 +117,50 @@ class TestTurnsIndexer:
         )
 
         doc = Document(
-            id="turn-1", content="User: test\nAssistant: response", org_id="org-123", session_id="session-1"
+            id="turn-1",
+            content="User: test\nAssistant: response",
+            org_id="org-123",
+            session_id="session-1",
         )
         result = await indexer.index_documents([doc])
 
         assert result == 1
         mock_qdrant.client.upsert.assert_called_once()
 
+    async def test_index_documents_routes_by_shard_key(
+        self,
+        mock_qdrant: MagicMock,
+        mock_embedder_factory: MagicMock,
+        config: TurnsIndexerConfig,
+    ) -> None:
+        """Test that points are upserted once per org shard key."""
+        mock_embedder_factory.get_text_embedder.return_value.embed_batch = AsyncMock(
+            return_value=[[0.1], [0.2], [0.3]]
+        )
+        mock_embedder_factory.get_sparse_embedder.return_value.embed_sparse_batch_async = AsyncMock(
+            return_value=[{1: 0.5}, {1: 0.5}, {1: 0.5}]
+        )
+        indexer = TurnsIndexer(
+            qdrant_client=mock_qdrant,
+            embedder_factory=mock_embedder_factory,
+            config=config,
+            shard_router=ShardRouter(enabled=True, dedicated_orgs=["big-org"]),
+        )
+
+        docs = [
+            Document(id="turn-1", content="a", org_id="big-org"),
+            Document(id="turn-2", content="b", org_id="small-org"),
+            Document(id="turn-3", content="c", org_id="big-org"),
+        ]
+        result = await indexer.index_documents(docs)
+
+        assert result == 3
+        calls = {
+            c.kwargs["shard_key_selector"]: [p.id for p in c.kwargs["points"]]
+            for c in mock_qdrant.client.upsert.call_args_list
+        }
+        assert calls == {"big-org": ["turn-1", "turn-3"], "default": ["turn-2"]}
+
     async def test_index_documents_with_colbert(
         self,
         mock_qdrant: MagicMock,
@@ -136,6 +180,45 @@ class TestTurnsIndexer:
         assert result == 1
         mock_embedder_factory.get_colbert_embedder.assert_called_once()
 
+    async def test_index_documents_runs_encoders_concurrently(
+        self,
+        mock_qdrant: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test sparse and ColBERT encoders run at the same time."""
+        # Each encoder waits for the other; run one after the other, both time out
+        started = {"sparse": asyncio.Event(), "colbert": asyncio.Event()}
+
+        async def meet(name: str, other: str) -> None:
+            started[name].set()
+            await asyncio.wait_for(started[other].wait(), timeout=5)
+
+        async def embed_sparse(texts: list[str], lane: EmbeddingLane) -> Any:
+            await meet("sparse", "colbert")
+            return [{1: 0.5}]
+
+        async def embed_colbert(texts: list[str], lane: EmbeddingLane) -> Any:
+            await meet("colbert", "sparse")
+            return [[[0.1, 0.2]]]
+
+        sparse_embedder = mock_embedder_factory.get_sparse_embedder.return_value
+        sparse_embedder.embed_sparse_batch_async.side_effect = embed_sparse
+        colbert_embedder = mock_embedder_factory.get_colbert_embedder.return_value
+        colbert_embedder.embed_document_batch_async.side_effect = embed_colbert
+        indexer = TurnsIndexer(
+            qdrant_client=mock_qdrant,
+            embedder_factory=mock_embedder_factory,
+            config=TurnsIndexerConfig(enable_colbert=True),
+        )
+
+        doc = Document(id="turn-1", content="test content", org_id="org-123")
+        result = await indexer.index_documents([doc])
+
+        assert result == 1
+        sparse_embedder.embed_sparse_batch_async.assert_awaited_once_with(
+            ["test content"], lane=EmbeddingLane.LIVE
+        )
+
     async def test_index_documents_error(
         self,
         mock_qdrant: MagicMock,
@@ -156,6 +239,119 @@ class TestTurnsIndexer:
 
         assert result == 0
 
+    async def test_index_documents_skips_unchanged(
+        self,
+        mock_qdrant: MagicMock,
+        mock_embedder_factory: MagicMock,
+        config: TurnsIndexerConfig,
+    ) -> None:
+        """Test replayed turns cost a lookup, not embedding, and payload changes skip vectors."""
+        mock_embedder_factory.model_versions = MagicMock(
+            return_value={"text": "bge", "sparse": "splade", "colbert": "colbert"}
+        )
+        mock_qdrant.client.retrieve = AsyncMock(return_value=[])
+        mock_qdrant.client.batch_update_points = AsyncMock()
+        indexer = TurnsIndexer(
+            qdrant_client=mock_qdrant,
+            embedder_factory=mock_embedder_factory,
+            config=config,
+        )
+        doc = Document(id="turn-1", content="test content", org_id="org-123")
+        text_embedder = await mock_embedder_factory.get_text_embedder()
+
+        assert await indexer.index_documents([doc]) == 1
+        stored = mock_qdrant.client.upsert.call_args.kwargs["points"][0]
+        mock_qdrant.client.retrieve = AsyncMock(
+            return_value=[models.Record(id="turn-1", payload=stored.payload)]
+        )
+
+        # Redelivery of the same turn
+        assert await indexer.index_documents([doc]) == 1
+        # Same content, new metadata
+        retagged = Document(
+            id="turn-1", content="test content", org_id="org-123", metadata={"tag": "x"}
+        )
+        assert await indexer.index_documents([retagged]) == 1
+
+        assert text_embedder.embed_batch.call_count == 1
+        assert mock_qdrant.client.upsert.call_count == 1
+        operations = mock_qdrant.client.batch_update_points.call_args.kwargs["update_operations"]
+        assert operations[0].overwrite_payload.payload["tag"] == "x"
+
+    async def test_index_documents_checks_cold_tier(
+        self,
+        mock_qdrant: MagicMock,
+        mock_embedder_factory: MagicMock,
+    ) -> None:
+        """Test turns already migrated to the cold tier are not embedded into the hot one."""
+        mock_embedder_factory.model_versions = MagicMock(
+            return_value={"text": "bge", "sparse": "splade", "colbert": "colbert"}
+        )
+        mock_qdrant.client.retrieve = AsyncMock(return_value=[])
+        mock_qdrant.client.batch_update_points = AsyncMock()
+        indexer = TurnsIndexer(
+            qdrant_client=mock_qdrant,
+            embedder_factory=mock_embedder_factory,
+            config=TurnsIndexerConfig(
+                enable_colbert=False, cold_collection_name="engram_turns_cold"
+            ),
+        )
+        old = Document(id="turn-old", content="old content", org_id="org-123")
+        new = Document(id="turn-new", content="new content", org_id="org-123")
+        text_embedder = await mock_embedder_factory.get_text_embedder()
+
+        await indexer.index_documents([old])
+        stored = mock_qdrant.client.upsert.call_args.kwargs["points"][0]
+        cold_records = [models.Record(id="turn-old", payload=stored.payload)]
+
+        async def retrieve(collection_name: str, **kwargs: object) -> list[models.Record]:
+            return cold_records if collection_name == "engram_turns_cold" else []
+
+        mock_qdrant.client.retrieve = AsyncMock(side_effect=retrieve)
+        text_embedder.embed_batch.reset_mock()
+
+        assert await indexer.index_documents([old, new]) == 2
+
+        assert text_embedder.embed_batch.call_args.args[0] == ["new content"]
+        points = mock_qdrant.client.upsert.call_args.kwargs["points"]
+        assert [point.id for point in points] == ["turn-new"]
+        looked_up = [
+            c.kwargs["collection_name"] for c in mock_qdrant.client.retrieve.call_args_list
+        ]
+        assert looked_up == ["engram_turns", "engram_turns_cold"]
+
+    async def test_index_documents_reembeds_on_model_change(
+        self,
+        mock_qdrant: MagicMock,
+        mock_embedder_factory: MagicMock,
+        config: TurnsIndexerConfig,
+    ) -> None:
+        """Test a changed embedding model invalidates stored content hashes."""
+        mock_embedder_factory.model_versions = MagicMock(
+            return_value={"text": "bge", "sparse": "splade", "colbert": "colbert"}
+        )
+        mock_qdrant.client.retrieve = AsyncMock(return_value=[])
+        indexer = TurnsIndexer(
+            qdrant_client=mock_qdrant,
+            embedder_factory=mock_embedder_factory,
+            config=config,
+        )
+        doc = Document(id="turn-1", content="test content", org_id="org-123")
+
+        await indexer.index_documents([doc])
+        stored = mock_qdrant.client.upsert.call_args.kwargs["points"][0]
+        mock_qdrant.client.retrieve = AsyncMock(
+            return_value=[models.Record(id="turn-1", payload=stored.payload)]
+        )
+        mock_embedder_factory.model_versions.return_value = {
+            "text": "bge-v2",
+            "sparse": "splade",
+            "colbert": "colbert",
+        }
+        await indexer.index_documents([doc])
+
+        assert mock_qdrant.client.upsert.call_count == 2
+
     def test_build_point_with_colbert(
         self,
         mock_qdrant: MagicMock,
@@ -214,6 +410,33 @@ class TestTurnsIndexer:
 
         assert config.colbert_vector_name not in point.vector
 
+    def test_build_point_encodes_payload(
+        self,
+        mock_qdrant: MagicMock,
+        mock_embedder_factory: MagicMock,
+        config: TurnsIndexerConfig,
+    ) -> None:
+        """Test the payload is passed through the payload codec."""
+        codec = MagicMock()
+        codec.encode.return_value = {"content": {"zstd": "..."}, "org_id": "org-123"}
+        indexer = TurnsIndexer(
+            qdrant_client=mock_qdrant,
+            embedder_factory=mock_embedder_factory,
+            config=config,
+            payload_codec=codec,
+        )
+
+        doc = Document(id="turn-1", content="test content", org_id="org-123")
+        point = indexer._build_point(
+            doc=doc,
+            dense_vec=[0.1, 0.2, 0.3],
+            sparse_vec={1: 0.5},
+            colbert_vecs=None,
+        )
+
+        assert codec.encode.call_args.args[0]["content"] == "test content"
+        assert point.payload == codec.encode.return_value
+
 
 class TestTurnFinalizedConsumerConfig:
     """Tests for TurnFinalizedConsumerConfig."""
@@ -326,6 +549,73 @@ class TestTurnFinalizedConsumer:
 
         mock_nats.create_consumer.assert_not_called()
 
+    async def test_start_indexes_through_pipeline(
+        self,
+        mock_nats: MagicMock,
+        mock_indexer: MagicMock,
+        config: TurnFinalizedConsumerConfig,
+    ) -> None:
+        """Test consumed turns are indexed through the pipeline, then acked, on stop."""
+        mock_indexer.embed_documents = AsyncMock(return_value=["point"])
+        mock_indexer.upsert_points = AsyncMock()
+        delivery = MagicMock()
+        delivery.ack = AsyncMock()
+        delivery.nak = AsyncMock()
+
+        async def subscribe(topic: str, group_id: str, handler: Any, **kwargs: Any) -> None:
+            assert kwargs["manual_ack"] is True
+            assert kwargs["capacity"]() > 0
+            data = {"id": "turn-123", "org_id": "org-123", "user_content": "test content"}
+            await handler("memory.turns.finalized", data, delivery)
+            delivery.ack.assert_not_called()
+
+        mock_nats.subscribe = AsyncMock(side_effect=subscribe)
+        consumer = TurnFinalizedConsumer(
+            nats_client=mock_nats,
+            indexer=mock_indexer,
+            config=config,
+        )
+
+        # subscribe returns immediately, so start() stops the consumer and flushes
+        await consumer.start()
+
+        documents = mock_indexer.embed_documents.call_args.args[0]
+        assert [doc.id for doc in documents] == ["turn-123"]
+        mock_indexer.upsert_points.assert_awaited_once_with(["point"])
+        mock_indexer.index_documents.assert_not_called()
+        delivery.ack.assert_awaited_once()
+        delivery.nak.assert_not_called()
+        assert consumer._pipeline is None
+
+    async def test_start_naks_when_upsert_fails(
+        self,
+        mock_nats: MagicMock,
+        mock_indexer: MagicMock,
+        config: TurnFinalizedConsumerConfig,
+    ) -> None:
+        """Test a turn whose upsert fails is nak'ed for redelivery, not acked."""
+        mock_indexer.embed_documents = AsyncMock(return_value=["point"])
+        mock_indexer.upsert_points = AsyncMock(side_effect=Exception("Qdrant down"))
+        delivery = MagicMock()
+        delivery.ack = AsyncMock()
+        delivery.nak = AsyncMock()
+
+        async def subscribe(topic: str, group_id: str, handler: Any, **kwargs: Any) -> None:
+            data = {"id": "turn-123", "org_id": "org-123", "user_content": "test content"}
+            await handler("memory.turns.finalized", data, delivery)
+
+        mock_nats.subscribe = AsyncMock(side_effect=subscribe)
+        consumer = TurnFinalizedConsumer(
+            nats_client=mock_nats,
+            indexer=mock_indexer,
+            config=config,
+        )
+
+        await consumer.start()
+
+        delivery.nak.assert_awaited_once()
+        delivery.ack.assert_not_called()
+
     def test_parse_turn_finalized_valid(
         self,
         mock_nats: MagicMock,
@@ -585,6 +875,54 @@ class TestTurnFinalizedConsumer:
         await consumer._handle_message("memory.turns.finalized", data)
         consumer._batch_queue.add.assert_not_called()
 
+    async def test_handle_message_unparseable_terminated(
+        self,
+        mock_nats: MagicMock,
+        mock_indexer: MagicMock,
+        config: TurnFinalizedConsumerConfig,
+    ) -> None:
+        """Test events that can never be indexed are terminated, not redelivered."""
+        consumer = TurnFinalizedConsumer(
+            nats_client=mock_nats,
+            indexer=mock_indexer,
+            config=config,
+        )
+        consumer._batch_queue = MagicMock()
+        consumer._batch_queue.add = AsyncMock()
+        delivery = MagicMock()
+        delivery.term = AsyncMock()
+        delivery.nak = AsyncMock()
+
+        await consumer._handle_message("memory.turns.finalized", {"org_id": "org-123"}, delivery)
+
+        delivery.term.assert_awaited_once()
+        delivery.nak.assert_not_called()
+        consumer._batch_queue.add.assert_not_called()
+
+    async def test_handle_message_queue_full_naks(
+        self,
+        mock_nats: MagicMock,
+        mock_indexer: MagicMock,
+        config: TurnFinalizedConsumerConfig,
+    ) -> None:
+        """Test a turn that cannot be queued is nak'ed instead of dropped."""
+        consumer = TurnFinalizedConsumer(
+            nats_client=mock_nats,
+            indexer=mock_indexer,
+            config=config,
+        )
+        consumer._batch_queue = MagicMock()
+        consumer._batch_queue.add = AsyncMock(
+            side_effect=RuntimeError("BatchQueue at max capacity")
+        )
+        delivery = MagicMock()
+        delivery.nak = AsyncMock()
+
+        data = {"id": "turn-123", "org_id": "org-123", "user_content": "test content"}
+        await consumer._handle_message("memory.turns.finalized", data, delivery)
+
+        delivery.nak.assert_awaited_once()
+
     async def test_handle_message_no_batch_queue(
         self,
         mock_nats: MagicMock,
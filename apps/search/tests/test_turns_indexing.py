@@ -49,12 +49,12 @@ class TestTurnsIndexer:
         # Mock sparse embedder
         sparse_embedder = MagicMock()
         sparse_embedder.load = AsyncMock()
-        sparse_embedder.embed_sparse_batch = MagicMock(return_value=[{1: 0.5, 2: 0.3}])
+        sparse_embedder.embed_sparse_batch_async = AsyncMock(return_value=[{1: 0.5, 2: 0.3}])
 
         # Mock ColBERT embedder
         colbert_embedder = MagicMock()
         colbert_embedder.load = AsyncMock()
-        colbert_embedder.embed_document_batch = MagicMock(return_value=[[[0.1] * 128]])
+        colbert_embedder.embed_document_batch_async = AsyncMock(return_value=[[[0.1] * 128]])
 
         factory.get_text_embedder = AsyncMock(return_value=text_embedder)
         factory.get_sparse_embedder = AsyncMock(return_value=sparse_embedder)
@@ -152,6 +152,57 @@ class TestTurnsIndexer:
         point = points[0]
         assert "turn_colbert" not in point.vector
 
+    @pytest.mark.asyncio
+    async def test_index_documents_with_late_chunks(
+        self,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+        mock_embedder_factory: EmbedderFactory,
+    ) -> None:
+        """Test late chunk vectors are stored when the collection defines them."""
+        info = MagicMock()
+        info.config.params.vectors = {"turn_dense": MagicMock(), "turn_chunks": MagicMock()}
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=info)  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.upsert = AsyncMock()  # type: ignore[method-assign]
+        text_embedder = await mock_embedder_factory.get_text_embedder()
+        text_embedder.embed_late_chunks = AsyncMock(return_value=[[[0.1] * 384, [0.2] * 384]])
+
+        config = TurnsIndexerConfig(collection_name="test_turns", enable_late_chunks=True)
+        indexer = TurnsIndexer(mock_qdrant_wrapper, mock_embedder_factory, config)
+        documents = [Document(id="turn-1", content="Test content", org_id="org-123", metadata={})]
+
+        assert await indexer.index_documents(documents) == 1
+
+        point = mock_qdrant_wrapper.client.upsert.call_args.kwargs["points"][0]
+        assert point.vector["turn_chunks"] == [[0.1] * 384, [0.2] * 384]
+        assert text_embedder.embed_late_chunks.call_args.kwargs["chunk_tokens"] == 128
+
+    @pytest.mark.asyncio
+    async def test_late_chunks_disabled_without_collection_vector(
+        self,
+        mock_qdrant_wrapper: QdrantClientWrapper,
+        mock_embedder_factory: EmbedderFactory,
+    ) -> None:
+        """Test late chunks turn off for collections created without the vector."""
+        info = MagicMock()
+        info.config.params.vectors = {"turn_dense": MagicMock()}
+        mock_qdrant_wrapper.get_collection_info = AsyncMock(return_value=info)  # type: ignore[method-assign]
+        mock_qdrant_wrapper.client.upsert = AsyncMock()  # type: ignore[method-assign]
+        text_embedder = await mock_embedder_factory.get_text_embedder()
+        text_embedder.embed_late_chunks = AsyncMock()
+
+        config = TurnsIndexerConfig(collection_name="test_turns", enable_late_chunks=True)
+        indexer = TurnsIndexer(mock_qdrant_wrapper, mock_embedder_factory, config)
+        documents = [Document(id="turn-1", content="Test content", org_id="org-123", metadata={})]
+
+        await indexer.index_documents(documents)
+        await indexer.index_documents(documents)
+
+        assert indexer.late_chunks is False
+        mock_qdrant_wrapper.get_collection_info.assert_awaited_once()
+        text_embedder.embed_late_chunks.assert_not_called()
+        point = mock_qdrant_wrapper.client.upsert.call_args.kwargs["points"][0]
+        assert "turn_chunks" not in point.vector
+
 
 class TestTurnFinalizedConsumer:
     """Tests for TurnFinalizedConsumer."""
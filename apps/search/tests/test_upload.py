@@ -0,0 +1,156 @@
+"""Tests for chunked parallel Qdrant upserts."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from qdrant_client.http import models
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+from src.config import Settings
+from src.indexing.upload import (
+    UpsertConfig,
+    chunk_points,
+    estimate_point_bytes,
+    upsert_chunked,
+)
+from src.services.sharding import ShardRouter
+
+
+def _point(i: int, org_id: str = "org-1", tokens: int = 4) -> models.PointStruct:
+    return models.PointStruct(
+        id=i,
+        vector={
+            "dense": [0.1] * 8,
+            "sparse": models.SparseVector(indices=[1, 2], values=[0.5, 0.5]),
+            "colbert": [[0.1] * 4 for _ in range(tokens)],
+        },
+        payload={"org_id": org_id},
+    )
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.upsert = AsyncMock()
+    return client
+
+
+def _error(status_code: int) -> UnexpectedResponse:
+    return UnexpectedResponse(
+        status_code=status_code, reason_phrase="error", content=b"", headers=MagicMock()
+    )
+
+
+class TestChunking:
+    """Tests for point size estimates and chunking."""
+
+    def test_estimate_point_bytes(self) -> None:
+        """Test dense, sparse and multi-vectors are all counted."""
+        payload_bytes = len('{"org_id": "org-1"}')
+
+        assert estimate_point_bytes(_point(1)) == payload_bytes + 4 * 8 + 8 * 2 + 4 * 16
+
+    def test_chunks_respect_size(self) -> None:
+        """Test chunks stay within the byte budget and keep point order."""
+        points = [_point(i) for i in range(5)]
+        size = estimate_point_bytes(points[0])
+
+        chunks = chunk_points(points, chunk_bytes=2 * size)
+
+        assert [[p.id for p in chunk] for chunk in chunks] == [[0, 1], [2, 3], [4]]
+
+    def test_oversized_point_gets_own_chunk(self) -> None:
+        """Test a point larger than the budget is still sent."""
+        points = [_point(0), _point(1, tokens=100), _point(2)]
+
+        chunks = chunk_points(points, chunk_bytes=estimate_point_bytes(points[0]) + 1)
+
+        assert [len(chunk) for chunk in chunks] == [1, 1, 1]
+
+
+class TestUpsertChunked:
+    """Tests for upsert_chunked."""
+
+    async def test_parallel_chunks(self) -> None:
+        """Test chunks are upserted concurrently up to max_concurrency."""
+        in_flight = peak = 0
+
+        async def upsert(**kwargs: object) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        client = _client()
+        client.upsert.side_effect = upsert
+        points = [_point(i) for i in range(6)]
+        config = UpsertConfig(chunk_bytes=estimate_point_bytes(points[0]), max_concurrency=2)
+
+        await upsert_chunked(client, "turns", points, ShardRouter(), config)
+
+        assert client.upsert.call_count == 6
+        assert peak == 2
+
+    async def test_wait_and_ordering(self) -> None:
+        """Test write semantics and shard keys are passed to every chunk."""
+        client = _client()
+        config = UpsertConfig(wait=False, ordering="strong")
+        router = ShardRouter(enabled=True, dedicated_orgs=["acme"])
+
+        await upsert_chunked(client, "turns", [_point(1), _point(2, org_id="acme")], router, config)
+
+        calls = {c.kwargs["shard_key_selector"]: c.kwargs for c in client.upsert.call_args_list}
+        assert set(calls) == {"default", "acme"}
+        assert calls["acme"]["wait"] is False
+        assert calls["acme"]["ordering"] == models.WriteOrdering.STRONG
+
+    async def test_retries_with_backoff(self) -> None:
+        """Test a transient failure is retried."""
+        client = _client()
+        client.upsert.side_effect = [_error(503), None]
+
+        await upsert_chunked(
+            client, "turns", [_point(1)], ShardRouter(), UpsertConfig(retry_delay_s=0)
+        )
+
+        assert client.upsert.call_count == 2
+
+    async def test_retries_exhausted(self) -> None:
+        """Test the error surfaces once retries are used up."""
+        client = _client()
+        client.upsert.side_effect = ConnectionError("qdrant down")
+        config = UpsertConfig(max_retries=2, retry_delay_s=0)
+
+        with pytest.raises(ConnectionError):
+            await upsert_chunked(client, "turns", [_point(1)], ShardRouter(), config)
+
+        assert client.upsert.call_count == 3
+
+    async def test_client_error_not_retried(self) -> None:
+        """Test a 4xx response fails immediately."""
+        client = _client()
+        client.upsert.side_effect = _error(400)
+
+        with pytest.raises(UnexpectedResponse):
+            await upsert_chunked(
+                client, "turns", [_point(1)], ShardRouter(), UpsertConfig(retry_delay_s=0)
+            )
+
+        client.upsert.assert_called_once()
+
+
+def test_from_settings() -> None:
+    """Test the upsert configuration is read from settings."""
+    settings = Settings(
+        _env_file=None,
+        indexing_upsert_chunk_bytes=1024,
+        indexing_upsert_wait=False,
+        indexing_upsert_ordering="medium",
+    )
+
+    config = UpsertConfig.from_settings(settings)
+
+    assert config.chunk_bytes == 1024
+    assert config.wait is False
+    assert config.ordering == models.WriteOrdering.MEDIUM
@@ -0,0 +1,143 @@
+"""Tests for the standalone indexing worker."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.worker import IndexingWorker, serve
+
+
+@pytest.fixture
+def settings() -> MagicMock:
+    """Create mock settings for the worker."""
+    settings = MagicMock()
+    settings.debug = False
+    settings.nats_url = "nats://localhost:4222"
+    settings.nats_consumer_group = "test-group"
+    settings.nats_pull_workers = 2
+    settings.nats_fetch_max_batch = 128
+    settings.nats_ack_wait_s = 60.0
+    settings.nats_max_deliver = 10
+    settings.nats_memory_consumer_enabled = False
+    settings.indexing_pipeline_depth = 2
+    settings.indexing_upsert_chunk_bytes = 1024
+    settings.indexing_upsert_concurrency = 2
+    settings.indexing_upsert_wait = False
+    settings.indexing_upsert_ordering = "weak"
+    settings.indexing_upsert_retries = 1
+    settings.session_centroids_enabled = True
+    settings.session_centroids_collection = "sessions"
+    settings.session_centroid_sparse_terms = 256
+    settings.qdrant_collection = "engram_turns"
+    settings.qdrant_turns_tiering_enabled = False
+    settings.qdrant_turns_cold_collection = "engram_turns_cold"
+    settings.qdrant_turns_hot_window_hours = 168.0
+    settings.late_chunking_enabled = False
+    settings.late_chunk_tokens = 128
+    settings.late_chunk_max_tokens = 8192
+    settings.embedder_backend = "local"
+    settings.embedder_preload = False
+    return settings
+
+
+@pytest.fixture
+def deps():
+    """Patch the clients and consumers created by the worker."""
+    with (
+        patch("src.worker.QdrantClientWrapper") as qdrant_cls,
+        patch("src.worker.EmbedderFactory") as factory_cls,
+        patch("src.worker.SchemaManager") as schema_manager_cls,
+        patch("src.worker.PayloadCodec"),
+        patch("src.worker.NatsClient") as nats_cls,
+        patch("src.worker.NatsPubSubPublisher") as pubsub_cls,
+        patch("src.worker.TurnsIndexer"),
+        patch("src.worker.TurnFinalizedConsumer") as turns_cls,
+        patch("src.worker.DocumentIndexer"),
+        patch("src.worker.MemoryEventConsumer") as memory_cls,
+    ):
+        qdrant_cls.return_value = AsyncMock()
+        factory_cls.return_value = AsyncMock()
+        nats_cls.return_value = AsyncMock()
+        pubsub_cls.return_value = AsyncMock()
+        turns_cls.return_value = AsyncMock()
+        memory_cls.return_value = AsyncMock()
+        schema_manager_cls.return_value.shard_router = AsyncMock()
+        yield MagicMock(
+            qdrant=qdrant_cls.return_value,
+            schema_manager=schema_manager_cls.return_value,
+            factory=factory_cls.return_value,
+            nats=nats_cls.return_value,
+            nats_cls=nats_cls,
+            pubsub=pubsub_cls.return_value,
+            turns=turns_cls.return_value,
+            memory=memory_cls.return_value,
+        )
+
+
+class TestIndexingWorker:
+    """Tests for IndexingWorker."""
+
+    async def test_start_and_stop(self, settings: MagicMock, deps: MagicMock) -> None:
+        """Test the worker runs the turn consumer and closes every client on stop."""
+        worker = IndexingWorker(settings, worker_id=3)
+
+        await worker.start()
+        await asyncio.sleep(0)
+
+        deps.turns.start.assert_called_once()
+        deps.memory.start.assert_not_called()
+        nats_config = deps.nats_cls.call_args.kwargs["config"]
+        assert nats_config.client_name == "search-indexer-3"
+        assert nats_config.pull_workers == 2
+        deps.schema_manager.shard_router.assert_awaited_once_with()
+
+        await worker.stop()
+
+        deps.turns.stop.assert_called_once()
+        deps.pubsub.disconnect.assert_called_once()
+        deps.nats.close.assert_called_once()
+        deps.factory.unload_all.assert_called_once()
+        deps.qdrant.close.assert_called_once()
+
+    async def test_memory_consumer_enabled(self, settings: MagicMock, deps: MagicMock) -> None:
+        """Test the memory consumer runs when enabled."""
+        settings.nats_memory_consumer_enabled = True
+        worker = IndexingWorker(settings)
+
+        await worker.start()
+        await asyncio.sleep(0)
+
+        assert len(worker.consumers) == 2
+        deps.memory.start.assert_called_once()
+        await worker.stop()
+
+    async def test_run_until_stop_requested(self, settings: MagicMock, deps: MagicMock) -> None:
+        """Test run_until returns True once stop is set."""
+        deps.turns.start = AsyncMock(side_effect=asyncio.Event().wait)
+        worker = IndexingWorker(settings)
+        await worker.start()
+        stop = asyncio.Event()
+        stop.set()
+
+        assert await worker.run_until(stop) is True
+        await worker.stop()
+
+    async def test_run_until_consumer_exits(self, settings: MagicMock, deps: MagicMock) -> None:
+        """Test run_until reports a consumer that exits on its own."""
+        worker = IndexingWorker(settings)
+        await worker.start()
+
+        assert await worker.run_until(asyncio.Event()) is False
+        await worker.stop()
+
+
+class TestServe:
+    """Tests for serve."""
+
+    async def test_start_failure_returns_error(self, settings: MagicMock, deps: MagicMock) -> None:
+        """Test an unreachable Qdrant exits with code 1 after cleanup."""
+        deps.qdrant.connect.side_effect = ConnectionError("qdrant down")
+
+        assert await serve(settings) == 1
+        deps.qdrant.close.assert_called_once()